@@ -4,6 +4,7 @@ from typing import override
 from httpx import HTTPStatusError
 
 from mpt_api_client.constants import MPT_STREAMING_ENABLED, MPT_STREAMING_HEADER
+from mpt_api_client.json_codec import JSONCodec, default_json_codec
 
 
 class MPTError(Exception):
@@ -39,10 +40,23 @@ class MPTHttpError(MPTError):
 
 
 class MPTMaxRetryError(MPTError):
-    """Represents an error when maximum retry attempts are exceeded."""
+    """Represents an error when maximum retry attempts are exceeded.
 
-    def __init__(self, message: str, attempts: int):
-        super().__init__(f"{message} error after {attempts} retry attempts.")
+    Attributes:
+        attempts: Attempts sent, the first one included.
+        budget_exhausted: Whether retrying stopped early because the retry budget of the
+            client was exhausted.
+    """
+
+    def __init__(self, message: str, attempts: int, *, budget_exhausted: bool = False):
+        self.attempts = attempts
+        self.budget_exhausted = budget_exhausted
+        reason = " Retry budget exhausted." if budget_exhausted else ""
+        super().__init__(f"{message} error after {attempts} retry attempts.{reason}")
+
+
+class MPTDeadlineExceededError(MPTError):
+    """Represents an operation stopped because its deadline passed or would pass."""
 
 
 class MPTAPIError(MPTHttpError):
@@ -70,7 +84,9 @@ class MPTAPIError(MPTHttpError):
         return str(self.payload)
 
 
-def transform_http_status_exception(http_status_exception: HTTPStatusError) -> MPTError:
+def transform_http_status_exception(
+    http_status_exception: HTTPStatusError, json_codec: JSONCodec | None = None
+) -> MPTError:
     """Transforms httpx exceptions into MPT exceptions.
 
     Attempts to extract API related information from HTTPStatusError and
@@ -78,17 +94,20 @@ def transform_http_status_exception(http_status_exception: HTTPStatusError) -> M
 
     Args:
         http_status_exception: Native httpx exception
+        json_codec: Codec used to decode the error body. Defaults to the standard
+            library ``json``.
 
     Returns:
         MPTError
     """
+    json_codec = json_codec or default_json_codec()
     try:
         return MPTAPIError(
             status_code=http_status_exception.response.status_code,
             message=http_status_exception.args[0],
-            payload=http_status_exception.response.json(),
+            payload=json_codec.loads(http_status_exception.response.content),
         )
-    except json.JSONDecodeError:
+    except ValueError:
         body = http_status_exception.response.content.decode()
         return MPTHttpError(
             status_code=http_status_exception.response.status_code,
@@ -1,14 +1,53 @@
+from mpt_api_client.http.adaptive_concurrency import AdaptiveConcurrency
 from mpt_api_client.http.async_client import AsyncHTTPClient
 from mpt_api_client.http.async_service import AsyncService
+from mpt_api_client.http.cache_backends import MemoryCacheBackend, SQLiteCacheBackend
+from mpt_api_client.http.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitState,
+    MPTCircuitOpenError,
+)
 from mpt_api_client.http.client import HTTPClient
+from mpt_api_client.http.deadline import Deadline, current_deadline, deadline
+from mpt_api_client.http.hedging import HedgingPolicy
+from mpt_api_client.http.hooks import RequestEvent, RequestHook
+from mpt_api_client.http.idempotency_journals import (
+    MemoryIdempotencyJournal,
+    SQLiteIdempotencyJournal,
+)
+from mpt_api_client.http.metrics import ClientMetrics
+from mpt_api_client.http.model_cache import ModelCachePolicy
+from mpt_api_client.http.prometheus import PROMETHEUS_CONTENT_TYPE, format_prometheus
+from mpt_api_client.http.rate_limiter import RateLimit
+from mpt_api_client.http.retry_budget import RetryBudget
 from mpt_api_client.http.service import Service
 from mpt_api_client.http.transport_settings import EnvTransportSettings, TransportSettings
 
 __all__ = [  # noqa: WPS410
+    "PROMETHEUS_CONTENT_TYPE",
+    "AdaptiveConcurrency",
     "AsyncHTTPClient",
     "AsyncService",
+    "CircuitBreakerPolicy",
+    "CircuitState",
+    "ClientMetrics",
+    "Deadline",
     "EnvTransportSettings",
     "HTTPClient",
+    "HedgingPolicy",
+    "MPTCircuitOpenError",
+    "MemoryCacheBackend",
+    "MemoryIdempotencyJournal",
+    "ModelCachePolicy",
+    "RateLimit",
+    "RequestEvent",
+    "RequestHook",
+    "RetryBudget",
+    "SQLiteCacheBackend",
+    "SQLiteIdempotencyJournal",
     "Service",
     "TransportSettings",
+    "current_deadline",
+    "deadline",
+    "format_prometheus",
 ]
@@ -0,0 +1,225 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import cast, override
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    Request,
+    Response,
+    TimeoutException,
+    codes,
+)
+
+from mpt_api_client.http.deadline_transport import is_deadline_timeout
+
+CONGESTION_STATUS_CODES = frozenset((
+    codes.TOO_MANY_REQUESTS,
+    codes.SERVICE_UNAVAILABLE,
+    codes.GATEWAY_TIMEOUT,
+))
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    """AIMD policy for the number of requests the async client keeps in flight.
+
+    Attributes:
+        initial_limit: Concurrency limit before any feedback is received.
+        min_limit: Lowest limit a decrease can reach.
+        max_limit: Highest limit an increase can reach.
+        increase: Amount the limit grows after a full window of healthy responses,
+            that is ``limit`` healthy responses in a row.
+        decrease_factor: Factor the limit is multiplied by on a 429, 503, 504 or timeout.
+        latency_threshold: Seconds to the response headers above which a successful
+            response no longer counts as healthy. None disables the latency check.
+    """
+
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 100
+    increase: float = 1
+    decrease_factor: float = 0.5
+    latency_threshold: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If the limits are not ordered ``1 <= min <= initial <= max`` or the
+                increase or decrease factor is out of range.
+        """
+        if self.min_limit < 1 or not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("Concurrency limits must satisfy 1 <= min <= initial <= max.")
+        if self.increase <= 0:
+            raise ValueError("Concurrency increase must be positive.")
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError("Concurrency decrease factor must be between 0 and 1.")
+
+
+@dataclass(frozen=True)
+class ConcurrencyStats:
+    """State of an adaptive concurrency limiter.
+
+    Attributes:
+        limit: Current concurrency limit.
+        in_flight: Permits currently held.
+        waiting: Requests waiting for a permit.
+    """
+
+    limit: int
+    in_flight: int
+    waiting: int
+
+
+class AdaptiveConcurrencyLimiter:  # noqa: WPS214
+    """In-flight request limiter with additive increase and multiplicative decrease.
+
+    Shared by every task on the event loop. Each permit remembers the generation it was
+    taken in; only the first congestion signal of a generation cuts the limit, so a burst
+    of 429s from requests started before the cut does not collapse it further.
+    """
+
+    def __init__(self, policy: AdaptiveConcurrency) -> None:
+        self._policy = policy
+        self._limit = float(policy.initial_limit)
+        self._in_flight = 0
+        self._generation = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of permits currently held."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting for a permit."""
+        return len(self._waiters)
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        """Current limit, permits held and waiters."""
+        return ConcurrencyStats(limit=self.limit, in_flight=self.in_flight, waiting=self.waiting)
+
+    async def acquire(self) -> int:
+        """Wait for a free slot and take it.
+
+        Returns:
+            The generation the permit was taken in, passed back to ``record_congestion``.
+        """
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return self._generation
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        return self._generation
+
+    def release(self) -> None:
+        """Give a slot back and wake waiters that now fit under the limit."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def record_success(self, latency: float) -> None:
+        """Grow the limit after a response that is neither congested nor too slow."""
+        threshold = self._policy.latency_threshold
+        if threshold is not None and latency > threshold:
+            return
+        grown_limit = self._limit + self._policy.increase / self._limit
+        self._limit = min(grown_limit, float(self._policy.max_limit))
+        self._wake_waiters()
+
+    def record_congestion(self, generation: int) -> None:
+        """Cut the limit once per generation after a 429, 503, 504 or timeout."""
+        if generation != self._generation:
+            return
+        self._generation += 1
+        cut_limit = self._limit * self._policy.decrease_factor
+        self._limit = max(cut_limit, float(self._policy.min_limit))
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+
+class _ReleasingStream(AsyncByteStream):
+    def __init__(self, stream: AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    @override
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release:
+                self._release()
+                self._release = None
+
+
+class AdaptiveConcurrencyTransport(AsyncBaseTransport):
+    """Async transport that holds a limiter permit until the response body is closed.
+
+    A timeout of a phase lowered to fit the deadline of the caller says nothing about
+    congestion, so it only gives its permit back.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        limiter: AdaptiveConcurrencyLimiter,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._transport = transport
+        self._limiter = limiter
+        self._clock = clock
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        generation = await self._limiter.acquire()
+        started_at = self._clock()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as error:
+            if isinstance(error, TimeoutException) and not is_deadline_timeout(request, error):
+                self._limiter.record_congestion(generation)
+            self._limiter.release()
+            raise
+        if response.status_code in CONGESTION_STATUS_CODES:
+            self._limiter.record_congestion(generation)
+        elif response.status_code < codes.INTERNAL_SERVER_ERROR:
+            self._limiter.record_success(self._clock() - started_at)
+        if response.is_closed:
+            self._limiter.release()
+            return response
+        response.stream = _ReleasingStream(
+            cast("AsyncByteStream", response.stream), self._limiter.release
+        )
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
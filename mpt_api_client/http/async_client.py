@@ -1,19 +1,28 @@
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import functools
+from collections.abc import AsyncIterator, Generator
+from contextlib import asynccontextmanager, contextmanager
 from typing import TYPE_CHECKING, Any
 
-from httpx import AsyncClient, HTTPError, RequestError
+from httpx import AsyncClient, HTTPError, RequestError, codes
 from httpx import Response as HTTPXResponse
-from httpx_retries import RetryTransport
 
-from mpt_api_client.constants import APPLICATION_JSON
-from mpt_api_client.exceptions import MPTError, MPTMaxRetryError
-from mpt_api_client.http.client import json_to_file_payload
+from mpt_api_client.exceptions import MPTError
+from mpt_api_client.http.client_components import build_async_components
 from mpt_api_client.http.client_utils import get_query_params
+from mpt_api_client.http.idempotency import idempotent_call
 from mpt_api_client.http.query_options import QueryOptions
-from mpt_api_client.http.request_response_utils import handle_response_http_error
+from mpt_api_client.http.request_response_utils import (
+    RequestKey,
+    add_json_part,
+    encode_json_body,
+    get_request_key,
+    max_retry_error,
+    raise_for_retried_status,
+)
+from mpt_api_client.http.transport_factory import build_async_transport
 from mpt_api_client.http.transport_settings import EnvTransportSettings, TransportSettings
 from mpt_api_client.http.types import HeaderTypes, QueryParam, RequestFiles, Response
+from mpt_api_client.json_codec import JSONCodec
 
 if TYPE_CHECKING:
     from mpt_api_client.auth.base import Authentication
@@ -38,16 +47,22 @@ class AsyncHTTPClient:
         """
         self._transport = transport or EnvTransportSettings()
         authentication.configure(self._transport)
+        self.components = build_async_components(self._transport)
         self.httpx_client = AsyncClient(
             base_url=self._transport.url,
             headers={"User-Agent": "swo-marketplace-client/1.0"},
             auth=authentication,
             timeout=self._transport.request_timeout,
-            transport=RetryTransport(retry=self._transport.retry),
+            transport=build_async_transport(self._transport, self.components),
             follow_redirects=True,
         )
 
-    async def request(  # noqa: WPS211
+    @property
+    def json_codec(self) -> JSONCodec:
+        """JSON codec used for request bodies, response bodies and streamed records."""
+        return self._transport.codec
+
+    async def request(  # noqa: WPS210 WPS211
         self,
         method: str,
         url: str,
@@ -84,29 +99,18 @@ class AsyncHTTPClient:
         """
         files = dict(files or {})
         if force_multipart or (files and json):
-            files[json_file_key] = (None, json_to_file_payload(json), APPLICATION_JSON)
+            files = add_json_part(files, json, json_file_key, self.json_codec)
             json = None
+        body, headers = encode_json_body(json, headers, self.json_codec)
         params_str = get_query_params(query_params, options)
-        try:
-            response = await self.httpx_client.request(
-                method,
-                url,
-                files=files,
-                json=json,
-                params=params_str or None,
-                headers=headers,
-            )
-        except RequestError as err:
-            raise MPTMaxRetryError(str(err), self._transport.retry.total + 1) from err
-        except HTTPError as err:
-            raise MPTError(f"HTTP Error: {err}") from err
-
-        handle_response_http_error(response)
-
-        return Response(
-            headers=dict(response.headers),
-            status_code=response.status_code,
-            content=response.content,
+        request_key = get_request_key(method, url, params_str, headers)
+        if request_key is None or files or body is not None:
+            with self._body_request(
+                method, url, files=files, content=body, params=params_str or None, headers=headers
+            ) as request_kwargs:
+                return await self._send(method, url, **request_kwargs)
+        return await self.components.coalesced(
+            request_key, f"{method} {url}", lambda: self._get(request_key, url, params_str, headers)
         )
 
     @asynccontextmanager
@@ -151,9 +155,79 @@ class AsyncHTTPClient:
             ) as response:
                 if response.is_error:
                     await response.aread()
-                handle_response_http_error(response)
+                raise_for_retried_status(response, self.json_codec, self.components.metrics, url)
                 yield response
         except RequestError as err:
-            raise MPTMaxRetryError(str(err), self._transport.retry.total + 1) from err
+            raise max_retry_error(
+                err, self.components.metrics, url, self._transport.retry.total + 1
+            ) from err
         except HTTPError as err:
             raise MPTError(f"HTTP Error: {err}") from err
+
+    async def _get(
+        self, request_key: RequestKey, url: str, params_str: str, headers: HeaderTypes | None
+    ) -> Response:
+        http_cache = self.components.http_cache
+        key, cached = "", None
+        if http_cache:
+            key, cached = http_cache.lookup(request_key)
+            headers = http_cache.conditional_headers(cached, headers)
+        response = await self.components.hedged(
+            functools.partial(
+                self._send,
+                "GET",
+                url,
+                revalidating=cached is not None,
+                params=params_str or None,
+                headers=headers,
+            )
+        )
+        return http_cache.resolve(key, cached, response) if http_cache else response
+
+    @contextmanager
+    def _body_request(
+        self, method: str, url: str, **request_kwargs: Any
+    ) -> Generator[dict[str, Any]]:
+        """Yield the arguments of a request with a body under an idempotency key.
+
+        The models the request may have changed are dropped from the model cache once it
+        is answered, or once it failed.
+        """
+        query = request_kwargs["params"]
+        target = f"{url}?{query}" if query else url
+        body = None if request_kwargs["files"] else request_kwargs["content"] or b""
+        headers = request_kwargs.pop("headers")
+        try:
+            with idempotent_call(
+                self.components.idempotency, method, target, body, headers
+            ) as call_headers:
+                yield {**request_kwargs, "headers": call_headers}
+        finally:
+            self.components.invalidate_models(method, url)
+
+    async def _send(
+        self, method: str, url: str, *, revalidating: bool = False, **request_kwargs: Any
+    ) -> Response:
+        """Send the request and return its response.
+
+        A ``304 Not Modified`` is returned as is only when ``revalidating`` a cached
+        response, which the cache then serves; otherwise it is an error like any other.
+        """
+        try:
+            response = await self.httpx_client.request(method, url, **request_kwargs)
+        except RequestError as err:
+            raise max_retry_error(
+                err, self.components.metrics, url, self._transport.retry.total + 1
+            ) from err
+        except HTTPError as err:
+            raise MPTError(f"HTTP Error: {err}") from err
+
+        if not revalidating or response.status_code != codes.NOT_MODIFIED:
+            raise_for_retried_status(response, self.json_codec, self.components.metrics, url)
+
+        return Response(
+            headers=dict(response.headers),
+            status_code=response.status_code,
+            content=response.content,
+            json_codec=self.json_codec,
+        )
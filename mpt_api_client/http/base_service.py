@@ -4,6 +4,7 @@ from mpt_api_client.http.query_state import QueryState
 from mpt_api_client.http.types import Response
 from mpt_api_client.models import Meta, ModelCollection
 from mpt_api_client.models import Model as BaseModel
+from mpt_api_client.models.model import Resource
 
 
 class ServiceBase[Client, Model: BaseModel]:  # noqa: WPS214
@@ -56,3 +57,12 @@ class ServiceBase[Client, Model: BaseModel]:  # noqa: WPS214
             ],
             meta=meta,
         )
+
+    @classmethod
+    def make_model(cls, resource_data: Resource) -> Model:
+        """Builds a model from the data of one resource.
+
+        Args:
+            resource_data: The resource data, as returned by ``to_dict()``.
+        """
+        return cls._model_class(resource_data)
@@ -0,0 +1,172 @@
+import asyncio
+import contextvars
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class BulkItemError:
+    """Failure of one entry of a bulk operation.
+
+    Attributes:
+        index: Position of the entry in the input.
+        entry: The input entry, such as the resource data or the resource id.
+        error: Exception raised for the entry.
+    """
+
+    index: int
+    entry: Any
+    error: Exception
+
+
+@dataclass
+class BulkResult[Output]:
+    """Outcome of a bulk operation, in input order.
+
+    Attributes:
+        results: One element per input entry: its result, or None when the entry failed.
+        errors: Failed entries, ordered by index.
+    """
+
+    results: list[Output | None] = field(default_factory=list)  # noqa: WPS110
+    errors: list[BulkItemError] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        """Number of entries that succeeded."""
+        return len(self.results) - len(self.errors)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every entry succeeded."""
+        return not self.errors
+
+
+class _BulkReport[Entry, Output]:
+    """Collects the outcomes of the entries of a bulk operation as they complete."""
+
+    def __init__(self) -> None:
+        self.outcome: BulkResult[Output] = BulkResult()
+        self.pending: dict[Future[Output], tuple[int, Entry]] = {}
+
+    def submit(
+        self, executor: Executor, entry: Entry, operation: Callable[[Entry], Output]
+    ) -> None:
+        """Run ``operation`` on ``entry`` in ``executor``, in a copy of the caller context."""
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, operation, entry)
+        self.pending[future] = (self.add(), entry)
+
+    def collect(self, done: set[Future[Output]]) -> None:
+        """Store the results or errors of the completed futures among the pending ones."""
+        for future in done:
+            index, entry = self.pending.pop(future)
+            try:
+                self.outcome.results[index] = future.result()
+            except Exception as error:
+                self._fail(index, entry, error)
+
+    async def run(
+        self,
+        index: int,
+        entry: Entry,
+        operation: Callable[[Entry], Awaitable[Output]],
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """Await ``operation`` on ``entry`` and store its outcome, then free its slot."""
+        try:
+            self.outcome.results[index] = await operation(entry)
+        except Exception as error:
+            self._fail(index, entry, error)
+        finally:
+            slots.release()
+
+    def finish(self) -> BulkResult[Output]:
+        """Return the outcome with its errors in input order."""
+        self.outcome.errors.sort(key=lambda entry_error: entry_error.index)
+        return self.outcome
+
+    def add(self) -> int:
+        """Reserve the result of the next entry and return its index."""
+        self.outcome.results.append(None)
+        return len(self.outcome.results) - 1
+
+    def _fail(self, index: int, entry: Entry, error: Exception) -> None:
+        self.outcome.errors.append(BulkItemError(index, entry, error))
+
+
+def run_bulk[Entry, Output](
+    entries: Iterable[Entry],
+    operation: Callable[[Entry], Output],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> BulkResult[Output]:
+    """Apply ``operation`` to every entry on a thread pool, collecting per-entry errors.
+
+    Entries are read lazily and at most ``concurrency`` run at a time, so a large input is
+    never materialised. Each entry runs in a copy of the caller context, so an active
+    ``deadline()`` applies to it.
+
+    Args:
+        entries: Input entries.
+        operation: Callable applied to each entry; its exceptions are reported per entry.
+        concurrency: Maximum number of entries in flight.
+
+    Returns:
+        The results and errors in input order.
+    """
+    _validate_concurrency(concurrency)
+    report: _BulkReport[Entry, Output] = _BulkReport()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for entry in entries:
+            report.submit(executor, entry, operation)
+            if len(report.pending) >= concurrency:
+                report.collect(wait(report.pending, return_when=FIRST_COMPLETED).done)
+        report.collect(wait(report.pending).done)
+    return report.finish()
+
+
+async def arun_bulk[Entry, Output](
+    entries: Iterable[Entry] | AsyncIterable[Entry],
+    operation: Callable[[Entry], Awaitable[Output]],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+) -> BulkResult[Output]:
+    """Apply ``operation`` to every entry in concurrent tasks, collecting per-entry errors.
+
+    Entries are read lazily and at most ``concurrency`` run at a time.
+
+    Args:
+        entries: Input entries, as an iterable or an async iterable.
+        operation: Coroutine function applied to each entry; its exceptions are reported
+            per entry.
+        concurrency: Maximum number of entries in flight.
+
+    Returns:
+        The results and errors in input order.
+    """
+    _validate_concurrency(concurrency)
+    report: _BulkReport[Entry, Output] = _BulkReport()
+    slots = asyncio.Semaphore(concurrency)
+    async with asyncio.TaskGroup() as task_group:
+        async for entry in _aiterate(entries):
+            await slots.acquire()
+            entry_run = report.run(report.add(), entry, operation, slots)
+            task_group.create_task(entry_run)  # type: ignore[unused-awaitable]
+    return report.finish()
+
+
+def _validate_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("Bulk concurrency must be at least 1.")
+
+
+async def _aiterate[Entry](entries: Iterable[Entry] | AsyncIterable[Entry]) -> AsyncIterator[Entry]:
+    if isinstance(entries, AsyncIterable):
+        async for async_entry in entries:
+            yield async_entry
+    else:
+        for entry in entries:
+            yield entry
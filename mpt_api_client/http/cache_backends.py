@@ -0,0 +1,161 @@
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from os import PathLike
+
+from mpt_api_client.http.http_cache import CachedResponse
+
+DEFAULT_MAX_ENTRIES = 1024
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    cache_key TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    access_order INTEGER NOT NULL
+)
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS http_cache_access_order ON http_cache (access_order)"
+_SELECT = (
+    "SELECT status_code, headers, content, etag, last_modified FROM http_cache WHERE cache_key = ?"
+)
+_TOUCH = (
+    "UPDATE http_cache SET access_order = "
+    "(SELECT COALESCE(MAX(access_order), 0) + 1 FROM http_cache) WHERE cache_key = ?"
+)
+_UPSERT = (
+    "INSERT OR REPLACE INTO http_cache VALUES "
+    "(?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(access_order), 0) + 1 FROM http_cache))"
+)
+_DELETE = "DELETE FROM http_cache WHERE cache_key = ?"
+_EVICT = (
+    "DELETE FROM http_cache WHERE cache_key IN ("
+    "SELECT cache_key FROM http_cache ORDER BY access_order DESC LIMIT -1 OFFSET ?)"
+)
+
+
+class MemoryCacheBackend:
+    """Thread-safe in-memory cache evicting the least recently used entry.
+
+    Entries keep their decoded response, so revalidated hits skip decoding entirely.
+
+    Args:
+        max_entries: Maximum number of stored responses.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("Cache max_entries must be at least 1.")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the response stored under ``key`` and mark it as recently used."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+            return cached
+
+    def set(self, key: str, cached: CachedResponse) -> None:
+        """Store ``cached`` under ``key``, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """Persistent cache in an SQLite database, evicting the least recently used entries.
+
+    Stores the raw body only; a revalidated hit is decoded again. Responses are cached
+    per base URL but not per credentials, so do not share a database between tokens that
+    see different data.
+
+    Args:
+        path: Database file; ``":memory:"`` keeps the cache for the process lifetime.
+        max_entries: Maximum number of stored responses; None removes the limit.
+    """
+
+    def __init__(
+        self, path: str | PathLike[str] = ":memory:", max_entries: int | None = None
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Cache max_entries must be at least 1.")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_CREATE_TABLE)
+            self._connection.execute(_CREATE_INDEX)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM http_cache").fetchone()
+        return int(row[0])
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the response stored under ``key`` and mark it as recently used."""
+        with self._lock, self._connection:
+            row = self._connection.execute(_SELECT, (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(_TOUCH, (key,))
+        return CachedResponse(
+            status_code=row[0],
+            headers=json.loads(row[1]),
+            content=bytes(row[2]),
+            etag=row[3],
+            last_modified=row[4],
+        )
+
+    def set(self, key: str, cached: CachedResponse) -> None:
+        """Store ``cached`` under ``key``, evicting the least recently used entries."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                _UPSERT,
+                (
+                    key,
+                    cached.status_code,
+                    json.dumps(cached.headers),
+                    cached.content,
+                    cached.etag,
+                    cached.last_modified,
+                ),
+            )
+            if self._max_entries is not None:
+                self._connection.execute(_EVICT, (self._max_entries,))
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``, if any."""
+        with self._lock, self._connection:
+            self._connection.execute(_DELETE, (key,))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM http_cache")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
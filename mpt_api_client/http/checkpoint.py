@@ -0,0 +1,220 @@
+import base64
+import contextlib
+import json
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import asdict, dataclass, replace
+from typing import Protocol, Self
+
+from mpt_api_client.http.keyset import keyset_position
+from mpt_api_client.models import Model as BaseModel
+from mpt_api_client.rql import RQLQuery
+
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+
+class CheckpointStore(Protocol):
+    """Named storage of checkpoint tokens."""
+
+    def load(self, name: str) -> str | None:
+        """Return the token saved under ``name``, or None."""
+
+    def save(self, name: str, token: str) -> None:
+        """Save ``token`` under ``name``, replacing any previous one."""
+
+    def delete(self, name: str) -> None:
+        """Forget the token saved under ``name``, if any."""
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Position of an iteration, serialisable as a token to resume it later.
+
+    Attributes:
+        mode: ``"iterate"`` or ``"stream"``; a checkpoint only resumes the same mode.
+        path: Collection path with its query: filter, ordering and field selection.
+        processed: Records the consumer finished with before the checkpoint.
+        keyset: Keyset field of a keyset iteration, or None for offset pagination.
+        cursor: RQL filter matching the records after the last processed one, for a
+            keyset iteration.
+    """
+
+    mode: str
+    path: str
+    processed: int = 0
+    keyset: str | None = None
+    cursor: str | None = None
+
+    @classmethod
+    def from_token(cls, token: str) -> Self:
+        """Decode a token returned by ``to_token``.
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+        try:
+            return cls(**json.loads(base64.urlsafe_b64decode(token.encode())))
+        except (ValueError, TypeError) as error:
+            raise ValueError("Malformed checkpoint token.") from error
+
+    def to_token(self) -> str:
+        """Encode the checkpoint as an opaque, URL-safe string."""
+        return base64.urlsafe_b64encode(json.dumps(asdict(self)).encode()).decode()
+
+    def position(self) -> RQLQuery | None:
+        """Return the keyset cursor as an RQL filter, or None."""
+        return RQLQuery.from_string(self.cursor) if self.cursor else None
+
+
+class Checkpointer:
+    """Saves the checkpoint of an iteration every ``interval`` records.
+
+    A checkpoint is also saved when the iteration stops early, on an error or when the
+    consumer breaks out of it, and deleted from the store once it completes. Pass the
+    token of ``load()`` as ``resume_from`` to continue a previous run:
+
+    Args:
+        store: Optional store of the tokens, such as ``FileCheckpointStore("export.json")``
+            or ``SQLiteCheckpointStore("checkpoints.db")``; the latest token is kept in
+            ``token`` either way.
+        name: Name of the checkpoint in the store.
+        interval: Records processed between two saves.
+
+    Examples:
+        >>> store = SQLiteCheckpointStore("export.db")  # doctest: +SKIP
+        >>> checkpointer = Checkpointer(store, "charges")  # doctest: +SKIP
+        >>> for charge in charges.iterate(  # doctest: +SKIP
+        ...     checkpoint=checkpointer, resume_from=checkpointer.load()
+        ... ):
+        ...     export(charge)
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore | None = None,
+        name: str = "default",
+        *,
+        interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        if interval < 1:
+            raise ValueError("Checkpoint interval must be at least 1.")
+        self.store = store
+        self.name = name
+        self.interval = interval
+        self.token: str | None = None
+
+    def load(self) -> str | None:
+        """Return the token to resume from: the saved one, or the latest of this object."""
+        if self.store is not None:
+            return self.store.load(self.name)
+        return self.token
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Store the token of ``checkpoint``."""
+        self.token = checkpoint.to_token()
+        if self.store is not None:
+            self.store.save(self.name, self.token)
+
+    def complete(self) -> None:
+        """Forget the checkpoint of an iteration that completed."""
+        self.token = None
+        if self.store is not None:
+            self.store.delete(self.name)
+
+
+class CheckpointTracker:
+    """Counts the records of one iteration and hands its checkpoints to a ``Checkpointer``.
+
+    Args:
+        start: Checkpoint the iteration starts from.
+        checkpointer: Optional checkpointer to save to.
+    """
+
+    def __init__(self, start: Checkpoint, checkpointer: Checkpointer | None) -> None:
+        self.start = start
+        self.processed = start.processed
+        self._checkpointer = checkpointer
+        self._last_resource: BaseModel | None = None
+        self._completed = False
+
+    def advance(self, resource: BaseModel) -> None:
+        """Count ``resource`` as processed, saving a checkpoint every interval."""
+        self.processed += 1
+        self._last_resource = resource
+        if self._checkpointer and self.processed % self._checkpointer.interval == 0:
+            self._checkpointer.save(self.checkpoint())
+
+    def checkpoint(self) -> Checkpoint:
+        """Return the current position."""
+        cursor = self.start.cursor
+        if self.start.keyset and self._last_resource is not None:
+            cursor = str(keyset_position(self.start.keyset, self._last_resource))
+        return replace(self.start, processed=self.processed, cursor=cursor)
+
+    def complete(self) -> None:
+        """Mark the iteration completed."""
+        self._completed = True
+        if self._checkpointer:
+            self._checkpointer.complete()
+
+    def close(self) -> None:
+        """Save the position of an iteration that stopped before completing."""
+        if self._checkpointer and not self._completed:
+            self._checkpointer.save(self.checkpoint())
+
+
+def start_checkpoint(
+    mode: str, path: str, keyset: str | None, resume_from: str | None
+) -> Checkpoint:
+    """Return the checkpoint an iteration starts from.
+
+    Args:
+        mode: ``"iterate"`` or ``"stream"``.
+        path: Collection path with its query.
+        keyset: Keyset field, or None for offset pagination.
+        resume_from: Token of a previous run, or None to start from the beginning.
+
+    Raises:
+        ValueError: If the token was taken for another mode, query or keyset.
+    """
+    start = Checkpoint(mode=mode, path=path, keyset=keyset)
+    if resume_from is None:
+        return start
+    resumed = Checkpoint.from_token(resume_from)
+    if (resumed.mode, resumed.path, resumed.keyset) != (mode, path, keyset):
+        raise ValueError(
+            f"Checkpoint of {resumed.mode} {resumed.path} (keyset {resumed.keyset}) cannot "
+            f"resume {mode} {path} (keyset {keyset})."
+        )
+    return resumed
+
+
+def checkpointed[Model: BaseModel](
+    resources: Iterator[Model], tracker: CheckpointTracker
+) -> Iterator[Model]:
+    """Yield ``resources``, counting each one processed once the consumer asks for the next.
+
+    The tracker saves its position if the iteration stops early and completes when
+    ``resources`` is exhausted.
+    """
+    with contextlib.ExitStack() as cleanup:
+        cleanup.callback(tracker.close)
+        for resource in resources:
+            yield resource
+            tracker.advance(resource)
+        tracker.complete()
+
+
+async def acheckpointed[Model: BaseModel](
+    resources: AsyncIterator[Model], tracker: CheckpointTracker
+) -> AsyncIterator[Model]:
+    """Yield ``resources``, counting each one processed once the consumer asks for the next.
+
+    The tracker saves its position if the iteration stops early and completes when
+    ``resources`` is exhausted.
+    """
+    with contextlib.ExitStack() as cleanup:
+        cleanup.callback(tracker.close)
+        async for resource in resources:
+            yield resource
+            tracker.advance(resource)
+        tracker.complete()
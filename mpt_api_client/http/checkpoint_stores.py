@@ -0,0 +1,96 @@
+import json
+import sqlite3
+import threading
+import time
+from os import PathLike
+from pathlib import Path
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    saved_at REAL NOT NULL
+)
+"""
+_SELECT = "SELECT token FROM checkpoints WHERE name = ?"
+_UPSERT = "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)"
+_DELETE = "DELETE FROM checkpoints WHERE name = ?"
+
+
+class FileCheckpointStore:
+    """Checkpoint tokens kept in a JSON file, keyed by name.
+
+    Each save rewrites the file through a temporary file renamed over it, so a process
+    killed mid-save leaves the previous checkpoints intact.
+
+    Args:
+        path: JSON file; created on the first save.
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self._path = Path(path)
+        self._staging = Path(f"{path}.tmp")
+        self._lock = threading.Lock()
+
+    def load(self, name: str) -> str | None:
+        """Return the token saved under ``name``, or None."""
+        with self._lock:
+            return self._read().get(name)
+
+    def save(self, name: str, token: str) -> None:
+        """Save ``token`` under ``name``, replacing any previous one."""
+        with self._lock:
+            tokens = self._read()
+            tokens[name] = token
+            self._write(tokens)
+
+    def delete(self, name: str) -> None:
+        """Forget the token saved under ``name``, if any."""
+        with self._lock:
+            tokens = self._read()
+            if tokens.pop(name, None) is not None:
+                self._write(tokens)
+
+    def _read(self) -> dict[str, str]:
+        if not self._path.exists():
+            return {}
+        return json.loads(self._path.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
+
+    def _write(self, tokens: dict[str, str]) -> None:
+        self._staging.write_text(json.dumps(tokens), encoding="utf-8")
+        self._staging.replace(self._path)
+
+
+class SQLiteCheckpointStore:
+    """Checkpoint tokens kept in an SQLite database, keyed by name.
+
+    Args:
+        path: Database file; ``":memory:"`` keeps the checkpoints for the process lifetime.
+    """
+
+    def __init__(self, path: str | PathLike[str] = ":memory:") -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_CREATE_TABLE)
+
+    def load(self, name: str) -> str | None:
+        """Return the token saved under ``name``, or None."""
+        with self._lock:
+            row = self._connection.execute(_SELECT, (name,)).fetchone()
+        return None if row is None else str(row[0])
+
+    def save(self, name: str, token: str) -> None:
+        """Save ``token`` under ``name``, replacing any previous one."""
+        with self._lock, self._connection:
+            self._connection.execute(_UPSERT, (name, token, time.time()))
+
+    def delete(self, name: str) -> None:
+        """Forget the token saved under ``name``, if any."""
+        with self._lock, self._connection:
+            self._connection.execute(_DELETE, (name,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,268 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from httpx import codes
+
+from mpt_api_client.exceptions import MPTError
+
+DEFAULT_FAILURE_STATUS_CODES = frozenset((
+    codes.INTERNAL_SERVER_ERROR,
+    codes.BAD_GATEWAY,
+    codes.SERVICE_UNAVAILABLE,
+    codes.GATEWAY_TIMEOUT,
+))
+
+
+class MPTCircuitOpenError(MPTError):
+    """Represents a request failed fast because the circuit of its endpoint is open.
+
+    Attributes:
+        endpoint: Endpoint template whose circuit is open.
+        retry_in: Seconds until the circuit lets a probe request through.
+    """
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {endpoint}; retry in {retry_in:.1f}s.")
+
+
+class CircuitState(StrEnum):
+    """State of the circuit of one endpoint."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """Policy of the per-endpoint circuit breaker.
+
+    The circuit of an endpoint opens when at least ``failure_ratio`` of its recent attempts
+    failed. Failures are responses with a status in ``failure_status_codes`` and transport
+    errors, timeouts included. An open circuit fails requests at once for
+    ``open_duration`` seconds, then lets ``half_open_probes`` requests through: it closes
+    when they all succeed and opens again on the first failure.
+
+    Attributes:
+        failure_ratio: Share of failed attempts that opens the circuit.
+        min_requests: Attempts needed in the window before the ratio is evaluated.
+        window: Number of recent attempts the ratio is computed from.
+        open_duration: Seconds an open circuit fails fast before probing.
+        half_open_probes: Probe requests let through, one at a time, to close the circuit.
+        failure_status_codes: Response statuses counted as failures.
+    """
+
+    failure_ratio: float = 0.5
+    min_requests: int = 20
+    window: int = 100
+    open_duration: float = 30
+    half_open_probes: int = 1
+    failure_status_codes: frozenset[int] = DEFAULT_FAILURE_STATUS_CODES
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If the ratio is not in ``(0, 1]``, a count is below 1 or the open
+                duration is not positive.
+        """
+        if not 0 < self.failure_ratio <= 1:
+            raise ValueError("Circuit breaker failure_ratio must be in (0, 1].")
+        if min(self.min_requests, self.window, self.half_open_probes) < 1:
+            raise ValueError(
+                "Circuit breaker min_requests, window and half_open_probes must be at least 1."
+            )
+        if self.open_duration <= 0:
+            raise ValueError("Circuit breaker open_duration must be positive.")
+
+
+@dataclass(frozen=True)
+class CircuitStatus:
+    """Point-in-time state of the circuit of one endpoint.
+
+    Attributes:
+        state: Circuit state.
+        attempts: Attempts in the current window.
+        failures: Failed attempts in the current window.
+        retry_in: Seconds until an open circuit lets a probe through; 0 otherwise.
+    """
+
+    state: CircuitState
+    attempts: int
+    failures: int
+    retry_in: float
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """Counters of a circuit breaker.
+
+    Attributes:
+        open_circuits: Endpoints whose circuit is open.
+        half_open_circuits: Endpoints whose circuit is probing.
+        opened: Times a circuit opened.
+        rejected: Requests failed fast by an open circuit.
+    """
+
+    open_circuits: int = 0
+    half_open_circuits: int = 0
+    opened: int = 0
+    rejected: int = 0
+
+
+class _Circuit:
+    """Circuit state machine of one endpoint; guarded by the lock of its breaker."""
+
+    def __init__(self, policy: CircuitBreakerPolicy, clock: Callable[[], float]) -> None:
+        self.opened = 0
+        self.probes_in_flight = 0
+        self._policy = policy
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=policy.window)
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at: float = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once its open duration ends."""
+        if self._state == CircuitState.OPEN and self.retry_in() <= 0:
+            self._state = CircuitState.HALF_OPEN
+            self.probes_in_flight = 0
+            self._probe_successes = 0
+        return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        return max(self._opened_at + self._policy.open_duration - self._clock(), 0)
+
+    def status(self) -> CircuitStatus:
+        """Point-in-time state of the circuit."""
+        state = self.state
+        return CircuitStatus(
+            state=state,
+            attempts=len(self._outcomes),
+            failures=self._failures,
+            retry_in=self.retry_in() if state == CircuitState.OPEN else 0,
+        )
+
+    def record_attempt(self, *, success: bool) -> None:
+        """Add the outcome of a regular attempt and open the circuit on too many failures."""
+        if self._state != CircuitState.CLOSED:
+            return
+        window_full = len(self._outcomes) == self._policy.window
+        if window_full and not self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(success)
+        self._failures += int(not success)
+        attempts = len(self._outcomes)
+        if attempts < self._policy.min_requests:
+            return
+        if self._failures / attempts >= self._policy.failure_ratio:
+            self._open()
+
+    def record_probe(self, *, success: bool | None) -> None:
+        """Close the circuit after enough successful probes, or open it again."""
+        self.probes_in_flight -= 1
+        if success is None:
+            return
+        if not success:
+            self._open()
+            return
+        self._probe_successes += 1
+        if self._probe_successes >= self._policy.half_open_probes:
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+            self._failures = 0
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self.opened += 1
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breakers keyed by endpoint template, shared by a client.
+
+    Works the same for the sync and the async client: deciding and recording never block.
+    """
+
+    def __init__(
+        self, policy: CircuitBreakerPolicy, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.policy = policy
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CircuitBreakerStats:
+        """Open and probing circuits, openings and fast failures."""
+        with self._lock:
+            states = [circuit.state for circuit in self._circuits.values()]
+            opened = sum(circuit.opened for circuit in self._circuits.values())
+            rejected = self._rejected
+        return CircuitBreakerStats(
+            open_circuits=states.count(CircuitState.OPEN),
+            half_open_circuits=states.count(CircuitState.HALF_OPEN),
+            opened=opened,
+            rejected=rejected,
+        )
+
+    def status(self) -> dict[str, CircuitStatus]:
+        """Return the state of every endpoint seen so far, keyed by endpoint template."""
+        with self._lock:
+            return {endpoint: circuit.status() for endpoint, circuit in self._circuits.items()}
+
+    def acquire(self, endpoint: str) -> bool:
+        """Let a request to ``endpoint`` through, or fail it fast.
+
+        Every call must be followed by ``record`` once the attempt is over.
+
+        Returns:
+            Whether the request is a half-open probe, passed back to ``record``.
+
+        Raises:
+            MPTCircuitOpenError: If the circuit of ``endpoint`` is open, or half-open with
+                its probe already in flight.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            state = circuit.state
+            if state == CircuitState.CLOSED:
+                return False
+            if state == CircuitState.HALF_OPEN and not circuit.probes_in_flight:
+                circuit.probes_in_flight += 1
+                return True
+            self._rejected += 1
+            retry_in = circuit.retry_in()
+        raise MPTCircuitOpenError(endpoint, retry_in)
+
+    def record(self, endpoint: str, *, probe: bool, success: bool | None) -> None:
+        """Record the outcome of an attempt let through by ``acquire``.
+
+        Args:
+            endpoint: Endpoint template passed to ``acquire``.
+            probe: Value returned by ``acquire``.
+            success: Whether the attempt succeeded; None for an attempt that ended without
+                telling anything about the endpoint, such as a cancelled one.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if probe:
+                circuit.record_probe(success=success)
+            elif success is not None:
+                circuit.record_attempt(success=success)
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        if endpoint not in self._circuits:
+            self._circuits[endpoint] = _Circuit(self.policy, self._clock)
+        return self._circuits[endpoint]
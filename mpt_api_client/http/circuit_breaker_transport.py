@@ -0,0 +1,74 @@
+import asyncio
+from typing import override
+
+from httpx import AsyncBaseTransport, BaseTransport, Request, Response, TransportError
+
+from mpt_api_client.http.circuit_breaker import CircuitBreaker
+from mpt_api_client.http.deadline_transport import is_deadline_timeout
+from mpt_api_client.http.hooks import endpoint_template
+
+
+class CircuitBreakerTransport(BaseTransport):
+    """Sync transport failing requests fast while the circuit of their endpoint is open.
+
+    A timeout of a phase lowered to fit the deadline of the caller says nothing about the
+    endpoint, so it is recorded as neither a success nor a failure.
+    """
+
+    def __init__(self, transport: BaseTransport, breaker: CircuitBreaker) -> None:
+        self._transport = transport
+        self._breaker = breaker
+
+    @override
+    def handle_request(self, request: Request) -> Response:
+        endpoint = endpoint_template(request.url.path)
+        probe = self._breaker.acquire(endpoint)
+        try:
+            response = self._transport.handle_request(request)
+        except TransportError as error:
+            self._breaker.record(endpoint, probe=probe, success=_error_outcome(request, error))
+            raise
+        except BaseException:
+            self._breaker.record(endpoint, probe=probe, success=None)
+            raise
+        self._breaker.record(endpoint, probe=probe, success=_succeeded(self._breaker, response))
+        return response
+
+    @override
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCircuitBreakerTransport(AsyncBaseTransport):
+    """Async transport failing requests fast while the circuit of their endpoint is open."""
+
+    def __init__(self, transport: AsyncBaseTransport, breaker: CircuitBreaker) -> None:
+        self._transport = transport
+        self._breaker = breaker
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        endpoint = endpoint_template(request.url.path)
+        probe = self._breaker.acquire(endpoint)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except TransportError as error:
+            self._breaker.record(endpoint, probe=probe, success=_error_outcome(request, error))
+            raise
+        except (Exception, asyncio.CancelledError):
+            self._breaker.record(endpoint, probe=probe, success=None)
+            raise
+        self._breaker.record(endpoint, probe=probe, success=_succeeded(self._breaker, response))
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _error_outcome(request: Request, error: TransportError) -> bool | None:
+    return None if is_deadline_timeout(request, error) else False
+
+
+def _succeeded(breaker: CircuitBreaker, response: Response) -> bool:
+    return response.status_code not in breaker.policy.failure_status_codes
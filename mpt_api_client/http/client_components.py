@@ -0,0 +1,182 @@
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, override
+
+from mpt_api_client.http.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from mpt_api_client.http.circuit_breaker import CircuitBreaker
+from mpt_api_client.http.deadline import current_deadline, deadline_wait
+from mpt_api_client.http.hedging import Hedger
+from mpt_api_client.http.hooks import RequestHooks
+from mpt_api_client.http.http_cache import HTTPCache
+from mpt_api_client.http.idempotency import IdempotencyKeys
+from mpt_api_client.http.metrics import ClientMetrics, StatsSource
+from mpt_api_client.http.model_cache import ModelCache
+from mpt_api_client.http.rate_limiter import AsyncRateLimiter, RateLimiter
+from mpt_api_client.http.retry_budget import RetryBudgetLimiter
+from mpt_api_client.http.singleflight import AsyncSingleFlight, SingleFlight
+from mpt_api_client.http.transport_settings import TransportSettings
+from mpt_api_client.http.types import Response
+
+
+@dataclass(kw_only=True)
+class _SharedComponents:
+    metrics: ClientMetrics
+    hooks: RequestHooks
+    http_cache: HTTPCache | None
+    model_cache: ModelCache | None
+    retry_budget: RetryBudgetLimiter | None
+    idempotency: IdempotencyKeys | None
+    circuit_breaker: CircuitBreaker | None
+    streaming_unsupported: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        """Include the counters of every enabled component in the metrics snapshots."""
+        for name, source in self.stats_sources().items():
+            self.metrics.register_stats(name, source)
+
+    def stats_sources(self) -> dict[str, StatsSource | None]:
+        """Return the components exposing counters, keyed by their snapshot name."""
+        return {
+            "retry_budget": self.retry_budget,
+            "circuit_breaker": self.circuit_breaker,
+            "idempotency": self.idempotency,
+            "http_cache": self.http_cache,
+            "model_cache": self.model_cache,
+        }
+
+    def invalidate_models(self, method: str, url: str) -> None:
+        """Drop the cached models a request to ``url`` may have changed, unless it is a GET."""
+        if self.model_cache is not None and method.upper() != "GET":
+            self.model_cache.invalidate(url.partition("?")[0])
+
+
+@dataclass(kw_only=True)
+class ClientComponents(_SharedComponents):
+    """Components of ``HTTPClient`` built from its transport settings.
+
+    Optional components are None when their setting leaves them disabled.
+
+    Attributes:
+        metrics: Metrics registry, registered as the first request hook when
+            ``request_metrics`` is enabled.
+        hooks: Request hooks notified of every attempt sent to the pool.
+        rate_limiter: Token-bucket limiter consulted before every attempt.
+        singleflight: Coalescer of identical GET requests in flight.
+        http_cache: Conditional-request cache of GET responses.
+        model_cache: Resource cache behind ``get`` on services.
+        retry_budget: Budget every retry spends a token of.
+        idempotency: Generator of the ``Idempotency-Key`` of POST requests.
+        circuit_breaker: Per-endpoint circuit breaker.
+        streaming_unsupported: Paths whose collections are read page by page because the
+            API did not confirm streaming mode for them.
+    """
+
+    rate_limiter: RateLimiter | None
+    singleflight: SingleFlight[Response] | None
+
+    def coalesced(self, key: Hashable, operation: str, send: Callable[[], Response]) -> Response:
+        """Call ``send`` through the coalescer, or alone when coalescing is disabled.
+
+        Only callers under the same deadline share a call, and a caller waits for the
+        call of another no longer than its deadline allows.
+        """
+        if self.singleflight is None:
+            return send()
+        with deadline_wait(operation) as timeout:
+            flight_key = (key, current_deadline())
+            response, shared = self.singleflight.run(flight_key, send, timeout)
+        return response.copy() if shared else response
+
+
+@dataclass(kw_only=True)
+class AsyncClientComponents(_SharedComponents):
+    """Components of ``AsyncHTTPClient`` built from its transport settings.
+
+    On top of the components of ``ClientComponents``, with an async rate limiter and
+    coalescer, the async client has an adaptive concurrency limiter and a GET hedger.
+    """
+
+    rate_limiter: AsyncRateLimiter | None
+    singleflight: AsyncSingleFlight[Response] | None
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None
+    hedger: Hedger | None
+
+    @override
+    def stats_sources(self) -> dict[str, StatsSource | None]:
+        """Return the components exposing counters, keyed by their snapshot name."""
+        return {
+            **super().stats_sources(),
+            "concurrency_limiter": self.concurrency_limiter,
+            "hedger": self.hedger,
+        }
+
+    async def coalesced(
+        self, key: Hashable, operation: str, send: Callable[[], Awaitable[Response]]
+    ) -> Response:
+        """Await ``send`` through the coalescer, or alone when coalescing is disabled.
+
+        Only callers under the same deadline share a call, and each caller waits for it
+        no longer than its deadline allows.
+        """
+        if self.singleflight is None:
+            return await send()
+        with deadline_wait(operation) as timeout:
+            flight_key = (key, current_deadline())
+            response, shared = await self.singleflight.run(flight_key, send, timeout)
+        return response.copy() if shared else response
+
+    async def hedged(self, send: Callable[[], Awaitable[Response]]) -> Response:
+        """Await ``send`` through the hedger, or once when hedging is disabled."""
+        return await (self.hedger.run(send) if self.hedger else send())
+
+
+def build_components(settings: TransportSettings) -> ClientComponents:
+    """Build the components of the sync client configured by ``settings``."""
+    rate_limiter = None
+    if settings.rate_limited:
+        rate_limiter = RateLimiter(settings.rate_limit, settings.endpoint_rate_limits)
+    return ClientComponents(
+        rate_limiter=rate_limiter,
+        singleflight=SingleFlight() if settings.coalesce_requests else None,
+        **_shared_components(settings),
+    )
+
+
+def build_async_components(settings: TransportSettings) -> AsyncClientComponents:
+    """Build the components of the async client configured by ``settings``."""
+    rate_limiter = None
+    if settings.rate_limited:
+        rate_limiter = AsyncRateLimiter(settings.rate_limit, settings.endpoint_rate_limits)
+    concurrency_limiter = None
+    if settings.adaptive_concurrency:
+        concurrency_limiter = AdaptiveConcurrencyLimiter(settings.adaptive_concurrency)
+    return AsyncClientComponents(
+        rate_limiter=rate_limiter,
+        singleflight=AsyncSingleFlight() if settings.coalesce_requests else None,
+        concurrency_limiter=concurrency_limiter,
+        hedger=None if settings.hedging is None else Hedger(settings.hedging),
+        **_shared_components(settings),
+    )
+
+
+def _shared_components(settings: TransportSettings) -> dict[str, Any]:
+    metrics = ClientMetrics(settings.max_connections)
+    http_cache = None
+    if settings.http_cache is not None:
+        http_cache = HTTPCache(settings.http_cache, settings.codec, namespace=settings.url)
+    idempotency = None
+    if settings.idempotency_keys:
+        idempotency = IdempotencyKeys(settings.idempotency_journal, scope=settings.url)
+    return {
+        "metrics": metrics,
+        "hooks": RequestHooks([metrics] if settings.request_metrics else []),
+        "http_cache": http_cache,
+        "model_cache": None if settings.model_cache is None else ModelCache(settings.model_cache),
+        "retry_budget": (
+            None if settings.retry_budget is None else RetryBudgetLimiter(settings.retry_budget)
+        ),
+        "idempotency": idempotency,
+        "circuit_breaker": (
+            None if settings.circuit_breaker is None else CircuitBreaker(settings.circuit_breaker)
+        ),
+    }
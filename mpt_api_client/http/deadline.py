@@ -0,0 +1,115 @@
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from mpt_api_client.exceptions import MPTDeadlineExceededError
+
+_current_deadline: ContextVar["Deadline | None"] = ContextVar("mpt_deadline", default=None)
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point in time by which an operation must finish.
+
+    Attributes:
+        expires_at: Expiry, as a value of ``clock``.
+        clock: Monotonic clock the expiry refers to.
+    """
+
+    expires_at: float
+    clock: Callable[[], float] = field(default=time.monotonic, compare=False, repr=False)
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> "Deadline":
+        """Return the deadline ``seconds`` from now."""
+        return cls(clock() + seconds, clock)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, 0 once it has passed."""
+        return max(self.expires_at - self.clock(), 0)
+
+    def check(self, operation: str, needed: float = 0) -> None:
+        """Raise if ``operation`` cannot finish ``needed`` seconds from now.
+
+        Raises:
+            MPTDeadlineExceededError: If the deadline has passed or falls within ``needed``
+                seconds.
+        """
+        remaining = self.remaining()
+        if remaining <= needed:
+            raise MPTDeadlineExceededError(
+                f"Deadline exceeded: {operation} needs {needed:.3f}s, {remaining:.3f}s left."
+            )
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline of the running context, if any."""
+    return _current_deadline.get()
+
+
+def check_deadline(operation: str, needed: float = 0) -> None:
+    """Raise if the deadline of the running context does not leave ``needed`` seconds.
+
+    Raises:
+        MPTDeadlineExceededError: If the deadline has passed or falls within ``needed``
+            seconds.
+    """
+    active_deadline = _current_deadline.get()
+    if active_deadline is not None:
+        active_deadline.check(operation, needed)
+
+
+@contextmanager
+def deadline_wait(operation: str) -> Generator[float | None]:
+    """Bound a wait inside the block to the deadline of the running context.
+
+    Args:
+        operation: Operation waited for, named in the error.
+
+    Yields:
+        Seconds left before the deadline, the timeout of the wait; None without a deadline.
+
+    Raises:
+        MPTDeadlineExceededError: If the wait raises ``TimeoutError`` under a deadline.
+    """
+    active_deadline = _current_deadline.get()
+    try:
+        yield None if active_deadline is None else active_deadline.remaining()
+    except TimeoutError as error:
+        if active_deadline is None:
+            raise
+        raise MPTDeadlineExceededError(
+            f"Deadline exceeded: {operation} did not finish in time."
+        ) from error
+
+
+@contextmanager
+def deadline(seconds: float, clock: Callable[[], float] = time.monotonic) -> Generator[Deadline]:
+    """Bound every client call made inside the block to ``seconds`` in total.
+
+    Works for the sync and the async client alike: the deadline follows the running
+    thread or task, including tasks created inside the block. Nested deadlines can only
+    shorten the budget.
+
+    Args:
+        seconds: Time budget of the block.
+        clock: Monotonic clock used to measure the budget.
+
+    Yields:
+        The deadline in force inside the block.
+
+    Examples:
+        >>> with deadline(2.5):  # doctest: +SKIP
+        ...     orders = list(client.commerce.orders.iterate())
+    """
+    block_deadline = Deadline.after(seconds, clock)
+    outer_deadline = _current_deadline.get()
+    if outer_deadline is not None and outer_deadline.remaining() < block_deadline.remaining():
+        block_deadline = outer_deadline
+    token = _current_deadline.set(block_deadline)
+    try:
+        yield block_deadline
+    finally:
+        _current_deadline.reset(token)
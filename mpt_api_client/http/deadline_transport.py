@@ -0,0 +1,149 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import cast, override
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    BaseTransport,
+    Request,
+    Response,
+    SyncByteStream,
+    TimeoutException,
+)
+
+from mpt_api_client.http.deadline import Deadline, current_deadline
+
+TIMEOUT_PHASES = ("connect", "read", "write", "pool")
+DEADLINE_CLAMPED_EXTENSION = "deadline_clamped"
+
+
+def clamp_timeouts(request: Request, remaining: float) -> None:
+    """Lower every phase timeout of ``request`` to ``remaining`` seconds.
+
+    A request with a phase timeout lowered is flagged in its extensions, so that its
+    timeouts are not mistaken for a slow endpoint.
+    """
+    timeouts = dict(request.extensions.get("timeout", {}))
+    for phase in TIMEOUT_PHASES:
+        phase_timeout = timeouts.get(phase)
+        if phase_timeout is None or phase_timeout > remaining:
+            timeouts[phase] = remaining
+            request.extensions[DEADLINE_CLAMPED_EXTENSION] = True
+    request.extensions["timeout"] = timeouts
+
+
+def is_deadline_timeout(request: Request, error: Exception) -> bool:
+    """Return whether ``error`` is a timeout of a phase the deadline lowered."""
+    return isinstance(error, TimeoutException) and bool(
+        request.extensions.get(DEADLINE_CLAMPED_EXTENSION)
+    )
+
+
+def _operation(request: Request) -> str:
+    method = request.method
+    path = request.url.path
+    return f"{method} {path}"
+
+
+class _DeadlineStream(SyncByteStream):
+    def __init__(self, stream: SyncByteStream, deadline: Deadline, operation: str) -> None:
+        self._stream = stream
+        self._deadline = deadline
+        self._operation = operation
+
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._deadline.check(self._operation)
+            yield chunk
+
+    @override
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncDeadlineStream(AsyncByteStream):
+    def __init__(self, stream: AsyncByteStream, deadline: Deadline, operation: str) -> None:
+        self._stream = stream
+        self._deadline = deadline
+        self._operation = operation
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._deadline.check(self._operation)
+            yield chunk
+
+    @override
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class DeadlineTransport(BaseTransport):
+    """Sync transport holding every attempt to the deadline of the running context.
+
+    An attempt is refused once the deadline has passed, its phase timeouts are lowered to
+    the time left and reading its body stops when the deadline passes.
+    """
+
+    def __init__(self, transport: BaseTransport) -> None:
+        self._transport = transport
+
+    @override
+    def handle_request(self, request: Request) -> Response:
+        active_deadline = current_deadline()
+        if active_deadline is None:
+            return self._transport.handle_request(request)
+        operation = _operation(request)
+        active_deadline.check(operation)
+        clamp_timeouts(request, active_deadline.remaining())
+        try:
+            response = self._transport.handle_request(request)
+        except TimeoutException:
+            active_deadline.check(operation)
+            raise
+        if not response.is_closed:
+            response.stream = _DeadlineStream(
+                cast("SyncByteStream", response.stream), active_deadline, operation
+            )
+        return response
+
+    @override
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncDeadlineTransport(AsyncBaseTransport):
+    """Async transport holding every attempt to the deadline of the running context.
+
+    On top of what the sync transport does, an attempt still waiting for its response
+    headers when the deadline passes is cancelled.
+    """
+
+    def __init__(self, transport: AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        active_deadline = current_deadline()
+        if active_deadline is None:
+            return await self._transport.handle_async_request(request)
+        operation = _operation(request)
+        active_deadline.check(operation)
+        clamp_timeouts(request, active_deadline.remaining())
+        try:
+            async with asyncio.timeout(active_deadline.remaining()):
+                response = await self._transport.handle_async_request(request)
+        except (TimeoutError, TimeoutException):
+            active_deadline.check(operation)
+            raise
+        if not response.is_closed:
+            response.stream = _AsyncDeadlineStream(
+                cast("AsyncByteStream", response.stream), active_deadline, operation
+            )
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
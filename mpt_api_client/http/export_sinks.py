@@ -0,0 +1,54 @@
+import shutil
+from collections.abc import Iterable
+from os import PathLike
+from pathlib import Path
+
+from mpt_api_client.json_codec import JSONCodec, default_json_codec
+from mpt_api_client.models import Model as BaseModel
+
+
+class JSONLExportSink:
+    """Writes a partitioned export to one JSON Lines file.
+
+    Each worker writes its partition to a part file next to ``path``; ``merge`` then
+    concatenates the parts in partition order, without decoding them again, and
+    replaces ``path`` in one rename.
+
+    Args:
+        path: Output file.
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self.path = Path(path)
+        self._staging = Path(f"{path}.tmp")
+
+    def part_path(self, index: int) -> Path:
+        """Return the part file of partition ``index``."""
+        return Path(f"{self.path}.part{index}")
+
+    def write_partition(
+        self, index: int, resources: Iterable[BaseModel], json_codec: JSONCodec | None = None
+    ) -> None:
+        """Write the resources of partition ``index``, one JSON object per line.
+
+        Args:
+            index: Position of the partition.
+            resources: Resources of the partition.
+            json_codec: Codec encoding the resources, the codec of the worker client in a
+                partitioned export. Defaults to the standard library ``json``.
+        """
+        json_codec = json_codec or default_json_codec()
+        with self.part_path(index).open("wb") as part:
+            for resource in resources:
+                part.write(json_codec.dumps(resource.to_dict()))
+                part.write(b"\n")
+
+    def merge(self, indexes: list[int]) -> None:
+        """Concatenate the parts of ``indexes`` into ``path`` and delete them."""
+        with self._staging.open("wb") as output:
+            for index in indexes:
+                with self.part_path(index).open("rb") as part:
+                    shutil.copyfileobj(part, output)
+        self._staging.replace(self.path)
+        for index in indexes:
+            self.part_path(index).unlink()
@@ -0,0 +1,157 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """Policy for hedging slow GET requests of the async client.
+
+    A GET still running after the hedge delay is sent a second time; whichever response
+    arrives first is used and the other request is cancelled.
+
+    Attributes:
+        percentile: Percentile of recent GET latencies used as the hedge delay.
+        initial_delay: Hedge delay in seconds until ``min_samples`` latencies are known.
+        min_delay: Lower bound of the hedge delay in seconds.
+        max_hedge_ratio: Fraction of requests that may be hedged. Every request earns
+            this many hedge tokens and every hedge spends one.
+        max_hedge_burst: Maximum number of hedge tokens saved up during quiet periods.
+        window: Number of recent latencies the percentile is computed from.
+        min_samples: Number of latencies needed before the percentile replaces
+            ``initial_delay``.
+    """
+
+    percentile: float = 95
+    initial_delay: float = 1
+    min_delay: float = 0.01
+    max_hedge_ratio: float = 0.1
+    max_hedge_burst: int = 10
+    window: int = 1000
+    min_samples: int = 20
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If a percentile, ratio, delay or size is out of range.
+        """
+        if not 0 < self.percentile < 100:
+            raise ValueError("Hedging percentile must be between 0 and 100.")
+        if not 0 < self.max_hedge_ratio <= 1:
+            raise ValueError("Hedging max_hedge_ratio must be in (0, 1].")
+        if (
+            min(self.initial_delay, self.min_delay) < 0
+            or min(self.max_hedge_burst, self.window, self.min_samples) < 1
+        ):
+            raise ValueError(
+                "Hedging delays must not be negative; burst, window and min_samples must be "
+                "at least 1."
+            )
+
+
+@dataclass
+class HedgeStats:
+    """Counters of a hedger.
+
+    Attributes:
+        requests: Requests sent through the hedger.
+        hedges: Hedge requests sent.
+        wins: Hedge requests that answered before the original request.
+        throttled: Slow requests not hedged because the hedge budget was exhausted.
+    """
+
+    requests: int = 0
+    hedges: int = 0
+    wins: int = 0
+    throttled: int = 0
+
+
+class Hedger:
+    """Sends a second copy of slow idempotent requests and keeps the first answer.
+
+    Shared by every task on the event loop.
+    """
+
+    def __init__(self, policy: HedgingPolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        self.policy = policy
+        self.stats = HedgeStats()
+        self._clock = clock
+        self._latencies: deque[float] = deque(maxlen=policy.window)
+        self._budget: float = 0
+
+    @property
+    def delay(self) -> float:
+        """Seconds a request may run before it is hedged."""
+        if len(self._latencies) < self.policy.min_samples:
+            return max(self.policy.initial_delay, self.policy.min_delay)
+        return max(_percentile(self._latencies, self.policy.percentile), self.policy.min_delay)
+
+    async def run[Result](self, call: Callable[[], Awaitable[Result]]) -> Result:
+        """Run ``call``, hedging it with a second call if it is slower than ``delay``.
+
+        Returns:
+            The result of the first call to succeed.
+
+        Raises:
+            Exception: The error of the original call when every call fails.
+        """
+        self.stats.requests += 1
+        self._budget = min(
+            self._budget + self.policy.max_hedge_ratio, float(self.policy.max_hedge_burst)
+        )
+        started_at = self._clock()
+        tasks: list[asyncio.Future[Result]] = [asyncio.ensure_future(call())]
+        try:
+            winner = await self._race(tasks, call)
+        except BaseException:
+            _cancel(tasks)
+            raise
+        _cancel(tasks)
+        hedged_result = winner.result()
+        self._latencies.append(self._clock() - started_at)
+        if winner is not tasks[0]:
+            self.stats.wins += 1
+        return hedged_result
+
+    async def _race[Result](
+        self,
+        tasks: list[asyncio.Future[Result]],
+        call: Callable[[], Awaitable[Result]],
+    ) -> asyncio.Future[Result]:
+        done, _ = await asyncio.wait(tasks, timeout=self.delay)
+        if not done:
+            self._hedge(tasks, call)
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task
+        return tasks[0]
+
+    def _hedge[Result](
+        self,
+        tasks: list[asyncio.Future[Result]],
+        call: Callable[[], Awaitable[Result]],
+    ) -> None:
+        if self._budget < 1:
+            self.stats.throttled += 1
+            return
+        self._budget -= 1
+        self.stats.hedges += 1
+        tasks.append(asyncio.ensure_future(call()))
+
+
+def _percentile(latencies: Collection[float], percentile: float) -> float:
+    ordered = sorted(latencies)
+    index = int(len(ordered) * percentile / 100)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def _cancel(tasks: Iterable[asyncio.Future[Any]]) -> None:
+    for task in tasks:
+        task.cancel()
@@ -0,0 +1,260 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, cast, override
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    BaseTransport,
+    Request,
+    Response,
+    SyncByteStream,
+)
+
+from mpt_api_client.http.hooks import RequestEvent, RequestHooks, get_trace_id, template_path
+
+ATTEMPT_EXTENSION = "mpt_attempt"
+
+_PHASES = (
+    ("connect", "connect_tcp.started", "connect_tcp.complete"),
+    ("tls", "start_tls.started", "start_tls.complete"),
+    ("send", "send_request_headers.started", "send_request_body.complete"),
+    ("server", "send_request_body.complete", "receive_response_headers.complete"),
+)
+
+
+class PhaseTimer:
+    """Turns the httpcore ``trace`` extension events of one attempt into phase durations."""
+
+    def __init__(self, clock: Callable[[], float]) -> None:
+        self._clock = clock
+        self._started_at = clock()
+        self._headers_at: float | None = None
+        self._marks: dict[str, float] = {}
+
+    def record(self, event_name: str, trace_info: dict[str, Any]) -> None:
+        """Record an httpcore trace event such as ``connection.connect_tcp.started``."""
+        _, _, phase_event = event_name.partition(".")
+        self._marks.setdefault(phase_event, self._clock())
+
+    async def arecord(self, event_name: str, trace_info: dict[str, Any]) -> None:
+        """Async variant of ``record`` for async transports."""
+        self.record(event_name, trace_info)
+
+    def headers_received(self, timings: dict[str, float]) -> None:
+        """Add the phases up to the response headers to ``timings``."""
+        self._headers_at = self._clock()
+        marks = self._marks
+        first_mark = marks.get("connect_tcp.started", marks.get("send_request_headers.started"))
+        if first_mark is not None:
+            timings["pool_wait"] = first_mark - self._started_at
+        for phase, start_event, end_event in _PHASES:
+            if start_event in marks and end_event in marks:
+                timings[phase] = marks[end_event] - marks[start_event]
+        timings["headers"] = self._headers_at - self._started_at
+
+    def body_complete(self, timings: dict[str, float]) -> None:
+        """Add the download and total durations to ``timings``."""
+        now = self._clock()
+        if self._headers_at is not None:
+            timings["download"] = now - self._headers_at
+        timings["total"] = now - self._started_at
+
+
+class _HookTransportBase:
+    """Event bookkeeping shared by the sync and async hook transports."""
+
+    _hooks: RequestHooks
+    _clock: Callable[[], float]
+
+    def _start(self, request: Request) -> tuple[RequestEvent, PhaseTimer]:
+        attempt = request.extensions.get(ATTEMPT_EXTENSION, 0) + 1
+        request.extensions[ATTEMPT_EXTENSION] = attempt
+        event = RequestEvent(
+            method=request.method,
+            path=request.url.path,
+            path_template=template_path(request.url.path),
+            attempt=attempt,
+            bytes_sent=int(request.headers.get("Content-Length", 0)),
+        )
+        timer = PhaseTimer(self._clock)
+        self._hooks.request_start(event)
+        return event, timer
+
+    def _headers(self, event: RequestEvent, timer: PhaseTimer, response: Response) -> None:
+        event.status_code = response.status_code
+        event.trace_id = get_trace_id(response.headers)
+        timer.headers_received(event.timings)
+        self._hooks.response_headers(event)
+
+    def _complete(self, event: RequestEvent, timer: PhaseTimer) -> None:
+        timer.body_complete(event.timings)
+        self._hooks.body_complete(event)
+
+    def _fail(self, event: RequestEvent, timer: PhaseTimer, error: BaseException) -> None:
+        event.error = error
+        timer.body_complete(event.timings)
+        self._hooks.error(event)
+
+    def _outcome(self, event: RequestEvent, timer: PhaseTimer) -> "_AttemptOutcome":
+        return _AttemptOutcome(
+            lambda: self._complete(event, timer),
+            lambda error: self._fail(event, timer, error),
+        )
+
+
+class _AttemptOutcome:
+    """Reports the end of a streamed attempt once, as a completion or a failure."""
+
+    def __init__(
+        self,
+        complete: Callable[[], None],
+        fail: Callable[[BaseException], None],
+    ) -> None:
+        self._complete = complete
+        self._fail = fail
+        self._reported = False
+
+    def complete(self) -> None:
+        if not self._reported:
+            self._reported = True
+            self._complete()
+
+    def fail(self, error: BaseException) -> None:
+        if not self._reported:
+            self._reported = True
+            self._fail(error)
+
+
+class _HookedStream(SyncByteStream):
+    def __init__(
+        self, stream: SyncByteStream, event: RequestEvent, outcome: _AttemptOutcome
+    ) -> None:
+        self._stream = stream
+        self._event = event
+        self._outcome = outcome
+
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._stream:
+                self._event.bytes_received += len(chunk)
+                yield chunk
+        except Exception as error:
+            self._outcome.fail(error)
+            raise
+
+    @override
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._outcome.complete()
+
+
+class _AsyncHookedStream(AsyncByteStream):
+    def __init__(
+        self, stream: AsyncByteStream, event: RequestEvent, outcome: _AttemptOutcome
+    ) -> None:
+        self._stream = stream
+        self._event = event
+        self._outcome = outcome
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                self._event.bytes_received += len(chunk)
+                yield chunk
+        except (Exception, asyncio.CancelledError) as error:
+            self._outcome.fail(error)
+            raise
+
+    @override
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._outcome.complete()
+
+
+class HookTransport(_HookTransportBase, BaseTransport):
+    """Sync transport notifying request hooks of every attempt it sends.
+
+    Placed beneath the retry transport, so each retry is reported as its own attempt.
+    """
+
+    def __init__(
+        self,
+        transport: BaseTransport,
+        hooks: RequestHooks,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._transport = transport
+        self._hooks = hooks
+        self._clock = clock
+
+    @override
+    def handle_request(self, request: Request) -> Response:
+        if not self._hooks:
+            return self._transport.handle_request(request)
+        event, timer = self._start(request)
+        request.extensions["trace"] = timer.record
+        try:
+            response = self._transport.handle_request(request)
+        except Exception as error:
+            self._fail(event, timer, error)
+            raise
+        self._headers(event, timer, response)
+        if response.is_closed:
+            event.bytes_received = len(response.content)
+            self._complete(event, timer)
+            return response
+        response.stream = _HookedStream(
+            cast("SyncByteStream", response.stream), event, self._outcome(event, timer)
+        )
+        return response
+
+    @override
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncHookTransport(_HookTransportBase, AsyncBaseTransport):
+    """Async transport notifying request hooks of every attempt it sends."""
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        hooks: RequestHooks,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._transport = transport
+        self._hooks = hooks
+        self._clock = clock
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        if not self._hooks:
+            return await self._transport.handle_async_request(request)
+        event, timer = self._start(request)
+        request.extensions["trace"] = timer.arecord
+        try:
+            response = await self._transport.handle_async_request(request)
+        except (Exception, asyncio.CancelledError) as error:
+            self._fail(event, timer, error)
+            raise
+        self._headers(event, timer, response)
+        if response.is_closed:
+            event.bytes_received = len(response.content)
+            self._complete(event, timer)
+            return response
+        response.stream = _AsyncHookedStream(
+            cast("AsyncByteStream", response.stream), event, self._outcome(event, timer)
+        )
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,152 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from httpx import Headers
+
+TRACE_ID_HEADERS = ("x-trace-id", "traceparent")
+TRACEPARENT_PARTS = 4
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[A-Z]{2,}-\d[\dA-Z-]*|\d+|[\da-fA-F]{8}(?:-[\da-fA-F]{4}){3}-[\da-fA-F]{12})$"
+)
+
+
+def template_path(path: str) -> str:
+    """Replace resource id segments of ``path`` with ``{id}``.
+
+    Examples:
+        >>> template_path("/public/v1/commerce/orders/ORD-1234-5678/lines")
+        '/public/v1/commerce/orders/{id}/lines'
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+def endpoint_template(path: str) -> str:
+    """Return the service endpoint template of ``path``: its template without a trailing id.
+
+    Examples:
+        >>> endpoint_template("/public/v1/commerce/orders/ORD-1234-5678")
+        '/public/v1/commerce/orders'
+        >>> endpoint_template("/public/v1/commerce/orders/ORD-1234-5678/subscriptions")
+        '/public/v1/commerce/orders/{id}/subscriptions'
+    """
+    return template_path(path).removesuffix("/{id}")
+
+
+def get_trace_id(headers: Headers) -> str | None:
+    """Return the trace id from ``X-Trace-Id`` or the W3C ``traceparent`` response header."""
+    for header_name in TRACE_ID_HEADERS:
+        header_value: str | None = headers.get(header_name)
+        if not header_value:
+            continue
+        parts = header_value.split("-")
+        if header_name == "traceparent" and len(parts) == TRACEPARENT_PARTS:
+            return parts[1]
+        return header_value
+    return None
+
+
+@dataclass
+class RequestEvent:
+    """State of one request attempt, passed to every hook call of that attempt.
+
+    The same object is updated as the attempt progresses, so a hook can keep it from
+    ``on_request_start`` until ``on_body_complete`` or ``on_error``, for example as the
+    handle of a tracing span.
+
+    Attributes:
+        method: HTTP method.
+        path: Request path.
+        path_template: ``path`` with resource ids replaced by ``{id}``, suitable as a
+            low-cardinality span or metric name.
+        attempt: Attempt number, starting at 1; higher numbers are retries.
+        status_code: Response status, once the headers are received.
+        bytes_sent: Request body size.
+        bytes_received: Response body bytes received so far, as sent on the wire.
+        trace_id: Trace id reported by the API in the response headers.
+        timings: Phase durations in seconds, filled in as they complete:
+            ``pool_wait`` (waiting for a pooled connection), ``connect`` (DNS and TCP),
+            ``tls``, ``send``, ``server`` (request sent until response headers),
+            ``headers`` (attempt start until response headers), ``download`` and
+            ``total``. Phases that did not happen, such as ``connect`` on a reused
+            connection, are absent.
+        error: Exception that ended the attempt, if any.
+    """
+
+    method: str
+    path: str
+    path_template: str
+    attempt: int
+    status_code: int | None = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    trace_id: str | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    error: BaseException | None = None
+
+
+class RequestHook:
+    """Receiver of request lifecycle events; override the methods you need.
+
+    Hooks run synchronously on the request path, for the sync and the async client alike,
+    so they must return quickly. Exceptions raised by a hook propagate to the caller.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before the first attempt of a request is sent."""
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Called before each retry attempt is sent."""
+
+    def on_response_headers(self, event: RequestEvent) -> None:
+        """Called when the response status and headers are received."""
+
+    def on_body_complete(self, event: RequestEvent) -> None:
+        """Called when the response body has been read or the response closed."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when an attempt fails with a transport error."""
+
+
+class RequestHooks:  # noqa: WPS214 - one dispatch method per hook phase
+    """Hooks registered on a client, notified in registration order."""
+
+    def __init__(self, hooks: Iterable[RequestHook] = ()) -> None:
+        self._hooks = list(hooks)
+
+    def __len__(self) -> int:
+        return len(self._hooks)
+
+    def register(self, hook: RequestHook) -> None:
+        """Add ``hook``."""
+        self._hooks.append(hook)
+
+    def unregister(self, hook: RequestHook) -> None:
+        """Remove ``hook``."""
+        self._hooks.remove(hook)
+
+    def request_start(self, event: RequestEvent) -> None:
+        """Notify an attempt start, as ``on_request_start`` or ``on_retry``."""
+        for hook in tuple(self._hooks):
+            if event.attempt == 1:
+                hook.on_request_start(event)
+            else:
+                hook.on_retry(event)
+
+    def response_headers(self, event: RequestEvent) -> None:
+        """Notify received response headers."""
+        for hook in tuple(self._hooks):
+            hook.on_response_headers(event)
+
+    def body_complete(self, event: RequestEvent) -> None:
+        """Notify a completed response body."""
+        for hook in tuple(self._hooks):
+            hook.on_body_complete(event)
+
+    def error(self, event: RequestEvent) -> None:
+        """Notify a failed attempt."""
+        for hook in tuple(self._hooks):
+            hook.on_error(event)
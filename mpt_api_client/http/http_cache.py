@@ -0,0 +1,155 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Protocol, runtime_checkable
+
+from httpx import Headers, codes
+
+from mpt_api_client.http.request_response_utils import RequestKey
+from mpt_api_client.http.types import HeaderTypes, Response
+from mpt_api_client.json_codec import JSONCodec
+
+KEY_SEPARATOR = "\x1f"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Response stored by an HTTP cache backend together with its validators.
+
+    Attributes:
+        status_code: HTTP status code of the stored response.
+        headers: Response headers.
+        content: Raw response body.
+        etag: ``ETag`` validator sent back as ``If-None-Match``.
+        last_modified: ``Last-Modified`` validator sent back as ``If-Modified-Since``.
+        response: Response kept by in-memory backends. Every hit gets its own
+            ``Response.copy()``, which shares the decoded JSON, so a revalidated hit
+            neither copies nor decodes the body again. Persistent backends leave it unset.
+    """
+
+    status_code: int
+    headers: HeaderTypes
+    content: bytes  # noqa: WPS110
+    etag: str | None = None
+    last_modified: str | None = None
+    response: Response | None = field(default=None, compare=False, repr=False)
+
+    def to_response(self, json_codec: JSONCodec) -> Response:
+        """Return a new response with the stored status, headers and body."""
+        if self.response is not None:
+            return self.response.copy()
+        return Response(
+            headers=dict(self.headers),
+            status_code=self.status_code,
+            content=self.content,
+            json_codec=json_codec,
+        )
+
+
+@runtime_checkable
+class HTTPCacheBackend(Protocol):
+    """Storage for cached responses, keyed by an opaque string."""
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the response stored under ``key``, or None."""
+
+    def set(self, key: str, cached: CachedResponse) -> None:
+        """Store ``cached`` under ``key``, replacing any previous entry."""
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``, if any."""
+
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+@dataclass
+class HTTPCacheStats:
+    """Counters of an HTTP cache.
+
+    Attributes:
+        hits: Revalidations answered with ``304 Not Modified`` and served from the cache.
+        misses: Cacheable requests sent without a cached response to revalidate.
+        revalidations: Conditional requests sent for a cached response.
+        stores: Responses written to the backend.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    stores: int = 0
+
+
+class HTTPCache:
+    """Conditional-request cache for GET responses.
+
+    A cached response is never served without asking the server: every request for it
+    carries ``If-None-Match`` and ``If-Modified-Since``, and a ``304 Not Modified`` reply
+    returns the stored response without transferring or decoding the body again. Only
+    ``200`` responses with an ``ETag`` or ``Last-Modified`` validator and without
+    ``Cache-Control: no-store`` are stored.
+    """
+
+    def __init__(
+        self, backend: HTTPCacheBackend, json_codec: JSONCodec, namespace: str = ""
+    ) -> None:
+        self.backend = backend
+        self.stats = HTTPCacheStats()
+        self._json_codec = json_codec
+        self._namespace = namespace
+        self._lock = threading.Lock()
+
+    def lookup(self, request_key: RequestKey) -> tuple[str, CachedResponse | None]:
+        """Return the backend key for ``request_key`` and the response stored under it."""
+        key = KEY_SEPARATOR.join((self._namespace, *request_key))
+        cached = self.backend.get(key)
+        self._count("revalidations" if cached else "misses")
+        return key, cached
+
+    def conditional_headers(
+        self, cached: CachedResponse | None, headers: HeaderTypes | None
+    ) -> HeaderTypes:
+        """Return ``headers`` extended with the validators of ``cached``."""
+        conditional = dict(headers or {})
+        if cached and cached.etag:
+            conditional["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            conditional["If-Modified-Since"] = cached.last_modified
+        return conditional
+
+    def resolve(self, key: str, cached: CachedResponse | None, response: Response) -> Response:
+        """Serve a ``304`` from ``cached`` and store a fresh cacheable response."""
+        if response.status_code == codes.NOT_MODIFIED and cached:
+            self._count("hits")
+            return cached.to_response(self._json_codec)
+        if response.status_code == codes.OK:
+            self._store(key, response)
+        return response
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.backend.clear()
+
+    def _store(self, key: str, response: Response) -> None:
+        headers = Headers(response.headers)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        no_store = "no-store" in headers.get("cache-control", "").lower()
+        if no_store or not (etag or last_modified):
+            self.backend.delete(key)
+            return
+        self.backend.set(
+            key,
+            CachedResponse(
+                status_code=response.status_code,
+                headers=response.headers,
+                content=response.content,
+                etag=etag,
+                last_modified=last_modified,
+                response=response,
+            ),
+        )
+        self._count("stores")
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
@@ -0,0 +1,126 @@
+from collections import UserDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from mpt_api_client.http.bulk import BulkResult
+from mpt_api_client.models import Model as BaseModel
+from mpt_api_client.models import ModelCollection
+from mpt_api_client.rql import RQLQuery
+from mpt_api_client.rql.query_builder import query_value_str
+
+if TYPE_CHECKING:
+    from mpt_api_client.http.mixins.queryable_mixin import QueryableMixin
+
+DEFAULT_MAX_URL_LENGTH = 4000
+DEFAULT_LOOKUP_CHUNK_SIZE = 100
+
+type IdChunks = list[list[str]]
+
+
+class ResourceMap[Model: BaseModel](UserDict[str, Model]):
+    """Resources found by ``get_many``, keyed by id in the order the ids were requested.
+
+    Attributes:
+        missing: Requested ids without a matching resource, in the order they were requested.
+    """
+
+    def __init__(self, resources: Iterable[tuple[str, Model]], missing: list[str]) -> None:
+        super().__init__(resources)
+        self.missing = missing
+
+
+def id_filter(ids: list[str]) -> RQLQuery:
+    """Return the ``in(id,(...))`` filter matching ``ids``."""
+    return RQLQuery(id__in=ids)
+
+
+def encoded_length(path: str) -> int:
+    """Return the length of ``path`` once percent-encoded into a request target."""
+    return len(httpx.URL(path).raw_path)
+
+
+def chunk_ids(
+    ids: Iterable[str], *, overhead: int, max_url_length: int, chunk_size: int
+) -> IdChunks:
+    """Split unique ``ids`` into chunks whose ``in()`` filter keeps the URL under a limit.
+
+    Args:
+        ids: Requested ids; duplicates are dropped.
+        overhead: Encoded length of the request target with an empty ``in(id,())`` filter.
+        max_url_length: Maximum encoded length of the request target.
+        chunk_size: Maximum number of ids per chunk.
+
+    Returns:
+        The chunks, in the order of the ids.
+
+    Raises:
+        ValueError: If ``chunk_size`` is below 1 or an id alone exceeds ``max_url_length``.
+    """
+    if chunk_size < 1:
+        raise ValueError("Lookup chunk_size must be at least 1.")
+    chunks: IdChunks = []
+    length = overhead
+    for resource_id in dict.fromkeys(ids):
+        id_length = encoded_length(f"?{query_value_str(resource_id)},") - len("/?")
+        if overhead + id_length > max_url_length:
+            raise ValueError(f"Id {resource_id!r} does not fit in a URL of {max_url_length}.")
+        chunk_full = bool(chunks) and len(chunks[-1]) >= chunk_size
+        if not chunks or chunk_full or length + id_length > max_url_length:
+            chunks.append([])
+            length = overhead
+        chunks[-1].append(resource_id)
+        length += id_length
+    return chunks
+
+
+def select_fields(select: list[str] | str | None) -> list[str]:
+    """Return the fields of a ``select`` argument given as a list or a comma-separated string."""
+    if isinstance(select, str):
+        return [field for field in select.split(",") if field]
+    return list(select or [])
+
+
+def resource_map[Model: BaseModel](
+    requested: list[str], outcome: BulkResult[ModelCollection[Model]]
+) -> ResourceMap[Model]:
+    """Key the resources of the fetched chunks by id, in the order of ``requested``.
+
+    Raises:
+        Exception: The error of the first chunk that failed.
+    """
+    if outcome.errors:
+        raise outcome.errors[0].error
+    found: dict[Any, Model] = {
+        resource.id: resource for page in outcome.results if page for resource in page
+    }
+    return ResourceMap(
+        ((resource_id, found[resource_id]) for resource_id in requested if resource_id in found),
+        missing=[resource_id for resource_id in requested if resource_id not in found],
+    )
+
+
+def plan_lookup[Service: "QueryableMixin"](
+    service: Service,
+    requested: list[str],
+    select: list[str] | str | None,
+    max_url_length: int,
+    chunk_size: int,
+) -> tuple[Service, IdChunks]:
+    """Return the service to query, with ``select`` applied, and the id chunks to fetch.
+
+    The URL overhead of the chunks is measured on the service path with its query.
+    """
+    fields = select_fields(select)
+    lookup = service.select(*fields) if fields else service
+    empty_path = lookup.filter(id_filter([])).build_path(  # type: ignore[attr-defined]
+        {"limit": chunk_size, "offset": 0}
+    )
+    chunks = chunk_ids(
+        requested,
+        overhead=encoded_length(empty_path),
+        max_url_length=max_url_length,
+        chunk_size=chunk_size,
+    )
+    return lookup, chunks
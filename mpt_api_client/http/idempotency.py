@@ -0,0 +1,175 @@
+import hashlib
+import threading
+import uuid
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, replace
+from typing import Protocol
+
+from httpx import codes
+
+from mpt_api_client.exceptions import MPTHttpError
+from mpt_api_client.http.retry_transport import IDEMPOTENCY_KEY_HEADER
+from mpt_api_client.http.types import HeaderTypes
+
+
+class IdempotencyJournal(Protocol):
+    """Storage of the idempotency keys of calls not known to have reached a final outcome.
+
+    Each entry holds the key of a call in flight, or of a failed call that the next call
+    with the same fingerprint replays.
+    """
+
+    def reserve(self, fingerprint: str, key: str) -> str:
+        """Return the key to send: the claimed key of a failed call, or ``key``."""
+
+    def complete(self, fingerprint: str, key: str) -> None:
+        """Forget the entry of ``fingerprint`` if it holds ``key``."""
+
+    def fail(self, fingerprint: str, key: str) -> None:
+        """Record that the call sending ``key`` ended without a final outcome."""
+
+
+@dataclass(frozen=True)
+class IdempotencyStats:
+    """Counters of the idempotency keys of a client.
+
+    Attributes:
+        generated: Keys generated for POST requests.
+        replayed: Pending keys reused from the journal for a call repeated after a failure.
+        completed: Journal entries removed because their call reached a final outcome.
+    """
+
+    generated: int = 0
+    replayed: int = 0
+    completed: int = 0
+
+
+def new_idempotency_key() -> str:
+    """Return a random idempotency key."""
+    return str(uuid.uuid4())
+
+
+class IdempotencyKeys:
+    """Attaches an ``Idempotency-Key`` header to the POST requests of a client.
+
+    The header is set once per logical call, so every retry of the call carries the same
+    key and the server can tell a retry from a second request. With a journal, a call that
+    ended without a final outcome (transport error, exhausted retries or a 5xx response)
+    keeps its key: the same call repeated later, from this process or a restarted one,
+    sends the same key again. A 2xx or 4xx response completes the call and frees its key.
+    Identical calls made while one is in flight get keys of their own, since they are
+    distinct requests rather than retries.
+
+    Args:
+        journal: Optional journal of pending keys, such as ``MemoryIdempotencyJournal()``
+            or ``SQLiteIdempotencyJournal("idempotency.db")``.
+        scope: Prefix of every call fingerprint, normally the base URL, so that a journal
+            shared between environments keeps their calls apart.
+        key_factory: Callable returning a new key.
+    """
+
+    def __init__(
+        self,
+        journal: IdempotencyJournal | None = None,
+        *,
+        scope: str = "",
+        key_factory: Callable[[], str] = new_idempotency_key,
+    ) -> None:
+        self.journal = journal
+        self._scope = scope
+        self._key_factory = key_factory
+        self._stats = IdempotencyStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> IdempotencyStats:
+        """Current counters."""
+        return self._stats
+
+    @contextmanager
+    def attach(
+        self, method: str, target: str, body: bytes | None, headers: HeaderTypes | None
+    ) -> Generator[HeaderTypes | None]:
+        """Add the idempotency key of a call to its headers for the duration of the call.
+
+        Requests other than POST and requests already carrying an ``Idempotency-Key``
+        header are left untouched.
+
+        Args:
+            method: HTTP method.
+            target: Request URL with its encoded query string.
+            body: Request body, ``b""`` for none; None for a body that cannot be
+                fingerprinted, such as a multipart upload, which is never journaled.
+            headers: Request headers.
+
+        Yields:
+            The request headers to send.
+        """
+        if method.upper() != "POST" or _has_idempotency_key(headers):
+            yield headers
+            return
+        fingerprint = None
+        if self.journal is not None and body is not None:
+            fingerprint = self._fingerprint(method, target, body)
+        key = self._reserve(fingerprint)
+        completed = False
+        try:
+            yield {**(headers or {}), IDEMPOTENCY_KEY_HEADER: key}
+        except MPTHttpError as error:
+            completed = error.status_code < codes.INTERNAL_SERVER_ERROR
+            raise
+        else:
+            completed = True
+        finally:
+            self._settle(fingerprint, key, completed=completed)
+
+    def _fingerprint(self, method: str, target: str, body: bytes) -> str:
+        digest = hashlib.sha256()
+        for part in (self._scope, method.upper(), target):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _reserve(self, fingerprint: str | None) -> str:
+        key = self._key_factory()
+        if self.journal is not None and fingerprint is not None:
+            pending_key = self.journal.reserve(fingerprint, key)
+            if pending_key != key:
+                self._increment("replayed")
+                return pending_key
+        self._increment("generated")
+        return key
+
+    def _settle(self, fingerprint: str | None, key: str, *, completed: bool) -> None:
+        if self.journal is None or fingerprint is None:
+            return
+        if completed:
+            self.journal.complete(fingerprint, key)
+            self._increment("completed")
+        else:
+            self.journal.fail(fingerprint, key)
+
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            counted = getattr(self._stats, counter) + 1
+            self._stats = replace(self._stats, **{counter: counted})
+
+
+def idempotent_call(
+    keys: IdempotencyKeys | None,
+    method: str,
+    target: str,
+    body: bytes | None,
+    headers: HeaderTypes | None,
+) -> AbstractContextManager[HeaderTypes | None]:
+    """Return ``keys.attach(...)``, or a context yielding ``headers`` as is without keys."""
+    if keys is None:
+        return nullcontext(headers)
+    return keys.attach(method, target, body, headers)
+
+
+def _has_idempotency_key(headers: HeaderTypes | None) -> bool:
+    header_name = IDEMPOTENCY_KEY_HEADER.lower()
+    return any(name.lower() == header_name for name in headers or {})
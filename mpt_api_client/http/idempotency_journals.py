@@ -0,0 +1,192 @@
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from os import PathLike
+
+DEFAULT_JOURNAL_TTL = 86400.0
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS idempotency_journal (
+    fingerprint TEXT PRIMARY KEY,
+    idempotency_key TEXT NOT NULL,
+    reserved_at REAL NOT NULL,
+    in_flight INTEGER NOT NULL
+)
+"""
+_SELECT = (
+    "SELECT idempotency_key, in_flight FROM idempotency_journal "
+    "WHERE fingerprint = ? AND reserved_at > ?"
+)
+_UPSERT = "INSERT OR REPLACE INTO idempotency_journal VALUES (?, ?, ?, ?)"
+_SET_IN_FLIGHT = (
+    "UPDATE idempotency_journal SET in_flight = ? WHERE fingerprint = ? AND idempotency_key = ?"
+)
+_DELETE = "DELETE FROM idempotency_journal WHERE fingerprint = ? AND idempotency_key = ?"
+_PURGE = "DELETE FROM idempotency_journal WHERE reserved_at <= ?"
+_RELEASE = "UPDATE idempotency_journal SET in_flight = 0"
+
+
+def _validate_ttl(ttl: float) -> None:
+    if ttl <= 0:
+        raise ValueError("Idempotency journal ttl must be positive.")
+
+
+@dataclass(frozen=True)
+class _JournalEntry:
+    key: str
+    reserved_at: float
+    in_flight: bool
+
+
+class MemoryIdempotencyJournal:
+    """Thread-safe in-memory journal of the idempotency keys of unfinished calls.
+
+    Lets a call repeated within the process reuse its key; use ``SQLiteIdempotencyJournal``
+    to survive a restart.
+
+    Args:
+        ttl: Seconds a pending key is reused for; match it to how long the server keeps
+            idempotency keys.
+        clock: Wall clock returning seconds.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_JOURNAL_TTL, clock: Callable[[], float] = time.time
+    ) -> None:
+        _validate_ttl(ttl)
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: dict[str, _JournalEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def reserve(self, fingerprint: str, key: str) -> str:
+        """Return the key to send for a call with ``fingerprint``.
+
+        The key of a failed call with that fingerprint is claimed and returned. Otherwise
+        ``key`` is returned, recorded as in flight unless another call with the same
+        fingerprint is in flight: identical calls made at the same time are distinct.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._live_entry(fingerprint, now)
+            if entry is None:
+                self._entries[fingerprint] = _JournalEntry(key, now, in_flight=True)
+            elif not entry.in_flight:
+                self._entries[fingerprint] = replace(entry, in_flight=True)
+                return entry.key
+        return key
+
+    def complete(self, fingerprint: str, key: str) -> None:
+        """Forget the entry of ``fingerprint`` if it holds ``key``."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None and entry.key == key:
+                self._entries.pop(fingerprint)
+
+    def fail(self, fingerprint: str, key: str) -> None:
+        """Record that the call sending ``key`` ended without a final outcome.
+
+        The key is replayed by the next call with ``fingerprint``, unless the entry holds
+        another call already.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._live_entry(fingerprint, now)
+            if entry is None:
+                self._entries[fingerprint] = _JournalEntry(key, now, in_flight=False)
+            elif entry.key == key:
+                self._entries[fingerprint] = replace(entry, in_flight=False)
+
+    def _live_entry(self, fingerprint: str, now: float) -> _JournalEntry | None:
+        entry = self._entries.get(fingerprint)
+        if entry is None or entry.reserved_at <= now - self._ttl:
+            return None
+        return entry
+
+
+class SQLiteIdempotencyJournal:
+    """Persistent journal of the idempotency keys of unfinished calls in an SQLite database.
+
+    A process restarted after a call failed without a final outcome sends the repeated
+    call with the key of the first attempt, so the server does not apply it twice. Calls
+    still in flight when the journal is opened are taken for failed ones, since the run
+    that sent them has ended: share a database between processes running one at a time
+    only.
+
+    Args:
+        path: Database file; ``":memory:"`` keeps the journal for the process lifetime.
+        ttl: Seconds a pending key is reused for; match it to how long the server keeps
+            idempotency keys. Expired entries are purged when the journal is opened.
+        clock: Wall clock returning seconds; it must survive restarts.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str] = ":memory:",
+        ttl: float = DEFAULT_JOURNAL_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        _validate_ttl(ttl)
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_CREATE_TABLE)
+            self._connection.execute(_PURGE, (self._clock() - ttl,))
+            self._connection.execute(_RELEASE)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM idempotency_journal").fetchone()
+        return int(row[0])
+
+    def reserve(self, fingerprint: str, key: str) -> str:
+        """Return the key to send for a call with ``fingerprint``.
+
+        The key of a failed call with that fingerprint is claimed and returned. Otherwise
+        ``key`` is returned, recorded as in flight unless another call with the same
+        fingerprint is in flight: identical calls made at the same time are distinct.
+        """
+        now = self._clock()
+        with self._lock, self._connection:
+            row = self._live_row(fingerprint, now)
+            if row is None:
+                self._connection.execute(_UPSERT, (fingerprint, key, now, True))
+            elif not row[1]:
+                self._connection.execute(_SET_IN_FLIGHT, (True, fingerprint, row[0]))
+                return str(row[0])
+        return key
+
+    def complete(self, fingerprint: str, key: str) -> None:
+        """Forget the entry of ``fingerprint`` if it holds ``key``."""
+        with self._lock, self._connection:
+            self._connection.execute(_DELETE, (fingerprint, key))
+
+    def fail(self, fingerprint: str, key: str) -> None:
+        """Record that the call sending ``key`` ended without a final outcome.
+
+        The key is replayed by the next call with ``fingerprint``, unless the entry holds
+        another call already.
+        """
+        now = self._clock()
+        with self._lock, self._connection:
+            row = self._live_row(fingerprint, now)
+            if row is None:
+                self._connection.execute(_UPSERT, (fingerprint, key, now, False))
+            elif row[0] == key:
+                self._connection.execute(_SET_IN_FLIGHT, (False, fingerprint, key))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _live_row(self, fingerprint: str, now: float) -> tuple[str, int] | None:
+        cursor = self._connection.execute(_SELECT, (fingerprint, now - self._ttl))
+        return cursor.fetchone()  # type: ignore[no-any-return]
@@ -0,0 +1,115 @@
+from typing import TYPE_CHECKING, Any
+
+from mpt_api_client.models import Model as BaseModel
+from mpt_api_client.models import ModelCollection
+from mpt_api_client.rql import RQLQuery
+
+if TYPE_CHECKING:
+    from mpt_api_client.http.mixins.queryable_mixin import QueryableMixin
+
+ID_FIELD = "id"
+
+
+def keyset_order(key: str) -> list[str]:
+    """Return the ordering of a keyset scan on ``key``, with ``id`` as the tie-breaker.
+
+    Examples:
+        >>> keyset_order("-audit.created.at")
+        ['-audit.created.at', '-id']
+    """
+    descending, field = _parse_key(key)
+    prefix = "-" if descending else ""
+    if field == ID_FIELD:
+        return [f"{prefix}{ID_FIELD}"]
+    return [f"{prefix}{field}", f"{prefix}{ID_FIELD}"]
+
+
+def keyset_position(key: str, last_resource: BaseModel) -> RQLQuery:
+    """Return the filter matching the resources after ``last_resource`` in keyset order.
+
+    Raises:
+        ValueError: If ``last_resource`` has no value for the key field or no id.
+
+    Examples:
+        With ``key="audit.created.at"`` the filter is
+        ``or(gt(audit.created.at,<last>),and(eq(audit.created.at,<last>),gt(id,<last id>)))``.
+    """
+    descending, field = _parse_key(key)
+    record = last_resource.to_dict()
+    after_id = _after(
+        RQLQuery(ID_FIELD), resource_field_value(record, ID_FIELD), descending=descending
+    )
+    if field == ID_FIELD:
+        return after_id
+    last_value = resource_field_value(record, field)
+    return _after(RQLQuery(field), last_value, descending=descending) | (
+        RQLQuery(field).eq(last_value) & after_id
+    )
+
+
+def keyset_service[Service: "QueryableMixin"](
+    service: Service,
+    key: str,
+    after: BaseModel | None = None,
+    *,
+    position: RQLQuery | None = None,
+) -> Service:
+    """Return ``service`` ordered for a keyset scan on ``key``, from after ``after``.
+
+    Args:
+        service: Service to scan.
+        key: Keyset field, prefixed with ``-`` for descending order.
+        after: Last resource of the previous page, or None to start from the beginning.
+        position: Position filter to start from instead of ``after``, such as the cursor
+            of a checkpoint.
+
+    Raises:
+        ValueError: If ``service`` already has an ordering.
+    """
+    if service.query_state.order_by is not None:  # type: ignore[attr-defined]
+        raise ValueError("Keyset pagination sets its own ordering; remove order_by().")
+    ordered = service.order_by(*keyset_order(key))
+    if after is not None:
+        position = keyset_position(key, after)
+    if position is None:
+        return ordered
+    return ordered.filter(position)
+
+
+def rebase_pagination[Model: BaseModel](
+    items_collection: ModelCollection[Model], offset: int
+) -> None:
+    """Make the pagination of a keyset page read as if it were fetched at ``offset``.
+
+    A keyset page reports the records left after its position; counting the ``offset``
+    records before it gives the total of the whole scan, as with offset pagination.
+    """
+    if items_collection.meta:
+        pagination = items_collection.meta.pagination
+        pagination.total += offset
+        pagination.offset = offset
+
+
+def resource_field_value(record: dict[str, Any], field: str) -> Any:
+    """Return the value of the dotted ``field`` of ``record``.
+
+    Raises:
+        ValueError: If ``record`` has no value for ``field``.
+    """
+    field_value: Any = record
+    for part in field.split("."):
+        if not isinstance(field_value, dict) or field_value.get(part) is None:
+            raise ValueError(f"Keyset field {field!r} is missing from a resource; select it.")
+        field_value = field_value[part]
+    return field_value
+
+
+def _parse_key(key: str) -> tuple[bool, str]:
+    field = key.removeprefix("-")
+    if not field:
+        raise ValueError("Keyset field must not be empty.")
+    return key.startswith("-"), field
+
+
+def _after(field: RQLQuery, field_value: Any, *, descending: bool) -> RQLQuery:
+    return field.lt(field_value) if descending else field.gt(field_value)
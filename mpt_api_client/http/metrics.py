@@ -0,0 +1,135 @@
+import copy
+import threading
+from dataclasses import asdict
+from typing import Any, Protocol, override
+
+from httpx import URL
+
+from mpt_api_client.http.hooks import RequestEvent, RequestHook, template_path
+from mpt_api_client.http.metrics_snapshot import (
+    EndpointKey,
+    EndpointMetrics,
+    MetricsSnapshot,
+    PoolMetrics,
+)
+
+
+class StatsSource(Protocol):
+    """Component exposing its counters as a ``stats`` dataclass."""
+
+    @property
+    def stats(self) -> Any:
+        """Dataclass instance holding the component counters."""
+
+
+class DecodeMeter:
+    """Records decoding work of ``iterate()`` and ``stream()`` for one endpoint."""
+
+    def __init__(self, endpoint: EndpointMetrics, lock: threading.Lock) -> None:
+        self._endpoint = endpoint
+        self._lock = lock
+
+    def record(self, records: int, seconds: float) -> None:
+        """Count ``records`` decoded in ``seconds``."""
+        with self._lock:
+            self._endpoint.records_decoded += records
+            self._endpoint.decode_seconds += seconds
+
+
+class ClientMetrics(RequestHook):  # noqa: WPS214 - one handler per request hook phase
+    """Thread-safe metrics registry of a client, fed by its request hooks."""
+
+    def __init__(self, max_connections: int | None = None) -> None:
+        self._endpoints: dict[EndpointKey, EndpointMetrics] = {}
+        self._pool = PoolMetrics(max_connections=max_connections)
+        self._sources: dict[str, StatsSource] = {}
+        self._lock = threading.Lock()
+
+    @override
+    def on_request_start(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._endpoint(event.method, event.path_template).requests += 1
+            self._acquire_connection()
+
+    @override
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._endpoint(event.method, event.path_template).retries += 1
+            self._acquire_connection()
+
+    @override
+    def on_response_headers(self, event: RequestEvent) -> None:
+        status_class = _status_class(event.status_code)
+        with self._lock:
+            status_classes = self._endpoint(event.method, event.path_template).status_classes
+            status_classes[status_class] = status_classes.get(status_class, 0) + 1
+
+    @override
+    def on_body_complete(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._release_connection(event)
+
+    @override
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._endpoint(event.method, event.path_template).transport_errors += 1
+            self._release_connection(event)
+
+    def register_stats(self, name: str, source: StatsSource | None) -> None:
+        """Include the ``stats`` of ``source`` in snapshots under ``name``; None is ignored."""
+        if source is not None:
+            self._sources[name] = source
+
+    def record_max_retry_error(self, method: str, url: str) -> None:
+        """Count a request that raised ``MPTMaxRetryError``."""
+        path_template = template_path(URL(url).path)
+        with self._lock:
+            self._endpoint(method, path_template).max_retry_errors += 1
+
+    def decoding(self, path: str) -> "DecodeMeter":
+        """Return the recorder of records decoded from the responses of ``path``."""
+        path_template = template_path(URL(path).path)
+        with self._lock:
+            return DecodeMeter(self._endpoint("GET", path_template), self._lock)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a copy of the current metrics."""
+        with self._lock:
+            endpoints = copy.deepcopy(self._endpoints)
+            pool = copy.deepcopy(self._pool)
+        return MetricsSnapshot(
+            endpoints=endpoints,
+            pool=pool,
+            components={name: _stats_dict(source) for name, source in self._sources.items()},
+        )
+
+    def _endpoint(self, method: str, path_template: str) -> EndpointMetrics:
+        key = (method.upper(), path_template)
+        if key not in self._endpoints:
+            self._endpoints[key] = EndpointMetrics()
+        return self._endpoints[key]
+
+    def _acquire_connection(self) -> None:
+        self._pool.in_use += 1
+        self._pool.peak_in_use = max(self._pool.peak_in_use, self._pool.in_use)
+
+    def _release_connection(self, event: RequestEvent) -> None:
+        self._pool.in_use -= 1
+        pool_wait = event.timings.get("pool_wait")
+        if pool_wait is not None:
+            self._pool.wait.observe(pool_wait)
+        endpoint = self._endpoint(event.method, event.path_template)
+        endpoint.bytes_sent += event.bytes_sent
+        endpoint.bytes_received += event.bytes_received
+        endpoint.latency.observe(event.timings.get("total", 0))
+
+
+def _status_class(status_code: int | None) -> str:
+    if status_code is None:
+        return "unknown"
+    status_family = status_code // 100
+    return f"{status_family}xx"
+
+
+def _stats_dict(source: StatsSource) -> dict[str, float]:
+    return dict(asdict(source.stats))
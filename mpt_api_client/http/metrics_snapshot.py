@@ -0,0 +1,111 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+EndpointKey = tuple[str, str]
+ComponentStats = dict[str, dict[str, float]]
+
+
+@dataclass
+class Histogram:
+    """Latency histogram with fixed upper bounds, in the Prometheus ``le`` sense.
+
+    Attributes:
+        bounds: Bucket upper bounds in seconds, ascending.
+        counts: Observations per bucket; the last one counts values above every bound.
+        total: Sum of the observed values.
+        count: Number of observations.
+    """
+
+    bounds: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    total: float = 0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Allocate one counter per bucket plus the overflow bucket."""
+        if not self.counts:
+            self.counts = [0 for _ in range(len(self.bounds) + 1)]
+
+    def observe(self, value: float) -> None:  # noqa: WPS110
+        """Add one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters of one method and endpoint template.
+
+    Attributes:
+        requests: Requests sent, retries excluded.
+        retries: Retry attempts sent.
+        transport_errors: Attempts that failed without a complete response.
+        max_retry_errors: Requests that raised ``MPTMaxRetryError``.
+        status_classes: Responses per status class, such as ``"2xx"``.
+        bytes_sent: Request body bytes sent.
+        bytes_received: Response body bytes received.
+        latency: Attempt durations, from the start of the attempt to its last body byte.
+        records_decoded: Records decoded into models by ``iterate()`` and ``stream()``.
+        decode_seconds: Time spent decoding those records.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    transport_errors: int = 0
+    max_retry_errors: int = 0
+    status_classes: dict[str, int] = field(default_factory=dict)
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    records_decoded: int = 0
+    decode_seconds: float = 0
+
+    @property
+    def records_per_second(self) -> float | None:
+        """Decoding throughput, or None before any record was decoded."""
+        if not self.decode_seconds:
+            return None
+        return self.records_decoded / self.decode_seconds
+
+
+@dataclass
+class PoolMetrics:
+    """Connection pool utilisation, as seen from the attempts sent to the pool.
+
+    Attributes:
+        max_connections: Pool size; None when unbounded.
+        in_use: Attempts currently holding a connection, until their body is read.
+        peak_in_use: Highest ``in_use`` observed.
+        wait: Time attempts waited for a pooled connection.
+    """
+
+    max_connections: int | None = None
+    in_use: int = 0
+    peak_in_use: int = 0
+    wait: Histogram = field(default_factory=Histogram)
+
+    @property
+    def saturation(self) -> float | None:
+        """Share of the pool in use, or None for an unbounded pool."""
+        if not self.max_connections:
+            return None
+        return self.in_use / self.max_connections
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of the client metrics.
+
+    Attributes:
+        endpoints: Counters per ``(method, endpoint template)``.
+        pool: Connection pool utilisation.
+        components: Counters of the optional client components, such as ``http_cache``,
+            ``model_cache``, ``hedger`` and ``concurrency_limiter``, keyed by name.
+    """
+
+    endpoints: dict[EndpointKey, EndpointMetrics]
+    pool: PoolMetrics
+    components: ComponentStats
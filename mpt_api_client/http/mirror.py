@@ -0,0 +1,192 @@
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from mpt_api_client.http.delta_sync import (
+    DEFAULT_SYNC_OVERLAP,
+    DEFAULT_WATERMARK_FIELD,
+    AsyncDeltaSync,
+    DeltaSync,
+    SyncChange,
+)
+from mpt_api_client.http.mirror_tables import SQLiteMirror
+from mpt_api_client.models import Model as BaseModel
+
+if TYPE_CHECKING:
+    from mpt_api_client.http.mixins.collection_mixin import (
+        AsyncCollectionMixin,
+        CollectionMixin,
+    )
+
+
+class _MirroredCollectionBase[Model: BaseModel]:
+    """Local reads shared by the sync and async mirrored collections."""
+
+    def __init__(
+        self,
+        mirror: SQLiteMirror,
+        service: "CollectionMixin[Model] | AsyncCollectionMixin[Model]",
+        indexes: Sequence[str] = (),
+        name: str | None = None,
+    ) -> None:
+        self.name = name or service.path  # type: ignore[union-attr]
+        self.table = mirror.table(self.name, indexes)
+        self._make_model = service.make_model  # type: ignore[union-attr]
+
+    def get(self, resource_id: str) -> Model | None:
+        """Return the mirrored resource ``resource_id``, or None when it is not mirrored."""
+        resource_data = self.table.get(resource_id)
+        return None if resource_data is None else self._make_model(resource_data)
+
+    def find(self, **equals: Any) -> list[Model]:
+        """Return the mirrored resources whose indexed fields equal ``equals``, by id.
+
+        Args:
+            equals: Values keyed by indexed column, the field with dots turned into
+                underscores: ``find(vendor_id="ACC-1")`` for the ``vendor.id`` index.
+
+        Raises:
+            ValueError: If a keyword is not an indexed column.
+        """
+        return [self._make_model(resource_data) for resource_data in self.table.find(equals)]
+
+    def iterate(self) -> Iterator[Model]:
+        """Yield every mirrored resource, by id."""
+        for resource_data in self.table.find({}):
+            yield self._make_model(resource_data)
+
+    def _known_ids(self) -> Iterator[str]:
+        yield from self.table.ids()
+
+    def _apply(self, change: SyncChange[Model]) -> None:
+        resource_data = None if change.resource is None else change.resource.to_dict()
+        self.table.apply(change.resource_id, resource_data)
+
+
+class MirroredCollection[Model: BaseModel](_MirroredCollectionBase[Model]):
+    """Local replica of a collection in an SQLite mirror, for reads that rarely change.
+
+    ``refresh()`` fills the table with a full scan the first time, then applies only the
+    resources changed since the previous refresh, through a ``DeltaSync`` whose watermark
+    is saved in the mirror together with the table. Reads never reach the API.
+
+    Args:
+        mirror: Database holding the table.
+        service: Collection to mirror, with its filter and field selection, which must
+            include ``field`` and every indexed field.
+        indexes: Dotted fields stored in indexed columns for ``find()``; changing them
+            rebuilds the table on the next refresh.
+        name: Table name; defaults to the path of the collection, so give filtered
+            mirrors of the same endpoint distinct names.
+        field: Timestamp field the API updates on every change.
+        batch_size: Number of resources to fetch per request.
+        reconcile_interval: Seconds between the passes dropping the resources deleted
+            from the collection; None never drops them until ``rebuild()``.
+        overlap: Seconds before the watermark re-read on every refresh, for the changes
+            committed late with an earlier timestamp.
+
+    Examples:
+        >>> mirror = SQLiteMirror("catalog.db")  # doctest: +SKIP
+        >>> products = MirroredCollection(  # doctest: +SKIP
+        ...     mirror, client.catalog.products, indexes=("status", "vendor.id")
+        ... )
+        >>> products.refresh()  # doctest: +SKIP
+        >>> products.find(vendor_id="ACC-1234-5678")  # doctest: +SKIP
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        mirror: SQLiteMirror,
+        service: "CollectionMixin[Model]",
+        indexes: Sequence[str] = (),
+        name: str | None = None,
+        *,
+        field: str = DEFAULT_WATERMARK_FIELD,
+        batch_size: int = 100,
+        reconcile_interval: float | None = None,
+        overlap: float = DEFAULT_SYNC_OVERLAP,
+    ) -> None:
+        super().__init__(mirror, service, indexes, name)
+        self.delta_sync: DeltaSync[Model] = DeltaSync(
+            service,
+            mirror,
+            self.name,
+            field=field,
+            batch_size=batch_size,
+            reconcile_interval=reconcile_interval,
+            overlap=overlap,
+        )
+
+    def refresh(self) -> int:
+        """Apply the changes of the collection since the previous refresh.
+
+        Returns:
+            Number of resources upserted or deleted.
+        """
+        applied = 0
+        for change in self.delta_sync.sync(known_ids=self._known_ids()):
+            self._apply(change)
+            applied += 1
+        return applied
+
+    def rebuild(self) -> int:
+        """Empty the table and fill it again with a full scan.
+
+        Returns:
+            Number of resources fetched.
+        """
+        self.table.clear()
+        self.delta_sync.reset()
+        return self.refresh()
+
+
+class AsyncMirroredCollection[Model: BaseModel](_MirroredCollectionBase[Model]):
+    """Local replica of a collection in an SQLite mirror, for reads that rarely change.
+
+    Async counterpart of ``MirroredCollection``, taking the same arguments. Only the
+    refreshes await the API; reads query the local database directly.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        mirror: SQLiteMirror,
+        service: "AsyncCollectionMixin[Model]",
+        indexes: Sequence[str] = (),
+        name: str | None = None,
+        *,
+        field: str = DEFAULT_WATERMARK_FIELD,
+        batch_size: int = 100,
+        reconcile_interval: float | None = None,
+        overlap: float = DEFAULT_SYNC_OVERLAP,
+    ) -> None:
+        super().__init__(mirror, service, indexes, name)
+        self.delta_sync: AsyncDeltaSync[Model] = AsyncDeltaSync(
+            service,
+            mirror,
+            self.name,
+            field=field,
+            batch_size=batch_size,
+            reconcile_interval=reconcile_interval,
+            overlap=overlap,
+        )
+
+    async def refresh(self) -> int:
+        """Apply the changes of the collection since the previous refresh.
+
+        Returns:
+            Number of resources upserted or deleted.
+        """
+        applied = 0
+        async for change in self.delta_sync.sync(known_ids=self._known_ids()):
+            self._apply(change)
+            applied += 1
+        return applied
+
+    async def rebuild(self) -> int:
+        """Empty the table and fill it again with a full scan.
+
+        Returns:
+            Number of resources fetched.
+        """
+        self.table.clear()
+        self.delta_sync.reset()
+        return await self.refresh()
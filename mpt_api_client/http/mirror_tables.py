@@ -0,0 +1,168 @@
+import json
+import sqlite3
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+from mpt_api_client.http.checkpoint_stores import SQLiteCheckpointStore
+from mpt_api_client.json_codec import default_json_codec
+from mpt_api_client.models.model import Resource
+
+_RESERVED_COLUMNS = ("id", "data")
+_DELETE_WATERMARK = "DELETE FROM checkpoints WHERE name = ?"
+
+
+def column_name(field: str) -> str:
+    """Return the column of the indexed ``field``, with dots turned into underscores.
+
+    Examples:
+        >>> column_name("vendor.id")
+        'vendor_id'
+    """
+    return field.replace(".", "_")
+
+
+def quote_identifier(name: str) -> str:
+    """Return ``name`` quoted as an SQLite identifier.
+
+    Raises:
+        ValueError: If ``name`` is empty or holds a NUL character, which SQLite
+            identifiers cannot.
+    """
+    if not name or "\x00" in name:
+        raise ValueError(f"Invalid mirror identifier {name!r}.")
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def column_value(resource_data: Resource, field: str) -> Any:
+    """Return the value of the dotted ``field`` of ``resource_data`` as stored in a column.
+
+    Missing fields are None and objects or lists are stored as JSON text.
+    """
+    field_value: Any = resource_data
+    for part in field.split("."):
+        if not isinstance(field_value, dict):
+            return None
+        field_value = field_value.get(part)
+    if isinstance(field_value, dict | list):
+        return json.dumps(field_value, sort_keys=True)
+    return field_value
+
+
+class SQLiteMirror(SQLiteCheckpointStore):
+    """SQLite database holding local replicas of collections and their watermarks.
+
+    Each collection gets its own table with the raw JSON of every resource and one indexed
+    column per chosen field; the watermarks of the delta refreshes are checkpoint tokens
+    kept in the same database, so a table and its watermark are committed together.
+
+    Args:
+        path: Database file; ``":memory:"`` keeps the replicas for the process lifetime.
+    """
+
+    def table(self, name: str, indexes: Sequence[str] = ()) -> "MirrorTable":
+        """Return the table ``name`` with a column per field of ``indexes``.
+
+        A table created earlier with other indexes is dropped together with its
+        watermark, so the next refresh fills it again.
+        """
+        return MirrorTable(self._connection, self._lock, name, indexes)
+
+
+class MirrorTable:
+    """Table of one mirrored collection: raw JSON keyed by id, plus indexed columns."""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        lock: threading.Lock,
+        name: str,
+        indexes: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.indexes = {column_name(field): field for field in indexes}
+        self._connection = connection
+        self._lock = lock
+        # Every statement interpolates only identifiers quoted, and so validated, here and
+        # by ``find``; values are always bound parameters.
+        table = quote_identifier(name)
+        columns = [*_RESERVED_COLUMNS, *self.indexes]
+        placeholders = ", ".join("?" for _ in columns)
+        self._table = table
+        self._delete_sql = f"DELETE FROM {table} WHERE id = ?"  # ruff: ignore[hardcoded-sql-expression]
+        self._upsert_sql = f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})"  # ruff: ignore[hardcoded-sql-expression]
+        with self._lock, self._connection:
+            _ensure_schema(self._connection, name, list(self.indexes))
+
+    def get(self, resource_id: str) -> Resource | None:
+        """Return the data of the resource ``resource_id``, or None."""
+        rows = self._select("data", "id = ?", [resource_id])
+        return _decode(rows[0]) if rows else None
+
+    def find(self, equals: dict[str, Any]) -> list[Resource]:
+        """Return the data of the resources whose indexed columns equal ``equals``, by id.
+
+        An empty ``equals`` returns every resource.
+
+        Raises:
+            ValueError: If a key of ``equals`` is not an indexed column.
+        """
+        unknown = set(equals) - set(self.indexes)
+        if unknown:
+            raise ValueError(f"Mirror {self.name!r} has no index on {sorted(unknown)}.")
+        conditions = [f"{quote_identifier(column)} IS ?" for column in equals]
+        where = " AND ".join(conditions) or "1"
+        rows = self._select("data", where, list(equals.values()))
+        return [_decode(raw_json) for raw_json in rows]
+
+    def ids(self) -> list[str]:
+        """Return the ids of every resource, without decoding them."""
+        return self._select("id")
+
+    def apply(self, resource_id: str, resource_data: Resource | None) -> None:
+        """Upsert the data of ``resource_id``, or delete the resource when it is None.
+
+        The change is committed with the next watermark saved in the mirror.
+        """
+        with self._lock:
+            if resource_data is None:
+                self._connection.execute(self._delete_sql, (resource_id,))
+                return
+            row = [resource_id, default_json_codec().dumps(resource_data)]
+            row.extend(column_value(resource_data, field) for field in self.indexes.values())
+            self._connection.execute(self._upsert_sql, row)
+
+    def clear(self) -> None:
+        """Delete every resource, recreating the table empty."""
+        with self._lock, self._connection:
+            self._connection.execute(f"DROP TABLE {self._table}")
+            _ensure_schema(self._connection, self.name, list(self.indexes))
+
+    def _select(self, column: str, where: str = "1", arguments: Sequence[Any] = ()) -> list[Any]:
+        query = f"SELECT {column} FROM {self._table} WHERE {where} ORDER BY id"  # ruff: ignore[hardcoded-sql-expression]
+        with self._lock:
+            rows = self._connection.execute(query, arguments).fetchall()
+        return [row[0] for row in rows]
+
+
+def _decode(raw_json: bytes | str) -> Resource:
+    return default_json_codec().loads(raw_json)  # type: ignore[no-any-return]
+
+
+def _ensure_schema(connection: sqlite3.Connection, name: str, columns: list[str]) -> None:
+    table = quote_identifier(name)
+    existing = [row[1] for row in connection.execute(f"PRAGMA table_info({table})")]
+    if existing and existing != [*_RESERVED_COLUMNS, *columns]:
+        connection.execute(f"DROP TABLE {table}")
+        connection.execute(_DELETE_WATERMARK, (name,))
+    index_columns = "".join(f", {quote_identifier(column)}" for column in columns)
+    connection.execute(
+        f"CREATE TABLE IF NOT EXISTS {table} "
+        f"(id TEXT PRIMARY KEY, data BLOB NOT NULL{index_columns})"
+    )
+    for column in columns:
+        index = quote_identifier(f"{name}:{column}")
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({quote_identifier(column)})"
+        )
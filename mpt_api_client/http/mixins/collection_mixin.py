@@ -1,6 +1,34 @@
-from collections.abc import AsyncIterator, Iterator
-
+import functools
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+
+from mpt_api_client.http.bulk import DEFAULT_BULK_CONCURRENCY, arun_bulk, run_bulk
+from mpt_api_client.http.checkpoint import (
+    Checkpoint,
+    Checkpointer,
+    CheckpointTracker,
+    acheckpointed,
+    checkpointed,
+    start_checkpoint,
+)
+from mpt_api_client.http.id_lookup import (
+    DEFAULT_LOOKUP_CHUNK_SIZE,
+    DEFAULT_MAX_URL_LENGTH,
+    ResourceMap,
+    id_filter,
+    plan_lookup,
+    resource_map,
+)
+from mpt_api_client.http.keyset import keyset_service, rebase_pagination
+from mpt_api_client.http.metrics import DecodeMeter
+from mpt_api_client.http.mixins.export_mixin import AsyncExportMixin, ExportMixin
 from mpt_api_client.http.mixins.queryable_mixin import QueryableMixin
+from mpt_api_client.http.parallel_pages import (
+    DEFAULT_PAGE_CONCURRENCY,
+    afetch_pages_parallel,
+    fetch_pages_parallel,
+)
+from mpt_api_client.http.prefetch import aprefetch_pages, prefetch_pages
 from mpt_api_client.http.types import Response
 from mpt_api_client.models import AsyncProgress, ModelCollection, Progress
 from mpt_api_client.models import Model as BaseModel
@@ -12,7 +40,15 @@ def _pagination_total[Model: BaseModel](items_collection: ModelCollection[Model]
     return 0
 
 
-class CollectionMixin[Model: BaseModel](QueryableMixin):
+def _is_last_page[Model: BaseModel](
+    items_collection: ModelCollection[Model], batch_size: int
+) -> bool:
+    if items_collection.meta:
+        return not items_collection.meta.pagination.has_next()
+    return len(items_collection) < batch_size
+
+
+class CollectionMixin[Model: BaseModel](ExportMixin, QueryableMixin):  # noqa: WPS214 - public queries plus the page helpers they share
     """Mixin providing collection functionality."""
 
     def fetch_page(self, limit: int = 100, offset: int = 0) -> ModelCollection[Model]:
@@ -45,8 +81,53 @@ class CollectionMixin[Model: BaseModel](QueryableMixin):
 
         return resource_list[0]  # type: ignore[no-any-return]
 
-    def iterate(
-        self, batch_size: int = 100, *, progress: Progress | None = None
+    def get_many(
+        self,
+        ids: Iterable[str],
+        select: list[str] | str | None = None,
+        *,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> ResourceMap[Model]:
+        """Fetch resources by id with a few ``in(id,(...))`` queries instead of one GET each.
+
+        The ids are split into chunks whose request URL stays within ``max_url_length``,
+        and the chunks are fetched concurrently with ``fetch_page``, combined with the
+        filter of the collection.
+
+        Args:
+            ids: Resource ids; duplicates are fetched once.
+            select: Fields to select, as a list or a comma-separated string.
+            max_url_length: Maximum length of the encoded request path and query.
+            chunk_size: Maximum number of ids per query.
+            concurrency: Maximum number of queries in flight.
+
+        Returns:
+            The resources keyed by id in the order of ``ids``; ids without a match are
+            listed in its ``missing`` attribute.
+
+        Raises:
+            ValueError: If an id alone does not fit in ``max_url_length``.
+        """
+        requested = list(dict.fromkeys(ids))
+        lookup, chunks = plan_lookup(self, requested, select, max_url_length, chunk_size)
+        outcome = run_bulk(
+            chunks,
+            lambda chunk: lookup.filter(id_filter(chunk)).fetch_page(limit=len(chunk)),
+            concurrency,
+        )
+        return resource_map(requested, outcome)
+
+    def iterate(  # noqa: WPS211
+        self,
+        batch_size: int = 100,
+        *,
+        progress: Progress | None = None,
+        prefetch: int = 0,
+        keyset: str | None = None,
+        checkpoint: Checkpointer | None = None,
+        resume_from: str | None = None,
     ) -> Iterator[Model]:
         """Iterate over all resources, yielding GenericResource objects.
 
@@ -56,17 +137,78 @@ class CollectionMixin[Model: BaseModel](QueryableMixin):
                 each page fetch with the current pagination total (0 when unknown),
                 `item_processed` once per record before it is yielded, and
                 `completed` once when iteration finishes normally.
+            prefetch: Number of pages fetched ahead of the consumer by a background
+                thread, so that fetching overlaps processing; 0 fetches each page when
+                the previous one is consumed.
+            keyset: Field to page on with keyset (seek) pagination instead of offsets,
+                such as ``"id"`` or ``"-audit.created.at"`` for descending order. Each
+                page then filters on the position after the last record of the previous
+                one, with ``id`` breaking ties, so deep pages cost the same as the first
+                and records changing during the scan are neither skipped nor repeated.
+                The collection must not have an ``order_by``.
+            checkpoint: Optional checkpointer saving the position of the iteration every
+                ``interval`` records and when it stops early; a record counts as
+                processed once the next one is requested.
+            resume_from: Checkpoint token to resume a previous iteration of the same
+                query, offset or keyset mode from, such as ``checkpoint.load()``.
+
+        Returns:
+            Iterator of resources.
+
+        Raises:
+            ValueError: If ``resume_from`` was taken for another query or mode.
+        """
+        start = start_checkpoint("iterate", self.build_path(), keyset, resume_from)  # type: ignore[attr-defined]
+        if keyset:
+            pages = self._iterate_keyset_pages(batch_size, keyset, start)
+        else:
+            pages = self._iterate_pages(batch_size, offset=start.processed)
+        if prefetch:
+            pages = prefetch_pages(pages, prefetch)
+        resources = self._iterate_resources(pages, progress)
+        yield from checkpointed(resources, CheckpointTracker(start, checkpoint))
+
+        if progress:
+            progress.completed()
+
+    def iterate_parallel(
+        self,
+        batch_size: int = 100,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        *,
+        ordered: bool = True,
+        progress: Progress | None = None,
+    ) -> Iterator[Model]:
+        """Iterate over all resources, fetching the pages after the first one concurrently.
+
+        The first page reveals the pagination total; the remaining pages are then fetched
+        on a thread pool, at most ``concurrency`` at a time.
+
+        Args:
+            batch_size: Number of resources to fetch per request
+            concurrency: Maximum number of pages in flight.
+            ordered: Yield the resources in page order, holding the pages that arrive
+                early; False yields each page as soon as it arrives, for throughput.
+            progress: Optional progress receiver, called as by ``iterate``.
 
         Returns:
             Iterator of resources.
         """
-        offset = 0
+        meter = self.http_client.components.metrics.decoding(self.path)  # type: ignore[attr-defined]
+        fetch = functools.partial(self._fetch_decoded_page, batch_size, meter=meter)
+        for items_collection in fetch_pages_parallel(fetch, concurrency, ordered=ordered):
+            yield from self._iterate_page(items_collection, progress)
+
+        if progress:
+            progress.completed()
+
+    def _iterate_pages(self, batch_size: int, offset: int = 0) -> Iterator[ModelCollection[Model]]:
         limit = batch_size  # Default page size
+        meter = self.http_client.components.metrics.decoding(self.path)  # type: ignore[attr-defined]
 
         while True:
-            response = self._fetch_page_as_response(limit=limit, offset=offset)
-            items_collection = self.make_collection(response)  # type: ignore[attr-defined]
-            yield from self._iterate_page(items_collection, progress)
+            items_collection = self._fetch_decoded_page(limit, offset, meter=meter)
+            yield items_collection
 
             if not items_collection.meta:
                 break
@@ -74,8 +216,11 @@ class CollectionMixin[Model: BaseModel](QueryableMixin):
                 break
             offset = items_collection.meta.pagination.next_offset()
 
-        if progress:
-            progress.completed()
+    def _iterate_resources(
+        self, pages: Iterator[ModelCollection[Model]], progress: Progress | None
+    ) -> Iterator[Model]:
+        for items_collection in pages:
+            yield from self._iterate_page(items_collection, progress)
 
     def _iterate_page(
         self, items_collection: ModelCollection[Model], progress: Progress | None
@@ -87,6 +232,36 @@ class CollectionMixin[Model: BaseModel](QueryableMixin):
                 progress.item_processed()
             yield resource
 
+    def _iterate_keyset_pages(
+        self, batch_size: int, keyset: str, start: Checkpoint
+    ) -> Iterator[ModelCollection[Model]]:
+        meter = self.http_client.components.metrics.decoding(self.path)  # type: ignore[attr-defined]
+        lookup = keyset_service(self, keyset, position=start.position())
+        offset = start.processed
+
+        while True:
+            path = lookup.build_path({"limit": batch_size, "offset": 0})  # type: ignore[attr-defined]
+            items_collection = self._decode_page(self.http_client.request("get", path), meter)  # type: ignore[attr-defined]
+            rebase_pagination(items_collection, offset)
+            yield items_collection
+
+            if _is_last_page(items_collection, batch_size):
+                break
+            offset += len(items_collection)
+            lookup = keyset_service(self, keyset, after=items_collection[-1])
+
+    def _fetch_decoded_page(
+        self, limit: int, offset: int, *, meter: DecodeMeter
+    ) -> ModelCollection[Model]:
+        response = self._fetch_page_as_response(limit=limit, offset=offset)
+        return self._decode_page(response, meter)
+
+    def _decode_page(self, response: Response, meter: DecodeMeter) -> ModelCollection[Model]:
+        started_at = time.perf_counter()
+        items_collection: ModelCollection[Model] = self.make_collection(response)  # type: ignore[attr-defined]
+        meter.record(len(items_collection), time.perf_counter() - started_at)
+        return items_collection
+
     def _fetch_page_as_response(self, limit: int = 100, offset: int = 0) -> Response:
         """Fetch one page of resources.
 
@@ -100,7 +275,7 @@ class CollectionMixin[Model: BaseModel](QueryableMixin):
         return self.http_client.request("get", self.build_path(pagination_params))  # type: ignore[attr-defined, no-any-return]
 
 
-class AsyncCollectionMixin[Model: BaseModel](QueryableMixin):
+class AsyncCollectionMixin[Model: BaseModel](AsyncExportMixin, QueryableMixin):  # noqa: WPS214 - public queries plus the page helpers they share
     """Async mixin providing collection functionality."""
 
     async def fetch_page(self, limit: int = 100, offset: int = 0) -> ModelCollection[Model]:
@@ -133,8 +308,53 @@ class AsyncCollectionMixin[Model: BaseModel](QueryableMixin):
 
         return resource_list[0]  # type: ignore[no-any-return]
 
-    async def iterate(
-        self, batch_size: int = 100, *, progress: AsyncProgress | None = None
+    async def get_many(
+        self,
+        ids: Iterable[str],
+        select: list[str] | str | None = None,
+        *,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        chunk_size: int = DEFAULT_LOOKUP_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> ResourceMap[Model]:
+        """Fetch resources by id with a few ``in(id,(...))`` queries instead of one GET each.
+
+        The ids are split into chunks whose request URL stays within ``max_url_length``,
+        and the chunks are fetched concurrently with ``fetch_page``, combined with the
+        filter of the collection.
+
+        Args:
+            ids: Resource ids; duplicates are fetched once.
+            select: Fields to select, as a list or a comma-separated string.
+            max_url_length: Maximum length of the encoded request path and query.
+            chunk_size: Maximum number of ids per query.
+            concurrency: Maximum number of queries in flight.
+
+        Returns:
+            The resources keyed by id in the order of ``ids``; ids without a match are
+            listed in its ``missing`` attribute.
+
+        Raises:
+            ValueError: If an id alone does not fit in ``max_url_length``.
+        """
+        requested = list(dict.fromkeys(ids))
+        lookup, chunks = plan_lookup(self, requested, select, max_url_length, chunk_size)
+        outcome = await arun_bulk(
+            chunks,
+            lambda chunk: lookup.filter(id_filter(chunk)).fetch_page(limit=len(chunk)),
+            concurrency,
+        )
+        return resource_map(requested, outcome)
+
+    async def iterate(  # noqa: WPS211
+        self,
+        batch_size: int = 100,
+        *,
+        progress: AsyncProgress | None = None,
+        prefetch: int = 0,
+        keyset: str | None = None,
+        checkpoint: Checkpointer | None = None,
+        resume_from: str | None = None,
     ) -> AsyncIterator[Model]:
         """Iterate over all resources, yielding GenericResource objects.
 
@@ -144,27 +364,95 @@ class AsyncCollectionMixin[Model: BaseModel](QueryableMixin):
                 each page fetch with the current pagination total (0 when unknown),
                 `item_processed` once per record before it is yielded, and
                 `completed` once when iteration finishes normally.
+            prefetch: Number of pages fetched ahead of the consumer by a background
+                task, so that fetching overlaps processing; 0 fetches each page when
+                the previous one is consumed.
+            keyset: Field to page on with keyset (seek) pagination instead of offsets,
+                such as ``"id"`` or ``"-audit.created.at"`` for descending order. Each
+                page then filters on the position after the last record of the previous
+                one, with ``id`` breaking ties, so deep pages cost the same as the first
+                and records changing during the scan are neither skipped nor repeated.
+                The collection must not have an ``order_by``.
+            checkpoint: Optional checkpointer saving the position of the iteration every
+                ``interval`` records and when it stops early; a record counts as
+                processed once the next one is requested.
+            resume_from: Checkpoint token to resume a previous iteration of the same
+                query, offset or keyset mode from, such as ``checkpoint.load()``.
 
         Returns:
             Iterator of resources.
+
+        Raises:
+            ValueError: If ``resume_from`` was taken for another query or mode.
         """
-        offset = 0
-        limit = batch_size  # Default page size
+        start = start_checkpoint("iterate", self.build_path(), keyset, resume_from)  # type: ignore[attr-defined]
+        if keyset:
+            pages = self._iterate_keyset_pages(batch_size, keyset, start)
+        else:
+            pages = self._iterate_pages(batch_size, offset=start.processed)
+        if prefetch:
+            pages = aprefetch_pages(pages, prefetch)
+        resources = self._iterate_resources(pages, progress)
+        async for resource in acheckpointed(resources, CheckpointTracker(start, checkpoint)):
+            yield resource
 
-        while True:
-            response = await self._fetch_page_as_response(limit=limit, offset=offset)
-            items_collection = self.make_collection(response)  # type: ignore[attr-defined]
+        if progress:
+            await progress.completed()
+
+    async def iterate_parallel(
+        self,
+        batch_size: int = 100,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        *,
+        ordered: bool = True,
+        progress: AsyncProgress | None = None,
+    ) -> AsyncIterator[Model]:
+        """Iterate over all resources, fetching the pages after the first one concurrently.
+
+        The first page reveals the pagination total; the remaining pages are then fetched
+        in concurrent tasks, at most ``concurrency`` at a time.
+
+        Args:
+            batch_size: Number of resources to fetch per request
+            concurrency: Maximum number of pages in flight.
+            ordered: Yield the resources in page order, holding the pages that arrive
+                early; False yields each page as soon as it arrives, for throughput.
+            progress: Optional progress receiver, awaited as by ``iterate``.
+
+        Returns:
+            Iterator of resources.
+        """
+        meter = self.http_client.components.metrics.decoding(self.path)  # type: ignore[attr-defined]
+        fetch = functools.partial(self._fetch_decoded_page, batch_size, meter=meter)
+        async for items_collection in afetch_pages_parallel(fetch, concurrency, ordered=ordered):
             async for resource in self._iterate_page(items_collection, progress):
                 yield resource
 
+        if progress:
+            await progress.completed()
+
+    async def _iterate_pages(
+        self, batch_size: int, offset: int = 0
+    ) -> AsyncIterator[ModelCollection[Model]]:
+        limit = batch_size  # Default page size
+        meter = self.http_client.components.metrics.decoding(self.path)  # type: ignore[attr-defined]
+
+        while True:
+            items_collection = await self._fetch_decoded_page(limit, offset, meter=meter)
+            yield items_collection
+
             if not items_collection.meta:
                 break
             if not items_collection.meta.pagination.has_next():
                 break
             offset = items_collection.meta.pagination.next_offset()
 
-        if progress:
-            await progress.completed()
+    async def _iterate_resources(
+        self, pages: AsyncIterator[ModelCollection[Model]], progress: AsyncProgress | None
+    ) -> AsyncIterator[Model]:
+        async for items_collection in pages:
+            async for resource in self._iterate_page(items_collection, progress):
+                yield resource
 
     async def _iterate_page(
         self, items_collection: ModelCollection[Model], progress: AsyncProgress | None
@@ -176,6 +464,39 @@ class AsyncCollectionMixin[Model: BaseModel](QueryableMixin):
                 await progress.item_processed()  # noqa: WPS476
             yield resource
 
+    async def _iterate_keyset_pages(
+        self, batch_size: int, keyset: str, start: Checkpoint
+    ) -> AsyncIterator[ModelCollection[Model]]:
+        meter = self.http_client.components.metrics.decoding(self.path)  # type: ignore[attr-defined]
+        lookup = keyset_service(self, keyset, position=start.position())
+        offset = start.processed
+
+        while True:
+            response = await self.http_client.request(  # type: ignore[attr-defined]
+                "get",
+                lookup.build_path({"limit": batch_size, "offset": 0}),  # type: ignore[attr-defined]
+            )
+            items_collection = self._decode_page(response, meter)
+            rebase_pagination(items_collection, offset)
+            yield items_collection
+
+            if _is_last_page(items_collection, batch_size):
+                break
+            offset += len(items_collection)
+            lookup = keyset_service(self, keyset, after=items_collection[-1])
+
+    async def _fetch_decoded_page(
+        self, limit: int, offset: int, *, meter: DecodeMeter
+    ) -> ModelCollection[Model]:
+        response = await self._fetch_page_as_response(limit=limit, offset=offset)
+        return self._decode_page(response, meter)
+
+    def _decode_page(self, response: Response, meter: DecodeMeter) -> ModelCollection[Model]:
+        started_at = time.perf_counter()
+        items_collection: ModelCollection[Model] = self.make_collection(response)  # type: ignore[attr-defined]
+        meter.record(len(items_collection), time.perf_counter() - started_at)
+        return items_collection
+
     async def _fetch_page_as_response(self, limit: int = 100, offset: int = 0) -> Response:
         """Fetch one page of resources.
 
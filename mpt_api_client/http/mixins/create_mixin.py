@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterable, Iterable
+
+from mpt_api_client.http.bulk import DEFAULT_BULK_CONCURRENCY, BulkResult, arun_bulk, run_bulk
 from mpt_api_client.models import ResourceData
 
 
@@ -14,6 +17,20 @@ class CreateMixin[Model]:
 
         return self._model_class.from_response(response)  # type: ignore[attr-defined, no-any-return]
 
+    def create_many(
+        self, resources: Iterable[ResourceData], *, concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> BulkResult[Model]:
+        """Create resources concurrently, one `POST /endpoint` per resource.
+
+        Args:
+            resources: Data of the resources to create.
+            concurrency: Maximum number of requests in flight, sent from a thread pool.
+
+        Returns:
+            Created resources in input order, and the errors of the resources that failed.
+        """
+        return run_bulk(resources, self.create, concurrency)
+
 
 class AsyncCreateMixin[Model]:
     """Create resource mixin."""
@@ -27,3 +44,20 @@ class AsyncCreateMixin[Model]:
         response = await self.http_client.request("post", self.path, json=resource_data)  # type: ignore[attr-defined]
 
         return self._model_class.from_response(response)  # type: ignore[attr-defined, no-any-return]
+
+    async def create_many(
+        self,
+        resources: Iterable[ResourceData] | AsyncIterable[ResourceData],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkResult[Model]:
+        """Create resources concurrently, one `POST /endpoint` per resource.
+
+        Args:
+            resources: Data of the resources to create.
+            concurrency: Maximum number of requests in flight, each sent from its own task.
+
+        Returns:
+            Created resources in input order, and the errors of the resources that failed.
+        """
+        return await arun_bulk(resources, self.create, concurrency)
@@ -1,3 +1,8 @@
+from collections.abc import AsyncIterable, Iterable
+
+from mpt_api_client.http.bulk import DEFAULT_BULK_CONCURRENCY, BulkResult, arun_bulk, run_bulk
+
+
 class DeleteMixin:
     """Delete resource mixin."""
 
@@ -9,6 +14,21 @@ class DeleteMixin:
         """
         self._resource(resource_id).delete()  # type: ignore[attr-defined]
 
+    def delete_many(
+        self, resource_ids: Iterable[str], *, concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> BulkResult[None]:
+        """Delete resources concurrently, one `DELETE /endpoint/{resource_id}` per resource.
+
+        Args:
+            resource_ids: Resource IDs.
+            concurrency: Maximum number of requests in flight, sent from a thread pool.
+
+        Returns:
+            One None per resource id in input order, and the errors of the deletes that
+            failed.
+        """
+        return run_bulk(resource_ids, self.delete, concurrency)
+
 
 class AsyncDeleteMixin:
     """Delete resource mixin."""
@@ -20,3 +40,21 @@ class AsyncDeleteMixin:
             resource_id: Resource ID.
         """
         await self._resource(resource_id).delete()  # type: ignore[attr-defined]
+
+    async def delete_many(
+        self,
+        resource_ids: Iterable[str] | AsyncIterable[str],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkResult[None]:
+        """Delete resources concurrently, one `DELETE /endpoint/{resource_id}` per resource.
+
+        Args:
+            resource_ids: Resource IDs.
+            concurrency: Maximum number of requests in flight, each sent from its own task.
+
+        Returns:
+            One None per resource id in input order, and the errors of the deletes that
+            failed.
+        """
+        return await arun_bulk(resource_ids, self.delete, concurrency)
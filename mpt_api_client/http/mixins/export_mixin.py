@@ -0,0 +1,132 @@
+import asyncio
+from collections.abc import Callable, Sequence
+from multiprocessing.context import BaseContext
+
+from mpt_api_client.http.bulk import BulkResult
+from mpt_api_client.http.client import HTTPClient
+from mpt_api_client.http.partition_worker import ExportSink, env_http_client
+from mpt_api_client.http.partitioned_export import (
+    DEFAULT_PARTITION_RETRIES,
+    ThreadsafeProgress,
+    partition_jobs,
+    run_partitioned_export,
+)
+from mpt_api_client.http.partitions import Partition, offset_partitions
+from mpt_api_client.models import AsyncProgress, Progress
+
+
+class ExportMixin:
+    """Partitioned export mixin, for services with ``CollectionMixin``."""
+
+    def export_partitioned(  # noqa: WPS211
+        self,
+        sink: ExportSink,
+        partitions: Sequence[Partition] | int = 4,
+        *,
+        processes: int | None = None,
+        client_factory: Callable[[], HTTPClient] = env_http_client,
+        batch_size: int = 100,
+        retries: int = DEFAULT_PARTITION_RETRIES,
+        progress: Progress | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> BulkResult[int]:
+        """Export the collection in disjoint partitions exported in parallel processes.
+
+        Each partition is exported by a worker process with its own client from
+        ``client_factory``, so decoding scales past one process. The partitions are
+        combined with the query of the collection, and the sink merges their output in
+        partition order once every partition is written.
+
+        Args:
+            sink: Destination of the records, pickled into the workers, such as
+                ``JSONLExportSink("orders.jsonl")``.
+            partitions: Disjoint partitions from ``time_partitions``,
+                ``range_partitions`` or ``offset_partitions``; a number splits the
+                collection into that many offset ranges of its current total.
+            processes: Number of worker processes; None uses the CPU count.
+            client_factory: Picklable callable building the client of a worker, such as
+                a module-level function; defaults to a client configured from the
+                ``MPT_API_BASE_URL`` and ``MPT_API_TOKEN`` environment variables.
+            batch_size: Number of resources to fetch per request
+            retries: Additional attempts of a failed partition, written again from its
+                start.
+            progress: Optional progress receiver, called with the records of every
+                partition as the workers report their pages.
+            mp_context: Multiprocessing context of the workers; defaults to the
+                ``spawn`` start method.
+
+        Returns:
+            Records written per partition, and the partitions that failed every attempt;
+            the sink is merged only when every partition succeeded.
+        """
+        if isinstance(partitions, int):
+            meta = self.fetch_page(limit=1).meta  # type: ignore[attr-defined]
+            partitions = offset_partitions(meta.pagination.total if meta else 0, partitions)
+        jobs = partition_jobs(self, partitions, sink, client_factory, batch_size)  # type: ignore[arg-type]
+        return run_partitioned_export(
+            jobs, processes, retries=retries, progress=progress, mp_context=mp_context
+        )
+
+
+class AsyncExportMixin:
+    """Async partitioned export mixin, for services with ``AsyncCollectionMixin``."""
+
+    async def export_partitioned(  # noqa: WPS211
+        self,
+        sink: ExportSink,
+        partitions: Sequence[Partition] | int = 4,
+        *,
+        processes: int | None = None,
+        client_factory: Callable[[], HTTPClient] = env_http_client,
+        batch_size: int = 100,
+        retries: int = DEFAULT_PARTITION_RETRIES,
+        progress: AsyncProgress | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> BulkResult[int]:
+        """Export the collection in disjoint partitions exported in parallel processes.
+
+        The workers use a sync client, and the engine waits for them in a thread, so the
+        event loop keeps running meanwhile.
+
+        Each partition is exported by a worker process with its own client from
+        ``client_factory``, so decoding scales past one process. The partitions are
+        combined with the query of the collection, and the sink merges their output in
+        partition order once every partition is written.
+
+        Args:
+            sink: Destination of the records, pickled into the workers, such as
+                ``JSONLExportSink("orders.jsonl")``.
+            partitions: Disjoint partitions from ``time_partitions``,
+                ``range_partitions`` or ``offset_partitions``; a number splits the
+                collection into that many offset ranges of its current total.
+            processes: Number of worker processes; None uses the CPU count.
+            client_factory: Picklable callable building the client of a worker, such as
+                a module-level function; defaults to a client configured from the
+                ``MPT_API_BASE_URL`` and ``MPT_API_TOKEN`` environment variables.
+            batch_size: Number of resources to fetch per request
+            retries: Additional attempts of a failed partition, written again from its
+                start.
+            progress: Optional progress receiver, awaited with the records of every
+                partition as the workers report their pages.
+            mp_context: Multiprocessing context of the workers; defaults to the
+                ``spawn`` start method.
+
+        Returns:
+            Records written per partition, and the partitions that failed every attempt;
+            the sink is merged only when every partition succeeded.
+        """
+        if isinstance(partitions, int):
+            meta = (await self.fetch_page(limit=1)).meta  # type: ignore[attr-defined]
+            partitions = offset_partitions(meta.pagination.total if meta else 0, partitions)
+        jobs = partition_jobs(self, partitions, sink, client_factory, batch_size)  # type: ignore[arg-type]
+        thread_progress = None
+        if progress:
+            thread_progress = ThreadsafeProgress(progress, asyncio.get_running_loop())
+        return await asyncio.to_thread(
+            run_partitioned_export,
+            jobs,
+            processes,
+            retries=retries,
+            progress=thread_progress,
+            mp_context=mp_context,
+        )
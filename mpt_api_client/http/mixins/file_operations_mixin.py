@@ -1,9 +1,9 @@
 from mpt_api_client.constants import APPLICATION_JSON
-from mpt_api_client.http.client import json_to_file_payload
 from mpt_api_client.http.mixins.download_file_mixin import (
     AsyncDownloadFileMixin,
     DownloadFileMixin,
 )
+from mpt_api_client.http.request_response_utils import json_to_file_payload
 from mpt_api_client.http.types import FileTypes
 from mpt_api_client.models import ResourceData
 
@@ -32,7 +32,7 @@ class FilesOperationsMixin[Model](DownloadFileMixin[Model]):
         if resource_data:
             files[data_key] = (
                 None,
-                json_to_file_payload(resource_data),
+                json_to_file_payload(resource_data, self.http_client.json_codec),  # type: ignore[attr-defined]
                 APPLICATION_JSON,
             )
         response = self.http_client.request("post", self.path, files=files)  # type: ignore[attr-defined]
@@ -64,7 +64,7 @@ class AsyncFilesOperationsMixin[Model](AsyncDownloadFileMixin[Model]):
         if resource_data:
             files[data_key] = (
                 None,
-                json_to_file_payload(resource_data),
+                json_to_file_payload(resource_data, self.http_client.json_codec),  # type: ignore[attr-defined]
                 APPLICATION_JSON,
             )
 
@@ -1,3 +1,6 @@
+from mpt_api_client.http.url_utils import join_url_path
+
+
 class GetMixin[Model]:
     """Get resource mixin."""
 
@@ -9,7 +12,7 @@ class GetMixin[Model]:
             select: List of fields to select.
 
         Returns:
-            Resource object.
+            Resource object, served from the client's model cache when enabled.
         """
         if isinstance(select, list):
             select = ",".join(select) if select else None
@@ -18,6 +21,20 @@ class GetMixin[Model]:
             options=self.query_state.options,  # type: ignore[attr-defined]
         )
 
+    def invalidate(self, resource_id: str | None = None) -> None:
+        """Drop cached copies of a resource, or of every resource of the service.
+
+        A no-op unless the client has a model cache enabled.
+
+        Args:
+            resource_id: Resource ID; None invalidates the whole service endpoint.
+        """
+        model_cache = self.http_client.components.model_cache  # type: ignore[attr-defined]
+        if model_cache is None:
+            return
+        path = self.path  # type: ignore[attr-defined]
+        model_cache.invalidate(join_url_path(path, resource_id) if resource_id else path)
+
 
 class AsyncGetMixin[Model]:
     """Async get resource mixin."""
@@ -30,7 +47,7 @@ class AsyncGetMixin[Model]:
             select: List of fields to select.
 
         Returns:
-            Resource object.
+            Resource object, served from the client's model cache when enabled.
         """
         if isinstance(select, list):
             select = ",".join(select) if select else None
@@ -38,3 +55,17 @@ class AsyncGetMixin[Model]:
             query_params={"select": select},
             options=self.query_state.options,  # type: ignore[attr-defined]
         )
+
+    def invalidate(self, resource_id: str | None = None) -> None:
+        """Drop cached copies of a resource, or of every resource of the service.
+
+        A no-op unless the client has a model cache enabled.
+
+        Args:
+            resource_id: Resource ID; None invalidates the whole service endpoint.
+        """
+        model_cache = self.http_client.components.model_cache  # type: ignore[attr-defined]
+        if model_cache is None:
+            return
+        path = self.path  # type: ignore[attr-defined]
+        model_cache.invalidate(join_url_path(path, resource_id) if resource_id else path)
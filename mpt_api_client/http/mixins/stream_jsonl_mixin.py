@@ -1,4 +1,4 @@
-import json
+import time
 from collections.abc import AsyncIterator, Iterator
 
 from mpt_api_client.constants import APPLICATION_JSONL
@@ -10,7 +10,7 @@ from mpt_api_client.models import Model as BaseModel
 class StreamJSONLMixin[Model: BaseModel](QueryableMixin):
     """Mixin providing JSONL (NDJSON) streaming of a collection line by line."""
 
-    def stream(self, *, progress: Progress | None = None) -> Iterator[Model]:
+    def stream(self, *, progress: Progress | None = None) -> Iterator[Model]:  # noqa: WPS210
         """Stream resources from a JSONL endpoint, yielding one model per line.
 
         Unlike ``iterate()``, which paginates and deserializes full pages, this
@@ -26,15 +26,20 @@ class StreamJSONLMixin[Model: BaseModel](QueryableMixin):
         Yields:
             Resources, one per non-empty line of the response.
         """
+        path = self.build_path()  # type: ignore[attr-defined]
+        json_codec = self.http_client.json_codec  # type: ignore[attr-defined]
+        meter = self.http_client.components.metrics.decoding(path)  # type: ignore[attr-defined]
         with self.http_client.stream(  # type: ignore[attr-defined]
             "GET",
-            self.build_path(),  # type: ignore[attr-defined]
+            path,
             headers={"Accept": APPLICATION_JSONL},
         ) as response:
             for line in response.iter_lines():
                 if not line.strip():
                     continue
-                model = self._model_class(json.loads(line))  # type: ignore[attr-defined]
+                started_at = time.perf_counter()
+                model = self._model_class(json_codec.loads(line))  # type: ignore[attr-defined]
+                meter.record(1, time.perf_counter() - started_at)
                 if progress:
                     progress.item_processed()
                 yield model
@@ -45,7 +50,9 @@ class StreamJSONLMixin[Model: BaseModel](QueryableMixin):
 class AsyncStreamJSONLMixin[Model: BaseModel](QueryableMixin):
     """Async mixin providing JSONL (NDJSON) streaming of a collection line by line."""
 
-    async def stream(self, *, progress: AsyncProgress | None = None) -> AsyncIterator[Model]:
+    async def stream(  # noqa: WPS210
+        self, *, progress: AsyncProgress | None = None
+    ) -> AsyncIterator[Model]:
         """Stream resources from a JSONL endpoint, yielding one model per line.
 
         Unlike ``iterate()``, which paginates and deserializes full pages, this
@@ -61,15 +68,20 @@ class AsyncStreamJSONLMixin[Model: BaseModel](QueryableMixin):
         Yields:
             Resources, one per non-empty line of the response.
         """
+        path = self.build_path()  # type: ignore[attr-defined]
+        json_codec = self.http_client.json_codec  # type: ignore[attr-defined]
+        meter = self.http_client.components.metrics.decoding(path)  # type: ignore[attr-defined]
         async with self.http_client.stream(  # type: ignore[attr-defined]
             "GET",
-            self.build_path(),  # type: ignore[attr-defined]
+            path,
             headers={"Accept": APPLICATION_JSONL},
         ) as response:
             async for line in response.aiter_lines():
                 if not line.strip():
                     continue
-                model = self._model_class(json.loads(line))  # type: ignore[attr-defined]
+                started_at = time.perf_counter()
+                model = self._model_class(json_codec.loads(line))  # type: ignore[attr-defined]
+                meter.record(1, time.perf_counter() - started_at)
                 if progress:
                     await progress.item_processed()  # noqa: WPS476
                 yield model
@@ -1,4 +1,5 @@
-import json
+import itertools
+import time
 from collections.abc import AsyncIterator, Iterator, Mapping
 
 from mpt_api_client.constants import (
@@ -7,6 +8,13 @@ from mpt_api_client.constants import (
     MPT_STREAMING_HEADER,
 )
 from mpt_api_client.exceptions import MPTStreamingNotEnabledError
+from mpt_api_client.http.checkpoint import (
+    Checkpointer,
+    CheckpointTracker,
+    acheckpointed,
+    checkpointed,
+    start_checkpoint,
+)
 from mpt_api_client.http.mixins.queryable_mixin import QueryableMixin
 from mpt_api_client.http.types import HeaderTypes
 from mpt_api_client.models import AsyncProgress, Progress
@@ -49,7 +57,13 @@ class StreamingMixin[Model: BaseModel](QueryableMixin):
     ``application/jsonl`` their own meaning outside streaming mode.
     """
 
-    def stream(self, *, progress: Progress | None = None) -> Iterator[Model]:
+    def stream(
+        self,
+        *,
+        progress: Progress | None = None,
+        checkpoint: Checkpointer | None = None,
+        resume_from: str | None = None,
+    ) -> Iterator[Model]:
         """Stream the full result set in streaming mode, yielding one model per record.
 
         Unlike ``iterate()``, which pages through the collection and deserializes whole
@@ -60,29 +74,74 @@ class StreamingMixin[Model: BaseModel](QueryableMixin):
             progress: Optional progress receiver. `item_processed` is called once per
                 record before it is yielded and `completed` once when the response body
                 is fully consumed. `set_total_items` is never called.
+            checkpoint: Optional checkpointer saving the number of records processed
+                every ``interval`` records and when the stream stops early.
+            resume_from: Checkpoint token of a previous stream of the same query. The
+                stream is reopened and the records already processed are skipped without
+                being decoded, so records added or removed meanwhile shift the position.
 
         Yields:
             Resources, one per non-empty line of the response.
 
         Raises:
             MPTStreamingNotEnabledError: If the API does not confirm streaming mode.
+            ValueError: If ``resume_from`` was taken for another query or mode.
         """
         path = self.build_path()  # type: ignore[attr-defined]
+        start = start_checkpoint("stream", path, None, resume_from)
+        records = self._stream_records(path, start.processed, progress)
+        yield from checkpointed(records, CheckpointTracker(start, checkpoint))
+        if progress:
+            progress.completed()
+
+    def stream_or_iterate(
+        self, batch_size: int = 100, *, progress: Progress | None = None
+    ) -> Iterator[Model]:
+        """Stream the full result set, or page through it where streaming mode is off.
+
+        The first call for an endpoint tries ``stream()``; when the API does not confirm
+        streaming mode, the endpoint is remembered on the HTTP client and this call, like
+        every later one, pages through the collection with ``iterate()`` instead. The
+        confirmation is checked before any record is read, so no record is yielded twice.
+
+        Args:
+            batch_size: Number of resources to fetch per request when paging.
+            progress: Optional progress receiver, passed on to ``stream()`` or
+                ``iterate()``.
+
+        Yields:
+            Resources of the collection.
+        """
+        unsupported = self.http_client.components.streaming_unsupported  # type: ignore[attr-defined]
+        endpoint = self._endpoint  # type: ignore[attr-defined]
+        if endpoint not in unsupported:
+            try:
+                yield from self.stream(progress=progress)
+            except MPTStreamingNotEnabledError:
+                unsupported.add(endpoint)
+            else:
+                return
+        yield from self.iterate(batch_size, progress=progress)  # type: ignore[attr-defined]
+
+    def _stream_records(  # noqa: WPS210
+        self, path: str, skip: int, progress: Progress | None
+    ) -> Iterator[Model]:
+        json_codec = self.http_client.json_codec  # type: ignore[attr-defined]
+        meter = self.http_client.components.metrics.decoding(path)  # type: ignore[attr-defined]
         with self.http_client.stream(  # type: ignore[attr-defined]
             "GET",
             path,
             headers=streaming_request_headers(),
         ) as response:
             confirm_streaming_mode(response.headers, path)
-            for line in response.iter_lines():
-                if not line.strip():
-                    continue
-                model = self._model_class(json.loads(line))  # type: ignore[attr-defined]
+            lines = (line for line in response.iter_lines() if line.strip())
+            for line in itertools.islice(lines, skip, None):
+                started_at = time.perf_counter()
+                model = self._model_class(json_codec.loads(line))  # type: ignore[attr-defined]
+                meter.record(1, time.perf_counter() - started_at)
                 if progress:
                     progress.item_processed()
                 yield model
-        if progress:
-            progress.completed()
 
 
 class AsyncStreamingMixin[Model: BaseModel](QueryableMixin):
@@ -94,7 +153,13 @@ class AsyncStreamingMixin[Model: BaseModel](QueryableMixin):
     ``application/jsonl`` their own meaning outside streaming mode.
     """
 
-    async def stream(self, *, progress: AsyncProgress | None = None) -> AsyncIterator[Model]:
+    async def stream(
+        self,
+        *,
+        progress: AsyncProgress | None = None,
+        checkpoint: Checkpointer | None = None,
+        resume_from: str | None = None,
+    ) -> AsyncIterator[Model]:
         """Stream the full result set in streaming mode, yielding one model per record.
 
         Unlike ``iterate()``, which pages through the collection and deserializes whole
@@ -105,14 +170,63 @@ class AsyncStreamingMixin[Model: BaseModel](QueryableMixin):
             progress: Optional progress receiver. `item_processed` is awaited once per
                 record before it is yielded and `completed` once when the response body
                 is fully consumed. `set_total_items` is never called.
+            checkpoint: Optional checkpointer saving the number of records processed
+                every ``interval`` records and when the stream stops early.
+            resume_from: Checkpoint token of a previous stream of the same query. The
+                stream is reopened and the records already processed are skipped without
+                being decoded, so records added or removed meanwhile shift the position.
 
         Yields:
             Resources, one per non-empty line of the response.
 
         Raises:
             MPTStreamingNotEnabledError: If the API does not confirm streaming mode.
+            ValueError: If ``resume_from`` was taken for another query or mode.
         """
         path = self.build_path()  # type: ignore[attr-defined]
+        start = start_checkpoint("stream", path, None, resume_from)
+        records = self._stream_records(path, start.processed, progress)
+        async for model in acheckpointed(records, CheckpointTracker(start, checkpoint)):
+            yield model
+        if progress:
+            await progress.completed()
+
+    async def stream_or_iterate(
+        self, batch_size: int = 100, *, progress: AsyncProgress | None = None
+    ) -> AsyncIterator[Model]:
+        """Stream the full result set, or page through it where streaming mode is off.
+
+        The first call for an endpoint tries ``stream()``; when the API does not confirm
+        streaming mode, the endpoint is remembered on the HTTP client and this call, like
+        every later one, pages through the collection with ``iterate()`` instead. The
+        confirmation is checked before any record is read, so no record is yielded twice.
+
+        Args:
+            batch_size: Number of resources to fetch per request when paging.
+            progress: Optional progress receiver, passed on to ``stream()`` or
+                ``iterate()``.
+
+        Yields:
+            Resources of the collection.
+        """
+        unsupported = self.http_client.components.streaming_unsupported  # type: ignore[attr-defined]
+        endpoint = self._endpoint  # type: ignore[attr-defined]
+        if endpoint not in unsupported:
+            try:
+                async for model in self.stream(progress=progress):
+                    yield model
+            except MPTStreamingNotEnabledError:
+                unsupported.add(endpoint)
+            else:
+                return
+        async for resource in self.iterate(batch_size, progress=progress):  # type: ignore[attr-defined]
+            yield resource
+
+    async def _stream_records(  # noqa: WPS210
+        self, path: str, skip: int, progress: AsyncProgress | None
+    ) -> AsyncIterator[Model]:
+        json_codec = self.http_client.json_codec  # type: ignore[attr-defined]
+        meter = self.http_client.components.metrics.decoding(path)  # type: ignore[attr-defined]
         async with self.http_client.stream(  # type: ignore[attr-defined]
             "GET",
             path,
@@ -122,9 +236,12 @@ class AsyncStreamingMixin[Model: BaseModel](QueryableMixin):
             async for line in response.aiter_lines():
                 if not line.strip():
                     continue
-                model = self._model_class(json.loads(line))  # type: ignore[attr-defined]
+                if skip:
+                    skip -= 1
+                    continue
+                started_at = time.perf_counter()
+                model = self._model_class(json_codec.loads(line))  # type: ignore[attr-defined]
+                meter.record(1, time.perf_counter() - started_at)
                 if progress:
                     await progress.item_processed()  # noqa: WPS476
                 yield model
-        if progress:
-            await progress.completed()
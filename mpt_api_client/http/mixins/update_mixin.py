@@ -1,5 +1,10 @@
+from collections.abc import AsyncIterable, Iterable
+
+from mpt_api_client.http.bulk import DEFAULT_BULK_CONCURRENCY, BulkResult, arun_bulk, run_bulk
 from mpt_api_client.models import ResourceData
 
+ResourceUpdate = tuple[str, ResourceData]
+
 
 class UpdateMixin[Model]:
     """Update resource mixin."""
@@ -8,6 +13,23 @@ class UpdateMixin[Model]:
         """Update a resource using `PUT /endpoint/{resource_id}`."""
         return self._resource(resource_id).put(json=resource_data)  # type: ignore[attr-defined, no-any-return]
 
+    def update_many(
+        self, updates: Iterable[ResourceUpdate], *, concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> BulkResult[Model]:
+        """Update resources concurrently, one `PUT /endpoint/{resource_id}` per resource.
+
+        Args:
+            updates: ``(resource_id, resource_data)`` pairs.
+            concurrency: Maximum number of requests in flight, sent from a thread pool.
+
+        Returns:
+            Updated resources in input order, and the errors of the updates that failed.
+        """
+        return run_bulk(updates, self._update_one, concurrency)
+
+    def _update_one(self, resource_update: ResourceUpdate) -> Model:
+        return self.update(*resource_update)
+
 
 class AsyncUpdateMixin[Model]:
     """Update resource mixin."""
@@ -15,3 +37,23 @@ class AsyncUpdateMixin[Model]:
     async def update(self, resource_id: str, resource_data: ResourceData) -> Model:
         """Update a resource using `PUT /endpoint/{resource_id}`."""
         return await self._resource(resource_id).put(json=resource_data)  # type: ignore[attr-defined, no-any-return]
+
+    async def update_many(
+        self,
+        updates: Iterable[ResourceUpdate] | AsyncIterable[ResourceUpdate],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> BulkResult[Model]:
+        """Update resources concurrently, one `PUT /endpoint/{resource_id}` per resource.
+
+        Args:
+            updates: ``(resource_id, resource_data)`` pairs.
+            concurrency: Maximum number of requests in flight, each sent from its own task.
+
+        Returns:
+            Updated resources in input order, and the errors of the updates that failed.
+        """
+        return await arun_bulk(updates, self._update_one, concurrency)
+
+    async def _update_one(self, resource_update: ResourceUpdate) -> Model:
+        return await self.update(*resource_update)
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+
+from mpt_api_client.http.hooks import template_path
+from mpt_api_client.http.types import Response
+from mpt_api_client.http.url_utils import is_path_within
+
+ModelCacheKey = tuple[str, str, bool]
+
+
+@dataclass(frozen=True)
+class ModelCachePolicy:
+    """Policy of the resource cache used by ``get`` on services.
+
+    Attributes:
+        ttl: Seconds a fetched resource is served from the cache.
+        max_entries: Maximum number of cached resources; the least recently used one is
+            evicted first.
+        endpoints: Service endpoint path prefixes to cache, for example
+            ``("/public/v1/catalog/listings", "/public/v1/commerce/agreements")``. None
+            caches every service.
+    """
+
+    ttl: float = 60
+    max_entries: int = 1024
+    endpoints: Collection[str] | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If ``ttl`` is not positive or ``max_entries`` is lower than 1.
+        """
+        if self.ttl <= 0:
+            raise ValueError("Model cache ttl must be positive.")
+        if self.max_entries < 1:
+            raise ValueError("Model cache max_entries must be at least 1.")
+
+
+@dataclass
+class ModelCacheStats:
+    """Counters of a model cache.
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups that found no live entry, expired entries included.
+        evictions: Entries dropped to respect ``max_entries``.
+        invalidations: Entries dropped because their resource was modified.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class ModelCache:
+    """Thread-safe TTL and LRU cache of single-resource responses.
+
+    Entries are keyed by resource URL, ``select`` and ``render`` and hold the response, so
+    every hit builds a fresh model that the caller may modify freely.
+
+    Attributes:
+        generation: Number of invalidations so far. A response is only stored when no
+            invalidation happened since its request was sent.
+    """
+
+    def __init__(self, policy: ModelCachePolicy, clock: Callable[[], float] = time.monotonic):
+        self.policy = policy
+        self.stats = ModelCacheStats()
+        self.generation = 0
+        self._clock = clock
+        self._entries: OrderedDict[ModelCacheKey, tuple[float, Response]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def caches(self, resource_url: str) -> bool:
+        """Return whether resources under ``resource_url`` are cached by the policy."""
+        if self.policy.endpoints is None:
+            return True
+        return any(is_path_within(resource_url, prefix) for prefix in self.policy.endpoints)
+
+    def get(self, key: ModelCacheKey) -> Response | None:
+        """Return the live response stored under ``key`` and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                self._entries.pop(key, None)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: ModelCacheKey, response: Response, generation: int | None = None) -> None:
+        """Store ``response`` under ``key`` for ``ttl`` seconds.
+
+        Args:
+            key: Cache key of the resource.
+            response: Response of the resource.
+            generation: ``generation`` read before the request was sent. The response is
+                dropped when an invalidation happened since, as it may predate the change.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (self._clock() + self.policy.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.policy.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, resource_url: str) -> None:
+        """Drop the entries of ``resource_url``, its sub-resources and its parent resource.
+
+        Modifying a resource also changes its parent's embedded view of it, for example an
+        order line and the order it belongs to. Its siblings and the resources further up
+        are left cached.
+        """
+        parent_url = _parent_resource(resource_url)
+        with self._lock:
+            self.generation += 1
+            stale_keys = [
+                key
+                for key in self._entries
+                if is_path_within(key[0], resource_url) or key[0] == parent_url
+            ]
+            for stale_key in stale_keys:
+                del self._entries[stale_key]  # noqa: WPS420
+            self.stats.invalidations += len(stale_keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+def _parent_resource(resource_url: str) -> str | None:
+    """Return the nearest ancestor of ``resource_url`` ending with a resource id, if any.
+
+    Examples:
+        >>> _parent_resource("/public/v1/commerce/orders/ORD-1/lines/LN-1")
+        '/public/v1/commerce/orders/ORD-1'
+        >>> _parent_resource("/public/v1/commerce/orders/ORD-1")
+    """
+    segments = resource_url.rstrip("/").split("/")
+    templated = template_path("/".join(segments)).split("/")
+    for end in range(len(segments) - 1, 0, -1):
+        if templated[end - 1] == "{id}":
+            return "/".join(segments[:end])
+    return None
@@ -0,0 +1,169 @@
+import asyncio
+import contextlib
+import contextvars
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from mpt_api_client.models import Model as BaseModel
+from mpt_api_client.models import ModelCollection
+from mpt_api_client.models.meta import Meta
+
+DEFAULT_PAGE_CONCURRENCY = 4
+
+
+type _AsyncFetch[Model: BaseModel] = Callable[[int], Awaitable[ModelCollection[Model]]]
+
+
+class _PageWindow[Started: Future[Any] | asyncio.Future[Any]]:
+    """Pages in flight, started in offset order and kept up to the window size.
+
+    Only the first page is started until ``plan`` reads the offsets of the other pages from
+    its pagination.
+    """
+
+    def __init__(self, start: Callable[[int], Started], concurrency: int) -> None:
+        self.in_flight: deque[Started] = deque()
+        self._offsets: Iterator[int] = iter((0,))
+        self._planned = False
+        self._start = start
+        self._concurrency = concurrency
+
+    def plan(self, meta: Meta | None) -> None:
+        """Queue the offsets of the pages after the first one, once, from its pagination."""
+        if self._planned:
+            return
+        self._planned = True
+        if meta and meta.pagination.has_next():
+            pagination = meta.pagination
+            self._offsets = iter(
+                range(pagination.next_offset(), pagination.total, pagination.limit)
+            )
+
+    def fill(self) -> None:
+        """Start pages until the window is full or no offsets are left."""
+        while len(self.in_flight) < self._concurrency:
+            offset = next(self._offsets, None)
+            if offset is None:
+                return
+            self.in_flight.append(self._start(offset))
+
+    def take(self, done: Collection[Started] | None) -> Started:
+        """Remove and return the earliest page, or the earliest of the ``done`` ones."""
+        if done is None:
+            return self.in_flight.popleft()
+        started = next(in_flight for in_flight in self.in_flight if in_flight in done)
+        self.in_flight.remove(started)
+        return started
+
+    def cancel(self) -> None:
+        """Cancel the pages in flight, retrieving the errors of the finished ones."""
+        for started in self.in_flight:
+            if started.done() and not started.cancelled():
+                started.exception()
+            started.cancel()
+
+
+def fetch_pages_parallel[Model: BaseModel](
+    fetch: Callable[[int], ModelCollection[Model]],
+    concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    *,
+    ordered: bool = True,
+) -> Iterator[ModelCollection[Model]]:
+    """Fetch the first page, then the pages after it on a thread pool.
+
+    The pagination total of the first page gives the offsets of the other pages, fetched at
+    most ``concurrency`` at a time. Each page runs in a copy of the caller context, so an
+    active ``deadline()`` applies to it. At most ``concurrency`` pages are in flight or
+    waiting to be yielded, so memory stays bounded however many pages there are.
+
+    Args:
+        fetch: Callable fetching the page at an offset.
+        concurrency: Maximum number of pages in flight.
+        ordered: Yield the pages in offset order, holding the pages that arrive early;
+            False yields each page as soon as it arrives.
+
+    Returns:
+        Iterator of the fetched pages.
+
+    Raises:
+        ValueError: If ``concurrency`` is below 1.
+    """
+    _validate_concurrency(concurrency)
+    return _fetch_pages(fetch, concurrency, ordered=ordered)
+
+
+def afetch_pages_parallel[Model: BaseModel](
+    fetch: _AsyncFetch[Model],
+    concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    *,
+    ordered: bool = True,
+) -> AsyncIterator[ModelCollection[Model]]:
+    """Fetch the first page, then the pages after it in concurrent tasks.
+
+    The pagination total of the first page gives the offsets of the other pages, fetched at
+    most ``concurrency`` at a time. At most ``concurrency`` pages are in flight or waiting
+    to be yielded. Closing the returned iterator, or an error of a page, cancels the pages
+    still in flight.
+
+    Args:
+        fetch: Coroutine function fetching the page at an offset.
+        concurrency: Maximum number of pages in flight.
+        ordered: Yield the pages in offset order, holding the pages that arrive early;
+            False yields each page as soon as it arrives.
+
+    Returns:
+        Async iterator of the fetched pages.
+
+    Raises:
+        ValueError: If ``concurrency`` is below 1.
+    """
+    _validate_concurrency(concurrency)
+    return _afetch_pages(fetch, concurrency, ordered=ordered)
+
+
+def _fetch_pages[Model: BaseModel](
+    fetch: Callable[[int], ModelCollection[Model]],
+    concurrency: int,
+    *,
+    ordered: bool,
+) -> Iterator[ModelCollection[Model]]:
+    with ThreadPoolExecutor(max_workers=concurrency) as executor, contextlib.ExitStack() as cleanup:
+        window = _PageWindow(
+            lambda offset: executor.submit(contextvars.copy_context().run, fetch, offset),
+            concurrency,
+        )
+        cleanup.callback(window.cancel)
+        window.fill()
+        while window.in_flight:
+            done = None if ordered else wait(window.in_flight, return_when=FIRST_COMPLETED).done
+            page = window.take(done).result()
+            window.plan(page.meta)
+            window.fill()
+            yield page
+
+
+async def _afetch_pages[Model: BaseModel](
+    fetch: _AsyncFetch[Model],
+    concurrency: int,
+    *,
+    ordered: bool,
+) -> AsyncIterator[ModelCollection[Model]]:
+    window = _PageWindow(lambda offset: asyncio.ensure_future(fetch(offset)), concurrency)
+    with contextlib.ExitStack() as cleanup:
+        cleanup.callback(window.cancel)
+        window.fill()
+        while window.in_flight:
+            done = None
+            if not ordered:
+                done = (await asyncio.wait(window.in_flight, return_when=FIRST_COMPLETED))[0]
+            page = await window.take(done)
+            window.plan(page.meta)
+            window.fill()
+            yield page
+
+
+def _validate_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("Page concurrency must be at least 1.")
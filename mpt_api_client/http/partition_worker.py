@@ -0,0 +1,150 @@
+import contextlib
+import queue
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from mpt_api_client.auth import EnvTokenAuthentication
+from mpt_api_client.http.base_service import ServiceBase
+from mpt_api_client.http.client import HTTPClient
+from mpt_api_client.http.partitions import Partition
+from mpt_api_client.http.query_options import QueryOptions
+from mpt_api_client.http.query_state import QueryState
+from mpt_api_client.json_codec import JSONCodec
+from mpt_api_client.models import Model as BaseModel
+from mpt_api_client.models import ModelCollection
+from mpt_api_client.rql import RQLQuery
+
+type PartitionEvent = tuple[int, int, int]
+
+
+class ExportSink(Protocol):
+    """Destination of a partitioned export.
+
+    The sink is pickled into every worker process, which writes its partition with
+    ``write_partition``; the parent process then calls ``merge`` once every partition is
+    written. A retried partition is written again from the start.
+    """
+
+    def write_partition(
+        self, index: int, resources: Iterable[BaseModel], json_codec: JSONCodec | None = None
+    ) -> None:
+        """Write the resources of partition ``index``, replacing a previous attempt.
+
+        The worker passes the JSON codec of its client as ``json_codec``.
+        """
+
+    def merge(self, indexes: list[int]) -> None:
+        """Combine the written partitions, in the order of ``indexes``."""
+
+
+def env_http_client() -> HTTPClient:
+    """Build a worker client from the ``MPT_API_BASE_URL`` and ``MPT_API_TOKEN`` variables."""
+    return HTTPClient(authentication=EnvTokenAuthentication())
+
+
+@dataclass(frozen=True)
+class PartitionJob:
+    """Everything a worker process needs to export one partition; it must pickle.
+
+    Attributes:
+        index: Position of the partition.
+        partition: The partition, for its offset range.
+        path: Collection path without query.
+        rql: Filter of the collection combined with the filter of the partition.
+        order_by: Ordering of the collection.
+        select: Field selection of the collection.
+        render: Whether the collection requests ``render()``.
+        service_class: Service class decoding the pages.
+        client_factory: Picklable callable building the HTTP client of the worker.
+        sink: Destination of the records.
+        batch_size: Number of records per page.
+        events: Queue receiving ``(index, total, processed)`` after every page; set by
+            the export engine.
+    """
+
+    index: int
+    partition: Partition
+    path: str
+    rql: str | None
+    order_by: list[str] | None
+    select: list[str] | None
+    render: bool
+    service_class: type[ServiceBase[Any, Any]]
+    client_factory: Callable[[], HTTPClient]
+    sink: ExportSink
+    batch_size: int
+    events: "queue.Queue[PartitionEvent] | None" = None
+
+    def page_path(self, limit: int, offset: int) -> str:
+        """Return the path of the page at ``offset``."""
+        query_state = QueryState(
+            RQLQuery.from_string(self.rql) if self.rql else None,
+            self.order_by,
+            self.select,
+            options=QueryOptions(render=self.render),
+        )
+        return f"{self.path}?{query_state.build({'limit': limit, 'offset': offset})}"
+
+
+def export_partition(job: PartitionJob) -> int:
+    """Export one partition into the sink; the entry point of the worker processes.
+
+    Returns:
+        Number of records written.
+    """
+    with contextlib.ExitStack() as cleanup:
+        client = job.client_factory()
+        cleanup.callback(client.httpx_client.close)
+        reader = _PartitionReader(job, client)
+        job.sink.write_partition(job.index, reader.records(), client.json_codec)
+        return reader.processed
+
+
+class _PartitionReader:
+    """Pages through a partition, reporting progress after every page."""
+
+    def __init__(self, job: PartitionJob, client: HTTPClient) -> None:
+        self.processed = 0
+        self._job = job
+        self._client = client
+
+    def records(self) -> Iterator[BaseModel]:
+        for page in self._pages():
+            yield from page
+            self.processed += len(page)
+            self._report(page)
+
+    def _pages(self) -> Iterator[ModelCollection[Any]]:
+        partition = self._job.partition
+        offset = partition.offset
+        while partition.stop is None or offset < partition.stop:
+            limit = self._job.batch_size
+            if partition.stop is not None:
+                limit = min(limit, partition.stop - offset)
+            response = self._client.request("get", self._job.page_path(limit, offset))
+            page = self._job.service_class.make_collection(response)
+            yield page
+            if not page or _is_last_page(page, limit):
+                return
+            offset += len(page)
+
+    def _report(self, page: ModelCollection[Any]) -> None:
+        total = self._total(page)
+        if self._job.events is not None:
+            self._job.events.put((self._job.index, total, self.processed))
+
+    def _total(self, page: ModelCollection[Any]) -> int:
+        if not page.meta:
+            return self.processed
+        partition = self._job.partition
+        end = page.meta.pagination.total
+        if partition.stop is not None:
+            end = min(end, partition.stop)
+        return max(end - partition.offset, self.processed)
+
+
+def _is_last_page(page: ModelCollection[Any], limit: int) -> bool:
+    if page.meta:
+        return not page.meta.pagination.has_next()
+    return len(page) < limit
@@ -0,0 +1,208 @@
+import asyncio
+import multiprocessing
+import queue
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import replace
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from mpt_api_client.http.base_service import ServiceBase
+from mpt_api_client.http.bulk import BulkItemError, BulkResult
+from mpt_api_client.http.client import HTTPClient
+from mpt_api_client.http.partition_worker import (
+    ExportSink,
+    PartitionEvent,
+    PartitionJob,
+    export_partition,
+)
+from mpt_api_client.http.partitions import Partition
+from mpt_api_client.models import AsyncProgress, Progress
+from mpt_api_client.rql import RQLQuery
+
+DEFAULT_PARTITION_RETRIES = 2
+DEFAULT_START_METHOD = "spawn"
+
+_POLL_INTERVAL = 0.05
+
+
+class ExportProgress:
+    """Folds the progress events of the worker processes into one progress receiver.
+
+    A retried partition reports its records again from zero; they only count once they
+    exceed what the failed attempts reported.
+    """
+
+    def __init__(self, progress: Progress | None) -> None:
+        self._progress = progress
+        self._totals: dict[int, int] = {}
+        self._reported: Counter[int] = Counter()
+
+    def drain(self, events: "queue.Queue[PartitionEvent]") -> None:
+        """Apply the events waiting in ``events``."""
+        while True:
+            try:
+                index, total, processed = events.get_nowait()
+            except queue.Empty:
+                return
+            self._apply(index, total, processed)
+
+    def _apply(self, index: int, total: int, processed: int) -> None:
+        if self._progress is None:
+            return
+        if self._totals.get(index) != total:
+            self._totals[index] = total
+            self._progress.set_total_items(sum(self._totals.values()))
+        for _ in range(processed - self._reported[index]):
+            self._progress.item_processed()
+        self._reported[index] = max(self._reported[index], processed)
+
+
+class ThreadsafeProgress:
+    """Progress receiver forwarding the calls of a worker thread to an ``AsyncProgress``.
+
+    Each call waits for the coroutine to finish on ``loop``, which must be running.
+    """
+
+    def __init__(self, progress: AsyncProgress, loop: asyncio.AbstractEventLoop) -> None:
+        self._progress = progress
+        self._loop = loop
+
+    def set_total_items(self, total: int) -> None:
+        """Forward ``set_total_items`` to the event loop."""
+        asyncio.run_coroutine_threadsafe(self._progress.set_total_items(total), self._loop).result()
+
+    def item_processed(self) -> None:
+        """Forward ``item_processed`` to the event loop."""
+        asyncio.run_coroutine_threadsafe(self._progress.item_processed(), self._loop).result()
+
+    def completed(self) -> None:
+        """Forward ``completed`` to the event loop."""
+        asyncio.run_coroutine_threadsafe(self._progress.completed(), self._loop).result()
+
+
+class _ExportRun:
+    """Partition jobs in flight in the worker pool, resubmitting the failed ones."""
+
+    def __init__(
+        self,
+        executor: Executor,
+        events: "queue.Queue[PartitionEvent]",
+        retries: int,
+        progress: Progress | None,
+    ) -> None:
+        self.outcome: BulkResult[int] = BulkResult()
+        self._pending: dict[Future[int], PartitionJob] = {}
+        self._executor = executor
+        self._events = events
+        self._retries = retries
+        self._progress = ExportProgress(progress)
+        self._attempts: Counter[int] = Counter()
+
+    def run(self, jobs: list[PartitionJob]) -> None:
+        """Run ``jobs`` until each one succeeded or failed every attempt."""
+        self.outcome.results = [None for _ in jobs]
+        for job in jobs:
+            self._submit(replace(job, events=self._events))
+        while self._pending:
+            done = wait(self._pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED).done
+            self._progress.drain(self._events)
+            self._collect(done)
+        self._progress.drain(self._events)
+
+    def _submit(self, job: PartitionJob) -> None:
+        self._pending[self._executor.submit(export_partition, job)] = job
+
+    def _collect(self, done: set[Future[int]]) -> None:
+        for future in done:
+            job = self._pending.pop(future)
+            try:
+                self.outcome.results[job.index] = future.result()
+            except Exception as error:
+                self._fail(job, error)
+
+    def _fail(self, job: PartitionJob, error: Exception) -> None:
+        self._attempts[job.index] += 1
+        if self._attempts[job.index] <= self._retries:
+            self._submit(job)
+            return
+        self.outcome.errors.append(BulkItemError(job.index, job.partition, error))
+
+
+def run_partitioned_export(
+    jobs: list[PartitionJob],
+    processes: int | None = None,
+    *,
+    retries: int = DEFAULT_PARTITION_RETRIES,
+    progress: Progress | None = None,
+    mp_context: BaseContext | None = None,
+) -> BulkResult[int]:
+    """Export every partition in a pool of worker processes, then merge the sink.
+
+    Args:
+        jobs: One job per partition, indexed in order.
+        processes: Number of worker processes; None uses the CPU count.
+        retries: Additional attempts of a failed partition.
+        progress: Optional progress receiver, fed from the workers after every page; the
+            total grows as the partitions report theirs.
+        mp_context: Multiprocessing context of the workers; defaults to the ``spawn``
+            start method, since forking a process running other threads, such as an
+            event loop thread, can deadlock the workers.
+
+    Returns:
+        Records written per partition, and the partitions that failed every attempt. The
+        sink is only merged, and ``progress`` completed, when every partition succeeded.
+    """
+    context = mp_context or multiprocessing.get_context(DEFAULT_START_METHOD)
+    with context.Manager() as manager, ProcessPoolExecutor(processes, context) as executor:
+        export_run = _ExportRun(executor, manager.Queue(), retries, progress)
+        export_run.run(jobs)
+    return _finish(export_run.outcome, jobs, progress)
+
+
+def _finish(
+    outcome: BulkResult[int], jobs: list[PartitionJob], progress: Progress | None
+) -> BulkResult[int]:
+    outcome.errors.sort(key=lambda item_error: item_error.index)
+    if outcome.ok and jobs:
+        jobs[0].sink.merge([job.index for job in jobs])
+    if outcome.ok and progress:
+        progress.completed()
+    return outcome
+
+
+def partition_jobs(
+    service: ServiceBase[Any, Any],
+    partitions: Sequence[Partition],
+    sink: ExportSink,
+    client_factory: Callable[[], HTTPClient],
+    batch_size: int,
+) -> list[PartitionJob]:
+    """Return the jobs exporting ``partitions`` of ``service`` with its query."""
+    query_state = service.query_state
+    return [
+        PartitionJob(
+            index=index,
+            partition=partition,
+            path=service.path,
+            rql=_partition_filter(query_state.filter, partition),
+            order_by=query_state.order_by,
+            select=query_state.select,
+            render=query_state.options.render,
+            service_class=type(service),
+            client_factory=client_factory,
+            sink=sink,
+            batch_size=batch_size,
+        )
+        for index, partition in enumerate(partitions)
+    ]
+
+
+def _partition_filter(collection_filter: RQLQuery | None, partition: Partition) -> str | None:
+    combined = RQLQuery()
+    if collection_filter:
+        combined &= collection_filter
+    if partition.rql:
+        combined &= RQLQuery.from_string(partition.rql)
+    return str(combined) or None
@@ -0,0 +1,104 @@
+import datetime as dt
+import itertools
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from mpt_api_client.rql import RQLQuery
+from mpt_api_client.rql.query_builder import QueryValue
+
+
+@dataclass(frozen=True)
+class Partition:
+    """Disjoint slice of a collection, exported by one worker process.
+
+    Attributes:
+        rql: RQL filter selecting the slice, combined with the filter of the collection,
+            or None for the whole collection.
+        offset: Offset of the first record of the slice.
+        stop: Offset after the last record of the slice, or None for the end.
+    """
+
+    rql: str | None = None
+    offset: int = 0
+    stop: int | None = None
+
+
+def range_partitions(boundaries: Sequence[QueryValue], field: str = "id") -> list[Partition]:
+    """Split a collection into ranges of ``field`` cut at ``boundaries``.
+
+    The first range has no lower bound and the last one no upper bound, so the ranges
+    cover every record exactly once: ``["ORD-5000"]`` gives ``lt(id,'ORD-5000')`` and
+    ``ge(id,'ORD-5000')``.
+
+    Args:
+        boundaries: Increasing values of ``field`` starting each range after the first.
+        field: Field to range on.
+
+    Returns:
+        One partition more than there are boundaries.
+
+    Raises:
+        ValueError: If the boundaries are not strictly increasing.
+    """
+    if any(upper <= lower for lower, upper in itertools.pairwise(boundaries)):  # type: ignore[operator]
+        raise ValueError("Partition boundaries must be strictly increasing.")
+    lower_bounds = [None, *boundaries]
+    upper_bounds = [*boundaries, None]
+    return [
+        Partition(rql=_range_filter(field, lower, upper))
+        for lower, upper in zip(lower_bounds, upper_bounds, strict=True)
+    ]
+
+
+def time_partitions(
+    start: dt.datetime, end: dt.datetime, count: int, field: str = "audit.created.at"
+) -> list[Partition]:
+    """Split a collection into ``count`` time windows of equal length on ``field``.
+
+    The windows divide ``start`` to ``end``; records before ``start`` fall in the first
+    window and records from ``end`` on in the last one, so no record is left out.
+
+    Raises:
+        ValueError: If ``count`` is below 1 or ``end`` is not after ``start``.
+    """
+    _validate_count(count)
+    if end <= start:
+        raise ValueError("Partition end must be after its start.")
+    step = (end - start) / count
+    boundaries = [start + step * index for index in range(1, count)]
+    return range_partitions(boundaries, field)
+
+
+def offset_partitions(total: int, count: int) -> list[Partition]:
+    """Split a collection of ``total`` records into at most ``count`` offset ranges.
+
+    The last range has no end, so records added meanwhile are exported too. Offsets
+    shift when records are added or removed during the export; order the collection by a
+    stable field, or prefer ``range_partitions``, for a changing collection.
+
+    Raises:
+        ValueError: If ``count`` is below 1.
+    """
+    _validate_count(count)
+    size = max(math.ceil(total / count), 1)
+    offsets = range(0, total, size)
+    partitions = [Partition(offset=offset, stop=offset + size) for offset in offsets]
+    if not partitions:
+        return [Partition()]
+    partitions[-1] = Partition(offset=partitions[-1].offset)
+    return partitions
+
+
+def _validate_count(count: int) -> None:
+    if count < 1:
+        raise ValueError("Partition count must be at least 1.")
+
+
+def _range_filter(field: str, lower: QueryValue | None, upper: QueryValue | None) -> str | None:
+    window = RQLQuery()
+    if lower is not None:
+        window &= RQLQuery(field).ge(lower)
+    if upper is not None:
+        window &= RQLQuery(field).lt(upper)
+    return str(window) or None
@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+import contextvars
+import queue
+import threading
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+
+_POLL_INTERVAL = 0.05
+
+
+@dataclass(frozen=True)
+class _End:
+    """End of the pages, with the error that ended them early, if any."""
+
+    error: BaseException | None = None
+
+    def raise_error(self) -> None:
+        """Raise the error that ended the pages, if any."""
+        if self.error is not None:
+            raise self.error
+
+
+def prefetch_pages[Page](pages: Iterator[Page], depth: int) -> Iterator[Page]:
+    """Read ``pages`` in a background thread, up to ``depth`` pages ahead of the consumer.
+
+    The pages run in a copy of the caller context, so an active ``deadline()`` applies to
+    them. An error raised by ``pages`` is raised to the consumer after the pages read
+    before it; closing the returned iterator stops the background thread.
+
+    Args:
+        pages: Page iterator, such as the page fetches of a collection.
+        depth: Maximum number of pages read ahead and buffered.
+
+    Yields:
+        The pages, in order.
+    """
+    _validate_depth(depth)
+    buffer: queue.Queue[Page | _End] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    reader = threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(_read_ahead, pages, buffer, stop),
+        daemon=True,
+    )
+    reader.start()
+    with contextlib.ExitStack() as cleanup:
+        cleanup.callback(stop.set)
+        while True:
+            page = buffer.get()
+            if isinstance(page, _End):
+                page.raise_error()
+                return
+            yield page
+
+
+async def aprefetch_pages[Page](pages: AsyncIterator[Page], depth: int) -> AsyncIterator[Page]:
+    """Read ``pages`` in a background task, up to ``depth`` pages ahead of the consumer.
+
+    An error raised by ``pages`` is raised to the consumer after the pages read before it;
+    closing the returned iterator, or cancelling its consumer, cancels the background task.
+
+    Args:
+        pages: Async page iterator, such as the page fetches of a collection.
+        depth: Maximum number of pages read ahead and buffered.
+
+    Yields:
+        The pages, in order.
+    """
+    _validate_depth(depth)
+    buffer: asyncio.Queue[Page | _End] = asyncio.Queue(maxsize=depth)
+    reader = asyncio.create_task(_aread_ahead(pages, buffer))
+    with contextlib.ExitStack() as cleanup:
+        cleanup.callback(reader.cancel)
+        while True:
+            page = await buffer.get()
+            if isinstance(page, _End):
+                page.raise_error()
+                return
+            yield page
+
+
+def _read_ahead[Page](
+    pages: Iterator[Page], buffer: queue.Queue[Page | _End], stop: threading.Event
+) -> None:
+    end = _End()
+    try:
+        for page in pages:
+            if not _put(buffer, page, stop):
+                return
+    except BaseException as error:
+        end = _End(error)
+    finally:
+        _put(buffer, end, stop)
+
+
+async def _aread_ahead[Page](
+    pages: AsyncIterator[Page], buffer: asyncio.Queue[Page | _End]
+) -> None:
+    end: _End | None = _End()
+    try:
+        async for page in pages:
+            await buffer.put(page)
+    except asyncio.CancelledError:
+        end = None
+        raise
+    except BaseException as error:
+        end = _End(error)
+    finally:
+        if end is not None:
+            await buffer.put(end)
+
+
+def _put[Page](
+    buffer: queue.Queue[Page | _End],
+    page: Page | _End,
+    stop: threading.Event,
+) -> bool:
+    while not stop.is_set():
+        try:
+            buffer.put(page, timeout=_POLL_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _validate_depth(depth: int) -> None:
+    if depth < 1:
+        raise ValueError("Prefetch depth must be at least 1.")
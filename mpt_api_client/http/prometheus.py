@@ -0,0 +1,120 @@
+import itertools
+from collections.abc import Iterator
+
+from mpt_api_client.http.metrics_snapshot import (
+    ComponentStats,
+    EndpointKey,
+    EndpointMetrics,
+    Histogram,
+    MetricsSnapshot,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_Endpoints = list[tuple[EndpointKey, EndpointMetrics]]
+
+_HEADER = "# HELP {name} {help_text}\n# TYPE {name} {metric_type}"
+
+_LABEL_ESCAPES = str.maketrans({"\\": r"\\", '"': r"\"", "\n": r"\n"})
+
+_ENDPOINT_COUNTERS = (
+    ("requests_total", "requests", "Requests sent, retries excluded."),
+    ("retries_total", "retries", "Retry attempts sent."),
+    ("transport_errors_total", "transport_errors", "Attempts failed without a response."),
+    ("max_retry_errors_total", "max_retry_errors", "Requests that exhausted their retries."),
+    ("request_bytes_total", "bytes_sent", "Request body bytes sent."),
+    ("response_bytes_total", "bytes_received", "Response body bytes received."),
+    ("records_decoded_total", "records_decoded", "Records decoded by iterate and stream."),
+    ("decode_seconds_total", "decode_seconds", "Time spent decoding records."),
+)
+
+
+def format_prometheus(snapshot: MetricsSnapshot, namespace: str = "mpt_client") -> str:
+    """Render ``snapshot`` in the Prometheus text exposition format.
+
+    Args:
+        snapshot: Metrics returned by ``ClientMetrics.snapshot()``.
+        namespace: Prefix of every metric name.
+
+    Returns:
+        The exposition text, served with ``PROMETHEUS_CONTENT_TYPE``.
+
+    Examples:
+        >>> format_prometheus(client.metrics.snapshot())  # doctest: +SKIP
+    """
+    endpoints = sorted(snapshot.endpoints.items())
+    lines = itertools.chain(
+        _counter_lines(namespace, endpoints),
+        _response_lines(namespace, endpoints),
+        _pool_lines(snapshot, namespace),
+        _component_lines(snapshot.components, namespace),
+    )
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _counter_lines(namespace: str, endpoints: _Endpoints) -> Iterator[str]:
+    for name, attribute, help_text in _ENDPOINT_COUNTERS:
+        yield _HEADER.format(name=f"{namespace}_{name}", metric_type="counter", help_text=help_text)
+        for key, endpoint in endpoints:
+            yield f"{namespace}_{name}{{{_endpoint_labels(key)}}} {getattr(endpoint, attribute)}"
+
+
+def _response_lines(namespace: str, endpoints: _Endpoints) -> Iterator[str]:
+    name = f"{namespace}_responses_total"
+    yield _HEADER.format(name=name, metric_type="counter", help_text="Responses per status class.")
+    for key, endpoint in endpoints:
+        for status_class, count in sorted(endpoint.status_classes.items()):
+            yield f'{name}{{{_endpoint_labels(key)},status_class="{status_class}"}} {count}'
+    name = f"{namespace}_request_duration_seconds"
+    yield _HEADER.format(
+        name=name,
+        metric_type="histogram",
+        help_text="Attempt duration until the last body byte.",
+    )
+    for key, endpoint in endpoints:
+        yield from _histogram(name, endpoint.latency, _endpoint_labels(key))
+
+
+def _component_lines(components: ComponentStats, namespace: str) -> Iterator[str]:
+    for component, stats in sorted(components.items()):
+        for stat_name, stat_value in sorted(stats.items()):
+            metric_name = f"{namespace}_{component}_{stat_name}"
+            yield _HEADER.format(
+                name=metric_name, metric_type="gauge", help_text=f"{component} {stat_name}."
+            )
+            yield f"{metric_name} {stat_value}"
+
+
+def _pool_lines(snapshot: MetricsSnapshot, namespace: str) -> Iterator[str]:
+    pool = snapshot.pool
+    yield _HEADER.format(
+        name=f"{namespace}_pool_in_use", metric_type="gauge", help_text="Connections in use."
+    )
+    yield f"{namespace}_pool_in_use {pool.in_use}"
+    if pool.max_connections is not None:
+        yield _HEADER.format(
+            name=f"{namespace}_pool_max_connections", metric_type="gauge", help_text="Pool size."
+        )
+        yield f"{namespace}_pool_max_connections {pool.max_connections}"
+    wait_name = f"{namespace}_pool_wait_seconds"
+    yield _HEADER.format(
+        name=wait_name, metric_type="histogram", help_text="Time waited for a pooled connection."
+    )
+    yield from _histogram(wait_name, pool.wait, "")
+
+
+def _histogram(name: str, histogram: Histogram, labels: str) -> Iterator[str]:
+    separator = "," if labels else ""
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts, strict=False):
+        cumulative += count
+        yield f'{name}_bucket{{{labels}{separator}le="{bound}"}} {cumulative}'
+    yield f'{name}_bucket{{{labels}{separator}le="+Inf"}} {histogram.count}'
+    suffix = f"{{{labels}}}" if labels else ""
+    yield f"{name}_sum{suffix} {histogram.total}"
+    yield f"{name}_count{suffix} {histogram.count}"
+
+
+def _endpoint_labels(key: EndpointKey) -> str:
+    method, endpoint = (label_value.translate(_LABEL_ESCAPES) for label_value in key)
+    return f'method="{method}",endpoint="{endpoint}"'
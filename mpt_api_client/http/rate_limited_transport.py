@@ -0,0 +1,45 @@
+from typing import override
+
+from httpx import AsyncBaseTransport, BaseTransport, Request, Response
+
+from mpt_api_client.http.rate_limiter import AsyncRateLimiter, RateLimiter
+
+
+class RateLimitedTransport(BaseTransport):
+    """Sync transport that waits for the rate limiter before every attempt."""
+
+    def __init__(self, transport: BaseTransport, rate_limiter: RateLimiter) -> None:
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+
+    @override
+    def handle_request(self, request: Request) -> Response:
+        path = request.url.path
+        self._rate_limiter.acquire(path)
+        response = self._transport.handle_request(request)
+        self._rate_limiter.observe(path, response.status_code, response.headers)
+        return response
+
+    @override
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(AsyncBaseTransport):
+    """Async transport that waits for the rate limiter before every attempt."""
+
+    def __init__(self, transport: AsyncBaseTransport, rate_limiter: AsyncRateLimiter) -> None:
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        path = request.url.path
+        await self._rate_limiter.acquire(path)
+        response = await self._transport.handle_async_request(request)
+        self._rate_limiter.observe(path, response.status_code, response.headers)
+        return response
+
+    @override
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,268 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import override
+
+from httpx import Headers, codes
+
+from mpt_api_client.http.deadline import check_deadline
+from mpt_api_client.http.url_utils import is_path_within
+
+THROTTLED_STATUS_CODES = frozenset((codes.TOO_MANY_REQUESTS, codes.SERVICE_UNAVAILABLE))
+RATE_LIMIT_REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+RATE_LIMIT_RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset")
+TOKEN_TOLERANCE = 1e-9
+MAX_RATE_LIMIT_RESET = 300.0
+EPOCH_RESET_MARGIN = 86400.0
+
+Clock = Callable[[], float]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token-bucket rate limit.
+
+    Attributes:
+        rate: Sustained number of requests per second.
+        burst: Number of requests that can be sent back to back before ``rate`` applies.
+    """
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the limit.
+
+        Raises:
+            ValueError: If ``rate`` is not positive or ``burst`` is lower than 1.
+        """
+        if self.rate <= 0:
+            raise ValueError("Rate limit rate must be positive.")
+        if self.burst < 1:
+            raise ValueError("Rate limit burst must be at least 1.")
+
+
+def parse_retry_after(retry_after: str, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header value into seconds to wait.
+
+    Args:
+        retry_after: Header value, either delta seconds or an HTTP date.
+        now: Current wall-clock time used for HTTP dates. Defaults to ``time.time()``.
+
+    Returns:
+        Non-negative number of seconds, or None if the value cannot be parsed.
+    """
+    retry_after = retry_after.strip()
+    if retry_after.isascii() and retry_after.isdigit():
+        return float(retry_after)
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    current_time = time.time() if now is None else now
+    return max(retry_at.timestamp() - current_time, 0)
+
+
+def parse_rate_limit_reset(reset: float, now: float | None = None) -> float:
+    """Convert a ``RateLimit-Reset`` header value into seconds to wait.
+
+    Servers send either the seconds until the window resets or the Unix time it resets
+    at; a value past ``now`` less ``EPOCH_RESET_MARGIN``, which tolerates clock skew, is
+    taken for a Unix time.
+
+    Args:
+        reset: Header value.
+        now: Current wall-clock time used for Unix times. Defaults to ``time.time()``.
+
+    Returns:
+        Seconds to wait, between 0 and ``MAX_RATE_LIMIT_RESET``.
+    """
+    current_time = time.time() if now is None else now
+    if reset > current_time - EPOCH_RESET_MARGIN:
+        reset -= current_time
+    return min(max(reset, 0), MAX_RATE_LIMIT_RESET)
+
+
+class TokenBucket:
+    """Token bucket that can be paused and drained by server feedback.
+
+    Not thread-safe; callers serialise access.
+    """
+
+    def __init__(self, rate_limit: RateLimit, clock: Clock = time.monotonic) -> None:
+        self._rate = rate_limit.rate
+        self._capacity = float(rate_limit.burst)
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated_at = clock()
+        self._paused_until: float = 0
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        self._refill(self._clock())
+        return self._tokens
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise the seconds to wait before trying again.
+        """
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill(now)
+        if self._tokens >= 1 - TOKEN_TOLERANCE:
+            self._tokens = max(self._tokens - 1, 0)
+            return 0
+        return (1 - self._tokens) / self._rate
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds``; one token is available afterwards."""
+        paused_until = self._clock() + seconds
+        if paused_until <= self._paused_until:
+            return
+        self._paused_until = paused_until
+        self._tokens = 1.0
+        self._updated_at = max(self._updated_at, paused_until)
+
+    def drain(self, remaining: float) -> None:
+        """Lower the available tokens to the ``remaining`` quota reported by the server."""
+        self._refill(self._clock())
+        self._tokens = min(self._tokens, max(remaining, 0))
+
+    def _refill(self, now: float) -> None:
+        if now <= self._updated_at:
+            return
+        elapsed = now - self._updated_at
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+
+class BaseRateLimiter:
+    """Selects token buckets per request path and adapts them to server feedback.
+
+    The client-wide limit applies to every request; an endpoint limit applies on top of
+    it to paths starting with its prefix, the longest matching prefix winning.
+    """
+
+    def __init__(
+        self,
+        rate_limit: RateLimit | None = None,
+        endpoint_rate_limits: Mapping[str, RateLimit] | None = None,
+        *,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self._client_bucket = TokenBucket(rate_limit, clock) if rate_limit else None
+        self._endpoint_buckets = {
+            prefix.rstrip("/"): TokenBucket(endpoint_limit, clock)
+            for prefix, endpoint_limit in (endpoint_rate_limits or {}).items()
+        }
+
+    def buckets_for(self, path: str) -> list[TokenBucket]:
+        """Return the buckets limiting ``path``, most specific first."""
+        buckets = []
+        endpoint_bucket = self._endpoint_bucket(path)
+        if endpoint_bucket:
+            buckets.append(endpoint_bucket)
+        if self._client_bucket:
+            buckets.append(self._client_bucket)
+        return buckets
+
+    def observe(self, path: str, status_code: int, headers: Headers) -> None:
+        """Adapt the most specific bucket for ``path`` to the response rate-limit headers.
+
+        ``Retry-After`` on a 429 or 503 pauses the bucket; ``RateLimit-Remaining``
+        lowers its tokens and, when exhausted, ``RateLimit-Reset`` pauses it until the
+        window resets. The ``X-`` prefixed variants of the quota headers are accepted too.
+        Either pause lasts ``MAX_RATE_LIMIT_RESET`` seconds at most.
+        """
+        buckets = self.buckets_for(path)
+        if not buckets:
+            return
+        bucket = buckets[0]
+        retry_after = headers.get("Retry-After")
+        if status_code in THROTTLED_STATUS_CODES and retry_after:
+            pause_seconds = parse_retry_after(retry_after)
+            if pause_seconds is not None:
+                bucket.pause(min(pause_seconds, MAX_RATE_LIMIT_RESET))
+        self._apply_quota(bucket, headers)
+
+    def _apply_quota(self, bucket: TokenBucket, headers: Headers) -> None:
+        remaining = self._header_float(headers, RATE_LIMIT_REMAINING_HEADERS)
+        if remaining is None:
+            return
+        bucket.drain(remaining)
+        reset = self._header_float(headers, RATE_LIMIT_RESET_HEADERS)
+        if remaining < 1 and reset is not None:
+            bucket.pause(parse_rate_limit_reset(reset))
+
+    def _header_float(self, headers: Headers, names: tuple[str, ...]) -> float | None:
+        for name in names:
+            header_value = headers.get(name)
+            if header_value is None:
+                continue
+            try:
+                return float(header_value)
+            except ValueError:
+                return None
+        return None
+
+    def _endpoint_bucket(self, path: str) -> TokenBucket | None:
+        matching_prefix = max(
+            (prefix for prefix in self._endpoint_buckets if is_path_within(path, prefix)),
+            key=len,
+            default=None,
+        )
+        if matching_prefix is None:
+            return None
+        return self._endpoint_buckets[matching_prefix]
+
+
+class RateLimiter(BaseRateLimiter):
+    """Thread-safe rate limiter for the sync client."""
+
+    def __init__(
+        self,
+        rate_limit: RateLimit | None = None,
+        endpoint_rate_limits: Mapping[str, RateLimit] | None = None,
+        *,
+        clock: Clock = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        super().__init__(rate_limit, endpoint_rate_limits, clock=clock)
+        self._lock = threading.Lock()
+        self._sleep = sleep
+
+    def acquire(self, path: str) -> None:
+        """Block until every bucket limiting ``path`` hands out a token."""
+        for bucket in self.buckets_for(path):
+            while True:  # noqa: WPS457
+                with self._lock:
+                    wait_seconds = bucket.try_acquire()
+                if not wait_seconds:
+                    break
+                check_deadline("rate limit wait", wait_seconds)
+                self._sleep(wait_seconds)
+
+    @override
+    def observe(self, path: str, status_code: int, headers: Headers) -> None:
+        with self._lock:
+            super().observe(path, status_code, headers)
+
+
+class AsyncRateLimiter(BaseRateLimiter):
+    """Rate limiter for the async client, shared by every task on the event loop."""
+
+    async def acquire(self, path: str) -> None:
+        """Wait until every bucket limiting ``path`` hands out a token."""
+        for bucket in self.buckets_for(path):
+            wait_seconds = bucket.try_acquire()
+            while wait_seconds:
+                check_deadline("rate limit wait", wait_seconds)
+                await asyncio.sleep(wait_seconds)  # noqa: WPS476
+                wait_seconds = bucket.try_acquire()
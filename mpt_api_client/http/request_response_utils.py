@@ -1,12 +1,139 @@
-from httpx import HTTPStatusError
+from typing import Any
+
+from httpx import HTTPStatusError, RequestError
 from httpx import Response as HTTPXResponse
 
-from mpt_api_client.exceptions import transform_http_status_exception
+from mpt_api_client.constants import APPLICATION_JSON
+from mpt_api_client.exceptions import (
+    MPTHttpError,
+    MPTMaxRetryError,
+    transform_http_status_exception,
+)
+from mpt_api_client.http.metrics import ClientMetrics
+from mpt_api_client.http.retry_transport import get_retry_state
+from mpt_api_client.http.types import HeaderTypes
+from mpt_api_client.json_codec import JSONCodec, default_json_codec
+from mpt_api_client.models import ResourceData
 
 
-def handle_response_http_error(response: HTTPXResponse) -> None:
+def handle_response_http_error(
+    response: HTTPXResponse, json_codec: JSONCodec | None = None
+) -> None:
     """Handles HTTP response error by raising a transformed HTTPStatusError exception."""
     try:
         response.raise_for_status()
     except HTTPStatusError as http_status_exception:
-        raise transform_http_status_exception(http_status_exception) from http_status_exception
+        raise transform_http_status_exception(
+            http_status_exception, json_codec
+        ) from http_status_exception
+
+
+def raise_for_retried_status(
+    response: HTTPXResponse, json_codec: JSONCodec, metrics: ClientMetrics, url: str
+) -> None:
+    """Raise the error of ``response``, as retry budget exhaustion if retries were refused.
+
+    Args:
+        response: Final response of the request, retries included.
+        json_codec: Codec decoding the error payload.
+        metrics: Metrics counting the ``MPTMaxRetryError`` raised.
+        url: Request URL, relative to the client base URL.
+    """
+    try:
+        handle_response_http_error(response, json_codec)
+    except MPTHttpError as error:
+        retry_state = get_retry_state(response.request)
+        if retry_state is None or not retry_state.budget_exhausted:
+            raise
+        metrics.record_max_retry_error(response.request.method, url)
+        raise MPTMaxRetryError(str(error), retry_state.attempts, budget_exhausted=True) from error
+
+
+def max_retry_error(
+    error: RequestError, metrics: ClientMetrics, url: str, max_attempts: int
+) -> MPTMaxRetryError:
+    """Build the ``MPTMaxRetryError`` of a request that failed without a response.
+
+    Args:
+        error: Transport error of the last attempt.
+        metrics: Metrics counting the ``MPTMaxRetryError`` raised.
+        url: Request URL, relative to the client base URL.
+        max_attempts: Attempts reported when the retry transport did not track them.
+    """
+    metrics.record_max_retry_error(error.request.method, url)
+    retry_state = get_retry_state(error.request)
+    if retry_state is None:
+        return MPTMaxRetryError(str(error), max_attempts)
+    return MPTMaxRetryError(
+        str(error), retry_state.attempts, budget_exhausted=retry_state.budget_exhausted
+    )
+
+
+def encode_json_body(
+    json: Any, headers: HeaderTypes | None, json_codec: JSONCodec
+) -> tuple[bytes | None, HeaderTypes | None]:
+    """Encode a JSON request body with ``json_codec``.
+
+    Returns:
+        The encoded body, or None when there is no JSON payload, and the request headers
+        with a JSON content type unless the caller already set one, in any letter case.
+    """
+    if json is None:
+        return None, headers
+    request_headers = dict(headers or {})
+    if not any(header_name.lower() == "content-type" for header_name in request_headers):
+        request_headers["Content-Type"] = APPLICATION_JSON
+    return json_codec.dumps(json), request_headers
+
+
+def json_to_file_payload(
+    resource_data: ResourceData | None, json_codec: JSONCodec | None = None
+) -> bytes:
+    """Convert resource data to file payload.
+
+    Args:
+        resource_data: Resource data; None is sent as an empty object.
+        json_codec: Codec used to encode the payload. Defaults to the standard library
+            ``json``.
+    """
+    if resource_data is None:
+        resource_data = {}
+    return (json_codec or default_json_codec()).dumps(resource_data)
+
+
+def add_json_part(
+    files: dict[str, Any], json: Any, json_file_key: str, json_codec: JSONCodec
+) -> dict[str, Any]:
+    """Return ``files`` with ``json`` encoded as the JSON part named ``json_file_key``."""
+    json_part = (None, json_to_file_payload(json, json_codec), APPLICATION_JSON)
+    return {**files, json_file_key: json_part}
+
+
+RequestKey = tuple[str, str, str, str]
+
+
+def get_request_key(
+    method: str, url: str, query: str, headers: HeaderTypes | None
+) -> RequestKey | None:
+    """Build the key identifying a GET request's response, or None if ``method`` is not GET.
+
+    Identical in-flight requests are coalesced on this key and cached responses are stored
+    under it.
+
+    Args:
+        method: HTTP method.
+        url: Request URL, relative to the client base URL.
+        query: Encoded query string.
+        headers: Request headers; only ``Accept`` takes part in the key.
+    """
+    if method.upper() != "GET":
+        return None
+    accept = next(
+        (
+            header_value
+            for header_name, header_value in (headers or {}).items()
+            if header_name.lower() == "accept"
+        ),
+        "",
+    )
+    return "GET", url, query, accept
@@ -1,6 +1,7 @@
 from mpt_api_client.constants import APPLICATION_JSON
 from mpt_api_client.http.async_client import AsyncHTTPClient
 from mpt_api_client.http.client import HTTPClient
+from mpt_api_client.http.model_cache import ModelCacheKey
 from mpt_api_client.http.query_options import QueryOptions
 from mpt_api_client.http.types import QueryParam, Response
 from mpt_api_client.http.url_utils import join_url_path
@@ -10,7 +11,44 @@ from mpt_api_client.models.model_collection import ModelCollection, ResourceList
 _JsonPayload = ResourceData | ResourceList | None
 
 
-class ResourceAccessor[ResourceModel: Model]:  # NOSONAR
+class _ModelCacheAccess:
+    """Model cache lookups shared by the sync and async accessors.
+
+    Only ``GET`` of the resource itself with at most a ``select`` query is cached; the client
+    invalidates the entries a request with any other method may change.
+    """
+
+    def __init__(self, http_client: HTTPClient | AsyncHTTPClient, resource_url: str) -> None:
+        self._model_cache = http_client.components.model_cache
+        self._resource_url = resource_url
+
+    def _cache_key(
+        self, query_params: QueryParam | None, options: QueryOptions | None
+    ) -> ModelCacheKey | None:
+        if self._model_cache is None or not self._model_cache.caches(self._resource_url):
+            return None
+        query_params = query_params or {}
+        if set(query_params) - {"select"}:
+            return None
+        select = query_params.get("select") or ""
+        return self._resource_url, str(select), bool(options and options.render)
+
+    def _cached_response(self, cache_key: ModelCacheKey | None) -> Response | None:
+        if self._model_cache is None or cache_key is None:
+            return None
+        return self._model_cache.get(cache_key)
+
+    def _cache_generation(self) -> int | None:
+        return None if self._model_cache is None else self._model_cache.generation
+
+    def _cache_response(
+        self, cache_key: ModelCacheKey | None, response: Response, generation: int | None
+    ) -> None:
+        if self._model_cache is not None and cache_key is not None:
+            self._model_cache.set(cache_key, response, generation)
+
+
+class ResourceAccessor[ResourceModel: Model](_ModelCacheAccess):  # NOSONAR
     """Synchronous accessor bound to a single resource URL.
 
     Provides ``.get()``, ``.post()``, ``.put()``, ``.delete()`` helpers that
@@ -24,8 +62,8 @@ class ResourceAccessor[ResourceModel: Model]:  # NOSONAR
         resource_url: str,
         model_class: type[ResourceModel],
     ) -> None:
+        super().__init__(http_client, resource_url)
         self._http_client = http_client
-        self._resource_url = resource_url
         self._model_class = model_class
 
     # -- raw request ---------------------------------------------------------
@@ -64,8 +102,24 @@ class ResourceAccessor[ResourceModel: Model]:  # NOSONAR
         query_params: QueryParam | None = None,
         options: QueryOptions | None = None,
     ) -> ResourceModel:
-        """``GET`` the resource (optionally with a sub-action)."""
-        return self._action("GET", action, query_params=query_params, options=options)  # type: ignore[return-value]
+        """``GET`` the resource (optionally with a sub-action).
+
+        The resource itself is served from the client's model cache when one is enabled.
+        """
+        cache_key = None if action else self._cache_key(query_params, options)
+        cached_response = self._cached_response(cache_key)
+        if cached_response is not None:
+            return self._model_class.from_response(cached_response)  # type: ignore[return-value]
+        generation = self._cache_generation()
+        response = self.do_request(
+            "GET",
+            action,
+            query_params=query_params,
+            headers={"Accept": APPLICATION_JSON},
+            options=options,
+        )
+        self._cache_response(cache_key, response, generation)
+        return self._model_class.from_response(response)  # type: ignore[return-value]
 
     def post(
         self,
@@ -111,7 +165,7 @@ class ResourceAccessor[ResourceModel: Model]:  # NOSONAR
         return self._model_class.from_response(response)
 
 
-class AsyncResourceAccessor[ResourceModel: Model]:  # NOSONAR
+class AsyncResourceAccessor[ResourceModel: Model](_ModelCacheAccess):  # NOSONAR
     """Asynchronous accessor bound to a single resource URL.
 
     Async counterpart of :class:`ResourceAccessor`.
@@ -123,8 +177,8 @@ class AsyncResourceAccessor[ResourceModel: Model]:  # NOSONAR
         resource_url: str,
         model_class: type[ResourceModel],
     ) -> None:
+        super().__init__(http_client, resource_url)
         self._http_client = http_client
-        self._resource_url = resource_url
         self._model_class = model_class
 
     # -- raw request ---------------------------------------------------------
@@ -163,8 +217,24 @@ class AsyncResourceAccessor[ResourceModel: Model]:  # NOSONAR
         query_params: QueryParam | None = None,
         options: QueryOptions | None = None,
     ) -> ResourceModel:
-        """``GET`` the resource (optionally with a sub-action)."""
-        return await self._action("GET", action, query_params=query_params, options=options)  # type: ignore[return-value]
+        """``GET`` the resource (optionally with a sub-action).
+
+        The resource itself is served from the client's model cache when one is enabled.
+        """
+        cache_key = None if action else self._cache_key(query_params, options)
+        cached_response = self._cached_response(cache_key)
+        if cached_response is not None:
+            return self._model_class.from_response(cached_response)  # type: ignore[return-value]
+        generation = self._cache_generation()
+        response = await self.do_request(
+            "GET",
+            action,
+            query_params=query_params,
+            headers={"Accept": APPLICATION_JSON},
+            options=options,
+        )
+        self._cache_response(cache_key, response, generation)
+        return self._model_class.from_response(response)  # type: ignore[return-value]
 
     async def post(
         self,
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+from httpx import Response
+from httpx_retries import Retry
+
+from mpt_api_client.http.deadline import check_deadline
+from mpt_api_client.http.rate_limiter import THROTTLED_STATUS_CODES
+
+RETRY_AFTER_HEADER = "Retry-After"
+
+
+class ClientRetry:
+    """Retry schedule of one request: the configured policy plus the rules of the clients.
+
+    The ``httpx_retries.Retry`` policy is wrapped, not copied, so a subclass keeps its
+    overrides: the policy decides what is retried, when it is exhausted and how long to
+    back off through ``backoff_strategy()``. On top of it:
+
+    - ``Retry-After`` is honoured on 429 and 503 responses only; other failures back off
+      with the strategy of the policy.
+    - No retry is scheduled that the deadline of the running context cannot fit: a backoff
+      that would outlast it raises ``MPTDeadlineExceededError`` instead of sleeping.
+
+    Args:
+        policy: Retry policy of the client, or of the request.
+    """
+
+    def __init__(self, policy: Retry) -> None:
+        self.policy = policy
+
+    def increment(self) -> "ClientRetry":
+        """Return the schedule of the next attempt."""
+        return ClientRetry(self.policy.increment())
+
+    def backoff(self, outcome: Response | Exception) -> float:
+        """Return the seconds to wait before retrying after ``outcome``."""
+        sleep_seconds = self._retry_after(outcome)
+        if sleep_seconds <= 0:
+            sleep_seconds = self.policy.backoff_strategy() if self.policy.attempts_made else 0
+        if self.policy.total_timeout is not None:
+            unspent = max(self.policy.total_timeout - self.policy.elapsed_sleep, 0)
+            sleep_seconds = min(sleep_seconds, unspent)
+        return sleep_seconds
+
+    def sleep(self, outcome: Response | Exception) -> None:
+        """Wait before retrying after ``outcome``.
+
+        Raises:
+            MPTDeadlineExceededError: If the wait would outlast the deadline.
+        """
+        time.sleep(self._checked_backoff(outcome))
+
+    async def asleep(self, outcome: Response | Exception) -> None:
+        """Wait before retrying after ``outcome`` without blocking the event loop.
+
+        Raises:
+            MPTDeadlineExceededError: If the wait would outlast the deadline.
+        """
+        await asyncio.sleep(self._checked_backoff(outcome))
+
+    def _checked_backoff(self, outcome: Response | Exception) -> float:
+        sleep_seconds = self.backoff(outcome)
+        check_deadline("retry backoff", sleep_seconds)
+        self.policy.elapsed_sleep += sleep_seconds
+        return sleep_seconds
+
+    def _retry_after(self, outcome: Response | Exception) -> float:
+        retry_after = _throttled_retry_after(outcome)
+        if not retry_after or not self.policy.respect_retry_after_header:
+            return 0
+        try:
+            return min(self.policy.parse_retry_after(retry_after), self.policy.max_backoff_wait)
+        except ValueError:
+            return 0
+
+
+def _throttled_retry_after(outcome: Response | Exception) -> str:
+    """Return the ``Retry-After`` of a throttled response, which may direct the backoff."""
+    if isinstance(outcome, Response) and outcome.status_code in THROTTLED_STATUS_CODES:
+        return str(outcome.headers.get(RETRY_AFTER_HEADER, "")).strip()
+    return ""
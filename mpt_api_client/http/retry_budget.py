@@ -0,0 +1,87 @@
+import threading
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class RetryBudget:
+    """Cap on the retries a client sends, relative to its recent requests.
+
+    Every request earns ``ratio`` retry tokens and every retry spends one, so under a
+    sustained outage the client sends at most ``ratio`` retries per request instead of
+    multiplying its load by the retry count.
+
+    Attributes:
+        ratio: Retries allowed per request sent, for example 0.1 for 10%.
+        burst: Maximum number of retry tokens saved up; a new client starts with a full
+            bucket, so isolated failures are retried in full.
+    """
+
+    ratio: float = 0.1
+    burst: int = 10
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If the ratio is not in ``(0, 1]`` or the burst is below 1.
+        """
+        if not 0 < self.ratio <= 1:
+            raise ValueError("Retry budget ratio must be in (0, 1].")
+        if self.burst < 1:
+            raise ValueError("Retry budget burst must be at least 1.")
+
+
+@dataclass(frozen=True)
+class RetryBudgetStats:
+    """Counters of a retry budget.
+
+    Attributes:
+        requests: Requests sent, retries excluded.
+        retries: Retries the budget allowed.
+        exhausted: Retries refused because the budget was exhausted.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    exhausted: int = 0
+
+
+class RetryBudgetLimiter:
+    """Thread-safe token bucket enforcing a ``RetryBudget``, shared by a client."""
+
+    def __init__(self, budget: RetryBudget) -> None:
+        self.budget = budget
+        self._tokens = float(budget.burst)
+        self._stats = RetryBudgetStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> RetryBudgetStats:
+        """Current counters."""
+        return self._stats
+
+    @property
+    def tokens(self) -> float:
+        """Retry tokens currently available."""
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Earn the retry tokens of a new request."""
+        with self._lock:
+            earned_tokens = self._tokens + self.budget.ratio
+            self._tokens = min(earned_tokens, float(self.budget.burst))
+            self._stats = replace(self._stats, requests=self._stats.requests + 1)
+
+    def try_retry(self) -> bool:
+        """Spend a retry token.
+
+        Returns:
+            True if the retry may be sent, False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self._stats = replace(self._stats, exhausted=self._stats.exhausted + 1)
+                return False
+            self._tokens -= 1
+            self._stats = replace(self._stats, retries=self._stats.retries + 1)
+            return True
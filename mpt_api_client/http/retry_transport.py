@@ -0,0 +1,163 @@
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import cast, override
+
+from httpx import AsyncBaseTransport, BaseTransport, Request, Response
+from httpx_retries import Retry, RetryTransport
+
+from mpt_api_client.http.retries import ClientRetry
+from mpt_api_client.http.retry_budget import RetryBudgetLimiter
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+RETRY_STATE_EXTENSION = "mpt_retry_state"
+
+_Outcome = Response | Exception
+_Validator = Callable[[Response], Awaitable[None] | None]
+
+
+@dataclass
+class RetryState:
+    """Retry bookkeeping of one request, kept in its ``mpt_retry_state`` extension.
+
+    Attributes:
+        attempts: Attempts sent so far, the first one included.
+        budget_exhausted: Whether a retry was refused because the retry budget was spent.
+    """
+
+    attempts: int = 0
+    budget_exhausted: bool = False
+
+
+class BudgetRetryTransport(RetryTransport):
+    """Retry transport enforcing the retry budget and the idempotency rule of the clients.
+
+    A POST is retried only when it carries an ``Idempotency-Key`` header, because the
+    server cannot otherwise tell a retry from a second request. Every retry spends a token
+    of the shared retry budget; once the budget is exhausted the last response or error is
+    returned as is. As in ``RetryTransport``, a response that the policy would not retry is
+    passed to its ``validate_response`` callback, and a retryable error it raises is retried.
+    """
+
+    def __init__(
+        self,
+        transport: BaseTransport | AsyncBaseTransport,
+        retry: Retry,
+        budget: RetryBudgetLimiter | None = None,
+    ) -> None:
+        super().__init__(transport=transport, retry=retry)
+        self.budget = budget
+        self._transport = transport
+
+    @override
+    def handle_request(self, request: Request) -> Response:
+        transport = cast("BaseTransport", self._transport)
+        retry, state = self._start(request)
+        if inspect.iscoroutinefunction(retry.policy.validate_response):
+            raise TypeError("validate_response must be a sync function when using a sync transport")
+        while True:
+            outcome = _send(transport, request, self._validating_policy(retry, request))
+            state.attempts += 1
+            if not self._should_retry(request, retry, state, outcome):
+                return _finish(outcome, retry)
+            if isinstance(outcome, Response):
+                outcome.close()
+            retry = retry.increment()
+            retry.sleep(outcome)
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        transport = cast("AsyncBaseTransport", self._transport)
+        retry, state = self._start(request)
+        while True:
+            outcome = await _asend(transport, request, self._validating_policy(retry, request))
+            state.attempts += 1
+            if not self._should_retry(request, retry, state, outcome):
+                return _finish(outcome, retry)
+            if isinstance(outcome, Response):
+                await outcome.aclose()
+            retry = retry.increment()
+            await retry.asleep(outcome)
+
+    def _start(self, request: Request) -> tuple[ClientRetry, RetryState]:
+        state = RetryState()
+        request.extensions[RETRY_STATE_EXTENSION] = state
+        if self.budget is not None:
+            self.budget.record_request()
+        return ClientRetry(request.extensions.setdefault("retry", self.retry)), state
+
+    def _validating_policy(self, retry: ClientRetry, request: Request) -> Retry | None:
+        """Return the policy whose ``validate_response`` checks the next response, if any."""
+        policy = retry.policy
+        if policy.validate_response is None or policy.is_exhausted():
+            return None
+        return policy if _is_retryable_request(policy, request) else None
+
+    def _should_retry(
+        self, request: Request, retry: ClientRetry, state: RetryState, outcome: _Outcome
+    ) -> bool:
+        policy = retry.policy
+        if policy.is_exhausted() or not _is_retryable_request(policy, request):
+            return False
+        if isinstance(outcome, Response):
+            retryable = policy.is_retryable_status_code(outcome.status_code)
+        else:
+            retryable = policy.is_retryable_exception(outcome)
+        if not retryable or self.budget is None:
+            return retryable
+        state.budget_exhausted = not self.budget.try_retry()
+        return not state.budget_exhausted
+
+
+def get_retry_state(request: Request) -> RetryState | None:
+    """Return the retry bookkeeping of a request sent through ``BudgetRetryTransport``."""
+    return request.extensions.get(RETRY_STATE_EXTENSION)
+
+
+def _is_retryable_request(retry: Retry, request: Request) -> bool:
+    if not retry.is_retryable_method(request.method):
+        return False
+    return request.method != "POST" or IDEMPOTENCY_KEY_HEADER in request.headers
+
+
+def _send(transport: BaseTransport, request: Request, policy: Retry | None) -> _Outcome:
+    try:
+        response = transport.handle_request(request)
+    except Exception as error:
+        return error
+    if policy is None or policy.is_retryable_status_code(response.status_code):
+        return response
+    response.request = request
+    try:
+        cast("_Validator", policy.validate_response)(response)
+    except Exception as error:
+        response.close()
+        return error
+    return response
+
+
+async def _asend(transport: AsyncBaseTransport, request: Request, policy: Retry | None) -> _Outcome:
+    try:
+        response = await transport.handle_async_request(request)
+    except Exception as error:
+        return error
+    if policy is None or policy.is_retryable_status_code(response.status_code):
+        return response
+    response.request = request
+    validate = cast("_Validator", policy.validate_response)
+    try:
+        if inspect.iscoroutinefunction(validate):
+            await validate(response)
+        else:
+            validate(response)
+    except Exception as error:
+        await response.aclose()
+        return error
+    return response
+
+
+def _finish(outcome: _Outcome, retry: ClientRetry) -> Response:
+    if isinstance(outcome, Exception):
+        raise outcome
+    outcome.extensions["retry"] = retry.policy
+    return outcome
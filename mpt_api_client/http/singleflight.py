@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+
+
+class SingleFlight[Result]:
+    """Thread-safe coalescing of identical concurrent calls.
+
+    The first caller for a key runs the call; callers arriving while it is in flight wait
+    for it and receive the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[Result]] = {}
+
+    def run(
+        self, key: Hashable, call: Callable[[], Result], timeout: float | None = None
+    ) -> tuple[Result, bool]:
+        """Run ``call`` once per in-flight ``key``.
+
+        Args:
+            key: Key of the call; callers with equal keys share one call.
+            call: Call run by the first caller for ``key``.
+            timeout: Seconds a caller waits for the call of another caller; None waits
+                until it ends.
+
+        Returns:
+            The result and whether it was shared from another caller's call.
+
+        Raises:
+            TimeoutError: If the shared call does not end within ``timeout``.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            shared = future is not None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+        if shared:
+            return future.result(timeout), True
+        try:
+            call_result = call()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(call_result)
+        finally:
+            with self._lock:
+                del self._calls[key]  # noqa: WPS420
+        return call_result, False
+
+
+class AsyncSingleFlight[Result]:
+    """Coalescing of identical concurrent coroutine calls on one event loop.
+
+    The call runs as a task shared by every caller for the key, so cancelling one caller,
+    the first included, does not cancel the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[Result]] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[Result]],
+        timeout: float | None = None,
+    ) -> tuple[Result, bool]:
+        """Run ``call`` once per in-flight ``key``.
+
+        Args:
+            key: Key of the call; callers with equal keys share one call.
+            call: Call run by the first caller for ``key``.
+            timeout: Seconds a caller waits for the call; None waits until it ends. The
+                call goes on for the other callers when one of them stops waiting.
+
+        Returns:
+            The result and whether it was shared from another caller's call.
+
+        Raises:
+            TimeoutError: If the call does not end within ``timeout``.
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        async with asyncio.timeout(timeout):
+            return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Result]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]  # noqa: WPS420
+        if not task.cancelled():
+            task.exception()
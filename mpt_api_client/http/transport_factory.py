@@ -0,0 +1,70 @@
+from httpx import AsyncBaseTransport, AsyncHTTPTransport, BaseTransport, HTTPTransport
+
+from mpt_api_client.http.adaptive_concurrency import AdaptiveConcurrencyTransport
+from mpt_api_client.http.circuit_breaker_transport import (
+    AsyncCircuitBreakerTransport,
+    CircuitBreakerTransport,
+)
+from mpt_api_client.http.client_components import AsyncClientComponents, ClientComponents
+from mpt_api_client.http.deadline_transport import AsyncDeadlineTransport, DeadlineTransport
+from mpt_api_client.http.hook_transport import AsyncHookTransport, HookTransport
+from mpt_api_client.http.rate_limited_transport import (
+    AsyncRateLimitedTransport,
+    RateLimitedTransport,
+)
+from mpt_api_client.http.retry_transport import BudgetRetryTransport
+from mpt_api_client.http.transport_settings import TransportSettings
+
+
+def build_transport(
+    settings: TransportSettings, components: ClientComponents
+) -> BudgetRetryTransport:
+    """Build the sync transport stack.
+
+    Retries wrap the circuit breaker, which wraps the deadline check, rate limiting and the
+    pool, so an open circuit fails an attempt before it waits for a token or a connection.
+
+    Args:
+        settings: Transport settings providing pool limits, HTTP/2 and the retry policy.
+        components: Components of the client; its hooks are notified of every attempt
+            sent to the pool and its enabled rate limiter, circuit breaker and retry
+            budget are consulted on every attempt, retries included.
+    """
+    transport: BaseTransport = HTTPTransport(limits=settings.limits, http2=settings.http2)
+    transport = HookTransport(transport, components.hooks)
+    if components.rate_limiter:
+        transport = RateLimitedTransport(transport, components.rate_limiter)
+    transport = DeadlineTransport(transport)
+    if components.circuit_breaker:
+        transport = CircuitBreakerTransport(transport, components.circuit_breaker)
+    return BudgetRetryTransport(transport, settings.retry, components.retry_budget)
+
+
+def build_async_transport(
+    settings: TransportSettings, components: AsyncClientComponents
+) -> BudgetRetryTransport:
+    """Build the async transport stack.
+
+    Retries wrap the circuit breaker, which wraps the deadline check, which wraps rate
+    limiting, which wraps the adaptive concurrency limit around the pool. An open circuit
+    fails an attempt before it waits anywhere, a request waiting for a rate-limit token does
+    not hold a concurrency slot, the measured latency covers the network round-trip only and
+    a deadline cancels an attempt wherever it waits.
+
+    Args:
+        settings: Transport settings providing pool limits, HTTP/2 and the retry policy.
+        components: Components of the client; its hooks are notified of every attempt
+            sent to the pool, its enabled concurrency limiter bounds the attempts in
+            flight and its enabled rate limiter, circuit breaker and retry budget are
+            consulted on every attempt, retries included.
+    """
+    transport: AsyncBaseTransport = AsyncHTTPTransport(limits=settings.limits, http2=settings.http2)
+    transport = AsyncHookTransport(transport, components.hooks)
+    if components.concurrency_limiter:
+        transport = AdaptiveConcurrencyTransport(transport, components.concurrency_limiter)
+    if components.rate_limiter:
+        transport = AsyncRateLimitedTransport(transport, components.rate_limiter)
+    transport = AsyncDeadlineTransport(transport)
+    if components.circuit_breaker:
+        transport = AsyncCircuitBreakerTransport(transport, components.circuit_breaker)
+    return BudgetRetryTransport(transport, settings.retry, components.retry_budget)
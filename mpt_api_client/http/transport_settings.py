@@ -1,20 +1,34 @@
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import cast, override
 
-from httpx import Timeout
+from httpx import Limits, Timeout
 from httpx_retries import Retry
 
+from mpt_api_client.http.adaptive_concurrency import AdaptiveConcurrency
+from mpt_api_client.http.circuit_breaker import CircuitBreakerPolicy
 from mpt_api_client.http.client_utils import validate_base_url
+from mpt_api_client.http.hedging import HedgingPolicy
+from mpt_api_client.http.http_cache import HTTPCacheBackend
+from mpt_api_client.http.idempotency import IdempotencyJournal
+from mpt_api_client.http.model_cache import ModelCachePolicy
+from mpt_api_client.http.rate_limiter import RateLimit
+from mpt_api_client.http.retry_budget import RetryBudget
+from mpt_api_client.json_codec import JSONCodec, default_json_codec
 
 RETRY_ALLOWED_METHODS = frozenset(("DELETE", "GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH"))
 ENV_BASE_URL = "MPT_API_BASE_URL"
 DEFAULT_TIMEOUT = 20.0
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
 DEFAULT_STREAM_READ_TIMEOUT = 120.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
 
 
 @dataclass
-class TransportSettings:
+class TransportSettings:  # noqa: WPS214
     """Transport-level settings shared by the HTTP clients and auth providers.
 
     Attributes:
@@ -37,10 +51,74 @@ class TransportSettings:
             The effective streaming read timeout is never lower than ``read_timeout``.
         retries: Retry policy; either the number of retries for failed requests or a
             fully configured ``httpx_retries.Retry`` instance used as is. Normalized
-            to a ``Retry`` instance at construction time.
-
-    No total-duration timeout is applied. A streamed export runs for as long as the
-    server keeps sending, bounded per phase rather than overall.
+            to a ``Retry`` instance at construction time. A plain count backs off
+            exponentially with full jitter. ``Retry-After`` is honoured on 429 and 503
+            responses, and a POST is retried only when it carries an ``Idempotency-Key``
+            header.
+        idempotency_keys: Attach a generated ``Idempotency-Key`` header to every POST
+            request that does not set one, kept across the retries of the request, so
+            creates and actions are retried safely. Off by default, so a POST is not
+            retried unless the caller sets the header.
+        idempotency_journal: Journal of the keys of POST requests that ended without a
+            final outcome, for example ``MemoryIdempotencyJournal()`` or
+            ``SQLiteIdempotencyJournal("idempotency.db")``: repeating such a request
+            with the same body sends the same key, even from a restarted process. None
+            (the default) generates a new key per call. Used only with
+            ``idempotency_keys`` enabled.
+        retry_budget: Cap on the retries of the client relative to its recent requests,
+            shared by every request of the client, for example ``RetryBudget()`` to allow
+            retries worth 10% of the requests. None (the default) leaves retries uncapped.
+        json_codec: Codec used for every JSON request body, response body and streamed
+            record. Defaults to the standard library ``json``; pass
+            ``fastest_json_codec()`` to use ``orjson`` or ``msgspec`` when installed.
+        max_connections: Maximum number of concurrent connections in the pool; None
+            removes the limit. Requests beyond it wait up to ``pool_timeout`` for a free
+            connection.
+        max_keepalive_connections: Maximum number of idle connections kept open for
+            reuse; None removes the limit.
+        keepalive_expiry: Seconds an idle connection is kept open; None keeps it open
+            indefinitely.
+        http2: Negotiate HTTP/2 when the server supports it, multiplexing concurrent
+            requests over a single connection. Requires the ``http2`` extra
+            (``pip install "mpt-api-client[http2]"``), which installs ``h2``.
+        rate_limit: Client-side token-bucket limit applied to every request, including
+            retries. None (the default) disables client-wide throttling.
+        endpoint_rate_limits: Additional limits keyed by path prefix, for example
+            ``{"/public/v1/billing": RateLimit(rate=5)}``; the longest matching prefix
+            applies on top of ``rate_limit``. ``Retry-After`` and ``RateLimit-*``
+            response headers pause or drain the most specific matching bucket.
+        adaptive_concurrency: AIMD policy bounding the requests ``AsyncHTTPClient`` keeps
+            in flight: the limit grows additively while responses are healthy and is cut
+            multiplicatively on 429, 503, 504 or timeouts. None (the default) leaves
+            concurrency to the caller. The sync client ignores it.
+        coalesce_requests: Share one upstream response between identical GET requests
+            in flight at the same time (same URL, query and ``Accept`` header). Off by
+            default.
+        http_cache: Backend of the conditional-request cache for GET responses, for
+            example ``MemoryCacheBackend()`` or ``SQLiteCacheBackend("cache.db")``.
+            Cached responses are revalidated with ``If-None-Match`` and
+            ``If-Modified-Since`` on every request and served from the cache on a
+            ``304 Not Modified``. None (the default) disables caching.
+        model_cache: TTL and LRU policy of the resource cache behind ``get`` on services,
+            invalidated by updates, deletes and actions on the cached resource. Unlike
+            ``http_cache`` a live entry is served without contacting the server. None
+            (the default) disables it.
+        hedging: Policy for hedging GET requests of ``AsyncHTTPClient``: a GET slower
+            than a percentile of recent latencies is sent again and the first response
+            wins, within a bounded hedge rate. None (the default) disables hedging. The
+            sync client ignores it.
+        circuit_breaker: Policy of the circuit breakers kept per endpoint template: an
+            endpoint failing too often is failed fast with ``MPTCircuitOpenError`` for a
+            while, then probed before it is used again. None (the default) disables them.
+        request_metrics: Register ``client.metrics`` as a request hook, counting the
+            requests, status classes, bytes and latency of every endpoint and the pool
+            utilisation. Off by default, so requests skip the hooks entirely; component
+            counters, ``MPTMaxRetryError`` counts and decoding metrics are kept either way.
+
+    The timeouts bound each phase of an attempt, not its total duration. Wrap calls in
+    ``mpt_api_client.http.deadline()`` to bound the total duration of a block, retries,
+    pages and stream chunks included; each attempt then has its phase timeouts lowered
+    to the time left.
     """
 
     base_url: str | None = None
@@ -51,15 +129,33 @@ class TransportSettings:
     pool_timeout: float | None = None
     stream_read_timeout: float = DEFAULT_STREAM_READ_TIMEOUT
     retries: int | Retry = 5
+    retry_budget: RetryBudget | None = None
+    idempotency_keys: bool = False
+    idempotency_journal: IdempotencyJournal | None = None
+    json_codec: JSONCodec | None = None
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = False
+    rate_limit: RateLimit | None = None
+    endpoint_rate_limits: Mapping[str, RateLimit] | None = None
+    adaptive_concurrency: AdaptiveConcurrency | None = None
+    coalesce_requests: bool = False
+    http_cache: HTTPCacheBackend | None = None
+    model_cache: ModelCachePolicy | None = None
+    hedging: HedgingPolicy | None = None
+    circuit_breaker: CircuitBreakerPolicy | None = None
+    request_metrics: bool = False
 
     def __post_init__(self) -> None:
-        """Validate ``base_url`` and normalize ``retries``.
+        """Validate ``base_url`` and normalize ``retries`` and ``json_codec``.
 
         Raises:
             ValueError: If ``base_url`` is missing or not a valid URL.
         """
         self.base_url = validate_base_url(self.base_url)
         self.retries = self._build_retry()
+        self.json_codec = self.json_codec or default_json_codec()
 
     @property
     def url(self) -> str:
@@ -71,6 +167,11 @@ class TransportSettings:
         """Normalized retry policy."""
         return cast("Retry", self.retries)
 
+    @property
+    def codec(self) -> JSONCodec:
+        """Resolved JSON codec."""
+        return cast("JSONCodec", self.json_codec)
+
     @property
     def request_timeout(self) -> Timeout:
         """Per-phase timeout for regular requests."""
@@ -91,6 +192,20 @@ class TransportSettings:
             pool=self._phase_timeout(self.pool_timeout),
         )
 
+    @property
+    def rate_limited(self) -> bool:
+        """Whether any client-side rate limit is configured."""
+        return bool(self.rate_limit or self.endpoint_rate_limits)
+
+    @property
+    def limits(self) -> Limits:
+        """Connection pool limits."""
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
     def _phase_timeout(self, phase_value: float | None) -> float:
         """Return the phase timeout, falling back to the default timeout when unset."""
         return self.timeout if phase_value is None else phase_value
@@ -99,7 +214,11 @@ class TransportSettings:
         """Return the retry policy, building one when ``retries`` is a plain count."""
         if isinstance(self.retries, Retry):
             return self.retries
-        return Retry(total=self.retries, allowed_methods=set(RETRY_ALLOWED_METHODS))
+        return Retry(
+            total=self.retries,
+            allowed_methods=set(RETRY_ALLOWED_METHODS),
+            backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
+        )
 
 
 @dataclass
@@ -2,6 +2,8 @@ import json
 from collections.abc import Mapping, Sequence
 from typing import IO, Any
 
+from mpt_api_client.json_codec import JSONCodec, default_json_codec
+
 PrimitiveType = str | int | float | bool | None
 QueryParam = dict[str, PrimitiveType]
 HeaderTypes = dict[str, str]
@@ -24,13 +26,41 @@ FileTypes = (
 RequestFiles = Mapping[str, FileTypes] | Sequence[tuple[str, FileTypes]]  # noqa: WPS221
 
 
+_NOT_DECODED: Any = object()
+
+
 class Response:
-    """HTTP Response."""
+    """HTTP Response.
 
-    def __init__(self, headers: HeaderTypes, status_code: int, content: bytes):  # noqa: WPS110
+    The JSON body is decoded lazily on the first ``json()`` call and cached, so the
+    collection, its ``Meta`` and the models built from one response share a single decode.
+    Decoding uses ``json_codec``, defaulting to the standard library ``json``.
+    """
+
+    def __init__(
+        self,
+        headers: HeaderTypes,
+        status_code: int,
+        content: bytes,  # noqa: WPS110
+        *,
+        json_codec: JSONCodec | None = None,
+    ):
         self.headers = headers
         self.status_code = status_code
         self.content = content  # noqa: WPS110
+        self._json_codec = json_codec or default_json_codec()
+        self._decoded_json: Any = _NOT_DECODED
+
+    def copy(self) -> "Response":
+        """Return a copy with the same content, sharing the JSON decoded so far."""
+        response_copy = Response(
+            headers=dict(self.headers),
+            status_code=self.status_code,
+            content=self.content,
+            json_codec=self._json_codec,
+        )
+        response_copy._decoded_json = self._decoded_json
+        return response_copy
 
     @property
     def text(self) -> str:
@@ -38,5 +68,14 @@ class Response:
         return self.content.decode()
 
     def json(self, **kwargs: Any) -> Any:
-        """Return the json-encoded content of a response, if any."""
-        return json.loads(self.content, **kwargs)
+        """Return the json-encoded content of a response, if any.
+
+        The decoded content is cached and shared by every caller and copy, so it must not be
+        mutated. Decoder keyword arguments bypass the cache and the codec; they are passed
+        to the standard library ``json.loads``.
+        """
+        if kwargs:
+            return json.loads(self.content, **kwargs)
+        if self._decoded_json is _NOT_DECODED:
+            self._decoded_json = self._json_codec.loads(self.content)
+        return self._decoded_json
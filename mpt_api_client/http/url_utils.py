@@ -24,3 +24,19 @@ def join_url_path(base: str, *segments: str) -> str:
     parts = [base.rstrip("/")]
     parts.extend(seg.strip("/") for seg in segments if seg)
     return "/".join(parts)
+
+
+def is_path_within(path: str, prefix: str) -> bool:
+    """Return whether *path* is *prefix* itself or one of its sub-paths.
+
+    Matching is segment-aware, so ``/orders`` contains ``/orders/ORD-1`` but not
+    ``/orders-archive``.
+
+    Examples:
+        >>> is_path_within("/api/v1/orders/ORD-001", "/api/v1/orders")
+        True
+        >>> is_path_within("/api/v1/orders-archive", "/api/v1/orders")
+        False
+    """
+    prefix = prefix.rstrip("/")
+    return path == prefix or path.startswith(f"{prefix}/")
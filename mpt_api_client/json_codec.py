@@ -0,0 +1,96 @@
+import importlib
+import json
+from contextlib import suppress
+from typing import Any, Protocol, cast, runtime_checkable
+
+
+@runtime_checkable
+class JSONCodec(Protocol):
+    """Encodes request bodies and decodes response bodies.
+
+    Implementations raise ``ValueError`` (or a subclass) when decoding invalid JSON.
+    """
+
+    name: str
+
+    def dumps(self, payload: Any) -> bytes:
+        """Serialize ``payload`` to compact UTF-8 encoded JSON."""
+
+    def loads(self, raw_json: bytes | str) -> Any:
+        """Deserialize ``raw_json``."""
+
+
+class StdlibJSONCodec:
+    """JSON codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, payload: Any) -> bytes:
+        """Serialize ``payload`` to compact UTF-8 encoded JSON, rejecting NaN and infinity."""
+        encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+        return encoded.encode("utf-8")
+
+    def loads(self, raw_json: bytes | str) -> Any:
+        """Deserialize ``raw_json``."""
+        return json.loads(raw_json)
+
+
+class OrjsonCodec:
+    """JSON codec backed by ``orjson``.
+
+    Raises:
+        ImportError: If ``orjson`` is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._orjson = importlib.import_module("orjson")
+
+    def dumps(self, payload: Any) -> bytes:
+        """Serialize ``payload`` to compact UTF-8 encoded JSON; NaN and infinity become null."""
+        return cast("bytes", self._orjson.dumps(payload))
+
+    def loads(self, raw_json: bytes | str) -> Any:
+        """Deserialize ``raw_json``."""
+        return self._orjson.loads(raw_json)
+
+
+class MsgspecCodec:
+    """JSON codec backed by ``msgspec``.
+
+    Raises:
+        ImportError: If ``msgspec`` is not installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        msgspec_json = importlib.import_module("msgspec.json")
+        self._encoder = msgspec_json.Encoder()
+        self._decoder = msgspec_json.Decoder()
+
+    def dumps(self, payload: Any) -> bytes:
+        """Serialize ``payload`` to compact UTF-8 encoded JSON; NaN and infinity become null."""
+        return cast("bytes", self._encoder.encode(payload))
+
+    def loads(self, raw_json: bytes | str) -> Any:
+        """Deserialize ``raw_json``."""
+        return self._decoder.decode(raw_json)
+
+
+def default_json_codec() -> JSONCodec:
+    """Return the codec used unless another is configured: the standard library ``json``.
+
+    The fast codecs encode NaN and infinity as null where ``json`` rejects them, so they
+    are opt-in through ``fastest_json_codec()``.
+    """
+    return StdlibJSONCodec()
+
+
+def fastest_json_codec() -> JSONCodec:
+    """Return the fastest installed codec: ``orjson``, then ``msgspec``, then ``json``."""
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        with suppress(ImportError):
+            return codec_class()
+    return StdlibJSONCodec()
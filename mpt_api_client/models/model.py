@@ -240,8 +240,8 @@ class Model(BaseModel):
 
         if isinstance(response_data, dict):
             meta = Meta.from_response(response)
-            response_data.pop("$meta", None)
-            return cls(response_data, meta)
+            resource_data = {key: value for key, value in response_data.items() if key != "$meta"}
+            return cls(resource_data, meta)
         if isinstance(response_data, list):
             return ModelCollection([cls(data_item) for data_item in response_data])
 
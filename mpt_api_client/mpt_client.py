@@ -1,7 +1,8 @@
 from typing import Self
 
 from mpt_api_client.auth import Authentication
-from mpt_api_client.http import AsyncHTTPClient, HTTPClient, TransportSettings
+from mpt_api_client.http import AsyncHTTPClient, ClientMetrics, HTTPClient, TransportSettings
+from mpt_api_client.json_codec import JSONCodec
 from mpt_api_client.resources import (
     Accounts,
     AsyncAccounts,
@@ -43,6 +44,7 @@ class AsyncMPTClient:
         authentication: Authentication,
         base_url: str,
         timeout: float = 60.0,
+        json_codec: JSONCodec | None = None,
     ) -> Self:
         """Create MPT client from configuration.
 
@@ -50,14 +52,20 @@ class AsyncMPTClient:
             authentication: Authentication provider (e.g. BearerTokenAuthentication).
             base_url: MPT Base URL
             timeout: HTTP request timeout in seconds. Defaults to 60.0.
+            json_codec: JSON codec. Defaults to the standard library ``json``.
 
         Returns:
             MPT Client
 
         """
-        transport = TransportSettings(base_url=base_url, timeout=timeout)
+        transport = TransportSettings(base_url=base_url, timeout=timeout, json_codec=json_codec)
         return cls(AsyncHTTPClient(authentication=authentication, transport=transport))
 
+    @property
+    def metrics(self) -> ClientMetrics:
+        """Request, retry, connection pool and decoding metrics of the HTTP client."""
+        return self.http_client.components.metrics
+
     @property
     def catalog(self) -> AsyncCatalog:
         """Catalog MPT API Client."""
@@ -129,6 +137,7 @@ class MPTClient:
         authentication: Authentication,
         base_url: str,
         timeout: float = 60.0,
+        json_codec: JSONCodec | None = None,
     ) -> Self:
         """Create MPT client from configuration.
 
@@ -136,12 +145,13 @@ class MPTClient:
             authentication: Authentication provider (e.g. BearerTokenAuthentication).
             base_url: MPT Base URL
             timeout: HTTP request timeout in seconds. Defaults to 60.0.
+            json_codec: JSON codec. Defaults to the standard library ``json``.
 
         Returns:
             MPT Client
 
         """
-        transport = TransportSettings(base_url=base_url, timeout=timeout)
+        transport = TransportSettings(base_url=base_url, timeout=timeout, json_codec=json_codec)
         return cls(HTTPClient(authentication=authentication, transport=transport))
 
     @property
@@ -154,6 +164,11 @@ class MPTClient:
         """
         return Commerce(http_client=self.http_client)
 
+    @property
+    def metrics(self) -> ClientMetrics:
+        """Request, retry, connection pool and decoding metrics of the HTTP client."""
+        return self.http_client.components.metrics
+
     @property
     def catalog(self) -> Catalog:
         """Catalog MPT API Client."""
@@ -3,9 +3,11 @@ from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncCreateMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     CollectionMixin,
     CreateMixin,
     GetMixin,
+    StreamingMixin,
 )
 from mpt_api_client.models import Model
 
@@ -25,6 +27,7 @@ class RecordsServiceConfig:
 class RecordsService(
     CreateMixin[Record],
     GetMixin[Record],
+    StreamingMixin[Record],
     CollectionMixin[Record],
     Service[Record],
     RecordsServiceConfig,
@@ -35,6 +38,7 @@ class RecordsService(
 class AsyncRecordsService(
     AsyncCreateMixin[Record],
     AsyncGetMixin[Record],
+    AsyncStreamingMixin[Record],
     AsyncCollectionMixin[Record],
     AsyncService[Record],
     RecordsServiceConfig,
@@ -2,8 +2,10 @@ from mpt_api_client.http import AsyncService, Service
 from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     CollectionMixin,
     GetMixin,
+    StreamingMixin,
 )
 from mpt_api_client.models import Model
 
@@ -22,6 +24,7 @@ class CustomLedgerChargesServiceConfig:
 
 class CustomLedgerChargesService(
     GetMixin[CustomLedgerCharge],
+    StreamingMixin[CustomLedgerCharge],
     CollectionMixin[CustomLedgerCharge],
     Service[CustomLedgerCharge],
     CustomLedgerChargesServiceConfig,
@@ -31,6 +34,7 @@ class CustomLedgerChargesService(
 
 class AsyncCustomLedgerChargesService(
     AsyncGetMixin[CustomLedgerCharge],
+    AsyncStreamingMixin[CustomLedgerCharge],
     AsyncCollectionMixin[CustomLedgerCharge],
     AsyncService[CustomLedgerCharge],
     CustomLedgerChargesServiceConfig,
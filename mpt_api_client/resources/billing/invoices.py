@@ -3,10 +3,12 @@ from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncCreateMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     AsyncUpdateMixin,
     CollectionMixin,
     CreateMixin,
     GetMixin,
+    StreamingMixin,
     UpdateMixin,
 )
 from mpt_api_client.models import Model
@@ -32,6 +34,7 @@ class InvoicesService(
     CreateMixin[Invoice],
     UpdateMixin[Invoice],
     GetMixin[Invoice],
+    StreamingMixin[Invoice],
     CollectionMixin[Invoice],
     Service[Invoice],
     InvoicesServiceConfig,
@@ -50,6 +53,7 @@ class AsyncInvoicesService(
     AsyncCreateMixin[Invoice],
     AsyncUpdateMixin[Invoice],
     AsyncGetMixin[Invoice],
+    AsyncStreamingMixin[Invoice],
     AsyncCollectionMixin[Invoice],
     AsyncService[Invoice],
     InvoicesServiceConfig,
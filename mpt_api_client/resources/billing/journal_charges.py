@@ -2,8 +2,10 @@ from mpt_api_client.http import AsyncService, Service
 from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     CollectionMixin,
     GetMixin,
+    StreamingMixin,
 )
 from mpt_api_client.models import Model
 
@@ -22,6 +24,7 @@ class JournalChargesServiceConfig:
 
 class JournalChargesService(
     GetMixin[JournalCharge],
+    StreamingMixin[JournalCharge],
     CollectionMixin[JournalCharge],
     Service[JournalCharge],
     JournalChargesServiceConfig,
@@ -31,6 +34,7 @@ class JournalChargesService(
 
 class AsyncJournalChargesService(
     AsyncGetMixin[JournalCharge],
+    AsyncStreamingMixin[JournalCharge],
     AsyncCollectionMixin[JournalCharge],
     AsyncService[JournalCharge],
     JournalChargesServiceConfig,
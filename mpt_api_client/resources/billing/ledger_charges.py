@@ -2,8 +2,10 @@ from mpt_api_client.http import AsyncService, Service
 from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     CollectionMixin,
     GetMixin,
+    StreamingMixin,
 )
 from mpt_api_client.models import Model
 
@@ -23,6 +25,7 @@ class LedgerChargesServiceConfig:
 class LedgerChargesService(
     GetMixin[LedgerCharge],
     Service[LedgerCharge],
+    StreamingMixin[LedgerCharge],
     CollectionMixin[LedgerCharge],
     LedgerChargesServiceConfig,
 ):
@@ -32,6 +35,7 @@ class LedgerChargesService(
 class AsyncLedgerChargesService(
     AsyncGetMixin[LedgerCharge],
     AsyncService[LedgerCharge],
+    AsyncStreamingMixin[LedgerCharge],
     AsyncCollectionMixin[LedgerCharge],
     LedgerChargesServiceConfig,
 ):
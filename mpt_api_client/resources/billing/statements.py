@@ -2,9 +2,11 @@ from mpt_api_client.http import AsyncService, Service
 from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     AsyncUpdateMixin,
     CollectionMixin,
     GetMixin,
+    StreamingMixin,
     UpdateMixin,
 )
 from mpt_api_client.models import Model
@@ -35,6 +37,7 @@ class StatementsService(
     UpdateMixin[Statement],
     IssuableMixin[Statement],
     GetMixin[Statement],
+    StreamingMixin[Statement],
     CollectionMixin[Statement],
     Service[Statement],
     StatementsServiceConfig,
@@ -60,6 +63,7 @@ class AsyncStatementsService(
     AsyncUpdateMixin[Statement],
     AsyncIssuableMixin[Statement],
     AsyncGetMixin[Statement],
+    AsyncStreamingMixin[Statement],
     AsyncCollectionMixin[Statement],
     AsyncService[Statement],
     StatementsServiceConfig,
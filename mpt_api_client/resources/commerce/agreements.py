@@ -2,8 +2,10 @@ from mpt_api_client.http import AsyncService, Service
 from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncManagedResourceMixin,
+    AsyncStreamingMixin,
     CollectionMixin,
     ManagedResourceMixin,
+    StreamingMixin,
 )
 from mpt_api_client.models import Model
 from mpt_api_client.models.model import BaseModel
@@ -89,6 +91,7 @@ class AgreementsService(
     RenderMixin[Agreement],
     TemplateMixin[Agreement],
     ManagedResourceMixin[Agreement],
+    StreamingMixin[Agreement],
     CollectionMixin[Agreement],
     Service[Agreement],
     AgreementsServiceConfig,
@@ -114,6 +117,7 @@ class AsyncAgreementsService(
     AsyncRenderMixin[Agreement],
     AsyncTemplateMixin[Agreement],
     AsyncManagedResourceMixin[Agreement],
+    AsyncStreamingMixin[Agreement],
     AsyncCollectionMixin[Agreement],
     AsyncService[Agreement],
     AgreementsServiceConfig,
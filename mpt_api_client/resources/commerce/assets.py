@@ -3,10 +3,12 @@ from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncCreateMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     AsyncUpdateMixin,
     CollectionMixin,
     CreateMixin,
     GetMixin,
+    StreamingMixin,
     UpdateMixin,
 )
 from mpt_api_client.models import Model
@@ -73,6 +75,7 @@ class AssetService(
     GetMixin[Asset],
     TerminateMixin[Asset],
     RenderMixin[Asset],
+    StreamingMixin[Asset],
     CollectionMixin[Asset],
     Service[Asset],
     AssetServiceConfig,
@@ -86,6 +89,7 @@ class AsyncAssetService(
     AsyncGetMixin[Asset],
     AsyncTerminateMixin[Asset],
     AsyncRenderMixin[Asset],
+    AsyncStreamingMixin[Asset],
     AsyncCollectionMixin[Asset],
     AsyncService[Asset],
     AssetServiceConfig,
@@ -5,8 +5,10 @@ from mpt_api_client.http import (
 from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncManagedResourceMixin,
+    AsyncStreamingMixin,
     CollectionMixin,
     ManagedResourceMixin,
+    StreamingMixin,
 )
 from mpt_api_client.models import Model, ResourceData
 from mpt_api_client.models.model import BaseModel
@@ -104,6 +106,7 @@ class OrdersService(  # noqa: WPS214
     RenderMixin[Order],
     TemplateMixin[Order],
     ManagedResourceMixin[Order],
+    StreamingMixin[Order],
     CollectionMixin[Order],
     Service[Order],
     OrdersServiceConfig,
@@ -209,6 +212,7 @@ class AsyncOrdersService(  # noqa: WPS214
     AsyncRenderMixin[Order],
     AsyncTemplateMixin[Order],
     AsyncManagedResourceMixin[Order],
+    AsyncStreamingMixin[Order],
     AsyncCollectionMixin[Order],
     AsyncService[Order],
     OrdersServiceConfig,
@@ -6,10 +6,12 @@ from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncCreateMixin,
     AsyncGetMixin,
+    AsyncStreamingMixin,
     AsyncUpdateMixin,
     CollectionMixin,
     CreateMixin,
     GetMixin,
+    StreamingMixin,
     UpdateMixin,
 )
 from mpt_api_client.models import Model
@@ -82,6 +84,7 @@ class SubscriptionsService(
     CreateMixin[Subscription],
     UpdateMixin[Subscription],
     GetMixin[Subscription],
+    StreamingMixin[Subscription],
     CollectionMixin[Subscription],
     TerminateMixin[Subscription],
     RenderMixin[Subscription],
@@ -95,6 +98,7 @@ class AsyncSubscriptionsService(
     AsyncCreateMixin[Subscription],
     AsyncUpdateMixin[Subscription],
     AsyncGetMixin[Subscription],
+    AsyncStreamingMixin[Subscription],
     AsyncCollectionMixin[Subscription],
     AsyncTerminateMixin[Subscription],
     AsyncRenderMixin[Subscription],
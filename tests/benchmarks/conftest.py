@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from mpt_api_client.http.types import Response
+
+BENCHMARK_ROUNDS = 20
+
+
+def build_record(index: int) -> dict:
+    """Build one order-like record with nested objects."""
+    record_id = str(index).zfill(4)
+    return {
+        "id": f"ORD-{record_id}",
+        "status": "Completed",
+        "product": {"id": "PRD-1", "name": "Product"},
+        "lines": [{"id": f"ALI-{record_id}", "quantity": 1, "price": {"unitPP": 1.5}}],
+        "audit": {"created": {"at": "2026-01-01T00:00:00Z", "by": {"id": "USR-1"}}},
+    }
+
+
+def build_page(record_count: int) -> bytes:
+    """Build the raw body of one collection page with `record_count` records."""
+    page = {
+        "data": [build_record(index) for index in range(record_count)],
+        "$meta": {"pagination": {"offset": 0, "limit": record_count, "total": record_count}},
+    }
+    return json.dumps(page).encode()
+
+
+class UncachedResponse(Response):
+    """Response that decodes on every `json()` call, as before the decode was cached."""
+
+    def json(self, **kwargs):
+        return json.loads(self.content, **kwargs)
+
+
+@pytest.fixture(params=[100, 1000], ids=lambda record_count: f"{record_count}-records")
+def page_content(request):
+    return build_page(request.param)
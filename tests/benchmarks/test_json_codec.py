@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from mpt_api_client.json_codec import MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+from tests.benchmarks.conftest import BENCHMARK_ROUNDS
+
+
+def cpu_time_per_decode(json_codec, page_content):
+    """Best CPU time in milliseconds of decoding one page with `json_codec`."""
+    timings = []
+    for _ in range(BENCHMARK_ROUNDS):
+        started = time.process_time()
+        json_codec.loads(page_content)
+        timings.append(time.process_time() - started)
+    return min(timings) * 1000
+
+
+@pytest.mark.parametrize(
+    ("module_name", "codec_class"),
+    [("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)],
+)
+def test_fast_codec_decode_saving(page_content, module_name, codec_class):
+    pytest.importorskip(module_name)
+    stdlib_codec = StdlibJSONCodec()
+    fast_codec = codec_class()
+    stdlib_ms = cpu_time_per_decode(stdlib_codec, page_content)
+
+    fast_ms = cpu_time_per_decode(fast_codec, page_content)  # act
+
+    saved_pct = (1 - fast_ms / stdlib_ms) * 100
+    print(  # noqa: WPS421
+        f"\n{module_name} decode CPU per page: json {stdlib_ms:.2f} ms, "
+        f"{module_name} {fast_ms:.2f} ms ({saved_pct:.0f}% saved)"
+    )
+    assert fast_codec.loads(page_content) == stdlib_codec.loads(page_content)
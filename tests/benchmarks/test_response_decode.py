@@ -0,0 +1,52 @@
+import json
+import time
+
+from mpt_api_client.http.types import Response
+from mpt_api_client.json_codec import StdlibJSONCodec
+from mpt_api_client.models import Meta, ModelCollection
+from tests.benchmarks.conftest import BENCHMARK_ROUNDS, UncachedResponse
+from tests.unit.conftest import DummyModel
+from tests.unit.http.conftest import DummyService
+
+
+def legacy_make_collection(response):
+    """Build a collection the way it was built before the decode was shared."""
+    meta = Meta.from_response(response)
+    return ModelCollection(
+        resources=[DummyModel(resource, meta) for resource in response.json()["data"]],
+        meta=meta,
+    )
+
+
+def cpu_time_per_page(make_collection, response_class, page_content):
+    """Best CPU time in milliseconds of building one collection from a fresh response."""
+    timings = []
+    for _ in range(BENCHMARK_ROUNDS):
+        response = response_class(
+            headers={}, status_code=200, content=page_content, json_codec=StdlibJSONCodec()
+        )
+        started = time.process_time()
+        make_collection(response)
+        timings.append(time.process_time() - started)
+    return min(timings) * 1000
+
+
+def test_make_collection_decode_saving(page_content, mocker):
+    legacy_ms = cpu_time_per_page(legacy_make_collection, UncachedResponse, page_content)
+    shared_ms = cpu_time_per_page(DummyService.make_collection, Response, page_content)
+    loads_spy = mocker.spy(json, "loads")
+    legacy_make_collection(UncachedResponse(headers={}, status_code=200, content=page_content))
+    legacy_decodes = loads_spy.call_count
+    loads_spy.reset_mock()
+
+    DummyService.make_collection(
+        Response(headers={}, status_code=200, content=page_content, json_codec=StdlibJSONCodec())
+    )  # act
+
+    saved_pct = (1 - shared_ms / legacy_ms) * 100
+    print(  # noqa: WPS421
+        f"\nmake_collection CPU per page: before {legacy_ms:.2f} ms, "
+        f"after {shared_ms:.2f} ms ({saved_pct:.0f}% saved)"
+    )
+    assert legacy_decodes == 2
+    assert loads_spy.call_count == 1
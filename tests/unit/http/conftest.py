@@ -1,18 +1,30 @@
+import multiprocessing
+
 import httpx
 import pytest
 
 from mpt_api_client import RQLQuery
+from mpt_api_client.auth import BearerTokenAuthentication
 from mpt_api_client.http import (
+    AsyncHTTPClient,
     AsyncService,
+    HTTPClient,
+    MemoryCacheBackend,
+    ModelCachePolicy,
+    RequestHook,
     Service,
+    TransportSettings,
 )
+from mpt_api_client.http.circuit_breaker import CircuitBreakerPolicy
+from mpt_api_client.http.idempotency_journals import MemoryIdempotencyJournal
 from mpt_api_client.http.mixins import (
     AsyncCollectionMixin,
     AsyncManagedResourceMixin,
     CollectionMixin,
     ManagedResourceMixin,
 )
-from tests.unit.conftest import DummyModel
+from mpt_api_client.http.retry_budget import RetryBudget
+from tests.unit.conftest import API_TOKEN, API_URL, DummyModel
 
 
 class DummyService(
@@ -33,6 +45,19 @@ class AsyncDummyService(
     _model_class = DummyModel
 
 
+class FakeClock:
+    """Monotonic clock advanced only by its own ``sleep``."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
 class RecordingProgress:
     """Progress fake recording every event as a tuple, in call order."""
 
@@ -65,6 +90,35 @@ class AsyncRecordingProgress:
         self.events.append(("completed",))
 
 
+class RecordingHook(RequestHook):
+    """Hook recording the event kind and attempt of every call."""
+
+    def __init__(self):
+        self.calls = []
+        self.events = []
+
+    def on_request_start(self, event):
+        self.events.append(event)
+        self.calls.append(("start", event.attempt))
+
+    def on_retry(self, event):
+        self.calls.append(("retry", event.attempt))
+
+    def on_response_headers(self, event):
+        self.calls.append(("headers", event.attempt))
+
+    def on_body_complete(self, event):
+        self.calls.append(("body", event.attempt))
+
+    def on_error(self, event):
+        self.calls.append(("error", event.attempt))
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
 @pytest.fixture
 def recording_progress():
     return RecordingProgress()
@@ -75,6 +129,143 @@ def async_recording_progress():
     return AsyncRecordingProgress()
 
 
+@pytest.fixture
+def fork_context():
+    return multiprocessing.get_context("fork")
+
+
+@pytest.fixture
+def no_retry_backoff(mocker):
+    mocker.patch("mpt_api_client.http.retries.time.sleep")
+    mocker.patch("mpt_api_client.http.retries.asyncio.sleep", new=mocker.AsyncMock())
+
+
+@pytest.fixture
+def recording_hook():
+    return RecordingHook()
+
+
+@pytest.fixture
+def caching_settings():
+    return TransportSettings(base_url=API_URL, http_cache=MemoryCacheBackend())
+
+
+@pytest.fixture
+def caching_client(caching_settings):
+    return HTTPClient(
+        transport=caching_settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+
+
+@pytest.fixture
+def async_caching_client(caching_settings):
+    return AsyncHTTPClient(
+        transport=caching_settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+
+
+@pytest.fixture
+def metered_settings():
+    return TransportSettings(base_url=API_URL, request_metrics=True)
+
+
+@pytest.fixture
+def metered_client(metered_settings, bearer_authentication):
+    return HTTPClient(transport=metered_settings, authentication=bearer_authentication)
+
+
+@pytest.fixture
+def async_metered_client(metered_settings, bearer_authentication):
+    return AsyncHTTPClient(transport=metered_settings, authentication=bearer_authentication)
+
+
+@pytest.fixture
+def small_budget_settings():
+    return TransportSettings(base_url=API_URL, retry_budget=RetryBudget(burst=1))
+
+
+@pytest.fixture
+def small_budget_client(small_budget_settings):
+    return HTTPClient(
+        transport=small_budget_settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+
+
+@pytest.fixture
+def async_small_budget_client(small_budget_settings):
+    return AsyncHTTPClient(
+        transport=small_budget_settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+
+
+@pytest.fixture
+def bearer_authentication():
+    return BearerTokenAuthentication(API_TOKEN)
+
+
+@pytest.fixture
+def circuit_breaker_settings():
+    return TransportSettings(
+        base_url=API_URL, circuit_breaker=CircuitBreakerPolicy(min_requests=1, window=1)
+    )
+
+
+@pytest.fixture
+def circuit_breaker_client(circuit_breaker_settings, bearer_authentication):
+    return HTTPClient(transport=circuit_breaker_settings, authentication=bearer_authentication)
+
+
+@pytest.fixture
+def async_circuit_breaker_client(circuit_breaker_settings, bearer_authentication):
+    return AsyncHTTPClient(transport=circuit_breaker_settings, authentication=bearer_authentication)
+
+
+@pytest.fixture
+def keyed_client(bearer_authentication):
+    return HTTPClient(
+        transport=TransportSettings(base_url=API_URL, idempotency_keys=True),
+        authentication=bearer_authentication,
+    )
+
+
+@pytest.fixture
+def journaled_settings():
+    return TransportSettings(
+        base_url=API_URL, idempotency_keys=True, idempotency_journal=MemoryIdempotencyJournal()
+    )
+
+
+@pytest.fixture
+def journaled_client(journaled_settings, bearer_authentication):
+    return HTTPClient(transport=journaled_settings, authentication=bearer_authentication)
+
+
+@pytest.fixture
+def async_journaled_client(journaled_settings, bearer_authentication):
+    return AsyncHTTPClient(transport=journaled_settings, authentication=bearer_authentication)
+
+
+@pytest.fixture
+def model_cache_settings():
+    return TransportSettings(base_url=API_URL, model_cache=ModelCachePolicy(ttl=60))
+
+
+@pytest.fixture
+def cached_dummy_service(model_cache_settings):
+    http_client = HTTPClient(
+        transport=model_cache_settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+    return DummyService(http_client=http_client)
+
+
+@pytest.fixture
+def async_cached_dummy_service(model_cache_settings):
+    http_client = AsyncHTTPClient(
+        transport=model_cache_settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+    return AsyncDummyService(http_client=http_client)
+
+
 @pytest.fixture
 def dummy_service(http_client):
     return DummyService(http_client=http_client)
@@ -1,15 +1,59 @@
+import multiprocessing
+import re
+from urllib.parse import unquote
+
 import httpx
 import pytest
 import respx
 
 from mpt_api_client import RQLQuery
-from mpt_api_client.exceptions import MPTAPIError
+from mpt_api_client.exceptions import MPTAPIError, MPTDeadlineExceededError
+from mpt_api_client.http.bulk import BulkResult
+from mpt_api_client.http.checkpoint import Checkpoint, Checkpointer
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.export_sinks import JSONLExportSink
+from mpt_api_client.http.partitions import Partition
 from tests.unit.http.conftest import (
     AsyncDummyService,
     AsyncRecordingProgress,
     DummyService,
     RecordingProgress,
 )
+from tests.unit.http.test_partitioned_export import make_client, paged_responder
+
+EXISTING_IDS = frozenset(("ID-1", "ID-2", "ID-3", "ID-4"))
+
+
+def lookup_responder(request: httpx.Request) -> httpx.Response:
+    """Answer an ``in(id,(...))`` query with the requested ids that exist."""
+    id_list = re.search(r"in\(id,\((.*?)\)\)", unquote(str(request.url)))
+    requested = re.findall(r"'([^']*)'", id_list.group(1)) if id_list else []
+    found = [{"id": resource_id} for resource_id in requested if resource_id in EXISTING_IDS]
+    return httpx.Response(httpx.codes.OK, json={"data": found})
+
+
+async def collect_ids(resources, resource_ids):
+    """Append the ids of async ``resources`` to ``resource_ids`` as they are yielded."""
+    async for resource in resources:
+        resource_ids.append(resource.id)
+
+
+def keyset_page(ids: list[str], total: int) -> httpx.Response:
+    return httpx.Response(
+        httpx.codes.OK,
+        json={
+            "data": [{"id": resource_id} for resource_id in ids],
+            "$meta": {"pagination": {"total": total, "offset": 0, "limit": 2}},
+        },
+    )
+
+
+def mock_keyset_pages() -> respx.Route:
+    """Mock a 3-record collection paged with ``gt(id,...)`` filters, 2 records per page."""
+    route = respx.get("https://api.example.com/api/v1/test")
+    first_page = keyset_page(["ID-1", "ID-2"], 3)
+    route.side_effect = [first_page, keyset_page(["ID-3"], 1)]
+    return route
 
 
 class FailingProgress(RecordingProgress):
@@ -127,6 +171,80 @@ def test_col_mx_fetch_page_with_filter(
     assert request.url == expected_url
 
 
+def test_col_mx_get_many(dummy_service: DummyService) -> None:
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(side_effect=lookup_responder)
+
+        result = dummy_service.get_many(["ID-2", "ID-9", "ID-1", "ID-2"])
+
+    assert list(result) == ["ID-2", "ID-1"]
+    assert result["ID-1"].id == "ID-1"
+    assert result.missing == ["ID-9"]
+    assert route.call_count == 1
+    assert route.calls[0].request.url == (
+        "https://api.example.com/api/v1/test?limit=3&offset=0&in(id,('ID-2','ID-9','ID-1'))"
+    )
+
+
+def test_col_mx_get_many_chunks_by_url_length(dummy_service: DummyService) -> None:
+    resource_ids = [f"ID-{index}" for index in range(1, 10)]
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(side_effect=lookup_responder)
+
+        result = dummy_service.get_many(resource_ids, max_url_length=100, concurrency=2)
+
+    target_lengths = [len(call.request.url.raw_path) for call in route.calls]
+    assert sorted(result) == sorted(EXISTING_IDS)
+    assert result.missing == resource_ids[4:]
+    assert route.call_count > 1
+    assert max(target_lengths) <= 100
+
+
+def test_col_mx_get_many_chunk_size_and_select(
+    dummy_service: DummyService, filter_status_active: RQLQuery
+) -> None:
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(side_effect=lookup_responder)
+
+        result = dummy_service.filter(filter_status_active).get_many(
+            ["ID-1", "ID-2", "ID-3"], select="name,status", chunk_size=2
+        )
+
+    urls = sorted(str(call.request.url) for call in route.calls)
+    assert len(result) == 3
+    assert urls == [
+        (
+            "https://api.example.com/api/v1/test?limit=1&offset=0&select=name,status"
+            "&and(eq(status,'active'),in(id,('ID-3')))"
+        ),
+        (
+            "https://api.example.com/api/v1/test?limit=2&offset=0&select=name,status"
+            "&and(eq(status,'active'),in(id,('ID-1','ID-2')))"
+        ),
+    ]
+
+
+def test_col_mx_get_many_raises_chunk_error(dummy_service: DummyService) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(
+            return_value=httpx.Response(httpx.codes.BAD_REQUEST, json={"message": "Bad"})
+        )
+
+        with pytest.raises(MPTAPIError):
+            dummy_service.get_many(["ID-1"])
+
+
+def test_col_mx_get_many_empty(dummy_service: DummyService) -> None:
+    with respx.mock(assert_all_called=False) as respx_mock:
+        route = respx_mock.get("https://api.example.com/api/v1/test")
+
+        result = dummy_service.get_many([])
+
+    assert not result
+    assert result.missing == []
+    assert not route.called
+
+
 def test_col_mx_iterate_single_page(
     dummy_service: DummyService, single_page_response: httpx.Response
 ) -> None:
@@ -169,6 +287,32 @@ def test_col_mx_iterate_multiple_pages(
     assert result[3].id == "ID-4"
 
 
+def test_col_mx_iterate_stops_at_deadline(
+    dummy_service: DummyService,
+    multi_page_response_page1: httpx.Response,
+    multi_page_response_page2: httpx.Response,
+    fake_clock,
+) -> None:
+    """Test that iteration requests no page once the deadline has passed."""
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        second_page = respx.get(
+            "https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}
+        ).mock(return_value=multi_page_response_page2)
+        with deadline(5, fake_clock):
+            iterator = dummy_service.iterate(2)
+            first_page = [next(iterator), next(iterator)]
+            fake_clock.sleep(5)
+
+            with pytest.raises(MPTDeadlineExceededError):
+                next(iterator)
+
+    assert [resource.id for resource in first_page] == ["ID-1", "ID-2"]
+    assert not second_page.called
+
+
 def test_col_mx_iterate_empty_results(
     dummy_service: DummyService, empty_response: httpx.Response
 ) -> None:
@@ -276,6 +420,207 @@ def test_col_mx_iterate_handles_api_errors(dummy_service: DummyService) -> None:
             list(iterator)
 
 
+def test_col_mx_iterate_prefetch(
+    dummy_service: DummyService,
+    multi_page_response_page1: httpx.Response,
+    multi_page_response_page2: httpx.Response,
+) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=multi_page_response_page2
+        )
+
+        result = [resource.id for resource in dummy_service.iterate(2, prefetch=2)]
+
+    assert result == ["ID-1", "ID-2", "ID-3", "ID-4"]
+
+
+def test_col_mx_iterate_prefetch_raises_api_error(
+    dummy_service: DummyService, multi_page_response_page1: httpx.Response
+) -> None:
+    resource_ids = []
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=httpx.Response(httpx.codes.BAD_REQUEST, json={"message": "Bad"})
+        )
+
+        with pytest.raises(MPTAPIError):
+            resource_ids.extend(resource.id for resource in dummy_service.iterate(2, prefetch=1))
+
+    assert resource_ids == ["ID-1", "ID-2"]
+
+
+def test_col_mx_iterate_parallel(
+    dummy_service: DummyService,
+    multi_page_response_page1: httpx.Response,
+    multi_page_response_page2: httpx.Response,
+) -> None:
+    progress = RecordingProgress()
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=multi_page_response_page2
+        )
+
+        result = [
+            resource.id
+            for resource in dummy_service.iterate_parallel(2, concurrency=2, progress=progress)
+        ]
+
+    assert result == ["ID-1", "ID-2", "ID-3", "ID-4"]
+    assert progress.events[-1] == ("completed",)
+
+
+def test_col_mx_iterate_parallel_unordered(
+    dummy_service: DummyService, single_page_response: httpx.Response
+) -> None:
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(
+            return_value=single_page_response
+        )
+
+        result = [resource.id for resource in dummy_service.iterate_parallel(ordered=False)]
+
+    assert result == ["ID-1", "ID-2"]
+    assert route.call_count == 1
+
+
+def test_col_mx_iterate_keyset(dummy_service: DummyService) -> None:
+    progress = RecordingProgress()
+    with respx.mock:
+        route = mock_keyset_pages()
+
+        result = [
+            resource.id for resource in dummy_service.iterate(2, keyset="id", progress=progress)
+        ]
+
+    urls = [str(call.request.url) for call in route.calls]
+    assert result == ["ID-1", "ID-2", "ID-3"]
+    assert urls == [
+        "https://api.example.com/api/v1/test?limit=2&offset=0&order=id",
+        "https://api.example.com/api/v1/test?limit=2&offset=0&order=id&gt(id,'ID-2')",
+    ]
+    assert progress.events.count(("set_total_items", 3)) == 2
+
+
+def test_col_mx_iterate_keyset_with_filter(
+    dummy_service: DummyService, filter_status_active: RQLQuery
+) -> None:
+    active_service = dummy_service.filter(filter_status_active)
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(
+            return_value=keyset_page(["ID-1", "ID-2"], 2)
+        )
+
+        result = list(active_service.iterate(2, keyset="-audit.created.at", prefetch=1))
+
+    assert len(result) == 2
+    assert route.call_count == 1
+    assert route.calls[0].request.url == (
+        "https://api.example.com/api/v1/test?limit=2&offset=0"
+        "&order=-audit.created.at,-id&eq(status,'active')"
+    )
+
+
+def test_col_mx_iterate_keyset_rejects_ordering(dummy_service: DummyService) -> None:
+    resources = dummy_service.order_by("name").iterate(keyset="id")
+
+    with pytest.raises(ValueError, match="remove order_by"):
+        next(resources)
+
+
+def test_col_mx_iterate_resumes_offset(
+    dummy_service: DummyService, multi_page_response_page2: httpx.Response
+) -> None:
+    token = Checkpoint("iterate", "/api/v1/test", 2).to_token()
+    with respx.mock:
+        route = respx.get(
+            "https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}
+        ).mock(return_value=multi_page_response_page2)
+
+        result = [resource.id for resource in dummy_service.iterate(2, resume_from=token)]
+
+    assert result == ["ID-3", "ID-4"]
+    assert route.call_count == 1
+
+
+def test_col_mx_iterate_checkpoint_on_break(
+    dummy_service: DummyService,
+    multi_page_response_page1: httpx.Response,
+    multi_page_response_page2: httpx.Response,
+) -> None:
+    checkpointer = Checkpointer(interval=100)
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(
+            side_effect=[multi_page_response_page1, multi_page_response_page2]
+        )
+        resources = dummy_service.iterate(2, checkpoint=checkpointer)
+        consumed = [next(resources).id for _ in range(3)]
+
+        resources.close()  # act
+
+    assert consumed == ["ID-1", "ID-2", "ID-3"]
+    assert Checkpoint.from_token(checkpointer.load()) == Checkpoint("iterate", "/api/v1/test", 2)
+
+
+def test_col_mx_iterate_resumes_keyset(dummy_service: DummyService) -> None:
+    checkpoint = Checkpoint("iterate", "/api/v1/test", 2, keyset="id", cursor="gt(id,'ID-2')")
+    progress = RecordingProgress()
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(
+            return_value=keyset_page(["ID-3"], 1)
+        )
+
+        result = [
+            resource.id
+            for resource in dummy_service.iterate(
+                2, keyset="id", progress=progress, resume_from=checkpoint.to_token()
+            )
+        ]
+
+    assert result == ["ID-3"]
+    assert route.calls[0].request.url == (
+        "https://api.example.com/api/v1/test?limit=2&offset=0&order=id&gt(id,'ID-2')"
+    )
+    assert ("set_total_items", 3) in progress.events
+
+
+def test_col_mx_iterate_rejects_other_query(
+    dummy_service: DummyService, filter_status_active: RQLQuery
+) -> None:
+    token = Checkpoint("iterate", "/api/v1/test", 2).to_token()
+    resources = dummy_service.filter(filter_status_active).iterate(resume_from=token)
+
+    with pytest.raises(ValueError, match="cannot resume"):
+        next(resources)
+
+
+def test_col_mx_export_partitioned(dummy_service: DummyService, tmp_path, fork_context) -> None:
+    sink = JSONLExportSink(tmp_path / "out.jsonl")
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(side_effect=paged_responder)
+
+        result = dummy_service.export_partitioned(
+            sink,
+            2,
+            processes=2,
+            client_factory=make_client,
+            batch_size=2,
+            mp_context=fork_context,
+        )
+
+    assert result.results == [3, 2]
+    assert len(sink.path.read_text().splitlines()) == 5
+
+
 def test_col_mx_iterate_progress_one_page(
     dummy_service: DummyService,
     single_page_response: httpx.Response,
@@ -485,6 +830,30 @@ async def test_async_col_mx_fetch_page_with_filter(
     assert request.url == expected_url
 
 
+async def test_async_col_mx_get_many(async_dummy_service: AsyncDummyService) -> None:
+    resource_ids = ["ID-3", "ID-7", "ID-1", "ID-4"]
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(side_effect=lookup_responder)
+
+        result = await async_dummy_service.get_many(resource_ids, select=["name"], chunk_size=2)
+
+    assert list(result) == ["ID-3", "ID-1", "ID-4"]
+    assert result.missing == ["ID-7"]
+    assert route.call_count == 2
+
+
+async def test_async_col_mx_get_many_raises_chunk_error(
+    async_dummy_service: AsyncDummyService,
+) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(
+            return_value=httpx.Response(httpx.codes.BAD_REQUEST, json={"message": "Bad"})
+        )
+
+        with pytest.raises(MPTAPIError):
+            await async_dummy_service.get_many(["ID-1"])
+
+
 async def test_async_col_mx_iterate_single_page(
     async_dummy_service: AsyncDummyService, single_page_response: httpx.Response
 ) -> None:
@@ -635,6 +1004,141 @@ async def test_async_col_mx_iterate_handles_api_errors(
             [resource async for resource in async_dummy_service.iterate()]
 
 
+async def test_async_col_mx_iterate_prefetch(
+    async_dummy_service: AsyncDummyService,
+    multi_page_response_page1: httpx.Response,
+    multi_page_response_page2: httpx.Response,
+) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=multi_page_response_page2
+        )
+
+        result = [resource.id async for resource in async_dummy_service.iterate(2, prefetch=2)]
+
+    assert result == ["ID-1", "ID-2", "ID-3", "ID-4"]
+
+
+async def test_async_col_mx_iterate_prefetch_error(
+    async_dummy_service: AsyncDummyService, multi_page_response_page1: httpx.Response
+) -> None:
+    resource_ids = []
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=httpx.Response(httpx.codes.BAD_REQUEST, json={"message": "Bad"})
+        )
+
+        with pytest.raises(MPTAPIError):
+            await collect_ids(async_dummy_service.iterate(2, prefetch=1), resource_ids)
+
+    assert resource_ids == ["ID-1", "ID-2"]
+
+
+async def test_async_col_mx_iterate_parallel(
+    async_dummy_service: AsyncDummyService,
+    multi_page_response_page1: httpx.Response,
+    multi_page_response_page2: httpx.Response,
+) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=multi_page_response_page2
+        )
+
+        result = [
+            resource.id async for resource in async_dummy_service.iterate_parallel(2, ordered=False)
+        ]
+
+    assert sorted(result) == ["ID-1", "ID-2", "ID-3", "ID-4"]
+
+
+async def test_async_col_mx_iterate_parallel_error(
+    async_dummy_service: AsyncDummyService, multi_page_response_page1: httpx.Response
+) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 0}).mock(
+            return_value=multi_page_response_page1
+        )
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=httpx.Response(httpx.codes.BAD_REQUEST, json={"message": "Bad"})
+        )
+
+        with pytest.raises(MPTAPIError):
+            [resource async for resource in async_dummy_service.iterate_parallel(2)]
+
+
+async def test_async_col_mx_iterate_keyset(async_dummy_service: AsyncDummyService) -> None:
+    with respx.mock:
+        route = mock_keyset_pages()
+
+        result = [resource.id async for resource in async_dummy_service.iterate(2, keyset="id")]
+
+    assert result == ["ID-1", "ID-2", "ID-3"]
+    assert route.calls[1].request.url == (
+        "https://api.example.com/api/v1/test?limit=2&offset=0&order=id&gt(id,'ID-2')"
+    )
+
+
+async def test_async_col_mx_iterate_checkpoint(
+    async_dummy_service: AsyncDummyService, multi_page_response_page2: httpx.Response
+) -> None:
+    checkpointer = Checkpointer(interval=1)
+    token = Checkpoint("iterate", "/api/v1/test", 2).to_token()
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test", params={"limit": 2, "offset": 2}).mock(
+            return_value=multi_page_response_page2
+        )
+
+        result = [
+            resource.id
+            async for resource in async_dummy_service.iterate(
+                2, checkpoint=checkpointer, resume_from=token
+            )
+        ]
+
+    assert result == ["ID-3", "ID-4"]
+    assert checkpointer.load() is None
+
+
+def fake_partitioned_export(jobs, processes, **kwargs):
+    kwargs["progress"].completed()
+    return BulkResult(results=[len(jobs)])
+
+
+async def test_async_col_mx_export_partitioned(
+    async_dummy_service: AsyncDummyService, tmp_path, mocker
+) -> None:
+    sink = JSONLExportSink(tmp_path / "out.jsonl")
+    progress = AsyncRecordingProgress()
+    spawn_context = multiprocessing.get_context("spawn")
+
+    run_export = mocker.patch(
+        "mpt_api_client.http.mixins.export_mixin.run_partitioned_export",
+        side_effect=fake_partitioned_export,
+    )
+
+    result = await async_dummy_service.export_partitioned(
+        sink,
+        [Partition(rql="lt(id,'ID-3')"), Partition(rql="ge(id,'ID-3')")],
+        processes=2,
+        client_factory=make_client,
+        progress=progress,
+        mp_context=spawn_context,
+    )
+
+    assert result.results == [2]
+    assert run_export.call_args.kwargs["mp_context"] is spawn_context
+    assert progress.events[-1] == ("completed",)
+
+
 async def test_async_col_mx_iterate_progress_one_page(
     async_dummy_service: AsyncDummyService,
     single_page_response: httpx.Response,
@@ -755,3 +1259,27 @@ async def test_async_col_mx_iterate_progress_error(
                 resource
                 async for resource in async_dummy_service.iterate(progress=AsyncFailingProgress())
             ]
+
+
+def test_col_mx_iterate_records_decoding_metrics(
+    dummy_service: DummyService, single_page_response: httpx.Response
+) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(return_value=single_page_response)
+
+        list(dummy_service.iterate())  # act
+
+    endpoints = dummy_service.http_client.components.metrics.snapshot().endpoints
+    assert endpoints["GET", "/api/v1/test"].records_decoded == 2
+
+
+async def test_async_col_mx_iterate_records_decoding(
+    async_dummy_service: AsyncDummyService, single_page_response: httpx.Response
+) -> None:
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(return_value=single_page_response)
+
+        [resource async for resource in async_dummy_service.iterate()]  # act
+
+    endpoints = async_dummy_service.http_client.components.metrics.snapshot().endpoints
+    assert endpoints["GET", "/api/v1/test"].records_decoded == 2
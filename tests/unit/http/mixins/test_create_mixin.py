@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import httpx
@@ -6,6 +7,22 @@ import respx
 from tests.unit.http.conftest import AsyncDummyService, DummyService
 
 
+class CreateResponder:
+    """Echo the posted resource with its name as id; fail resources named ``fail``."""
+
+    def __call__(self, request):
+        resource = json.loads(request.content)
+        if resource["name"] == "fail":
+            return httpx.Response(httpx.codes.BAD_REQUEST, json={"title": "Invalid"})
+        return httpx.Response(httpx.codes.CREATED, json={"id": resource["name"], **resource})
+
+
+async def resource_stream(*names):
+    for name in names:
+        await asyncio.sleep(0)  # noqa: WPS476
+        yield {"name": name}
+
+
 async def test_async_create_mixin(async_dummy_service: AsyncDummyService) -> None:
     """Test creating a resource asynchronously."""
     resource_data = {"name": "Test Resource", "status": "active"}
@@ -44,3 +61,28 @@ def test_sync_create_mixin(dummy_service: DummyService) -> None:
     assert request.method == "POST"
     assert request.url == "https://api.example.com/api/v1/test"
     assert json.loads(request.content.decode()) == resource_data
+
+
+def test_sync_create_many(dummy_service: DummyService) -> None:
+    """Test creating resources concurrently, reporting the failed ones."""
+    with respx.mock:
+        respx.post("https://api.example.com/api/v1/test").mock(side_effect=CreateResponder())
+
+        result = dummy_service.create_many(
+            [{"name": "first"}, {"name": "fail"}, {"name": "third"}], concurrency=2
+        )
+
+    assert [resource and resource.id for resource in result.results] == ["first", None, "third"]
+    assert [error.index for error in result.errors] == [1]
+    assert result.errors[0].entry == {"name": "fail"}
+
+
+async def test_async_create_many(async_dummy_service: AsyncDummyService) -> None:
+    """Test creating resources concurrently from an async iterable."""
+    with respx.mock:
+        respx.post("https://api.example.com/api/v1/test").mock(side_effect=CreateResponder())
+
+        result = await async_dummy_service.create_many(resource_stream("first", "second"))
+
+    assert [resource.id for resource in result.results] == ["first", "second"]
+    assert result.ok is True
@@ -28,3 +28,31 @@ def test_sync_delete_mixin(dummy_service: DummyService) -> None:
         dummy_service.delete("RES-123")  # act
 
     assert mock_route.call_count == 1
+
+
+def test_sync_delete_many(dummy_service: DummyService) -> None:
+    """Test deleting resources concurrently, reporting the failed ones."""
+    with respx.mock:
+        respx.delete("https://api.example.com/api/v1/test/RES-1").mock(
+            return_value=httpx.Response(httpx.codes.NO_CONTENT)
+        )
+        respx.delete("https://api.example.com/api/v1/test/RES-2").mock(
+            return_value=httpx.Response(httpx.codes.NOT_FOUND, json={"title": "Not Found"})
+        )
+
+        result = dummy_service.delete_many(iter(["RES-1", "RES-2"]), concurrency=1)
+
+    assert result.results == [None, None]
+    assert [error.entry for error in result.errors] == ["RES-2"]
+
+
+async def test_async_delete_many(async_dummy_service: AsyncDummyService) -> None:
+    """Test deleting resources concurrently."""
+    with respx.mock:
+        mock_route = respx.delete(url__regex=r"https://api\.example\.com/api/v1/test/RES-\d").mock(
+            return_value=httpx.Response(httpx.codes.NO_CONTENT)
+        )
+
+        result = await async_dummy_service.delete_many([f"RES-{index}" for index in range(5)])
+
+    assert (result.ok, mock_route.call_count) == (True, 5)
@@ -96,3 +96,65 @@ async def test_async_get_with_render(async_http_client) -> None:
 
     assert result.to_dict() == resource_data
     assert mock_route.call_count == 1
+
+
+@respx.mock
+def test_sync_get_served_from_model_cache(cached_dummy_service: DummyService) -> None:
+    mock_route = respx.get("https://api.example.com/api/v1/test/RES-123").mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    first_model = cached_dummy_service.get("RES-123")
+
+    result = cached_dummy_service.get("RES-123")
+
+    assert mock_route.call_count == 1
+    assert result is not first_model
+    assert result.to_dict() == {"id": "RES-123"}
+
+
+@respx.mock
+def test_sync_get_cache_keyed_by_select(cached_dummy_service: DummyService) -> None:
+    mock_route = respx.get("https://api.example.com/api/v1/test/RES-123").mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    cached_dummy_service.get("RES-123")
+
+    cached_dummy_service.get("RES-123", select=["id"])  # act
+
+    assert mock_route.call_count == 2
+
+
+@respx.mock
+def test_sync_invalidate(cached_dummy_service: DummyService) -> None:
+    mock_route = respx.get("https://api.example.com/api/v1/test/RES-123").mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    cached_dummy_service.get("RES-123")
+    cached_dummy_service.invalidate("RES-123")
+
+    cached_dummy_service.get("RES-123")  # act
+
+    assert mock_route.call_count == 2
+
+
+def test_invalidate_without_model_cache(dummy_service: DummyService) -> None:
+    result = dummy_service.invalidate()
+
+    assert result is None
+
+
+@respx.mock
+async def test_async_get_served_from_model_cache(
+    async_cached_dummy_service: AsyncDummyService,
+) -> None:
+    mock_route = respx.get("https://api.example.com/api/v1/test/RES-123").mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    await async_cached_dummy_service.get("RES-123")
+    async_cached_dummy_service.invalidate()
+    await async_cached_dummy_service.get("RES-123")
+
+    result = await async_cached_dummy_service.get("RES-123")
+
+    assert mock_route.call_count == 2
+    assert result.to_dict() == {"id": "RES-123"}
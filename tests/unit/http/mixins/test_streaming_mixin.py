@@ -5,7 +5,13 @@ import respx
 from mpt_api_client import RQLQuery
 from mpt_api_client.exceptions import MPTStreamingNotEnabledError
 from mpt_api_client.http import AsyncService, Service
-from mpt_api_client.http.mixins import AsyncStreamingMixin, StreamingMixin
+from mpt_api_client.http.checkpoint import Checkpoint, Checkpointer
+from mpt_api_client.http.mixins import (
+    AsyncCollectionMixin,
+    AsyncStreamingMixin,
+    CollectionMixin,
+    StreamingMixin,
+)
 from tests.unit.conftest import API_URL, DummyModel
 from tests.unit.http.conftest import AsyncRecordingProgress, RecordingProgress
 
@@ -30,6 +36,24 @@ class AsyncDummyStreamingService(
     _model_class = DummyModel
 
 
+class DummyStreamingCollectionService(
+    StreamingMixin[DummyModel],
+    CollectionMixin[DummyModel],
+    Service[DummyModel],
+):
+    _endpoint = "/api/v1/orders"
+    _model_class = DummyModel
+
+
+class AsyncDummyStreamingCollectionService(
+    AsyncStreamingMixin[DummyModel],
+    AsyncCollectionMixin[DummyModel],
+    AsyncService[DummyModel],
+):
+    _endpoint = "/api/v1/orders"
+    _model_class = DummyModel
+
+
 @pytest.fixture
 def streaming_service(http_client):
     return DummyStreamingService(http_client=http_client)
@@ -44,6 +68,16 @@ def streaming_response():
     return jsonl_response({"MPT-Streaming": "true"})
 
 
+def paged_response():
+    return httpx.Response(
+        httpx.codes.OK,
+        json={
+            "data": [{"id": "ID-1"}, {"id": "ID-2"}],
+            "$meta": {"pagination": {"total": 2, "offset": 0, "limit": 100}},
+        },
+    )
+
+
 def jsonl_response(headers=None):
     return httpx.Response(httpx.codes.OK, content=JSONL_BODY, headers=headers)
 
@@ -163,3 +197,115 @@ async def test_async_stream_progress_events(
         ("item_processed",),
         ("completed",),
     ]
+
+
+@respx.mock
+def test_stream_resume_skips_processed(streaming_service):
+    respx.get(STREAM_URL).mock(return_value=streaming_response())
+    token = Checkpoint("stream", "/api/v1/orders", 1).to_token()
+
+    result = [order.id for order in streaming_service.stream(resume_from=token)]
+
+    assert result == ["ID-2"]
+
+
+@respx.mock
+def test_stream_checkpoint_on_break(streaming_service):
+    respx.get(STREAM_URL).mock(return_value=streaming_response())
+    checkpointer = Checkpointer(interval=100)
+    records = streaming_service.stream(checkpoint=checkpointer)
+    next(records)
+    next(records)
+
+    records.close()  # act
+
+    assert Checkpoint.from_token(checkpointer.load()).processed == 1
+
+
+def test_stream_rejects_iterate_token(streaming_service):
+    token = Checkpoint("iterate", "/api/v1/orders", 1).to_token()
+
+    with pytest.raises(ValueError, match="cannot resume"):
+        next(streaming_service.stream(resume_from=token))
+
+
+@respx.mock
+async def test_async_stream_resume(async_streaming_service):
+    respx.get(STREAM_URL).mock(return_value=streaming_response())
+    checkpointer = Checkpointer()
+    token = Checkpoint("stream", "/api/v1/orders", 1).to_token()
+
+    result = [
+        order.id
+        async for order in async_streaming_service.stream(
+            checkpoint=checkpointer, resume_from=token
+        )
+    ]
+
+    assert result == ["ID-2"]
+    assert checkpointer.token is None
+
+
+@respx.mock
+def test_stream_decodes_with_client_codec(mocker, streaming_service, http_client):
+    respx.get(STREAM_URL).mock(return_value=streaming_response())
+    loads_spy = mocker.spy(http_client.json_codec, "loads")
+
+    result = [order.id for order in streaming_service.stream()]
+
+    assert result == ["ID-1", "ID-2"]
+    assert loads_spy.call_count == 2
+
+
+@respx.mock
+def test_stream_records_decoding_metrics(streaming_service):
+    respx.get(STREAM_URL).mock(return_value=streaming_response())
+
+    list(streaming_service.stream())  # act
+
+    endpoint = streaming_service.http_client.components.metrics.snapshot().endpoints[
+        "GET", "/api/v1/orders"
+    ]
+    assert endpoint.records_decoded == 2
+    assert endpoint.decode_seconds > 0
+
+
+@respx.mock
+def test_stream_or_iterate_streams(http_client):
+    service = DummyStreamingCollectionService(http_client=http_client)
+    route = respx.get(STREAM_URL).mock(return_value=streaming_response())
+
+    result = [order.id for order in service.stream_or_iterate()]
+
+    request = route.calls[0].request
+    assert result == ["ID-1", "ID-2"]
+    assert request.headers["MPT-Streaming"] == "true"
+    assert not http_client.components.streaming_unsupported
+
+
+@respx.mock
+def test_stream_or_iterate_falls_back(http_client):
+    service = DummyStreamingCollectionService(http_client=http_client)
+    route = respx.get(STREAM_URL)
+    route.side_effect = [jsonl_response(), paged_response(), paged_response()]
+
+    result = [order.id for order in service.stream_or_iterate(batch_size=100)]
+
+    assert result == ["ID-1", "ID-2"]
+    assert http_client.components.streaming_unsupported == {"/api/v1/orders"}
+    assert [order.id for order in service.stream_or_iterate()] == ["ID-1", "ID-2"]
+    assert "MPT-Streaming" not in route.calls[2].request.headers
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_async_stream_or_iterate_falls_back(async_http_client):
+    service = AsyncDummyStreamingCollectionService(http_client=async_http_client)
+    route = respx.get(STREAM_URL)
+    route.side_effect = [jsonl_response(), paged_response(), streaming_response()]
+
+    result = [order.id async for order in service.stream_or_iterate()]
+
+    assert result == ["ID-1", "ID-2"]
+    assert async_http_client.components.streaming_unsupported == {"/api/v1/orders"}
+    assert route.call_count == 2
@@ -36,3 +36,36 @@ def test_sync_update_resource(dummy_service: DummyService) -> None:
     request = mock_route.calls[0].request
     assert mock_route.call_count == 1
     assert json.loads(request.content.decode()) == resource_data
+
+
+def test_sync_update_many(dummy_service: DummyService) -> None:
+    """Test updating resources concurrently in input order."""
+    updates = [("RES-2", {"name": "b"}), ("RES-1", {"name": "a"})]
+    with respx.mock:
+        for resource_id in ("RES-1", "RES-2"):
+            respx.put(f"https://api.example.com/api/v1/test/{resource_id}").mock(
+                return_value=httpx.Response(httpx.codes.OK, json={"id": resource_id})
+            )
+
+        result = dummy_service.update_many(updates)
+
+    assert [resource.id for resource in result.results] == ["RES-2", "RES-1"]
+
+
+async def test_async_update_many(async_dummy_service: AsyncDummyService) -> None:
+    """Test updating resources concurrently, reporting the failed ones."""
+    with respx.mock:
+        respx.put("https://api.example.com/api/v1/test/RES-1").mock(
+            return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-1"})
+        )
+        respx.put("https://api.example.com/api/v1/test/RES-2").mock(
+            return_value=httpx.Response(httpx.codes.NOT_FOUND, json={"title": "Not Found"})
+        )
+
+        result = await async_dummy_service.update_many([
+            ("RES-1", {"name": "a"}),
+            ("RES-2", {"name": "b"}),
+        ])
+
+    assert result.results[0].id == "RES-1"
+    assert result.errors[0].entry == ("RES-2", {"name": "b"})
@@ -0,0 +1,235 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mpt_api_client.http.adaptive_concurrency import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyLimiter,
+    AdaptiveConcurrencyTransport,
+)
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.deadline_transport import AsyncDeadlineTransport
+from tests.unit.conftest import API_URL
+
+ORDERS_URL = f"{API_URL}/public/v1/commerce/orders"
+
+
+@pytest.fixture
+def limiter():
+    return AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=2, min_limit=1))
+
+
+def status_transport(status_code):
+    return httpx.MockTransport(lambda request: httpx.Response(status_code, content=b"{}"))
+
+
+async def body_chunks():
+    await asyncio.sleep(0)
+    yield b"{}"
+
+
+def streaming_handler(request):
+    return httpx.Response(200, content=body_chunks())
+
+
+def timeout_handler(request):
+    raise httpx.ReadTimeout("timed out", request=request)
+
+
+@pytest.mark.parametrize(
+    "policy_kwargs",
+    [
+        {"min_limit": 0},
+        {"min_limit": 5, "initial_limit": 2},
+        {"initial_limit": 20, "max_limit": 10},
+        {"increase": 0},
+        {"decrease_factor": 1},
+        {"decrease_factor": 0},
+    ],
+)
+def test_policy_validation(policy_kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(**policy_kwargs)
+
+
+async def test_acquire_waits_for_free_slot(limiter):
+    await limiter.acquire()
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release()  # act
+
+    await waiter
+    assert limiter.in_flight == 2
+    assert limiter.waiting == 0
+
+
+async def test_cancelled_waiter_does_not_hold_slot(limiter):
+    await limiter.acquire()
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    limiter.release()  # act
+
+    assert limiter.in_flight == 1
+
+
+def test_success_grows_limit_additively(limiter):
+    for _ in range(4):  # act
+        limiter.record_success(latency=0.1)
+
+    assert limiter.limit == 3
+
+
+def test_growth_is_capped_at_max():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=2, max_limit=2))
+
+    limiter.record_success(latency=0.1)  # act
+
+    assert limiter.limit == 2
+
+
+def test_slow_success_does_not_grow_limit():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(latency_threshold=1.0))
+
+    limiter.record_success(latency=2.0)  # act
+
+    assert limiter.limit == 10
+
+
+def test_congestion_cuts_once_per_generation():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=16))
+
+    for _ in range(3):  # act
+        limiter.record_congestion(generation=0)
+
+    assert limiter.limit == 8
+
+
+def test_congestion_is_floored_at_min():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=4, min_limit=3))
+
+    limiter.record_congestion(generation=0)  # act
+
+    assert limiter.limit == 3
+
+
+async def test_growth_wakes_waiters():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=1, increase=1))
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.record_success(latency=0.1)  # act
+
+    await waiter
+    assert limiter.in_flight == 2
+
+
+async def test_transport_holds_slot_until_closed(limiter):
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(streaming_handler), limiter)
+
+    result = await transport.handle_async_request(httpx.Request("GET", ORDERS_URL))
+
+    assert limiter.in_flight == 1
+    await result.aread()
+    await result.aclose()
+    assert limiter.in_flight == 0
+    assert limiter.limit == 2
+
+
+async def test_transport_cuts_limit_on_throttle():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=8))
+    transport = AdaptiveConcurrencyTransport(status_transport(429), limiter)
+
+    result = await transport.handle_async_request(httpx.Request("GET", ORDERS_URL))
+
+    await result.aclose()
+    assert limiter.limit == 4
+
+
+async def test_transport_ignores_server_errors():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=8))
+    transport = AdaptiveConcurrencyTransport(status_transport(500), limiter)
+
+    result = await transport.handle_async_request(httpx.Request("GET", ORDERS_URL))
+
+    await result.aclose()
+    assert limiter.limit == 8
+
+
+async def test_transport_cuts_limit_on_timeout():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=8))
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(timeout_handler), limiter)
+
+    with pytest.raises(httpx.ReadTimeout):
+        await transport.handle_async_request(httpx.Request("GET", ORDERS_URL))
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+async def test_transport_ignores_deadline_timeout():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=8))
+    transport = AsyncDeadlineTransport(
+        AdaptiveConcurrencyTransport(httpx.MockTransport(timeout_handler), limiter)
+    )
+    request = httpx.Request("GET", ORDERS_URL, extensions={"timeout": {"read": 60}})
+
+    with deadline(30), pytest.raises(httpx.ReadTimeout):
+        await transport.handle_async_request(request)
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+
+
+async def test_transport_releases_slot_on_error(mocker, limiter):
+    inner = mocker.AsyncMock(spec=httpx.AsyncBaseTransport)
+    inner.handle_async_request.side_effect = httpx.ConnectError("refused")
+    transport = AdaptiveConcurrencyTransport(inner, limiter)
+
+    with pytest.raises(httpx.ConnectError):
+        await transport.handle_async_request(httpx.Request("GET", ORDERS_URL))
+
+    assert limiter.in_flight == 0
+    assert limiter.limit == 2
+
+
+async def test_buffered_response_releases_slot(limiter):
+    transport = AdaptiveConcurrencyTransport(status_transport(200), limiter)
+
+    result = await transport.handle_async_request(httpx.Request("GET", ORDERS_URL))
+
+    assert result.is_closed
+    assert limiter.in_flight == 0
+
+
+async def test_client_respects_limit():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=2, max_limit=2))
+    in_flight_seen = []
+
+    async def slow_handler(request):  # noqa: WPS430
+        in_flight_seen.append(limiter.in_flight)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=body_chunks())
+
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(slow_handler), limiter)
+    async with httpx.AsyncClient(transport=transport) as client:
+        calls = [client.get(ORDERS_URL) for _ in range(6)]
+        await asyncio.gather(*calls)  # act
+
+    assert max(in_flight_seen) == 2
+    assert limiter.in_flight == 0
+
+
+async def test_stats(limiter):
+    await limiter.acquire()
+
+    result = limiter.stats
+
+    assert (result.limit, result.in_flight, result.waiting) == (2, 1, 0)
@@ -1,3 +1,4 @@
+import asyncio
 import io
 import json
 
@@ -6,12 +7,24 @@ import respx
 from httpx import ConnectTimeout, Request, Response, Timeout, codes
 
 from mpt_api_client.auth import BearerTokenAuthentication
-from mpt_api_client.exceptions import MPTAPIError, MPTError, MPTMaxRetryError
-from mpt_api_client.http.async_client import AsyncHTTPClient
+from mpt_api_client.exceptions import (
+    MPTAPIError,
+    MPTDeadlineExceededError,
+    MPTError,
+    MPTHttpError,
+    MPTMaxRetryError,
+)
+from mpt_api_client.http import AsyncHTTPClient, MPTCircuitOpenError, TransportSettings
+from mpt_api_client.http.adaptive_concurrency import AdaptiveConcurrency
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.hedging import HedgingPolicy
 from mpt_api_client.http.query_options import QueryOptions
-from mpt_api_client.http.transport_settings import TransportSettings
+from mpt_api_client.http.rate_limiter import AsyncRateLimiter, RateLimit
+from mpt_api_client.http.retry_transport import IDEMPOTENCY_KEY_HEADER
 from tests.unit.conftest import API_TOKEN, API_URL
 
+ITEMS_REQUEST = Request("GET", f"{API_URL}/items")
+
 
 @pytest.fixture
 def mock_request():
@@ -41,6 +54,37 @@ def test_async_http_initialization(mocker):
     )
 
 
+def test_async_rate_limiter_disabled_by_default():
+    result = AsyncHTTPClient(
+        transport=TransportSettings(base_url=API_URL),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+    assert result.components.rate_limiter is None
+
+
+def test_async_concurrency_limiter_from_settings():
+    settings = TransportSettings(
+        base_url=API_URL, adaptive_concurrency=AdaptiveConcurrency(initial_limit=3)
+    )
+
+    result = AsyncHTTPClient(
+        transport=settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+
+    assert result.components.concurrency_limiter.limit == 3
+
+
+def test_async_rate_limiter_built_from_settings():
+    settings = TransportSettings(base_url=API_URL, rate_limit=RateLimit(rate=10))
+
+    result = AsyncHTTPClient(
+        transport=settings, authentication=BearerTokenAuthentication(API_TOKEN)
+    )
+
+    assert isinstance(result.components.rate_limiter, AsyncRateLimiter)
+
+
 def test_async_env_base_url_initialization(monkeypatch, mocker):
     monkeypatch.setenv("MPT_API_BASE_URL", API_URL)
     mock_async_client = mocker.patch("mpt_api_client.http.async_client.AsyncClient")
@@ -68,6 +112,7 @@ async def test_async_http_call_success(async_http_client, mock_response):
     assert success_route.called
 
 
+@pytest.mark.usefixtures("no_retry_backoff")
 @respx.mock
 async def test_async_http_call_failure(async_http_client):
     timeout_route = respx.get(f"{API_URL}/timeout").mock(side_effect=ConnectTimeout("Mock Timeout"))
@@ -107,6 +152,7 @@ async def test_async_stream_error_status(async_http_client):
         await drain_async_stream(async_http_client.stream("GET", "/charges"))
 
 
+@pytest.mark.usefixtures("no_retry_backoff")
 @respx.mock
 async def test_async_stream_conn_error(async_http_client):
     respx.get(f"{API_URL}/charges").mock(side_effect=ConnectTimeout("Mock Timeout"))
@@ -125,7 +171,7 @@ async def test_http_call_with_json_and_files(mocker, async_http_client, mock_htt
     await async_http_client.request("POST", "/upload", files=files, json=json_data)  # act
 
     called_kwargs = parent_request.call_args[1]
-    assert called_kwargs["json"] is None
+    assert called_kwargs["content"] is None
     sent_files = called_kwargs["files"]
     assert "file" in sent_files
     assert "_attachment_data" in sent_files
@@ -144,7 +190,7 @@ async def test_http_call_force_multipart(mocker, async_http_client, mock_httpx_r
 
     called_kwargs = parent_request.call_args[1]
     sent_files = called_kwargs["files"]
-    assert called_kwargs["json"] is None
+    assert called_kwargs["content"] is None
     assert "_attachment_data" in sent_files
     payload_tuple = sent_files["_attachment_data"]
     assert payload_tuple[2] == "application/json"
@@ -173,3 +219,205 @@ async def test_request_with_render_and_query_params(mocker, async_http_client, m
 
     called_kwargs = parent_request.call_args[1]
     assert called_kwargs["params"] == "select=id%2Cname&render()"
+
+
+@respx.mock
+async def test_request_encodes_json_with_codec(mocker, async_http_client):
+    created = Response(codes.CREATED, json={"id": "ORD-1"})
+    route = respx.post(f"{API_URL}/orders").mock(return_value=created)
+    dumps_spy = mocker.spy(async_http_client.json_codec, "dumps")
+
+    result = await async_http_client.request("POST", "/orders", json={"name": "Zoë"})
+
+    request = route.calls[0].request
+    assert result.json() == {"id": "ORD-1"}
+    assert request.content == '{"name":"Zoë"}'.encode()
+    assert request.headers["Content-Type"] == "application/json"
+    dumps_spy.assert_called_once_with({"name": "Zoë"})
+
+
+@pytest.fixture
+def async_coalescing_client():
+    return AsyncHTTPClient(
+        transport=TransportSettings(base_url=API_URL, coalesce_requests=True),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+
+@respx.mock
+async def test_async_request_not_coalesced_by_default(async_http_client):
+    route = respx.get(f"{API_URL}/items").mock(
+        return_value=Response(200, json={}, request=ITEMS_REQUEST)
+    )
+
+    await async_http_client.request("GET", "/items")  # act
+
+    assert async_http_client.components.singleflight is None
+    assert route.call_count == 1
+
+
+async def slow_items_response(*args, **kwargs):
+    await asyncio.sleep(0)
+    return Response(200, json={"id": "PRD-1"}, request=ITEMS_REQUEST)
+
+
+async def test_async_coalesced_gets_share_one_request(mocker, async_coalescing_client):
+    mock_request = mocker.patch.object(
+        async_coalescing_client.httpx_client, "request", side_effect=slow_items_response
+    )
+
+    result = await asyncio.gather(
+        async_coalescing_client.request("GET", "/items"),
+        async_coalescing_client.request("GET", "/items"),
+    )
+
+    mock_request.assert_called_once_with("GET", "/items", params=None, headers=None)
+    assert result[0] is not result[1]
+    assert result[0].json() == {"id": "PRD-1"}
+    assert result[1].json() == {"id": "PRD-1"}
+
+
+async def test_async_coalescing_skips_writes(mocker, async_coalescing_client):
+    mocker.patch.object(
+        async_coalescing_client.httpx_client,
+        "request",
+        return_value=Response(200, json={}, request=ITEMS_REQUEST),
+    )
+    run = mocker.spy(async_coalescing_client.components.singleflight, "run")
+
+    await async_coalescing_client.request("POST", "/items", json={"name": "item"})  # act
+
+    run.assert_not_called()
+
+
+@respx.mock
+async def test_async_cached_get_serves_not_modified(async_caching_client):
+    route = respx.get(f"{API_URL}/items").mock(
+        side_effect=[
+            Response(200, json={"id": "PRD-1"}, headers={"Last-Modified": "Mon"}),
+            Response(codes.NOT_MODIFIED),
+        ]
+    )
+    first_response = await async_caching_client.request("GET", "/items")
+
+    result = await async_caching_client.request("GET", "/items")
+
+    assert result is not first_response
+    assert result.json() == first_response.json()
+    last_request = route.calls.last.request
+    assert last_request.headers["If-Modified-Since"] == "Mon"
+    assert async_caching_client.components.http_cache.stats.hits == 1
+
+
+@respx.mock
+async def test_async_not_modified_without_cache_raises(async_http_client):
+    respx.get(f"{API_URL}/items").mock(return_value=Response(codes.NOT_MODIFIED))
+
+    with pytest.raises(MPTHttpError):
+        await async_http_client.request("GET", "/items")
+
+
+@respx.mock
+async def test_async_hedging_applies_to_gets_only():
+    client = AsyncHTTPClient(
+        transport=TransportSettings(base_url=API_URL, hedging=HedgingPolicy()),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+    respx.get(f"{API_URL}/items").mock(return_value=Response(200, json={}))
+    respx.post(f"{API_URL}/items").mock(return_value=Response(201, json={}))
+    await client.request("POST", "/items", json={"name": "item"})
+
+    result = await client.request("GET", "/items")
+
+    assert result.status_code == 200
+    assert client.components.hedger.stats.requests == 1
+
+
+@respx.mock
+async def test_async_hooks_notified_of_requests(async_http_client, recording_hook):
+    product = Response(codes.OK, json={})
+    respx.get(f"{API_URL}/items/PRD-1234").mock(return_value=product)
+    async_http_client.components.hooks.register(recording_hook)
+
+    await async_http_client.request("GET", "/items/PRD-1234")  # act
+
+    event = recording_hook.events[0]
+    assert recording_hook.calls == [("start", 1), ("headers", 1), ("body", 1)]
+    assert event.path_template == "/items/{id}"
+    assert event.status_code == codes.OK
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+async def test_async_metrics_count_max_retry_errors(async_metered_client):
+    respx.get(f"{API_URL}/timeout").mock(side_effect=ConnectTimeout("Mock Timeout"))
+
+    with pytest.raises(MPTMaxRetryError):
+        await async_metered_client.request("GET", "/timeout")
+
+    endpoint = async_metered_client.components.metrics.snapshot().endpoints["GET", "/timeout"]
+    assert (endpoint.requests, endpoint.retries, endpoint.max_retry_errors) == (1, 5, 1)
+
+
+def test_async_metrics_include_component_stats(async_caching_client):
+    result = async_caching_client.components.metrics.snapshot().components
+
+    assert result == {
+        "http_cache": {"hits": 0, "misses": 0, "revalidations": 0, "stores": 0},
+    }
+
+
+@respx.mock
+async def test_deadline_stops_retries(async_http_client):
+    unavailable = Response(codes.SERVICE_UNAVAILABLE, headers={"Retry-After": "30"})
+    route = respx.get(f"{API_URL}/orders").mock(return_value=unavailable)
+
+    with deadline(5), pytest.raises(MPTDeadlineExceededError, match="retry backoff"):
+        await async_http_client.request("GET", "/orders")  # act
+
+    assert route.call_count == 1
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+async def test_async_retry_budget_exhaustion_surfaced(async_small_budget_client):
+    respx.get(f"{API_URL}/orders").mock(side_effect=ConnectTimeout("Mock Timeout"))
+
+    with pytest.raises(MPTMaxRetryError, match="Retry budget exhausted") as error_info:
+        await async_small_budget_client.request("GET", "/orders")
+
+    assert (error_info.value.attempts, error_info.value.budget_exhausted) == (2, True)
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+async def test_async_open_circuit_stops_retries(async_circuit_breaker_client):
+    route = respx.get(f"{API_URL}/orders").mock(return_value=Response(codes.SERVICE_UNAVAILABLE))
+
+    with pytest.raises(MPTCircuitOpenError, match="Circuit open for /orders"):
+        await async_circuit_breaker_client.request("GET", "/orders")
+
+    assert route.call_count == 1
+    assert async_circuit_breaker_client.components.circuit_breaker.stats.rejected == 1
+    assert (
+        async_circuit_breaker_client.components.metrics.snapshot().components["circuit_breaker"][
+            "opened"
+        ]
+        == 1
+    )
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+async def test_async_post_keeps_idempotency_key(async_journaled_client):
+    route = respx.post(f"{API_URL}/orders").mock(
+        side_effect=[Response(codes.BAD_GATEWAY), Response(codes.CREATED, json={})]
+    )
+
+    result = await async_journaled_client.request("POST", "/orders", json={"name": "Order"})
+
+    assert result.status_code == codes.CREATED
+    keys = {call.request.headers[IDEMPOTENCY_KEY_HEADER] for call in route.calls}
+    assert route.call_count == 2
+    assert len(keys) == 1
+    assert async_journaled_client.components.idempotency.stats.completed == 1
@@ -1,5 +1,7 @@
 from mpt_api_client.http import Service
 from mpt_api_client.http.query_state import QueryState
+from mpt_api_client.http.types import Response
+from mpt_api_client.json_codec import StdlibJSONCodec
 from tests.unit.conftest import DummyModel
 from tests.unit.http.conftest import DummyService
 
@@ -82,3 +84,20 @@ def test_build_url_with_chained_methods(dummy_service, filter_status_active):
         "/api/v1/test?limit=10&order=-created,name&select=id,name,-audit&eq(status,'active')"
     )
     assert result == expected_url
+
+
+def test_make_collection_decodes_response_once(mocker):
+    json_codec = StdlibJSONCodec()
+    response = Response(
+        headers={},
+        status_code=200,
+        content=b'{"data": [{"id": "ID-1"}], "$meta": {"pagination": {"total": 1}}}',
+        json_codec=json_codec,
+    )
+    loads_spy = mocker.spy(json_codec, "loads")
+
+    result = DummyService.make_collection(response)
+
+    assert [resource.id for resource in result] == ["ID-1"]
+    assert result.meta.pagination.total == 1
+    loads_spy.assert_called_once()
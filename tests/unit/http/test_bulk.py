@@ -0,0 +1,130 @@
+import asyncio
+import threading
+
+import pytest
+
+from mpt_api_client.http.bulk import BulkItemError, arun_bulk, run_bulk
+from mpt_api_client.http.deadline import current_deadline, deadline
+
+
+class ConcurrencyProbe:
+    """Operation recording the peak number of concurrent calls; fails on negative input."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._release = threading.Event()
+
+    def __call__(self, number):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self._release.wait(0.01)
+        with self._lock:
+            self.active -= 1
+        return double(number)
+
+    async def arun(self, number):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        return double(number)
+
+
+def double(number):
+    if number < 0:
+        raise ValueError(f"negative: {number}")
+    return number * 2
+
+
+async def async_double(number):
+    await asyncio.sleep(0)
+    return double(number)
+
+
+async def async_numbers(count):
+    for number in range(count):
+        await asyncio.sleep(0)  # noqa: WPS476
+        yield number
+
+
+def test_run_bulk_preserves_order():
+    result = run_bulk(range(20), double, concurrency=4)
+
+    assert result.results == [number * 2 for number in range(20)]
+    assert result.ok is True
+    assert result.succeeded == 20
+
+
+def test_run_bulk_bounds_concurrency():
+    probe = ConcurrencyProbe()
+
+    result = run_bulk(range(12), probe, concurrency=3)
+
+    assert result.succeeded == 12
+    assert 1 <= probe.peak <= 3
+
+
+def test_run_bulk_collects_errors():
+    result = run_bulk([1, -2, 3, -4], double, concurrency=2)
+
+    assert result.results == [2, None, 6, None]
+    assert [error.index for error in result.errors] == [1, 3]
+    assert [error.entry for error in result.errors] == [-2, -4]
+    assert isinstance(result.errors[0].error, ValueError)
+    assert (result.ok, result.succeeded) == (False, 2)
+
+
+def test_run_bulk_empty_input():
+    result = run_bulk([], double)
+
+    assert (result.results, result.errors) == ([], [])
+
+
+def test_run_bulk_propagates_deadline():
+    with deadline(30):
+        result = run_bulk([1], lambda _: current_deadline())
+
+    assert result.results[0] is not None
+
+
+def test_run_bulk_concurrency_validation():
+    with pytest.raises(ValueError, match="at least 1"):
+        run_bulk([], double, concurrency=0)
+
+
+async def test_arun_bulk_concurrency_validation():
+    with pytest.raises(ValueError, match="at least 1"):
+        await arun_bulk([], async_double, concurrency=0)
+
+
+async def test_arun_bulk_preserves_order():
+    result = await arun_bulk(range(20), async_double, concurrency=4)
+
+    assert result.results == [number * 2 for number in range(20)]
+
+
+async def test_arun_bulk_accepts_async_iterable():
+    result = await arun_bulk(async_numbers(5), async_double)
+
+    assert result.results == [0, 2, 4, 6, 8]
+
+
+async def test_arun_bulk_bounds_concurrency():
+    probe = ConcurrencyProbe()
+
+    result = await arun_bulk(range(12), probe.arun, concurrency=3)
+
+    assert result.succeeded == 12
+    assert probe.peak == 3
+
+
+async def test_arun_bulk_collects_errors():
+    result = await arun_bulk([-1, 2, -3], async_double, concurrency=2)
+
+    assert result.results == [None, 4, None]
+    assert [error.index for error in result.errors] == [0, 2]
+    last_error = result.errors[-1]
+    assert last_error == BulkItemError(2, -3, last_error.error)
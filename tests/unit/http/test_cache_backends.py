@@ -0,0 +1,91 @@
+import pytest
+
+from mpt_api_client.http.cache_backends import MemoryCacheBackend, SQLiteCacheBackend
+from mpt_api_client.http.http_cache import CachedResponse, HTTPCacheBackend
+from mpt_api_client.http.types import Response
+
+CACHED = CachedResponse(
+    status_code=200,
+    headers={"etag": '"v1"', "content-type": "application/json"},
+    content=b'{"id": "PRD-1"}',
+    etag='"v1"',
+    last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend(max_entries=2)
+    return SQLiteCacheBackend(tmp_path / "cache.db", max_entries=2)
+
+
+def test_backend_protocol(backend):
+    result = isinstance(backend, HTTPCacheBackend)
+
+    assert result is True
+
+
+def test_get_missing(backend):
+    result = backend.get("missing")
+
+    assert result is None
+
+
+def test_set_and_get(backend):
+    backend.set("key", CACHED)
+
+    result = backend.get("key")
+
+    assert result == CACHED
+
+
+def test_delete_and_clear(backend):
+    backend.set("first", CACHED)
+    backend.set("second", CACHED)
+
+    backend.delete("first")  # act
+
+    assert backend.get("first") is None
+    backend.clear()
+    assert len(backend) == 0
+
+
+def test_evicts_least_recently_used(backend):
+    backend.set("first", CACHED)
+    backend.set("second", CACHED)
+    backend.get("first")
+
+    backend.set("third", CACHED)  # act
+
+    assert backend.get("second") is None
+    assert backend.get("first") == CACHED
+    assert backend.get("third") == CACHED
+
+
+@pytest.mark.parametrize("backend_class", [MemoryCacheBackend, SQLiteCacheBackend])
+def test_invalid_max_entries(backend_class):
+    with pytest.raises(ValueError, match="at least 1"):
+        backend_class(max_entries=0)
+
+
+def test_memory_backend_keeps_decoded_response():
+    backend = MemoryCacheBackend()
+    response = Response(headers={}, status_code=200, content=b"{}")
+    backend.set("key", CachedResponse(200, {}, b"{}", etag='"v1"', response=response))
+
+    result = backend.get("key")
+
+    assert result.response is response
+
+
+def test_sqlite_backend_persists(tmp_path):
+    path = tmp_path / "cache.db"
+    backend = SQLiteCacheBackend(path)
+    backend.set("key", CACHED)
+    backend.close()
+
+    result = SQLiteCacheBackend(path).get("key")
+
+    assert result == CACHED
+    assert result.response is None
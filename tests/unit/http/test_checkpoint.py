@@ -0,0 +1,132 @@
+import pytest
+
+from mpt_api_client.http.checkpoint import (
+    Checkpoint,
+    Checkpointer,
+    CheckpointTracker,
+    checkpointed,
+    start_checkpoint,
+)
+from mpt_api_client.http.checkpoint_stores import SQLiteCheckpointStore
+from mpt_api_client.models import Model
+
+PATH = "/api/v1/test?eq(status,'active')"
+
+
+def failing(resources):
+    """Yield ``resources``, then fail like a page fetch."""
+    yield from resources
+    raise RuntimeError("fetch failure")
+
+
+@pytest.fixture
+def resources():
+    return [Model({"id": f"ID-{index}"}) for index in range(1, 6)]
+
+
+@pytest.fixture
+def store():
+    return SQLiteCheckpointStore()
+
+
+def test_token_round_trip():
+    checkpoint = Checkpoint("iterate", PATH, 3, keyset="id", cursor="gt(id,'ID-3')")
+
+    result = Checkpoint.from_token(checkpoint.to_token())
+
+    assert result == checkpoint
+    assert str(result.position()) == "gt(id,'ID-3')"
+
+
+def test_malformed_token():
+    with pytest.raises(ValueError, match="Malformed checkpoint token"):
+        Checkpoint.from_token("not-a-token")
+
+
+def test_interval_validation():
+    with pytest.raises(ValueError, match="interval must be at least 1"):
+        Checkpointer(interval=0)
+
+
+def test_start_checkpoint_without_token():
+    result = start_checkpoint("iterate", PATH, None, None)
+
+    assert result == Checkpoint("iterate", PATH)
+
+
+def test_start_checkpoint_resumes_token():
+    token = Checkpoint("iterate", PATH, 4).to_token()
+
+    result = start_checkpoint("iterate", PATH, None, token)
+
+    assert result.processed == 4
+
+
+@pytest.mark.parametrize(
+    ("mode", "path", "keyset"),
+    [("stream", PATH, None), ("iterate", "/api/v1/test", None), ("iterate", PATH, "id")],
+)
+def test_start_checkpoint_rejects_other_query(mode, path, keyset):
+    token = Checkpoint("iterate", PATH, 4).to_token()
+
+    with pytest.raises(ValueError, match="cannot resume"):
+        start_checkpoint(mode, path, keyset, token)
+
+
+def test_tracker_saves_every_interval(resources, store):
+    checkpointer = Checkpointer(store, "export", interval=2)
+    tracker = CheckpointTracker(Checkpoint("iterate", PATH), checkpointer)
+
+    for resource in resources[:3]:
+        tracker.advance(resource)  # act
+
+    assert Checkpoint.from_token(store.load("export")).processed == 2
+
+
+def test_tracker_keyset_cursor(resources):
+    tracker = CheckpointTracker(Checkpoint("iterate", PATH, keyset="-id"), None)
+    tracker.advance(resources[0])
+
+    result = tracker.checkpoint()
+
+    assert result.cursor == "lt(id,'ID-1')"
+    assert result.processed == 1
+
+
+def test_checkpointed_saves_on_break(resources, store):
+    checkpointer = Checkpointer(store, "export", interval=100)
+    tracked = checkpointed(
+        iter(resources), CheckpointTracker(Checkpoint("iterate", PATH), checkpointer)
+    )
+    consumed = [next(tracked) for _ in range(3)]
+
+    tracked.close()  # act
+
+    assert len(consumed) == 3
+    assert Checkpoint.from_token(checkpointer.load()).processed == 2
+
+
+def test_checkpointed_saves_on_error(resources):
+    checkpointer = Checkpointer()
+
+    with pytest.raises(RuntimeError):
+        list(
+            checkpointed(
+                failing(resources[:2]), CheckpointTracker(Checkpoint("iterate", PATH), checkpointer)
+            )
+        )
+
+    assert Checkpoint.from_token(checkpointer.token).processed == 2
+
+
+def test_checkpointed_completes(resources, store):
+    store.save("export", Checkpoint("iterate", PATH, 1).to_token())
+    checkpointer = Checkpointer(store, "export", interval=2)
+
+    result = list(
+        checkpointed(iter(resources), CheckpointTracker(Checkpoint("iterate", PATH), checkpointer))
+    )
+
+    assert result == resources
+    assert store.load("export") is None
+    assert checkpointer.token is None
@@ -0,0 +1,56 @@
+import pytest
+
+from mpt_api_client.http.checkpoint_stores import FileCheckpointStore, SQLiteCheckpointStore
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileCheckpointStore(tmp_path / "checkpoints.json")
+    return SQLiteCheckpointStore()
+
+
+def test_load_missing(store):
+    result = store.load("export")
+
+    assert result is None
+
+
+def test_save_replaces_token(store):
+    store.save("export", "token-1")
+    store.save("export", "token-2")
+    store.save("other", "token-3")
+
+    result = store.load("export")
+
+    assert result == "token-2"
+
+
+def test_delete(store):
+    store.save("export", "token-1")
+
+    store.delete("export")  # act
+
+    assert store.load("export") is None
+    store.delete("export")
+
+
+def test_file_store_survives_restart(tmp_path):
+    path = tmp_path / "checkpoints.json"
+    FileCheckpointStore(path).save("export", "token-1")
+
+    result = FileCheckpointStore(path).load("export")
+
+    assert result == "token-1"
+    assert not (tmp_path / "checkpoints.json.tmp").exists()
+
+
+def test_sqlite_store_survives_restart(tmp_path):
+    path = tmp_path / "checkpoints.db"
+    store = SQLiteCheckpointStore(path)
+    store.save("export", "token-1")
+    store.close()
+
+    result = SQLiteCheckpointStore(path).load("export")
+
+    assert result == "token-1"
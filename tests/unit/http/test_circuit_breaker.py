@@ -0,0 +1,157 @@
+import pytest
+
+from mpt_api_client.http.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitBreakerStats,
+    CircuitState,
+    CircuitStatus,
+    MPTCircuitOpenError,
+)
+
+ORDERS = "/public/v1/commerce/orders"
+POLICY = CircuitBreakerPolicy(failure_ratio=0.5, min_requests=4, window=4, open_duration=10)
+
+
+def attempt(breaker, *, success):
+    breaker.record(ORDERS, probe=breaker.acquire(ORDERS), success=success)
+
+
+@pytest.fixture
+def breaker(fake_clock):
+    return CircuitBreaker(POLICY, clock=fake_clock)
+
+
+@pytest.fixture
+def open_breaker(breaker):
+    for _ in range(4):
+        attempt(breaker, success=False)
+    return breaker
+
+
+def test_policy_validation_ratio():
+    with pytest.raises(ValueError, match="failure_ratio"):
+        CircuitBreakerPolicy(failure_ratio=0)
+
+
+@pytest.mark.parametrize(
+    "policy_kwargs",
+    [{"min_requests": 0}, {"window": 0}, {"half_open_probes": 0}],
+)
+def test_policy_validation_counts(policy_kwargs):
+    with pytest.raises(ValueError, match="at least 1"):
+        CircuitBreakerPolicy(**policy_kwargs)
+
+
+def test_policy_validation_open_duration():
+    with pytest.raises(ValueError, match="open_duration"):
+        CircuitBreakerPolicy(open_duration=0)
+
+
+def test_stays_closed_below_min_requests(breaker):
+    for _ in range(3):  # act
+        attempt(breaker, success=False)
+
+    assert breaker.status()[ORDERS] == CircuitStatus(
+        state=CircuitState.CLOSED, attempts=3, failures=3, retry_in=0
+    )
+
+
+def test_stays_closed_below_failure_ratio(breaker):
+    for success in (True, True, False, True, True, True):  # act
+        attempt(breaker, success=success)
+
+    assert breaker.status()[ORDERS].state == CircuitState.CLOSED
+    assert breaker.status()[ORDERS].failures == 1
+
+
+def test_opens_at_failure_ratio(open_breaker):
+    result = open_breaker.status()[ORDERS]
+
+    assert result == CircuitStatus(state=CircuitState.OPEN, attempts=4, failures=4, retry_in=10)
+
+
+def test_open_circuit_fails_fast(open_breaker, fake_clock):
+    fake_clock.sleep(4)
+
+    with pytest.raises(MPTCircuitOpenError) as error:
+        open_breaker.acquire(ORDERS)
+
+    assert error.value.endpoint == ORDERS
+    assert error.value.retry_in == 6
+    assert str(error.value) == f"Circuit open for {ORDERS}; retry in 6.0s."
+    assert open_breaker.stats == CircuitBreakerStats(open_circuits=1, opened=1, rejected=1)
+
+
+def test_circuits_are_per_endpoint(open_breaker):
+    result = open_breaker.acquire("/public/v1/catalog/products")
+
+    assert result is False
+
+
+def test_half_open_after_open_duration(open_breaker, fake_clock):
+    fake_clock.sleep(10)
+
+    result = open_breaker.acquire(ORDERS)
+
+    assert result is True
+    assert open_breaker.stats.half_open_circuits == 1
+
+
+def test_second_probe_rejected(open_breaker, fake_clock):
+    fake_clock.sleep(10)
+    open_breaker.acquire(ORDERS)
+
+    with pytest.raises(MPTCircuitOpenError):
+        open_breaker.acquire(ORDERS)
+
+
+def test_successful_probe_closes_circuit(open_breaker, fake_clock):
+    fake_clock.sleep(10)
+
+    attempt(open_breaker, success=True)  # act
+
+    assert open_breaker.status()[ORDERS] == CircuitStatus(
+        state=CircuitState.CLOSED, attempts=0, failures=0, retry_in=0
+    )
+
+
+def test_failed_probe_opens_circuit_again(open_breaker, fake_clock):
+    fake_clock.sleep(10)
+
+    attempt(open_breaker, success=False)  # act
+
+    assert open_breaker.status()[ORDERS].state == CircuitState.OPEN
+    assert open_breaker.status()[ORDERS].retry_in == 10
+    assert open_breaker.stats.opened == 2
+
+
+def test_inconclusive_probe_frees_probe_slot(open_breaker, fake_clock):
+    fake_clock.sleep(10)
+    attempt(open_breaker, success=None)
+
+    result = open_breaker.acquire(ORDERS)
+
+    assert result is True
+
+
+def test_multiple_probes_needed(fake_clock):
+    policy = CircuitBreakerPolicy(min_requests=1, window=1, open_duration=1, half_open_probes=2)
+    breaker = CircuitBreaker(policy, clock=fake_clock)
+    attempt(breaker, success=False)
+    fake_clock.sleep(1)
+
+    attempt(breaker, success=True)  # act
+
+    assert breaker.status()[ORDERS].state == CircuitState.HALF_OPEN
+    attempt(breaker, success=True)
+    assert breaker.status()[ORDERS].state == CircuitState.CLOSED
+
+
+def test_window_drops_old_outcomes(breaker):
+    for success in (False, True, True, True, True):  # act
+        attempt(breaker, success=success)
+
+    assert breaker.status()[ORDERS] == CircuitStatus(
+        state=CircuitState.CLOSED, attempts=4, failures=0, retry_in=0
+    )
@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+from mpt_api_client.http.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+    MPTCircuitOpenError,
+)
+from mpt_api_client.http.circuit_breaker_transport import (
+    AsyncCircuitBreakerTransport,
+    CircuitBreakerTransport,
+)
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.deadline_transport import DeadlineTransport
+from tests.unit.conftest import API_URL
+
+ORDERS = "/public/v1/commerce/orders"
+ORDER_URL = f"{API_URL}{ORDERS}/ORD-1234-5678"
+
+
+class StatusResponder:
+    """MockTransport handler answering every request with the same status or error."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = 0
+
+    def __call__(self, request):
+        self.calls += 1
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return httpx.Response(self.outcome)
+
+
+@pytest.fixture
+def breaker(fake_clock):
+    return CircuitBreaker(
+        CircuitBreakerPolicy(min_requests=2, window=2, open_duration=5), clock=fake_clock
+    )
+
+
+def breaker_client(breaker, responder):
+    transport = CircuitBreakerTransport(httpx.MockTransport(responder), breaker)
+    return httpx.Client(transport=transport)
+
+
+def get_order(client):
+    return client.get(ORDER_URL)
+
+
+def send_failing(client, times):
+    for _ in range(times):
+        with contextlib.suppress(httpx.ConnectError):
+            get_order(client)
+
+
+async def asend(client, times):
+    for _ in range(times):
+        await client.get(ORDER_URL)  # noqa: WPS476
+
+
+def async_breaker_client(breaker, responder):
+    transport = AsyncCircuitBreakerTransport(httpx.MockTransport(responder), breaker)
+    return httpx.AsyncClient(transport=transport)
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [httpx.codes.INTERNAL_SERVER_ERROR, httpx.codes.GATEWAY_TIMEOUT, httpx.ConnectError("down")],
+)
+def test_failures_open_circuit(breaker, outcome):
+    responder = StatusResponder(outcome)
+    client = breaker_client(breaker, responder)
+    send_failing(client, 2)
+
+    with pytest.raises(MPTCircuitOpenError):
+        get_order(client)
+
+    assert responder.calls == 2
+    assert breaker.status()[ORDERS].state == CircuitState.OPEN
+
+
+def test_client_errors_are_successes(breaker):
+    client = breaker_client(breaker, StatusResponder(httpx.codes.NOT_FOUND))
+
+    send_failing(client, 3)  # act
+
+    assert breaker.status()[ORDERS].failures == 0
+
+
+def test_other_errors_not_recorded(breaker):
+    client = breaker_client(breaker, StatusResponder(RuntimeError("boom")))
+
+    with pytest.raises(RuntimeError):
+        get_order(client)
+
+    assert breaker.status()[ORDERS].attempts == 0
+
+
+def test_deadline_timeouts_not_recorded(breaker):
+    responder = StatusResponder(httpx.ReadTimeout("timed out"))
+    transport = DeadlineTransport(httpx.MockTransport(responder))
+    client = httpx.Client(transport=CircuitBreakerTransport(transport, breaker), timeout=60)
+
+    with deadline(30), pytest.raises(httpx.ReadTimeout):
+        get_order(client)  # act
+
+    assert breaker.status()[ORDERS].attempts == 0
+
+
+def test_probe_closes_circuit(breaker, fake_clock):
+    responder = StatusResponder(httpx.codes.SERVICE_UNAVAILABLE)
+    client = breaker_client(breaker, responder)
+    send_failing(client, 2)
+    fake_clock.sleep(5)
+    responder.outcome = httpx.codes.OK
+
+    result = get_order(client)
+
+    assert result.status_code == httpx.codes.OK
+    assert breaker.status()[ORDERS].state == CircuitState.CLOSED
+
+
+async def test_async_failures_open_circuit(breaker):
+    responder = StatusResponder(httpx.codes.BAD_GATEWAY)
+    client = async_breaker_client(breaker, responder)
+    await asend(client, 2)
+
+    with pytest.raises(MPTCircuitOpenError):
+        await client.get(ORDER_URL)  # noqa: WPS476
+
+    assert responder.calls == 2
+
+
+async def test_async_cancelled_probe_frees_probe_slot(breaker, fake_clock):
+    client = async_breaker_client(breaker, StatusResponder(httpx.codes.BAD_GATEWAY))
+    await asend(client, 2)
+    fake_clock.sleep(5)
+    cancelled = async_breaker_client(breaker, StatusResponder(asyncio.CancelledError()))
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled.get(ORDER_URL)
+
+    assert breaker.status()[ORDERS].state == CircuitState.HALF_OPEN
+    assert (await client.get(ORDER_URL)).status_code == httpx.codes.BAD_GATEWAY
+    assert breaker.status()[ORDERS].state == CircuitState.OPEN
@@ -1,24 +1,41 @@
+import contextlib
 import io
 import json
 
 import pytest
 import respx
-from httpx import ConnectTimeout, Response, Timeout, codes
+from httpx import ConnectTimeout, Request, Response, Timeout, codes
 
 from mpt_api_client.auth import BearerTokenAuthentication
-from mpt_api_client.exceptions import MPTAPIError, MPTMaxRetryError
+from mpt_api_client.exceptions import (
+    MPTAPIError,
+    MPTDeadlineExceededError,
+    MPTHttpError,
+    MPTMaxRetryError,
+)
+from mpt_api_client.http.circuit_breaker import MPTCircuitOpenError
 from mpt_api_client.http.client import HTTPClient
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.http_cache import HTTPCacheStats
 from mpt_api_client.http.query_options import QueryOptions
+from mpt_api_client.http.rate_limiter import RateLimit, RateLimiter
+from mpt_api_client.http.retry_transport import IDEMPOTENCY_KEY_HEADER
 from mpt_api_client.http.transport_settings import (
     DEFAULT_STREAM_READ_TIMEOUT,
     TransportSettings,
 )
 from tests.unit.conftest import API_TOKEN, API_URL
 
+ITEMS_REQUEST = Request("GET", f"{API_URL}/items")
 STREAM_PATH = "/api/v1/stream"
 STREAM_URL = f"{API_URL}{STREAM_PATH}"
 
 
+def last_idempotency_key(route):
+    headers = route.calls.last.request.headers
+    return headers.get(IDEMPOTENCY_KEY_HEADER)
+
+
 def test_http_initialization(mocker):
     mock_client = mocker.patch("mpt_api_client.http.client.Client")
     authentication = BearerTokenAuthentication(API_TOKEN)
@@ -35,6 +52,23 @@ def test_http_initialization(mocker):
     )
 
 
+def test_rate_limiter_disabled_by_default():
+    result = HTTPClient(
+        transport=TransportSettings(base_url=API_URL),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+    assert result.components.rate_limiter is None
+
+
+def test_rate_limiter_built_from_settings():
+    settings = TransportSettings(base_url=API_URL, rate_limit=RateLimit(rate=10))
+
+    result = HTTPClient(transport=settings, authentication=BearerTokenAuthentication(API_TOKEN))
+
+    assert isinstance(result.components.rate_limiter, RateLimiter)
+
+
 def test_env_base_url_initialization(monkeypatch, mocker):
     monkeypatch.setenv("MPT_API_BASE_URL", API_URL)
     mock_client = mocker.patch("mpt_api_client.http.client.Client")
@@ -64,6 +98,7 @@ def test_http_call_success(http_client):
     assert success_route.called
 
 
+@pytest.mark.usefixtures("no_retry_backoff")
 @respx.mock
 def test_http_call_failure(http_client):
     timeout_route = respx.get(f"{API_URL}/timeout").mock(side_effect=ConnectTimeout("Mock Timeout"))
@@ -83,7 +118,7 @@ def test_http_call_with_json_and_files(mocker, http_client, mock_httpx_response)
     http_client.request("POST", "/upload", files=files, json={"foo": "bar"})  # act
 
     called_kwargs = parent_request.call_args[1]
-    assert called_kwargs["json"] is None
+    assert called_kwargs["content"] is None
     sent_files = called_kwargs["files"]
     assert "file" in sent_files
     assert "_attachment_data" in sent_files
@@ -100,7 +135,7 @@ def test_http_call_force_multipart(mocker, http_client):
 
     called_kwargs = parent_request.call_args[1]
     sent_files = called_kwargs["files"]
-    assert called_kwargs["json"] is None
+    assert called_kwargs["content"] is None
     assert "_attachment_data" in sent_files
     payload_tuple = sent_files["_attachment_data"]
     assert payload_tuple[2] == "application/json"
@@ -136,6 +171,7 @@ def test_stream_raises_on_error_status(http_client):
         drain_stream(http_client.stream("GET", "/charges"))
 
 
+@pytest.mark.usefixtures("no_retry_backoff")
 @respx.mock
 def test_stream_raises_on_connection_error(http_client):
     respx.get(f"{API_URL}/charges").mock(side_effect=ConnectTimeout("Mock Timeout"))
@@ -200,3 +236,321 @@ def test_stream_uses_the_longer_stream_timeout(mocker):
     assert passed_timeout.read == pytest.approx(DEFAULT_STREAM_READ_TIMEOUT)
     assert passed_timeout.read > client.httpx_client.timeout.read
     assert passed_timeout.connect == pytest.approx(11.0)
+
+
+@respx.mock
+def test_request_encodes_json_with_codec(mocker, http_client):
+    created = Response(codes.CREATED, json={"id": "ORD-1"})
+    route = respx.post(f"{API_URL}/orders").mock(return_value=created)
+    dumps_spy = mocker.spy(http_client.json_codec, "dumps")
+
+    result = http_client.request("POST", "/orders", json={"name": "Zoë"})
+
+    request = route.calls[0].request
+    assert result.json() == {"id": "ORD-1"}
+    assert request.content == '{"name":"Zoë"}'.encode()
+    assert request.headers["Content-Type"] == "application/json"
+    dumps_spy.assert_called_once_with({"name": "Zoë"})
+
+
+@respx.mock
+def test_request_keeps_explicit_content_type(http_client):
+    route = respx.post(f"{API_URL}/orders").mock(return_value=Response(codes.CREATED))
+    merge_patch = {"Content-Type": "application/merge-patch+json"}
+
+    http_client.request("POST", "/orders", json={"id": 1}, headers=merge_patch)  # act
+
+    request = route.calls[0].request
+    assert request.headers["Content-Type"] == "application/merge-patch+json"
+
+
+@respx.mock
+def test_response_decoded_with_client_codec(mocker, http_client):
+    order = Response(codes.OK, json={"id": "ORD-1"})
+    respx.get(f"{API_URL}/orders").mock(return_value=order)
+    loads_spy = mocker.spy(http_client.json_codec, "loads")
+
+    result = http_client.request("GET", "/orders").json()
+
+    assert result == {"id": "ORD-1"}
+    loads_spy.assert_called_once()
+
+
+@respx.mock
+def test_error_decoded_with_client_codec(mocker, http_client):
+    bad_request = Response(codes.BAD_REQUEST, json={"title": "Invalid"})
+    respx.get(f"{API_URL}/orders").mock(return_value=bad_request)
+    loads_spy = mocker.spy(http_client.json_codec, "loads")
+
+    with pytest.raises(MPTAPIError, match="Invalid"):
+        http_client.request("GET", "/orders")
+
+    loads_spy.assert_called_once()
+
+
+@pytest.fixture
+def coalescing_client():
+    return HTTPClient(
+        transport=TransportSettings(base_url=API_URL, coalesce_requests=True),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+
+@respx.mock
+def test_request_is_not_coalesced_by_default(http_client):
+    route = respx.get(f"{API_URL}/items").mock(
+        return_value=Response(200, json={}, request=ITEMS_REQUEST)
+    )
+
+    http_client.request("GET", "/items")  # act
+
+    assert http_client.components.singleflight is None
+    assert route.call_count == 1
+
+
+def test_coalesced_get_shares_response(mocker, coalescing_client):
+    mock_response = Response(200, json={"id": "PRD-1"}, request=ITEMS_REQUEST)
+    mock_request = mocker.patch.object(
+        coalescing_client.httpx_client, "request", return_value=mock_response
+    )
+    run = mocker.spy(coalescing_client.components.singleflight, "run")
+
+    result = coalescing_client.request("GET", "/items", query_params={"limit": 1})
+
+    assert result.json() == {"id": "PRD-1"}
+    run.assert_called_once()
+    mock_request.assert_called_once_with("GET", "/items", params="limit=1", headers=None)
+
+
+def test_coalesced_follower_gets_copy(mocker, coalescing_client):
+    shared_response = mocker.Mock()
+    mocker.patch.object(
+        coalescing_client.components.singleflight, "run", return_value=(shared_response, True)
+    )
+
+    result = coalescing_client.request("GET", "/items")
+
+    assert result is shared_response.copy.return_value
+
+
+def test_coalescing_skips_writes(mocker, coalescing_client):
+    mocker.patch.object(
+        coalescing_client.httpx_client,
+        "request",
+        return_value=Response(200, json={}, request=ITEMS_REQUEST),
+    )
+    run = mocker.spy(coalescing_client.components.singleflight, "run")
+
+    coalescing_client.request("POST", "/items", json={"name": "item"})  # act
+
+    run.assert_not_called()
+
+
+@respx.mock
+def test_cached_get_serves_not_modified(caching_client):
+    route = respx.get(f"{API_URL}/items").mock(
+        side_effect=[
+            Response(200, json={"id": "PRD-1"}, headers={"ETag": '"v1"'}),
+            Response(codes.NOT_MODIFIED),
+        ]
+    )
+    first_response = caching_client.request("GET", "/items")
+
+    result = caching_client.request("GET", "/items")
+
+    assert result is not first_response
+    assert result.json() == first_response.json()
+    last_request = route.calls.last.request
+    assert last_request.headers["If-None-Match"] == '"v1"'
+    assert caching_client.components.http_cache.stats.hits == 1
+    assert caching_client.components.http_cache.stats.misses == 1
+
+
+@respx.mock
+def test_not_modified_without_cache_raises(http_client):
+    respx.get(f"{API_URL}/items").mock(return_value=Response(codes.NOT_MODIFIED))
+
+    with pytest.raises(MPTHttpError):
+        http_client.request("GET", "/items")
+
+
+@respx.mock
+def test_cached_get_replaced_on_change(caching_client):
+    respx.get(f"{API_URL}/items").mock(
+        side_effect=[
+            Response(200, json={"id": "PRD-1"}, headers={"ETag": '"v1"'}),
+            Response(200, json={"id": "PRD-2"}, headers={"ETag": '"v2"'}),
+        ]
+    )
+    caching_client.request("GET", "/items")
+
+    result = caching_client.request("GET", "/items")
+
+    assert result.json() == {"id": "PRD-2"}
+    assert caching_client.components.http_cache.stats.stores == 2
+    assert caching_client.components.http_cache.stats.hits == 0
+
+
+@respx.mock
+def test_http_cache_skips_writes(caching_client):
+    route = respx.post(f"{API_URL}/items").mock(
+        return_value=Response(200, json={}, headers={"ETag": '"v1"'})
+    )
+
+    caching_client.request("POST", "/items", json={"name": "item"})  # act
+
+    assert "If-None-Match" not in route.calls.last.request.headers
+    assert caching_client.components.http_cache.stats == HTTPCacheStats()
+
+
+@respx.mock
+def test_hooks_notified_of_requests(http_client, recording_hook):
+    product = Response(codes.OK, json={})
+    respx.get(f"{API_URL}/items/PRD-1234").mock(return_value=product)
+    http_client.components.hooks.register(recording_hook)
+
+    http_client.request("GET", "/items/PRD-1234")  # act
+
+    event = recording_hook.events[0]
+    assert recording_hook.calls == [("start", 1), ("headers", 1), ("body", 1)]
+    assert event.path_template == "/items/{id}"
+    assert event.status_code == codes.OK
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+def test_metrics_count_max_retry_errors(metered_client):
+    respx.get(f"{API_URL}/timeout").mock(side_effect=ConnectTimeout("Mock Timeout"))
+
+    with pytest.raises(MPTMaxRetryError):
+        metered_client.request("GET", "/timeout")
+
+    endpoint = metered_client.components.metrics.snapshot().endpoints["GET", "/timeout"]
+    assert (endpoint.requests, endpoint.retries, endpoint.max_retry_errors) == (1, 5, 1)
+
+
+@respx.mock
+def test_request_metrics_off_by_default(http_client):
+    respx.get(f"{API_URL}/items").mock(return_value=Response(200, json={}))
+
+    http_client.request("GET", "/items")  # act
+
+    assert not http_client.components.hooks
+    assert http_client.components.metrics.snapshot().endpoints == {}
+
+
+@respx.mock
+def test_deadline_stops_retries(http_client):
+    unavailable = Response(codes.SERVICE_UNAVAILABLE, headers={"Retry-After": "30"})
+    route = respx.get(f"{API_URL}/orders").mock(return_value=unavailable)
+
+    with deadline(5), pytest.raises(MPTDeadlineExceededError, match="retry backoff"):
+        http_client.request("GET", "/orders")  # act
+
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_post_without_idempotency_key_not_retried(http_client):
+    route = respx.post(f"{API_URL}/orders").mock(side_effect=ConnectTimeout("Mock Timeout"))
+
+    with pytest.raises(MPTMaxRetryError, match="after 1 retry attempts"):
+        http_client.request("POST", "/orders", json={})
+
+    assert route.call_count == 1
+    assert IDEMPOTENCY_KEY_HEADER not in route.calls.last.request.headers
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+def test_retry_budget_exhaustion_surfaced(small_budget_client):
+    respx.get(f"{API_URL}/orders").mock(side_effect=ConnectTimeout("Mock Timeout"))
+
+    with pytest.raises(MPTMaxRetryError, match="Retry budget exhausted") as error_info:
+        small_budget_client.request("GET", "/orders")
+
+    assert (error_info.value.attempts, error_info.value.budget_exhausted) == (2, True)
+    assert (
+        small_budget_client.components.metrics.snapshot().components["retry_budget"]["exhausted"]
+        == 1
+    )
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+def test_retry_budget_exhaustion_on_server_error(small_budget_client):
+    respx.get(f"{API_URL}/orders").mock(return_value=Response(codes.SERVICE_UNAVAILABLE))
+
+    with pytest.raises(MPTMaxRetryError, match="HTTP 503") as error_info:
+        small_budget_client.request("GET", "/orders")
+
+    assert (error_info.value.attempts, error_info.value.budget_exhausted) == (2, True)
+    assert error_info.value.__cause__.status_code == codes.SERVICE_UNAVAILABLE
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+def test_open_circuit_stops_retries(circuit_breaker_client):
+    route = respx.get(f"{API_URL}/orders").mock(return_value=Response(codes.SERVICE_UNAVAILABLE))
+
+    with pytest.raises(MPTCircuitOpenError, match="Circuit open for /orders"):
+        circuit_breaker_client.request("GET", "/orders")
+
+    assert route.call_count == 1
+    assert circuit_breaker_client.components.circuit_breaker.stats.rejected == 1
+    assert (
+        circuit_breaker_client.components.metrics.snapshot().components["circuit_breaker"]["opened"]
+        == 1
+    )
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+def test_post_retried_with_stable_idempotency_key(keyed_client):
+    route = respx.post(f"{API_URL}/orders").mock(
+        side_effect=[ConnectTimeout("Mock Timeout"), Response(codes.CREATED, json={})]
+    )
+
+    result = keyed_client.request("POST", "/orders", json={"name": "Order"})
+
+    assert result.status_code == codes.CREATED
+    keys = {call.request.headers[IDEMPOTENCY_KEY_HEADER] for call in route.calls}
+    assert route.call_count == 2
+    assert len(keys) == 1
+
+
+@respx.mock
+def test_caller_idempotency_key_kept(keyed_client):
+    created = Response(codes.CREATED, json={})
+    route = respx.post(f"{API_URL}/orders").mock(return_value=created)
+
+    keyed_client.request("POST", "/orders", json={}, headers={"idempotency-key": "order-1"})  # act
+
+    assert last_idempotency_key(route) == "order-1"
+    assert keyed_client.components.idempotency.stats.generated == 0
+
+
+@respx.mock
+def test_get_has_no_idempotency_key(keyed_client):
+    route = respx.get(f"{API_URL}/orders").mock(return_value=Response(codes.OK))
+
+    keyed_client.request("GET", "/orders")  # act
+
+    assert last_idempotency_key(route) is None
+
+
+@pytest.mark.usefixtures("no_retry_backoff")
+@respx.mock
+def test_journal_replays_key_of_failed_call(journaled_client, journaled_settings):
+    timeouts = [ConnectTimeout("Mock Timeout") for _ in range(6)]
+    created = Response(codes.CREATED, json={})
+    route = respx.post(f"{API_URL}/orders").mock(side_effect=[*timeouts, created])
+    with contextlib.suppress(MPTMaxRetryError):
+        journaled_client.request("POST", "/orders", json={"name": "Order"})
+    failed_key = last_idempotency_key(route)
+
+    result = journaled_client.request("POST", "/orders", json={"name": "Order"})
+
+    assert result.status_code == codes.CREATED
+    assert last_idempotency_key(route) == failed_key
+    assert len(journaled_settings.idempotency_journal) == 0
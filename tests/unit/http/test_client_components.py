@@ -0,0 +1,159 @@
+import pytest
+
+from mpt_api_client.http.adaptive_concurrency import (
+    AdaptiveConcurrency,
+    AdaptiveConcurrencyLimiter,
+)
+from mpt_api_client.http.cache_backends import MemoryCacheBackend
+from mpt_api_client.http.circuit_breaker import CircuitBreaker, CircuitBreakerPolicy
+from mpt_api_client.http.client_components import build_async_components, build_components
+from mpt_api_client.http.hedging import Hedger, HedgingPolicy
+from mpt_api_client.http.http_cache import HTTPCache
+from mpt_api_client.http.idempotency import IdempotencyKeys
+from mpt_api_client.http.idempotency_journals import MemoryIdempotencyJournal
+from mpt_api_client.http.model_cache import ModelCache, ModelCachePolicy
+from mpt_api_client.http.rate_limiter import AsyncRateLimiter, RateLimit, RateLimiter
+from mpt_api_client.http.retry_budget import RetryBudget, RetryBudgetLimiter
+from mpt_api_client.http.singleflight import AsyncSingleFlight, SingleFlight
+from mpt_api_client.http.transport_settings import TransportSettings
+from tests.unit.conftest import API_URL
+
+DEFAULT_SETTINGS = TransportSettings(base_url=API_URL)
+ENABLED_SETTINGS = TransportSettings(
+    base_url=API_URL,
+    rate_limit=RateLimit(rate=1),
+    coalesce_requests=True,
+    http_cache=MemoryCacheBackend(),
+    model_cache=ModelCachePolicy(ttl=5),
+    retry_budget=RetryBudget(ratio=0.2),
+    circuit_breaker=CircuitBreakerPolicy(min_requests=5),
+    idempotency_keys=True,
+    idempotency_journal=MemoryIdempotencyJournal(),
+    max_connections=8,
+)
+ASYNC_SETTINGS = TransportSettings(
+    base_url=API_URL,
+    rate_limit=RateLimit(rate=1),
+    coalesce_requests=True,
+    adaptive_concurrency=AdaptiveConcurrency(initial_limit=4),
+    hedging=HedgingPolicy(),
+)
+ORDERS = "/public/v1/commerce/orders"
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "rate_limiter",
+        "singleflight",
+        "concurrency_limiter",
+        "hedger",
+        "http_cache",
+        "model_cache",
+        "circuit_breaker",
+        "retry_budget",
+        "idempotency",
+    ],
+)
+def test_optional_components_disabled_by_default(attribute):
+    result = build_async_components(DEFAULT_SETTINGS)
+
+    assert getattr(result, attribute) is None
+
+
+def test_disabled_components_not_in_metrics():
+    result = build_async_components(DEFAULT_SETTINGS)
+
+    assert not result.metrics.snapshot().components
+
+
+@pytest.mark.parametrize(
+    ("attribute", "component_type"),
+    [
+        ("rate_limiter", RateLimiter),
+        ("singleflight", SingleFlight),
+        ("http_cache", HTTPCache),
+        ("model_cache", ModelCache),
+        ("retry_budget", RetryBudgetLimiter),
+        ("circuit_breaker", CircuitBreaker),
+        ("idempotency", IdempotencyKeys),
+    ],
+)
+def test_build_components(attribute, component_type):
+    result = build_components(ENABLED_SETTINGS)
+
+    assert isinstance(getattr(result, attribute), component_type)
+
+
+def test_build_components_from_settings():
+    result = build_components(ENABLED_SETTINGS)
+
+    assert result.http_cache.backend is ENABLED_SETTINGS.http_cache
+    assert result.model_cache.policy is ENABLED_SETTINGS.model_cache
+    assert result.retry_budget.budget is ENABLED_SETTINGS.retry_budget
+    assert result.circuit_breaker.policy is ENABLED_SETTINGS.circuit_breaker
+    assert result.idempotency.journal is ENABLED_SETTINGS.idempotency_journal
+
+
+def test_build_components_metrics_sized_to_pool():
+    result = build_components(ENABLED_SETTINGS)
+
+    assert result.metrics.snapshot().pool.max_connections == 8
+
+
+@pytest.mark.parametrize(
+    ("attribute", "component_type"),
+    [
+        ("rate_limiter", AsyncRateLimiter),
+        ("singleflight", AsyncSingleFlight),
+        ("concurrency_limiter", AdaptiveConcurrencyLimiter),
+        ("hedger", Hedger),
+    ],
+)
+def test_build_async_components(attribute, component_type):
+    result = build_async_components(ASYNC_SETTINGS)
+
+    assert isinstance(getattr(result, attribute), component_type)
+
+
+def test_build_async_components_from_settings():
+    result = build_async_components(ASYNC_SETTINGS)
+
+    assert result.concurrency_limiter.limit == 4
+    assert result.hedger.policy is ASYNC_SETTINGS.hedging
+
+
+@pytest.mark.parametrize("request_metrics", [True, False])
+def test_metrics_hook(request_metrics):
+    settings = TransportSettings(base_url=API_URL, request_metrics=request_metrics)
+
+    result = build_components(settings)
+
+    assert len(result.hooks) == int(request_metrics)
+
+
+def test_enabled_components_registered_in_metrics():
+    settings = TransportSettings(
+        base_url=API_URL,
+        http_cache=MemoryCacheBackend(),
+        adaptive_concurrency=AdaptiveConcurrency(),
+        hedging=HedgingPolicy(),
+    )
+
+    result = build_async_components(settings)
+
+    components = result.metrics.snapshot().components
+    assert {"http_cache", "concurrency_limiter", "hedger"} <= components.keys()
+    assert "model_cache" not in components
+
+
+@pytest.mark.parametrize(("method", "invalidated"), [("POST", True), ("GET", False)])
+def test_invalidate_models(mocker, method, invalidated):
+    components = build_components(
+        TransportSettings(base_url=API_URL, model_cache=ModelCachePolicy(ttl=5))
+    )
+    invalidate = mocker.spy(components.model_cache, "invalidate")
+
+    components.invalidate_models(method, f"{ORDERS}/ORD-1?select=id")  # act
+
+    assert invalidate.call_count == int(invalidated)
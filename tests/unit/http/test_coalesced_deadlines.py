@@ -0,0 +1,122 @@
+import asyncio
+import contextlib
+import threading
+import time
+
+import pytest
+import respx
+from httpx import Response, codes
+
+from mpt_api_client.auth import BearerTokenAuthentication
+from mpt_api_client.exceptions import MPTDeadlineExceededError
+from mpt_api_client.http import AsyncHTTPClient, HTTPClient, TransportSettings
+from mpt_api_client.http.deadline import deadline
+from tests.unit.conftest import API_TOKEN, API_URL
+
+ITEMS_URL = f"{API_URL}/items"
+RESPONSE_DELAY = 0.1
+SETTINGS = TransportSettings(base_url=API_URL, coalesce_requests=True)
+
+
+class SlowItems:
+    """Items endpoint answering after a delay, flagging once a request is in flight."""
+
+    def __init__(self):
+        self.in_flight = threading.Event()
+
+    def __call__(self, request):
+        self.in_flight.set()
+        time.sleep(RESPONSE_DELAY)
+        return Response(codes.OK, json={"id": "PRD-1"})
+
+
+async def aslow_items(request):
+    await asyncio.sleep(RESPONSE_DELAY)
+    return Response(codes.OK, json={"id": "PRD-1"})
+
+
+def request_items_within(client, seconds):
+    with deadline(seconds), contextlib.suppress(MPTDeadlineExceededError):
+        client.request("GET", "/items")
+
+
+async def arequest_items_within(client, seconds):
+    with deadline(seconds), contextlib.suppress(MPTDeadlineExceededError):
+        await client.request("GET", "/items")
+
+
+@pytest.fixture
+def coalescing_client():
+    return HTTPClient(transport=SETTINGS, authentication=BearerTokenAuthentication(API_TOKEN))
+
+
+@pytest.fixture
+def async_coalescing_client():
+    return AsyncHTTPClient(transport=SETTINGS, authentication=BearerTokenAuthentication(API_TOKEN))
+
+
+@respx.mock
+def test_leader_deadline_spares_follower(coalescing_client):
+    slow_items = SlowItems()
+    route = respx.get(ITEMS_URL).mock(side_effect=slow_items)
+    leader = threading.Thread(target=request_items_within, args=(coalescing_client, 0.01))
+    leader.start()
+    slow_items.in_flight.wait(timeout=5)
+
+    result = coalescing_client.request("GET", "/items")
+
+    leader.join(timeout=5)
+    assert result.status_code == codes.OK
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_follower_deadline_enforced(coalescing_client):
+    slow_items = SlowItems()
+    respx.get(ITEMS_URL).mock(side_effect=slow_items)
+    leader = threading.Thread(target=coalescing_client.request, args=("GET", "/items"))
+    leader.start()
+    slow_items.in_flight.wait(timeout=5)
+
+    with deadline(0.02), pytest.raises(MPTDeadlineExceededError):
+        coalescing_client.request("GET", "/items")  # act
+
+    leader.join(timeout=5)
+
+
+@respx.mock
+async def test_async_leader_deadline_spares_follower(async_coalescing_client):
+    respx.get(ITEMS_URL).mock(side_effect=aslow_items)
+    leader = asyncio.create_task(arequest_items_within(async_coalescing_client, 0.01))
+    await asyncio.sleep(0)
+
+    result = await async_coalescing_client.request("GET", "/items")
+
+    await leader
+    assert result.status_code == codes.OK
+
+
+@respx.mock
+async def test_async_follower_deadline_enforced(async_coalescing_client):
+    respx.get(ITEMS_URL).mock(side_effect=aslow_items)
+    leader = asyncio.create_task(async_coalescing_client.request("GET", "/items"))
+    await asyncio.sleep(0)
+
+    with deadline(0.02), pytest.raises(MPTDeadlineExceededError):
+        await async_coalescing_client.request("GET", "/items")
+
+    assert (await leader).status_code == codes.OK
+
+
+@respx.mock
+async def test_async_same_deadline_shares_request(async_coalescing_client):
+    route = respx.get(ITEMS_URL).mock(side_effect=aslow_items)
+
+    with deadline(5):
+        result = await asyncio.gather(
+            async_coalescing_client.request("GET", "/items"),
+            async_coalescing_client.request("GET", "/items"),
+        )
+
+    assert [response.status_code for response in result] == [codes.OK, codes.OK]
+    assert route.call_count == 1
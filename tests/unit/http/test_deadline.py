@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from mpt_api_client.exceptions import MPTDeadlineExceededError
+from mpt_api_client.http.deadline import (
+    Deadline,
+    check_deadline,
+    current_deadline,
+    deadline,
+    deadline_wait,
+)
+
+
+def test_remaining(fake_clock):
+    budget = Deadline.after(5, fake_clock)
+    fake_clock.sleep(2)
+
+    result = budget.remaining()
+
+    assert result == pytest.approx(3)
+
+
+def test_remaining_never_negative(fake_clock):
+    budget = Deadline.after(1, fake_clock)
+    fake_clock.sleep(2)
+
+    result = budget.remaining()
+
+    assert result == 0
+
+
+def test_check_passes_with_time_left(fake_clock):
+    budget = Deadline.after(5, fake_clock)
+
+    budget.check("GET /orders", needed=4)  # act
+
+    assert budget.remaining() == pytest.approx(5)
+
+
+def test_check_raises_when_needed_exceeds_left(fake_clock):
+    budget = Deadline.after(5, fake_clock)
+
+    with pytest.raises(MPTDeadlineExceededError, match=r"retry backoff needs 6\.000s"):
+        budget.check("retry backoff", needed=6)
+
+
+def test_check_raises_once_expired(fake_clock):
+    budget = Deadline.after(1, fake_clock)
+    fake_clock.sleep(1)
+
+    with pytest.raises(MPTDeadlineExceededError, match="Deadline exceeded"):
+        budget.check("GET /orders")
+
+
+def test_context_sets_and_resets_deadline(fake_clock):
+    with deadline(5, fake_clock) as budget:
+        result = current_deadline()
+
+    assert result is budget
+    assert current_deadline() is None
+
+
+def test_context_resets_deadline_on_error(fake_clock):
+    with pytest.raises(MPTDeadlineExceededError), deadline(0, fake_clock):
+        check_deadline("GET /orders")  # act
+
+    assert current_deadline() is None
+
+
+def test_nested_deadline_cannot_extend(fake_clock):
+    with deadline(1, fake_clock) as outer, deadline(10, fake_clock) as inner:
+        result = inner
+
+    assert result is outer
+
+
+def test_nested_deadline_can_shorten(fake_clock):
+    with deadline(10, fake_clock), deadline(1, fake_clock) as inner:
+        result = current_deadline()
+
+    assert result is inner
+    assert result.remaining() == pytest.approx(1)
+
+
+def test_check_deadline_without_deadline():
+    check_deadline("GET /orders", needed=1000)  # act
+
+    assert current_deadline() is None
+
+
+async def test_deadline_propagates_to_tasks(fake_clock):
+    with deadline(5, fake_clock) as budget:
+        result = await asyncio.create_task(asyncio.to_thread(current_deadline))
+
+    assert result is budget
+
+
+def test_deadline_wait_timeout_is_time_left(fake_clock):
+    with deadline(5, clock=fake_clock), deadline_wait("GET /items") as timeout:
+        result = timeout
+
+    assert result == 5
+
+
+def test_deadline_wait_timeout_raises(fake_clock):
+    with (
+        deadline(5, clock=fake_clock),
+        pytest.raises(MPTDeadlineExceededError, match="GET /items"),
+        deadline_wait("GET /items"),
+    ):
+        raise TimeoutError  # act
+
+
+def test_deadline_wait_without_deadline():
+    with pytest.raises(TimeoutError), deadline_wait("GET /items"):
+        raise TimeoutError
@@ -0,0 +1,167 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mpt_api_client.exceptions import MPTDeadlineExceededError
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.deadline_transport import (
+    AsyncDeadlineTransport,
+    DeadlineTransport,
+    clamp_timeouts,
+)
+from tests.unit.conftest import API_URL
+
+ORDERS_URL = f"{API_URL}/public/v1/commerce/orders"
+
+
+class SlowChunkStream(httpx.SyncByteStream):
+    """Stream advancing a fake clock by one second per chunk."""
+
+    def __init__(self, fake_clock, *chunks):
+        self._fake_clock = fake_clock
+        self._chunks = chunks
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            self._fake_clock.sleep(1)
+            yield chunk
+
+
+class RecordingResponder:
+    """MockTransport handler recording the timeouts of every request."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def __call__(self, request):
+        self.timeouts.append(request.extensions.get("timeout"))
+        return httpx.Response(httpx.codes.OK, json={})
+
+
+class TimingOutResponder:
+    """MockTransport handler timing out after advancing a fake clock by ``latency``."""
+
+    def __init__(self, fake_clock, latency):
+        self._fake_clock = fake_clock
+        self._latency = latency
+
+    def __call__(self, request):
+        self._fake_clock.sleep(self._latency)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+
+def clamped_timeouts(seconds):
+    return dict.fromkeys(("connect", "read", "write", "pool"), seconds)
+
+
+def deadline_client(respond):
+    return httpx.Client(transport=DeadlineTransport(httpx.MockTransport(respond)))
+
+
+async def hang(request):
+    await asyncio.Event().wait()
+
+
+def test_clamp_timeouts():
+    request = httpx.Request("GET", ORDERS_URL)
+    request.extensions["timeout"] = {"connect": 1, "read": 20, "write": None, "pool": 5}
+
+    clamp_timeouts(request, 3)  # act
+
+    assert request.extensions["timeout"] == {**clamped_timeouts(3), "connect": 1}
+    assert request.extensions["deadline_clamped"] is True
+
+
+def test_clamp_timeouts_within_deadline():
+    request = httpx.Request("GET", ORDERS_URL)
+    request.extensions["timeout"] = clamped_timeouts(5)
+
+    clamp_timeouts(request, 30)  # act
+
+    assert request.extensions["timeout"] == clamped_timeouts(5)
+    assert "deadline_clamped" not in request.extensions
+
+
+def test_passes_through_without_deadline():
+    responder = RecordingResponder()
+
+    with deadline_client(responder) as client:
+        result = client.get(ORDERS_URL, timeout=20)
+
+    assert result.status_code == httpx.codes.OK
+    assert responder.timeouts == [clamped_timeouts(20)]
+
+
+def test_clamps_timeouts_to_deadline(fake_clock):
+    responder = RecordingResponder()
+
+    with deadline_client(responder) as client, deadline(3, fake_clock):
+        client.get(ORDERS_URL, timeout=20)  # act
+
+    assert responder.timeouts == [clamped_timeouts(3)]
+
+
+def test_refuses_attempt_after_deadline(fake_clock):
+    responder = RecordingResponder()
+    client = deadline_client(responder)
+
+    with deadline(0, fake_clock), pytest.raises(MPTDeadlineExceededError, match="GET /public"):
+        client.get(ORDERS_URL)  # act
+
+    assert responder.timeouts == []
+
+
+def test_timeout_past_deadline_raises(fake_clock):
+    client = deadline_client(TimingOutResponder(fake_clock, latency=2))
+
+    with deadline(2, fake_clock), pytest.raises(MPTDeadlineExceededError):
+        client.get(ORDERS_URL)  # act
+
+
+def test_timeout_within_deadline_reraised(fake_clock):
+    client = deadline_client(TimingOutResponder(fake_clock, latency=1))
+
+    with deadline(2, fake_clock), pytest.raises(httpx.ReadTimeout):
+        client.get(ORDERS_URL)  # act
+
+
+def test_body_read_stops_at_deadline(fake_clock):
+    stream = SlowChunkStream(fake_clock, b"a", b"b", b"c")
+    client = deadline_client(lambda request: httpx.Response(httpx.codes.OK, stream=stream))
+
+    with deadline(2.5, fake_clock), pytest.raises(MPTDeadlineExceededError):
+        client.get(ORDERS_URL)  # act
+
+
+def test_stream_chunks_before_deadline(fake_clock):
+    chunks = []
+    stream = SlowChunkStream(fake_clock, b"a", b"b", b"c")
+    client = deadline_client(lambda request: httpx.Response(httpx.codes.OK, stream=stream))
+
+    with (
+        deadline(2.5, fake_clock),
+        client.stream("GET", ORDERS_URL) as response,
+        pytest.raises(MPTDeadlineExceededError),
+    ):
+        chunks.extend(response.iter_bytes())  # act
+
+    assert chunks == [b"a", b"b"]
+
+
+async def test_async_cancels_attempt_at_deadline():
+    client = httpx.AsyncClient(transport=AsyncDeadlineTransport(httpx.MockTransport(hang)))
+
+    with deadline(0.05), pytest.raises(MPTDeadlineExceededError):
+        await client.get(ORDERS_URL)  # act
+
+
+async def test_async_passes_through_without_deadline():
+    transport = AsyncDeadlineTransport(
+        httpx.MockTransport(lambda request: httpx.Response(httpx.codes.OK))
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await client.get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.OK
@@ -0,0 +1,239 @@
+import datetime as dt
+from urllib.parse import unquote
+
+import httpx
+import pytest
+import respx
+
+from mpt_api_client.http.checkpoint_stores import SQLiteCheckpointStore
+from mpt_api_client.http.delta_sync import AsyncDeltaSync, DeltaSync, SyncChange, Watermark
+
+SERVICE_URL = "https://api.example.com/api/v1/test"
+UPDATED_AT = "2025-01-02T00:00:00Z"
+LATE_UPDATED_AT = "2025-01-01T23:59:30Z"
+WATERMARK = Watermark(updated_at=UPDATED_AT, synced={"ID-1": UPDATED_AT, "ID-2": UPDATED_AT})
+SINCE = "ge(audit.updated.at,'2025-01-01T23:59:00Z')"
+
+
+def updated_page(ids: list[str], updated_at: str = UPDATED_AT) -> httpx.Response:
+    return httpx.Response(
+        httpx.codes.OK,
+        json={
+            "data": [
+                {"id": resource_id, "audit": {"updated": {"at": updated_at}}} for resource_id in ids
+            ],
+            "$meta": {"pagination": {"total": len(ids), "offset": 0, "limit": 10}},
+        },
+    )
+
+
+def mock_page(response: httpx.Response) -> respx.Route:
+    return respx.get(SERVICE_URL).mock(return_value=response)
+
+
+def requested_query(route: respx.Route, index: int = 0) -> str:
+    request = route.calls[index].request
+    return unquote(request.url.query.decode())
+
+
+class FakeWallClock:
+    """Wall clock returning a settable time."""
+
+    def __init__(self, now: float = 1000) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_watermark_token_round_trip() -> None:
+    watermark = Watermark(updated_at=UPDATED_AT, synced={"ID-1": UPDATED_AT}, reconciled_at=12.5)
+
+    result = Watermark.from_token(watermark.to_token())
+
+    assert result == watermark
+    assert Watermark.from_token(None) == Watermark()
+
+
+def test_watermark_advanced_keeps_overlap_window() -> None:
+    synced = {"ID-3": "2025-01-02T00:00:30Z"}
+
+    result = WATERMARK.advanced(synced, dt.timedelta(seconds=10))
+
+    assert result.updated_at == "2025-01-02T00:00:30Z"
+    assert result.synced == synced
+
+
+def test_watermark_advanced_bounds_synced_ids() -> None:
+    synced = {f"ID-{index}": f"2025-01-02T00:00:0{index}Z" for index in range(10)}
+
+    result = WATERMARK.advanced(synced, dt.timedelta(seconds=60), max_synced=3)
+
+    assert result.synced == {
+        "ID-9": "2025-01-02T00:00:09Z",
+        "ID-8": "2025-01-02T00:00:08Z",
+        "ID-7": "2025-01-02T00:00:07Z",
+    }
+    assert len(result.to_token()) < 200
+
+
+def test_sync_change_deleted() -> None:
+    result = SyncChange("ID-1")
+
+    assert result.deleted is True
+
+
+def test_delta_sync_rejects_negative_overlap(dummy_service) -> None:
+    with pytest.raises(ValueError, match="overlap must not be negative"):
+        DeltaSync(dummy_service, overlap=-1)
+
+
+@respx.mock
+def test_delta_sync_first_run_scans_query(dummy_service) -> None:
+    route = mock_page(updated_page(["ID-1", "ID-2"]))
+    delta_sync = DeltaSync(dummy_service, batch_size=10)
+
+    result = [change.resource_id for change in delta_sync.sync()]
+
+    assert result == ["ID-1", "ID-2"]
+    assert "order=audit.updated.at,id" in requested_query(route)
+    assert "ge(" not in requested_query(route)
+    assert delta_sync.watermark == WATERMARK
+
+
+@respx.mock
+def test_delta_sync_rereads_overlap_window(dummy_service) -> None:
+    store = SQLiteCheckpointStore()
+    store.save("orders", WATERMARK.to_token())
+    route = mock_page(updated_page(["ID-1", "ID-2", "ID-3"]))
+    delta_sync = DeltaSync(dummy_service, store, "orders", batch_size=10)
+
+    result = [change.resource for change in delta_sync.sync()]
+
+    assert [resource.id for resource in result] == ["ID-3"]
+    assert SINCE in requested_query(route)
+    saved = Watermark.from_token(store.load("orders"))
+    assert sorted(saved.synced) == ["ID-1", "ID-2", "ID-3"]
+
+
+@respx.mock
+def test_delta_sync_picks_up_late_commit(dummy_service) -> None:
+    mock_page(updated_page(["ID-0"], LATE_UPDATED_AT))
+    delta_sync = DeltaSync(dummy_service)
+    delta_sync.watermark = WATERMARK
+
+    result = [change.resource_id for change in delta_sync.sync()]
+
+    assert result == ["ID-0"]
+    assert delta_sync.watermark.updated_at == UPDATED_AT
+    assert delta_sync.watermark.synced["ID-0"] == LATE_UPDATED_AT
+
+
+@respx.mock
+def test_delta_sync_repeats_updated_resource(dummy_service) -> None:
+    mock_page(updated_page(["ID-2"], "2025-01-02T00:00:05Z"))
+    delta_sync = DeltaSync(dummy_service)
+    delta_sync.watermark = WATERMARK
+
+    result = [change.resource_id for change in delta_sync.sync()]
+
+    assert result == ["ID-2"]
+    assert delta_sync.watermark.updated_at == "2025-01-02T00:00:05Z"
+
+
+@respx.mock
+def test_delta_sync_without_changes(dummy_service) -> None:
+    mock_page(updated_page([]))
+    store = SQLiteCheckpointStore()
+    store.save("orders", WATERMARK.to_token())
+    delta_sync = DeltaSync(dummy_service, store, "orders")
+
+    result = list(delta_sync.sync())
+
+    assert not result
+    assert delta_sync.watermark == WATERMARK
+
+
+@respx.mock
+def test_delta_sync_saves_watermark_on_break(dummy_service) -> None:
+    mock_page(updated_page(["ID-1", "ID-2", "ID-3"]))
+    store = SQLiteCheckpointStore()
+    delta_sync = DeltaSync(dummy_service, store, "orders", batch_size=10)
+    changes = delta_sync.sync()
+    next(changes)
+    next(changes)
+
+    changes.close()  # act
+
+    saved = Watermark.from_token(store.load("orders"))
+    assert saved.synced == {"ID-1": UPDATED_AT}
+
+
+@respx.mock
+def test_delta_sync_resource_without_timestamp(dummy_service) -> None:
+    page_data = updated_page(["ID-1"]).json()
+    created_only = {"id": "ID-2", "audit": {"created": {"at": UPDATED_AT}}}
+    page_data["data"].append(created_only)
+    mock_page(httpx.Response(httpx.codes.OK, json=page_data))
+    delta_sync = DeltaSync(dummy_service, batch_size=10)
+
+    with pytest.raises(ValueError, match=r"Resource ID-2 has no 'audit\.updated\.at'"):
+        list(delta_sync.sync())
+
+    assert delta_sync.watermark.synced == {"ID-1": UPDATED_AT}
+
+
+@respx.mock
+def test_delta_sync_reconciles_when_due(dummy_service) -> None:
+    route = respx.get(SERVICE_URL)
+    route.side_effect = [updated_page(["ID-2"]), updated_page(["ID-1", "ID-2"])]
+    clock = FakeWallClock()
+    delta_sync = DeltaSync(dummy_service, reconcile_interval=60, clock=clock)
+
+    result = list(delta_sync.sync(known_ids=["ID-1", "ID-2", "ID-9"]))
+
+    assert result[1:] == [SyncChange("ID-9")]
+    assert "select=id" in requested_query(route, 1)
+    assert delta_sync.watermark.reconciled_at == clock.now
+
+
+@respx.mock
+def test_delta_sync_skips_reconcile_until_due(dummy_service) -> None:
+    route = mock_page(updated_page([]))
+    delta_sync = DeltaSync(dummy_service, reconcile_interval=60, clock=FakeWallClock())
+    delta_sync.watermark = Watermark(reconciled_at=990)
+
+    result = list(delta_sync.sync(known_ids=["ID-9"]))
+
+    assert not result
+    assert route.call_count == 1
+
+
+def test_delta_sync_reset(dummy_service) -> None:
+    store = SQLiteCheckpointStore()
+    store.save("orders", WATERMARK.to_token())
+    delta_sync = DeltaSync(dummy_service, store, "orders")
+
+    delta_sync.reset()  # act
+
+    assert delta_sync.watermark == Watermark()
+    assert Watermark.from_token(store.load("orders")) == Watermark()
+
+
+def test_delta_sync_name_defaults_to_path(dummy_service) -> None:
+    result = DeltaSync(dummy_service)
+
+    assert result.name == "/api/v1/test"
+
+
+@respx.mock
+async def test_async_delta_sync(async_dummy_service) -> None:
+    route = respx.get(SERVICE_URL)
+    route.side_effect = [updated_page(["ID-1", "ID-2"]), updated_page(["ID-1"])]
+    delta_sync = AsyncDeltaSync(async_dummy_service, reconcile_interval=0)
+
+    result = [change async for change in delta_sync.sync(known_ids=["ID-2"])]
+
+    assert [change.resource_id for change in result] == ["ID-1", "ID-2", "ID-2"]
+    assert result[-1].deleted is True
+    assert delta_sync.watermark.synced == WATERMARK.synced
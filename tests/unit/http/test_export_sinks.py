@@ -0,0 +1,44 @@
+import json
+
+from mpt_api_client.http.export_sinks import JSONLExportSink
+from mpt_api_client.json_codec import JSONCodec
+from mpt_api_client.models import Model
+
+
+def make_models(*resource_ids):
+    return [Model({"id": resource_id}) for resource_id in resource_ids]
+
+
+def read_ids(path):
+    return [json.loads(line)["id"] for line in path.read_text().splitlines()]
+
+
+def test_merge_concatenates_parts(tmp_path):
+    sink = JSONLExportSink(tmp_path / "export.jsonl")
+    sink.write_partition(1, make_models("ID-3"))
+    sink.write_partition(0, make_models("ID-1", "ID-2"))
+
+    sink.merge([0, 1])  # act
+
+    assert read_ids(tmp_path / "export.jsonl") == ["ID-1", "ID-2", "ID-3"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["export.jsonl"]
+
+
+def test_write_partition_replaces_attempt(tmp_path):
+    sink = JSONLExportSink(tmp_path / "export.jsonl")
+    sink.write_partition(0, make_models("ID-1", "ID-2"))
+
+    sink.write_partition(0, make_models("ID-1"))  # act
+
+    assert read_ids(sink.part_path(0)) == ["ID-1"]
+
+
+def test_write_partition_with_codec(tmp_path, mocker):
+    json_codec = mocker.Mock(spec=JSONCodec)
+    json_codec.dumps.return_value = b'{"id": "ID-1"}'
+    sink = JSONLExportSink(tmp_path / "export.jsonl")
+
+    sink.write_partition(0, make_models("ID-1"), json_codec)  # act
+
+    json_codec.dumps.assert_called_once_with({"id": "ID-1"})
+    assert read_ids(sink.part_path(0)) == ["ID-1"]
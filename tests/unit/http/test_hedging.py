@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from mpt_api_client.http.hedging import Hedger, HedgeStats, HedgingPolicy
+
+FAST_HEDGING = HedgingPolicy(initial_delay=0.01, min_delay=0, max_hedge_ratio=1)
+
+
+class ScriptedCalls:
+    """Serves one scripted coroutine per call, in order."""
+
+    def __init__(self, *scripts):
+        self._scripts = list(scripts)
+        self.cancelled = []
+
+    def __call__(self):
+        return self._run(len(self.cancelled), self._scripts.pop(0))
+
+    async def _run(self, index, script):
+        self.cancelled.append(False)
+        try:
+            return await script()
+        except asyncio.CancelledError:
+            self.cancelled[index] = True
+            raise
+
+
+class TimedCall:
+    """Call that advances a fake clock by ``latency``."""
+
+    def __init__(self, fake_clock, latency):
+        self._fake_clock = fake_clock
+        self._latency = latency
+
+    async def __call__(self):
+        await asyncio.sleep(0)
+        self._fake_clock.sleep(self._latency)
+        return self._latency
+
+
+async def never():
+    await asyncio.Event().wait()
+
+
+async def fast():
+    await asyncio.sleep(0)
+    return "fast"
+
+
+async def slow():
+    await asyncio.sleep(0.05)
+    return "slow"
+
+
+async def slow_failure():
+    await asyncio.sleep(0.05)
+    raise ValueError("primary failed")
+
+
+async def failure():
+    await asyncio.sleep(0)
+    raise ValueError("hedge failed")
+
+
+@pytest.mark.parametrize(
+    "policy_kwargs",
+    [
+        {"percentile": 100},
+        {"max_hedge_ratio": 0},
+        {"min_delay": -1},
+        {"window": 0},
+    ],
+)
+def test_policy_validation(policy_kwargs):
+    with pytest.raises(ValueError, match="Hedging"):
+        HedgingPolicy(**policy_kwargs)
+
+
+async def test_delay_uses_percentile(fake_clock):
+    hedger = Hedger(HedgingPolicy(percentile=50, min_samples=3, min_delay=0), clock=fake_clock)
+    await hedger.run(TimedCall(fake_clock, 3))
+    await hedger.run(TimedCall(fake_clock, 1))
+    await hedger.run(TimedCall(fake_clock, 2))
+
+    result = hedger.delay
+
+    assert result == 2
+
+
+def test_initial_delay_until_min_samples():
+    hedger = Hedger(HedgingPolicy(initial_delay=2, min_delay=0.1))
+
+    result = hedger.delay
+
+    assert result == 2
+
+
+async def test_fast_request_not_hedged():
+    hedger = Hedger(FAST_HEDGING)
+
+    result = await hedger.run(fast)
+
+    assert result == "fast"
+    assert hedger.stats == HedgeStats(requests=1)
+
+
+async def test_hedge_wins_and_cancels_primary():
+    hedger = Hedger(FAST_HEDGING)
+    calls = ScriptedCalls(never, fast)
+
+    result = await hedger.run(calls)
+
+    await asyncio.sleep(0)
+    assert result == "fast"
+    assert calls.cancelled == [True, False]
+    assert hedger.stats == HedgeStats(requests=1, hedges=1, wins=1)
+
+
+async def test_primary_wins_and_cancels_hedge():
+    hedger = Hedger(FAST_HEDGING)
+    calls = ScriptedCalls(slow, never)
+
+    result = await hedger.run(calls)
+
+    await asyncio.sleep(0)
+    assert result == "slow"
+    assert calls.cancelled == [False, True]
+    assert hedger.stats == HedgeStats(requests=1, hedges=1)
+
+
+async def test_hedge_budget_bounds_rate():
+    hedger = Hedger(HedgingPolicy(initial_delay=0.01, min_delay=0, max_hedge_ratio=0.5))
+
+    result = await hedger.run(ScriptedCalls(slow, fast))
+
+    assert result == "slow"
+    assert hedger.stats == HedgeStats(requests=1, throttled=1)
+
+
+async def test_hedge_used_when_primary_fails():
+    hedger = Hedger(FAST_HEDGING)
+
+    result = await hedger.run(ScriptedCalls(slow_failure, slow))
+
+    assert result == "slow"
+    assert hedger.stats.wins == 1
+
+
+async def test_primary_error_raised_when_all_fail():
+    hedger = Hedger(FAST_HEDGING)
+
+    with pytest.raises(ValueError, match="primary failed"):
+        await hedger.run(ScriptedCalls(slow_failure, failure))
+
+
+async def test_caller_cancellation_cancels_requests():
+    hedger = Hedger(FAST_HEDGING)
+    calls = ScriptedCalls(never, never)
+    hedged = asyncio.ensure_future(hedger.run(calls))
+    await asyncio.sleep(0.05)
+
+    hedged.cancel()  # act
+
+    with pytest.raises(asyncio.CancelledError):
+        await hedged
+    assert calls.cancelled == [True, True]
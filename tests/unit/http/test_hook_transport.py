@@ -0,0 +1,236 @@
+import httpx
+import pytest
+
+from mpt_api_client.http.hook_transport import AsyncHookTransport, HookTransport, PhaseTimer
+from mpt_api_client.http.hooks import RequestHooks
+from tests.unit.conftest import API_URL
+
+ORDERS_URL = f"{API_URL}/public/v1/commerce/orders/ORD-1234-5678"
+COMPLETED_CALLS = (("start", 1), ("headers", 1), ("body", 1))
+FAILED_CALLS = (("start", 1), ("error", 1))
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+class ChunkStream(httpx.SyncByteStream):
+    def __init__(self, *chunks, error=None):
+        self._chunks = chunks
+        self._error = error
+
+    def __iter__(self):
+        yield from self._chunks
+        if self._error:
+            raise self._error
+
+
+class AsyncChunkStream(httpx.AsyncByteStream):
+    def __init__(self, *chunks, error=None):
+        self._chunks = chunks
+        self._error = error
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+        if self._error:
+            raise self._error
+
+
+def traced_response(request):
+    trace = request.extensions["trace"]
+    for event_name in ("send_request_headers.started", "send_request_body.complete"):
+        trace(f"http11.{event_name}", {})
+    return httpx.Response(httpx.codes.OK, json={"id": "ORD-1234-5678"})
+
+
+async def async_traced_response(request):
+    await request.extensions["trace"]("http11.receive_response_headers.complete", {})
+    return httpx.Response(httpx.codes.OK, headers={"x-trace-id": "abc"}, content=b"{}")
+
+
+def hooked_client(respond, recording_hook):
+    transport = HookTransport(httpx.MockTransport(respond), RequestHooks([recording_hook]))
+    return httpx.Client(transport=transport)
+
+
+def async_hooked_client(respond, recording_hook):
+    transport = AsyncHookTransport(httpx.MockTransport(respond), RequestHooks([recording_hook]))
+    return httpx.AsyncClient(transport=transport)
+
+
+def test_phase_timer(fake_clock):
+    timer = PhaseTimer(fake_clock)
+    timings = {}
+    for event_name in ("connect_tcp.started", "connect_tcp.complete"):
+        fake_clock.sleep(1)
+        timer.record(f"connection.{event_name}", {})
+    timer.record("http11.send_request_headers.started", {})
+    timer.record("http11.send_request_body.complete", {})
+    fake_clock.sleep(2)
+    timer.record("http11.receive_response_headers.complete", {})
+
+    timer.headers_received(timings)  # act
+
+    fake_clock.sleep(3)
+    timer.body_complete(timings)
+    assert timings == {
+        "pool_wait": 1,
+        "connect": 1,
+        "send": 0,
+        "server": 2,
+        "headers": 4,
+        "download": 3,
+        "total": 7,
+    }
+
+
+def test_no_hooks_passes_through():
+    inner = httpx.MockTransport(lambda request: httpx.Response(httpx.codes.OK))
+    request = httpx.Request("GET", ORDERS_URL)
+
+    result = HookTransport(inner, RequestHooks()).handle_request(request)
+
+    assert result.status_code == httpx.codes.OK
+    assert "trace" not in request.extensions
+
+
+def test_buffered_response_events(recording_hook):
+    client = hooked_client(traced_response, recording_hook)
+
+    result = client.get(ORDERS_URL)
+
+    event = recording_hook.events[0]
+    assert result.status_code == httpx.codes.OK
+    assert recording_hook.calls == list(COMPLETED_CALLS)
+    assert event.path_template == "/public/v1/commerce/orders/{id}"
+    assert event.bytes_received == len(result.content)
+    assert {"pool_wait", "send", "headers", "total"} <= event.timings.keys()
+
+
+def test_streamed_response_completes_on_close(recording_hook):
+    headers = {"traceparent": TRACEPARENT}
+    client = hooked_client(
+        lambda request: httpx.Response(
+            httpx.codes.OK, headers=headers, stream=ChunkStream(b"ab", b"c")
+        ),
+        recording_hook,
+    )
+    response = client.send(client.build_request("GET", ORDERS_URL), stream=True)
+    calls_before_read = list(recording_hook.calls)
+
+    response.read()  # act
+
+    event = recording_hook.events[0]
+    assert calls_before_read == [("start", 1), ("headers", 1)]
+    assert recording_hook.calls == list(COMPLETED_CALLS)
+    assert event.bytes_received == 3
+    assert event.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def test_streamed_response_error(recording_hook):
+    stream = ChunkStream(b"ab", error=httpx.ReadError("reset"))
+    client = hooked_client(
+        lambda request: httpx.Response(httpx.codes.OK, stream=stream), recording_hook
+    )
+
+    with pytest.raises(httpx.ReadError):
+        client.get(ORDERS_URL)
+
+    assert recording_hook.calls == [("start", 1), ("headers", 1), ("error", 1)]
+
+
+def test_retry_attempts_reported(recording_hook):
+    inner = httpx.MockTransport(lambda request: httpx.Response(httpx.codes.SERVICE_UNAVAILABLE))
+    transport = HookTransport(inner, RequestHooks([recording_hook]))
+    request = httpx.Request("GET", ORDERS_URL)
+    transport.handle_request(request)
+
+    transport.handle_request(request)  # act
+
+    assert recording_hook.calls == [
+        ("start", 1),
+        ("headers", 1),
+        ("body", 1),
+        ("retry", 2),
+        ("headers", 2),
+        ("body", 2),
+    ]
+
+
+def test_transport_error_reported(recording_hook):
+    client = hooked_client(lambda request: _raise(httpx.ConnectError("refused")), recording_hook)
+
+    with pytest.raises(httpx.ConnectError):
+        client.get(ORDERS_URL)
+
+    event = recording_hook.events[0]
+    assert recording_hook.calls == list(FAILED_CALLS)
+    assert isinstance(event.error, httpx.ConnectError)
+
+
+def test_bytes_sent(recording_hook):
+    client = hooked_client(lambda request: httpx.Response(httpx.codes.CREATED), recording_hook)
+
+    client.post(ORDERS_URL, content=b"12345")  # act
+
+    event = recording_hook.events[0]
+    assert event.method == "POST"
+    assert event.bytes_sent == 5
+
+
+async def test_async_buffered_response_events(recording_hook):
+    client = async_hooked_client(async_traced_response, recording_hook)
+
+    result = await client.get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.OK
+    assert recording_hook.calls == list(COMPLETED_CALLS)
+    assert recording_hook.events[0].trace_id == "abc"
+
+
+async def test_async_streamed_response_completes(recording_hook):
+    client = async_hooked_client(
+        lambda request: httpx.Response(httpx.codes.OK, stream=AsyncChunkStream(b"ab", b"c")),
+        recording_hook,
+    )
+
+    async with client.stream("GET", ORDERS_URL) as response:
+        await response.aread()
+
+    assert recording_hook.calls == list(COMPLETED_CALLS)
+    assert recording_hook.events[0].bytes_received == 3
+
+
+async def test_async_streamed_response_error(recording_hook):
+    stream = AsyncChunkStream(b"ab", error=httpx.ReadError("reset"))
+    client = async_hooked_client(
+        lambda request: httpx.Response(httpx.codes.OK, stream=stream), recording_hook
+    )
+
+    with pytest.raises(httpx.ReadError):
+        await client.get(ORDERS_URL)
+
+    assert recording_hook.calls == [("start", 1), ("headers", 1), ("error", 1)]
+
+
+async def test_async_transport_error_reported(recording_hook):
+    client = async_hooked_client(
+        lambda request: _raise(httpx.ConnectError("refused")), recording_hook
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        await client.get(ORDERS_URL)
+
+    assert recording_hook.calls == list(FAILED_CALLS)
+
+
+async def test_async_no_hooks_passes_through():
+    inner = httpx.MockTransport(lambda request: httpx.Response(httpx.codes.OK))
+    request = httpx.Request("GET", ORDERS_URL)
+
+    result = await AsyncHookTransport(inner, RequestHooks()).handle_async_request(request)
+
+    assert result.status_code == httpx.codes.OK
+    assert "trace" not in request.extensions
+
+
+def _raise(error):
+    raise error
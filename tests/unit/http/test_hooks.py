@@ -0,0 +1,123 @@
+import pytest
+from httpx import Headers
+
+from mpt_api_client.http.hooks import (
+    RequestEvent,
+    RequestHook,
+    RequestHooks,
+    endpoint_template,
+    get_trace_id,
+    template_path,
+)
+
+
+def make_event(attempt=1):
+    return RequestEvent(method="GET", path="/orders", path_template="/orders", attempt=attempt)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/public/v1/commerce/orders", "/public/v1/commerce/orders"),
+        ("/public/v1/commerce/orders/ORD-1234-5678/lines", "/public/v1/commerce/orders/{id}/lines"),
+        (
+            "/public/v1/catalog/products/PRD-1234/items/ITM-1234-1234-0001",
+            "/public/v1/catalog/products/{id}/items/{id}",
+        ),
+        ("/files/42", "/files/{id}"),
+        ("/files/0f8fad5b-d9cb-469f-a165-70867728950e", "/files/{id}"),
+        ("/public/v1/commerce/orders/-/render", "/public/v1/commerce/orders/-/render"),
+    ],
+)
+def test_template_path(path, expected):
+    result = template_path(path)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/public/v1/commerce/orders", "/public/v1/commerce/orders"),
+        ("/public/v1/commerce/orders/ORD-1234-5678", "/public/v1/commerce/orders"),
+        (
+            "/public/v1/commerce/orders/ORD-1234-5678/lines/LIN-1",
+            "/public/v1/commerce/orders/{id}/lines",
+        ),
+        ("/public/v1/commerce/orders/ORD-1234-5678/fail", "/public/v1/commerce/orders/{id}/fail"),
+    ],
+)
+def test_endpoint_template(path, expected):
+    result = endpoint_template(path)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"x-trace-id": "abc123"}, "abc123"),
+        (
+            {"traceparent": "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"},
+            "4bf92f3577b34da6a3ce929d0e0e4736",
+        ),
+        ({"x-trace-id": "abc123", "traceparent": "00-def-01-01"}, "abc123"),
+        ({}, None),
+    ],
+)
+def test_get_trace_id(headers, expected):
+    result = get_trace_id(Headers(headers))
+
+    assert result == expected
+
+
+def test_hooks_dispatch_to_every_hook(recording_hook):
+    hooks = RequestHooks([recording_hook])
+    hooks.register(recording_hook)
+
+    hooks.request_start(make_event())  # act
+
+    assert recording_hook.calls == [("start", 1), ("start", 1)]
+
+
+def test_hooks_dispatch_retry(recording_hook):
+    hooks = RequestHooks([recording_hook])
+    event = make_event(attempt=2)
+
+    hooks.request_start(event)  # act
+
+    assert recording_hook.calls == [("retry", 2)]
+
+
+def test_hooks_dispatch_phases(recording_hook):
+    hooks = RequestHooks([recording_hook])
+    event = make_event()
+
+    hooks.response_headers(event)  # act
+
+    hooks.body_complete(event)
+    hooks.error(event)
+    assert recording_hook.calls == [("headers", 1), ("body", 1), ("error", 1)]
+
+
+def test_unregister(recording_hook):
+    hooks = RequestHooks([recording_hook])
+
+    hooks.unregister(recording_hook)  # act
+
+    assert not hooks
+
+
+def test_base_hook_ignores_events():
+    hook = RequestHook()
+    event = make_event()
+
+    result = [
+        hook.on_request_start(event),
+        hook.on_retry(event),
+        hook.on_response_headers(event),
+        hook.on_body_complete(event),
+        hook.on_error(event),
+    ]
+
+    assert result == [None, None, None, None, None]
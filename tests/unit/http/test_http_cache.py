@@ -0,0 +1,105 @@
+import pytest
+
+from mpt_api_client.http.cache_backends import MemoryCacheBackend
+from mpt_api_client.http.http_cache import CachedResponse, HTTPCache, HTTPCacheStats
+from mpt_api_client.http.types import Response
+from mpt_api_client.json_codec import StdlibJSONCodec
+
+REQUEST_KEY = ("GET", "/public/v1/catalog/products", "limit=10", "")
+BACKEND_KEY = "https://api.example.com\x1fGET\x1f/public/v1/catalog/products\x1flimit=10\x1f"
+
+
+@pytest.fixture
+def backend():
+    return MemoryCacheBackend()
+
+
+@pytest.fixture
+def http_cache(backend):
+    return HTTPCache(backend, StdlibJSONCodec(), namespace="https://api.example.com")
+
+
+def make_response(status_code=200, headers=None):
+    return Response(headers=headers or {}, status_code=status_code, content=b'{"id": "PRD-1"}')
+
+
+def test_lookup_miss(http_cache):
+    result = http_cache.lookup(REQUEST_KEY)
+
+    assert result == (BACKEND_KEY, None)
+    assert http_cache.stats == HTTPCacheStats(misses=1)
+
+
+def test_resolve_stores_response_with_validators(http_cache, backend):
+    response = make_response(headers={"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024"})
+
+    result = http_cache.resolve(BACKEND_KEY, None, response)
+
+    assert result is response
+    assert backend.get(BACKEND_KEY) == CachedResponse(
+        status_code=200,
+        headers=response.headers,
+        content=response.content,
+        etag='"v1"',
+        last_modified="Mon, 01 Jan 2024",
+    )
+    assert http_cache.stats.stores == 1
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"etag": '"v1"', "cache-control": "private, no-store"}],
+)
+def test_resolve_skips_uncacheable_response(http_cache, backend, headers):
+    backend.set(BACKEND_KEY, CachedResponse(200, {}, b"{}", etag='"v0"'))
+
+    http_cache.resolve(BACKEND_KEY, None, make_response(headers=headers))  # act
+
+    assert backend.get(BACKEND_KEY) is None
+    assert http_cache.stats.stores == 0
+
+
+def test_revalidation_sends_validators(http_cache, backend):
+    backend.set(BACKEND_KEY, CachedResponse(200, {}, b"{}", etag='"v1"', last_modified="Mon"))
+    _, cached = http_cache.lookup(REQUEST_KEY)
+
+    result = http_cache.conditional_headers(cached, {"Accept": "application/json"})
+
+    assert result == {
+        "Accept": "application/json",
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon",
+    }
+    assert http_cache.stats == HTTPCacheStats(revalidations=1)
+
+
+def test_not_modified_serves_response_copy(http_cache):
+    stored_response = make_response(headers={"etag": '"v1"'})
+    stored_response.json()
+    http_cache.resolve(BACKEND_KEY, None, stored_response)
+    key, cached = http_cache.lookup(REQUEST_KEY)
+
+    result = http_cache.resolve(key, cached, make_response(status_code=304))
+
+    assert result is not stored_response
+    assert result.json() == stored_response.json()
+    assert result.json() is stored_response.json()
+    assert http_cache.stats == HTTPCacheStats(hits=1, revalidations=1, stores=1)
+
+
+def test_not_modified_rebuilds_persisted_response(http_cache, backend):
+    cached = CachedResponse(200, {"etag": '"v1"'}, b'{"id": "PRD-1"}', etag='"v1"')
+
+    result = http_cache.resolve(BACKEND_KEY, cached, make_response(status_code=304))
+
+    assert result.status_code == 200
+    assert result.json() == {"id": "PRD-1"}
+    assert result.headers == {"etag": '"v1"'}
+
+
+def test_clear(http_cache, backend):
+    backend.set(BACKEND_KEY, CachedResponse(200, {}, b"{}", etag='"v1"'))
+
+    http_cache.clear()  # act
+
+    assert backend.get(BACKEND_KEY) is None
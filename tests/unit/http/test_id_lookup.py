@@ -0,0 +1,55 @@
+import pytest
+
+from mpt_api_client.http.id_lookup import chunk_ids, encoded_length, select_fields
+
+
+def test_chunk_ids_by_chunk_size():
+    resource_ids = ["A", "B", "C", "A"]
+
+    result = chunk_ids(resource_ids, overhead=10, max_url_length=100, chunk_size=2)
+
+    assert result == [["A", "B"], ["C"]]
+
+
+def test_chunk_ids_by_url_length():
+    resource_ids = ["ID-1", "ID-2", "ID-3"]
+
+    result = chunk_ids(resource_ids, overhead=10, max_url_length=25, chunk_size=100)
+
+    assert result == [["ID-1", "ID-2"], ["ID-3"]]
+
+
+def test_chunk_ids_counts_encoded_length():
+    result = chunk_ids(["a b", "c"], overhead=10, max_url_length=18, chunk_size=100)
+
+    assert result == [["a b"], ["c"]]
+
+
+def test_chunk_ids_id_too_long():
+    with pytest.raises(ValueError, match="does not fit"):
+        chunk_ids(["X" * 50], overhead=10, max_url_length=40, chunk_size=100)
+
+
+def test_chunk_ids_invalid_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size"):
+        chunk_ids(["A"], overhead=10, max_url_length=100, chunk_size=0)
+
+
+def test_encoded_length():
+    result = encoded_length("/api/v1/test?in(id,('a b'))")
+
+    assert result == len("/api/v1/test?in(id,('a%20b'))")
+
+
+@pytest.mark.parametrize(
+    ("select", "expected"),
+    [
+        (None, []),
+        ("name,status", ["name", "status"]),
+        (["name"], ["name"]),
+    ],
+)
+def test_select_fields(select, expected):
+    result = select_fields(select)
+
+    assert result == expected
@@ -0,0 +1,178 @@
+import pytest
+
+from mpt_api_client.exceptions import MPTHttpError, MPTMaxRetryError
+from mpt_api_client.http.idempotency import IdempotencyKeys, IdempotencyStats, idempotent_call
+from mpt_api_client.http.idempotency_journals import MemoryIdempotencyJournal
+from mpt_api_client.http.retry_transport import IDEMPOTENCY_KEY_HEADER
+
+ORDERS = "/public/v1/commerce/orders"
+BODY = b'{"name": "Order"}'
+
+
+class CountingKeyFactory:
+    """Key factory returning ``key-1``, ``key-2`` and so on."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f"key-{self.calls}"
+
+
+@pytest.fixture
+def journal():
+    return MemoryIdempotencyJournal()
+
+
+@pytest.fixture
+def keys(journal):
+    return IdempotencyKeys(journal, scope="https://api", key_factory=CountingKeyFactory())
+
+
+def entered(context):
+    with context as headers:
+        return headers
+
+
+def fail(keys, body=BODY):
+    with pytest.raises(MPTMaxRetryError):
+        send(keys, body, MPTMaxRetryError("Timeout", 3))
+
+
+def fail_around_identical_call(keys):
+    with pytest.raises(MPTMaxRetryError):
+        complete_inside_failed_call(keys)
+
+
+def complete_inside_failed_call(keys):
+    with keys.attach("POST", ORDERS, BODY, None):
+        entered(keys.attach("POST", ORDERS, BODY, None))
+        raise MPTMaxRetryError("Timeout", 3)
+
+
+def send_concurrently(keys):
+    with keys.attach("POST", ORDERS, BODY, None) as first_headers:
+        return first_headers, entered(keys.attach("POST", ORDERS, BODY, None))
+
+
+def send(keys, body=BODY, error=None):
+    with keys.attach("POST", ORDERS, body, {"Accept": "application/json"}) as headers:
+        if error is not None:
+            raise error
+        return headers
+
+
+def test_attaches_generated_key():
+    keys = IdempotencyKeys(key_factory=CountingKeyFactory())
+
+    result = send(keys)
+
+    assert result == {"Accept": "application/json", IDEMPOTENCY_KEY_HEADER: "key-1"}
+    assert keys.stats == IdempotencyStats(generated=1)
+
+
+def test_default_keys_are_unique():
+    keys = IdempotencyKeys()
+
+    result = {send(keys)[IDEMPOTENCY_KEY_HEADER] for _ in range(3)}
+
+    assert len(result) == 3
+
+
+@pytest.mark.parametrize("method", ["GET", "PUT", "DELETE"])
+def test_other_methods_untouched(keys, method):
+    result = entered(keys.attach(method, ORDERS, b"", None))
+
+    assert result is None
+    assert keys.stats == IdempotencyStats()
+
+
+def test_caller_key_kept(keys):
+    headers = {"idempotency-key": "mine"}
+
+    result = entered(keys.attach("post", ORDERS, BODY, headers))
+
+    assert result is headers
+
+
+def test_completed_call_gets_new_key(keys, journal):
+    send(keys)
+
+    result = send(keys)
+
+    assert result[IDEMPOTENCY_KEY_HEADER] == "key-2"
+    assert len(journal) == 0
+    assert keys.stats == IdempotencyStats(generated=2, completed=2)
+
+
+def test_failed_call_replays_key(keys, journal):
+    fail(keys)
+
+    result = send(keys)
+
+    assert result[IDEMPOTENCY_KEY_HEADER] == "key-1"
+    assert keys.stats == IdempotencyStats(generated=1, replayed=1, completed=1)
+
+
+def test_concurrent_identical_calls_get_own_keys(keys, journal):
+    result = send_concurrently(keys)
+
+    assert [headers[IDEMPOTENCY_KEY_HEADER] for headers in result] == ["key-1", "key-2"]
+    assert len(journal) == 0
+    assert keys.stats == IdempotencyStats(generated=2, completed=2)
+
+
+def test_concurrent_failed_call_replayed(keys):
+    fail_around_identical_call(keys)
+
+    result = send(keys)
+
+    assert result[IDEMPOTENCY_KEY_HEADER] == "key-1"
+
+
+def test_server_error_keeps_key(keys, journal):
+    with pytest.raises(MPTHttpError):
+        send(keys, error=MPTHttpError(502, "Bad Gateway", ""))
+
+    assert len(journal) == 1
+
+
+def test_client_error_completes_call(keys, journal):
+    with pytest.raises(MPTHttpError):
+        send(keys, error=MPTHttpError(400, "Bad Request", ""))
+
+    assert len(journal) == 0
+
+
+def test_different_body_gets_own_key(keys):
+    fail(keys)
+
+    result = send(keys, body=b"{}")
+
+    assert result[IDEMPOTENCY_KEY_HEADER] == "key-2"
+
+
+def test_multipart_call_not_journaled(keys, journal):
+    fail(keys, body=None)  # act
+
+    assert len(journal) == 0
+    assert keys.stats == IdempotencyStats(generated=1)
+
+
+def test_scope_separates_fingerprints(journal):
+    first = IdempotencyKeys(journal, scope="https://test", key_factory=CountingKeyFactory())
+    second = IdempotencyKeys(journal, scope="https://prod", key_factory=lambda: "other")
+    fail(first)
+
+    result = send(second)
+
+    assert result[IDEMPOTENCY_KEY_HEADER] == "other"
+
+
+def test_idempotent_call_without_keys():
+    headers = {"Accept": "application/json"}
+
+    result = entered(idempotent_call(None, "POST", ORDERS, BODY, headers))
+
+    assert result is headers
@@ -0,0 +1,107 @@
+import pytest
+
+from mpt_api_client.http.idempotency_journals import (
+    MemoryIdempotencyJournal,
+    SQLiteIdempotencyJournal,
+)
+
+
+def fail_call(journal, key="key-1"):
+    journal.reserve("fingerprint", key)
+    journal.fail("fingerprint", key)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def journal(request, fake_clock):
+    if request.param == "memory":
+        return MemoryIdempotencyJournal(ttl=60, clock=fake_clock)
+    return SQLiteIdempotencyJournal(ttl=60, clock=fake_clock)
+
+
+@pytest.mark.parametrize("journal_class", [MemoryIdempotencyJournal, SQLiteIdempotencyJournal])
+def test_ttl_validation(journal_class):
+    with pytest.raises(ValueError, match="ttl must be positive"):
+        journal_class(ttl=0)
+
+
+def test_reserve_stores_key(journal):
+    result = journal.reserve("fingerprint", "key-1")
+
+    assert result == "key-1"
+    assert len(journal) == 1
+
+
+def test_in_flight_key_not_shared(journal):
+    journal.reserve("fingerprint", "key-1")
+
+    result = journal.reserve("fingerprint", "key-2")
+
+    assert result == "key-2"
+    assert len(journal) == 1
+
+
+def test_failed_key_replayed_once(journal):
+    fail_call(journal)
+
+    result = [journal.reserve("fingerprint", "key-2"), journal.reserve("fingerprint", "key-3")]
+
+    assert result == ["key-1", "key-3"]
+
+
+def test_complete_frees_key(journal):
+    journal.reserve("fingerprint", "key-1")
+    journal.complete("fingerprint", "key-1")
+
+    result = journal.reserve("fingerprint", "key-2")
+
+    assert result == "key-2"
+
+
+def test_complete_of_other_call_keeps_entry(journal):
+    journal.reserve("fingerprint", "key-1")
+    journal.complete("fingerprint", "key-2")
+    journal.fail("fingerprint", "key-1")
+
+    result = journal.reserve("fingerprint", "key-3")
+
+    assert result == "key-1"
+
+
+def test_fail_records_unjournaled_key(journal):
+    journal.fail("fingerprint", "key-1")
+
+    result = journal.reserve("fingerprint", "key-2")
+
+    assert result == "key-1"
+
+
+def test_expired_key_replaced(journal, fake_clock):
+    fail_call(journal)
+    fake_clock.sleep(60)
+
+    result = journal.reserve("fingerprint", "key-2")
+
+    assert result == "key-2"
+
+
+def test_sqlite_journal_survives_restart(tmp_path, fake_clock):
+    path = tmp_path / "idempotency.db"
+    journal = SQLiteIdempotencyJournal(path, clock=fake_clock)
+    journal.reserve("fingerprint", "key-1")
+    journal.close()
+
+    result = SQLiteIdempotencyJournal(path, clock=fake_clock).reserve("fingerprint", "key-2")
+
+    assert result == "key-1"
+
+
+def test_sqlite_journal_purges_expired_entries(tmp_path, fake_clock):
+    path = tmp_path / "idempotency.db"
+    journal = SQLiteIdempotencyJournal(path, ttl=60, clock=fake_clock)
+    journal.reserve("fingerprint", "key-1")
+    journal.close()
+    fake_clock.sleep(60)
+
+    result = SQLiteIdempotencyJournal(path, ttl=60, clock=fake_clock)
+
+    assert len(result) == 0
@@ -0,0 +1,91 @@
+import httpx
+import pytest
+
+from mpt_api_client.http.keyset import (
+    keyset_order,
+    keyset_position,
+    keyset_service,
+    rebase_pagination,
+)
+from mpt_api_client.models import Meta, Model, ModelCollection, Pagination
+from tests.unit.http.conftest import DummyService
+
+
+@pytest.fixture
+def last_resource():
+    return Model({"id": "ID-2", "audit": {"created": {"at": "2025-01-01T00:00:00Z"}}})
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("id", ["id"]),
+        ("-id", ["-id"]),
+        ("audit.created.at", ["audit.created.at", "id"]),
+        ("-audit.created.at", ["-audit.created.at", "-id"]),
+    ],
+)
+def test_keyset_order(key, expected):
+    result = keyset_order(key)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("id", "gt(id,'ID-2')"),
+        ("-id", "lt(id,'ID-2')"),
+        (
+            "audit.created.at",
+            (
+                "or(gt(audit.created.at,'2025-01-01T00:00:00Z'),"
+                "and(eq(audit.created.at,'2025-01-01T00:00:00Z'),gt(id,'ID-2')))"
+            ),
+        ),
+        (
+            "-audit.created.at",
+            (
+                "or(lt(audit.created.at,'2025-01-01T00:00:00Z'),"
+                "and(eq(audit.created.at,'2025-01-01T00:00:00Z'),lt(id,'ID-2')))"
+            ),
+        ),
+    ],
+)
+def test_keyset_position(last_resource, key, expected):
+    result = keyset_position(key, last_resource)
+
+    assert str(result) == expected
+
+
+def test_keyset_position_missing_field(last_resource):
+    with pytest.raises(ValueError, match="'name' is missing"):
+        keyset_position("name", last_resource)
+
+
+def test_keyset_position_empty_key(last_resource):
+    with pytest.raises(ValueError, match="must not be empty"):
+        keyset_position("-", last_resource)
+
+
+def test_keyset_service(dummy_service: DummyService, last_resource):
+    result = keyset_service(dummy_service, "id", after=last_resource)
+
+    assert result.build_path() == "/api/v1/test?order=id&gt(id,'ID-2')"
+
+
+def test_keyset_service_rejects_ordering(dummy_service: DummyService):
+    ordered_service = dummy_service.order_by("name")
+
+    with pytest.raises(ValueError, match="remove order_by"):
+        keyset_service(ordered_service, "id")
+
+
+def test_rebase_pagination():
+    response = httpx.Response(httpx.codes.OK)
+    meta = Meta(response=response, pagination=Pagination(2, 0, 3))
+    items_collection = ModelCollection([Model({"id": "ID-3"})], meta)
+
+    rebase_pagination(items_collection, 4)  # act
+
+    assert meta.pagination == Pagination(limit=2, offset=4, total=7)
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+
+import pytest
+
+from mpt_api_client.http.hooks import RequestEvent
+from mpt_api_client.http.metrics import ClientMetrics
+from mpt_api_client.http.metrics_snapshot import EndpointMetrics, Histogram
+
+ORDER_KEY = ("GET", "/public/v1/commerce/orders/{id}")
+
+
+@dataclass
+class CounterStats:
+    hits: int = 3
+
+
+class StatsComponent:
+    stats = CounterStats()
+
+
+def order_event(attempt=1, **event_kwargs):
+    return RequestEvent(
+        method="GET",
+        path="/public/v1/commerce/orders/ORD-1234-5678",
+        path_template=ORDER_KEY[1],
+        attempt=attempt,
+        **event_kwargs,
+    )
+
+
+def complete(metrics, event, status_code=200):
+    event.status_code = status_code
+    metrics.on_response_headers(event)
+    metrics.on_body_complete(event)
+
+
+@pytest.fixture
+def metrics():
+    return ClientMetrics(max_connections=4)
+
+
+def test_histogram_buckets():
+    histogram = Histogram(bounds=(0.1, 1))
+
+    for latency in (0.05, 0.1, 0.5, 2):  # act
+        histogram.observe(latency)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.total == pytest.approx(2.65)
+
+
+def test_completed_request(metrics):
+    event = order_event(bytes_sent=10, bytes_received=100, timings={"total": 0.2, "pool_wait": 0})
+    metrics.on_request_start(event)
+
+    complete(metrics, event)  # act
+
+    snapshot = metrics.snapshot()
+    endpoint = snapshot.endpoints[ORDER_KEY]
+    assert endpoint.requests == 1
+    assert endpoint.status_classes == {"2xx": 1}
+    assert (endpoint.bytes_sent, endpoint.bytes_received) == (10, 100)
+    assert (endpoint.latency.count, snapshot.pool.wait.count) == (1, 1)
+    assert snapshot.pool.in_use == 0
+
+
+def test_retries_and_errors(metrics):
+    first_attempt = order_event()
+    retry = order_event(attempt=2)
+    metrics.on_request_start(first_attempt)
+    complete(metrics, first_attempt, status_code=503)
+    metrics.on_retry(retry)
+
+    metrics.on_error(retry)  # act
+
+    endpoint = metrics.snapshot().endpoints[ORDER_KEY]
+    assert (endpoint.requests, endpoint.retries, endpoint.transport_errors) == (1, 1, 1)
+    assert endpoint.status_classes == {"5xx": 1}
+
+
+def test_pool_saturation(metrics):
+    events = [order_event(), order_event(), order_event()]
+    for event in events:
+        metrics.on_request_start(event)
+
+    complete(metrics, events[0])  # act
+
+    pool = metrics.snapshot().pool
+    assert (pool.in_use, pool.peak_in_use) == (2, 3)
+    assert pool.saturation == pytest.approx(0.5)
+
+
+def test_unbounded_pool_has_no_saturation():
+    result = ClientMetrics().snapshot().pool.saturation
+
+    assert result is None
+
+
+def test_max_retry_error_counted_per_template(metrics):
+    metrics.record_max_retry_error("get", "/public/v1/commerce/orders/ORD-1234-5678?select=id")
+
+    result = metrics.snapshot().endpoints[ORDER_KEY]
+
+    assert result.max_retry_errors == 1
+
+
+def test_decoding_meter(metrics):
+    meter = metrics.decoding("/public/v1/commerce/orders/ORD-1234-5678?limit=100")
+
+    meter.record(50, 0.5)  # act
+
+    endpoint = metrics.snapshot().endpoints[ORDER_KEY]
+    assert endpoint.records_decoded == 50
+    assert endpoint.records_per_second == pytest.approx(100)
+
+
+def test_records_per_second_before_decoding():
+    result = EndpointMetrics().records_per_second
+
+    assert result is None
+
+
+def test_snapshot_includes_registered_stats(metrics):
+    metrics.register_stats("http_cache", StatsComponent())
+    metrics.register_stats("model_cache", None)
+
+    result = metrics.snapshot()
+
+    assert result.components == {"http_cache": {"hits": 3}}
+
+
+def test_snapshot_is_a_copy(metrics):
+    event = order_event()
+    metrics.on_request_start(event)
+    snapshot = metrics.snapshot()
+
+    metrics.on_retry(order_event(attempt=2))  # act
+
+    assert snapshot.endpoints[ORDER_KEY].retries == 0
+    assert snapshot.pool.in_use == 1
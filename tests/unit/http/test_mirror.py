@@ -0,0 +1,132 @@
+import httpx
+import pytest
+import respx
+
+from mpt_api_client.http.mirror import AsyncMirroredCollection, MirroredCollection
+from mpt_api_client.http.mirror_tables import SQLiteMirror
+from tests.unit.http.conftest import DummyModel
+
+SERVICE_URL = "https://api.example.com/api/v1/test"
+
+
+def product(resource_id: str, status: str) -> dict:
+    day = resource_id[-1]
+    return {
+        "id": resource_id,
+        "status": status,
+        "vendor": {"id": "ACC-1"},
+        "audit": {"updated": {"at": f"2025-01-0{day}T00:00:00Z"}},
+    }
+
+
+def products_page(*ids: str, draft: tuple[str, ...] = ()) -> httpx.Response:
+    resources = [
+        product(resource_id, "Draft" if resource_id in draft else "Active") for resource_id in ids
+    ]
+    return httpx.Response(
+        httpx.codes.OK,
+        json={
+            "data": resources,
+            "$meta": {"pagination": {"total": len(resources), "offset": 0, "limit": 100}},
+        },
+    )
+
+
+@pytest.fixture
+def mirror():
+    sqlite_mirror = SQLiteMirror()
+    yield sqlite_mirror
+    sqlite_mirror.close()
+
+
+@pytest.fixture
+def mirrored(mirror, dummy_service):
+    return MirroredCollection(mirror, dummy_service, ("status", "vendor.id"), reconcile_interval=0)
+
+
+@respx.mock
+def test_mirrored_refresh_fills_table(mirrored: MirroredCollection) -> None:
+    respx.get(SERVICE_URL).mock(return_value=products_page("P-1", "P-2"))
+
+    result = mirrored.refresh()
+
+    assert result == 2
+    assert isinstance(mirrored.get("P-1"), DummyModel)
+    assert mirrored.get("P-1").vendor.id == "ACC-1"
+    assert mirrored.get("P-9") is None
+
+
+@respx.mock
+def test_mirrored_refresh_applies_delta(mirrored: MirroredCollection) -> None:
+    route = respx.get(SERVICE_URL)
+    route.side_effect = [
+        products_page("P-1", "P-2"),
+        products_page("P-1", "P-2"),
+        products_page("P-3", draft=("P-3",)),
+        products_page("P-1", "P-3"),
+    ]
+    mirrored.refresh()
+
+    result = mirrored.refresh()
+
+    assert result == 2
+    assert "ge(audit.updated.at,'2025-01-01T23:59:00Z')" in str(route.calls[2].request.url)
+    assert [resource.id for resource in mirrored.iterate()] == ["P-1", "P-3"]
+
+
+@respx.mock
+def test_mirrored_find(mirrored: MirroredCollection) -> None:
+    page = products_page("P-1", "P-2", "P-3", draft=("P-2",))
+    respx.get(SERVICE_URL).mock(return_value=page)
+    mirrored.refresh()
+
+    result = mirrored.find(status="Active", vendor_id="ACC-1")
+
+    assert [resource.id for resource in result] == ["P-1", "P-3"]
+
+
+@respx.mock
+def test_mirrored_rebuild(mirrored: MirroredCollection) -> None:
+    route = respx.get(SERVICE_URL)
+    route.side_effect = [
+        products_page("P-1"),
+        products_page("P-1"),
+        products_page("P-2"),
+        products_page("P-2"),
+    ]
+    mirrored.refresh()
+
+    result = mirrored.rebuild()
+
+    assert result == 1
+    assert "gt(" not in str(route.calls[2].request.url)
+    assert [resource.id for resource in mirrored.iterate()] == ["P-2"]
+
+
+@respx.mock
+def test_mirrored_watermark_survives_restart(tmp_path, dummy_service) -> None:
+    route = respx.get(SERVICE_URL).mock(return_value=products_page("P-1"))
+    first = SQLiteMirror(tmp_path / "mirror.db")
+    MirroredCollection(first, dummy_service).refresh()
+    first.close()
+    second = SQLiteMirror(tmp_path / "mirror.db")
+
+    result = MirroredCollection(second, dummy_service)
+
+    assert result.get("P-1").id == "P-1"
+    assert result.refresh() == 0
+    assert "ge(audit.updated.at,'2024-12-31T23:59:00Z')" in str(route.calls[1].request.url)
+    second.close()
+
+
+@respx.mock
+async def test_async_mirrored_refresh(mirror, async_dummy_service) -> None:
+    route = respx.get(SERVICE_URL)
+    route.side_effect = [products_page("P-1", "P-2"), products_page()]
+    mirrored = AsyncMirroredCollection(mirror, async_dummy_service, ("status",))
+
+    result = await mirrored.refresh()
+
+    assert result == 2
+    assert await mirrored.refresh() == 0
+    assert [resource.id for resource in mirrored.find(status="Active")] == ["P-1", "P-2"]
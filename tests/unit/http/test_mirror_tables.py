@@ -0,0 +1,145 @@
+import pytest
+
+from mpt_api_client.http.checkpoint_stores import SQLiteCheckpointStore
+from mpt_api_client.http.mirror_tables import (
+    MirrorTable,
+    SQLiteMirror,
+    column_name,
+    column_value,
+    quote_identifier,
+)
+
+
+def make_product(resource_id: str = "PRD-1", status: str = "Active") -> dict:
+    return {"id": resource_id, "status": status, "vendor": {"id": "ACC-1"}}
+
+
+@pytest.fixture
+def mirror():
+    sqlite_mirror = SQLiteMirror()
+    yield sqlite_mirror
+    sqlite_mirror.close()
+
+
+@pytest.fixture
+def products(mirror):
+    return mirror.table("/catalog/products", ("status", "vendor.id"))
+
+
+def test_column_name() -> None:
+    result = column_name("audit.updated.at")
+
+    assert result == "audit_updated_at"
+
+
+def test_quote_identifier() -> None:
+    result = quote_identifier('/a"b')
+
+    assert result == '"/a""b"'
+
+
+@pytest.mark.parametrize("name", ["", "a\x00b"])
+def test_quote_identifier_invalid(name) -> None:
+    with pytest.raises(ValueError, match="Invalid mirror identifier"):
+        quote_identifier(name)
+
+
+@pytest.mark.parametrize(
+    ("field", "expected"),
+    [
+        ("status", "Active"),
+        ("vendor.id", "ACC-1"),
+        ("vendor", '{"id": "ACC-1"}'),
+        ("vendor.name", None),
+        ("status.code", None),
+    ],
+)
+def test_column_value(field, expected) -> None:
+    result = column_value(make_product(), field)
+
+    assert result == expected
+
+
+def test_sqlite_mirror_is_checkpoint_store(mirror) -> None:
+    mirror.save("/catalog/products", "token")
+
+    result = mirror.load("/catalog/products")
+
+    assert isinstance(mirror, SQLiteCheckpointStore)
+    assert result == "token"
+
+
+def test_mirror_table_get(products: MirrorTable) -> None:
+    products.apply("PRD-1", make_product())
+
+    result = products.get("PRD-1")
+
+    assert result == make_product()
+    assert products.get("PRD-2") is None
+
+
+def test_mirror_table_find(products: MirrorTable) -> None:
+    products.apply("PRD-2", make_product("PRD-2", "Draft"))
+    products.apply("PRD-1", make_product())
+
+    result = products.find({"vendor_id": "ACC-1", "status": "Active"})
+
+    assert result == [make_product()]
+    assert [product["id"] for product in products.find({})] == ["PRD-1", "PRD-2"]
+
+
+def test_mirror_table_find_rejects_unindexed(products: MirrorTable) -> None:
+    with pytest.raises(ValueError, match=r"no index on \['name'\]"):
+        products.find({"name": "Product"})
+
+
+def test_mirror_table_find_missing_value(products: MirrorTable) -> None:
+    products.apply("PRD-3", {"id": "PRD-3", "status": "Draft"})
+
+    result = products.find({"vendor_id": None})
+
+    assert [product["id"] for product in result] == ["PRD-3"]
+
+
+def test_mirror_table_apply_upserts_and_deletes(products: MirrorTable) -> None:
+    products.apply("PRD-1", make_product())
+    products.apply("PRD-1", make_product(status="Deleted"))
+    products.apply("PRD-2", make_product("PRD-2"))
+
+    products.apply("PRD-2", None)  # act
+
+    assert products.find({}) == [make_product(status="Deleted")]
+    assert products.ids() == ["PRD-1"]
+
+
+def test_mirror_table_clear(products: MirrorTable) -> None:
+    products.apply("PRD-1", make_product())
+
+    products.clear()  # act
+
+    assert not products.ids()
+
+
+def test_mirror_table_keeps_rows_on_reopen(tmp_path) -> None:
+    path = tmp_path / "mirror.db"
+    first = SQLiteMirror(path)
+    first.table("/catalog/products", ("status",)).apply("PRD-1", make_product())
+    first.save("/catalog/products", "token")
+    first.close()
+    second = SQLiteMirror(path)
+
+    result = second.table("/catalog/products", ("status",))
+
+    assert result.ids() == ["PRD-1"]
+    assert second.load("/catalog/products") == "token"
+    second.close()
+
+
+def test_mirror_table_rebuilds_on_new_indexes(mirror) -> None:
+    mirror.table("/catalog/products", ("status",)).apply("PRD-1", make_product())
+    mirror.save("/catalog/products", "token")
+
+    result = mirror.table("/catalog/products", ("status", "vendor.id"))
+
+    assert not result.ids()
+    assert mirror.load("/catalog/products") is None
@@ -0,0 +1,128 @@
+import pytest
+
+from mpt_api_client.http.model_cache import ModelCache, ModelCachePolicy, ModelCacheStats
+from mpt_api_client.http.types import Response
+
+ORDER_URL = "/public/v1/commerce/orders/ORD-1"
+ORDER_KEY = (ORDER_URL, "", False)
+RESPONSE = Response(headers={}, status_code=200, content=b'{"id": "ORD-1"}')
+
+
+@pytest.fixture
+def model_cache(fake_clock):
+    return ModelCache(ModelCachePolicy(ttl=10, max_entries=2), clock=fake_clock)
+
+
+@pytest.mark.parametrize(
+    ("policy_kwargs", "message"),
+    [({"ttl": 0}, "ttl must be positive"), ({"max_entries": 0}, "at least 1")],
+)
+def test_policy_validation(policy_kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        ModelCachePolicy(**policy_kwargs)
+
+
+@pytest.mark.parametrize(
+    ("endpoints", "expected"),
+    [
+        (None, True),
+        (("/public/v1/commerce/orders",), True),
+        (("/public/v1/catalog/listings",), False),
+    ],
+)
+def test_caches(endpoints, expected):
+    model_cache = ModelCache(ModelCachePolicy(endpoints=endpoints))
+
+    result = model_cache.caches(ORDER_URL)
+
+    assert result is expected
+
+
+def test_get_live_entry(model_cache):
+    model_cache.set(ORDER_KEY, RESPONSE)
+
+    result = model_cache.get(ORDER_KEY)
+
+    assert result is RESPONSE
+    assert model_cache.stats == ModelCacheStats(hits=1)
+
+
+def test_get_expired_entry(model_cache, fake_clock):
+    model_cache.set(ORDER_KEY, RESPONSE)
+    fake_clock.sleep(10)
+
+    result = model_cache.get(ORDER_KEY)
+
+    assert result is None
+    assert len(model_cache) == 0
+    assert model_cache.stats == ModelCacheStats(misses=1)
+
+
+def test_evicts_least_recently_used(model_cache):
+    select_key = (ORDER_URL, "id", False)
+    render_key = (ORDER_URL, "", True)
+    model_cache.set(ORDER_KEY, RESPONSE)
+    model_cache.set(select_key, RESPONSE)
+    model_cache.get(ORDER_KEY)
+
+    model_cache.set(render_key, RESPONSE)  # act
+
+    assert model_cache.get(select_key) is None
+    assert model_cache.get(ORDER_KEY) is RESPONSE
+    assert model_cache.stats.evictions == 1
+
+
+@pytest.mark.parametrize(
+    ("modified_url", "expected_len"),
+    [
+        (ORDER_URL, 0),
+        (f"{ORDER_URL}/complete", 0),
+        (f"{ORDER_URL}/lines/LN-1", 0),
+        (f"{ORDER_URL}/lines/LN-1/taxes/TX-1", 1),
+        ("/public/v1/commerce/orders", 0),
+        ("/public/v1/commerce/orders/ORD-2", 1),
+    ],
+)
+def test_invalidate_related_resources(model_cache, modified_url, expected_len):
+    model_cache.set(ORDER_KEY, RESPONSE)
+
+    model_cache.invalidate(modified_url)  # act
+
+    assert len(model_cache) == expected_len
+    assert model_cache.stats.invalidations == 1 - expected_len
+
+
+def test_invalidate_keeps_sibling_resources(model_cache):
+    sibling_key = (f"{ORDER_URL}/lines/LN-2", "", False)
+    model_cache.set(ORDER_KEY, RESPONSE)
+    model_cache.set(sibling_key, RESPONSE)
+
+    model_cache.invalidate(f"{ORDER_URL}/lines/LN-1")  # act
+
+    assert model_cache.get(sibling_key) is RESPONSE
+    assert model_cache.get(ORDER_KEY) is None
+
+
+def test_set_skips_stale_generation(model_cache):
+    generation = model_cache.generation
+    model_cache.invalidate(ORDER_URL)
+
+    model_cache.set(ORDER_KEY, RESPONSE, generation)  # act
+
+    assert model_cache.get(ORDER_KEY) is None
+
+
+def test_set_current_generation(model_cache):
+    model_cache.invalidate(ORDER_URL)
+
+    model_cache.set(ORDER_KEY, RESPONSE, model_cache.generation)  # act
+
+    assert model_cache.get(ORDER_KEY) is RESPONSE
+
+
+def test_clear(model_cache):
+    model_cache.set(ORDER_KEY, RESPONSE)
+
+    model_cache.clear()  # act
+
+    assert len(model_cache) == 0
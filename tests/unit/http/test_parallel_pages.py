@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from mpt_api_client.http.deadline import current_deadline, deadline
+from mpt_api_client.http.parallel_pages import afetch_pages_parallel, fetch_pages_parallel
+from mpt_api_client.models import Meta, Model, ModelCollection
+from mpt_api_client.models.meta import Pagination
+
+
+def make_page(offset, total=10, limit=2):
+    meta = Meta(
+        response=httpx.Response(httpx.codes.OK), pagination=Pagination(limit, offset, total)
+    )
+    return ModelCollection([Model({"id": f"ID-{offset}"})], meta)
+
+
+def page_ids(pages):
+    return [page[0].id for page in pages]
+
+
+class PageServer:
+    """Page fetcher recording the offsets and the peak number of concurrent fetches."""
+
+    def __init__(self, total=10, slow_offsets=()):
+        self.total = total
+        self.slow_offsets = slow_offsets
+        self.offsets = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, offset):
+        with self._lock:
+            self.offsets.append(offset)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        if offset in self.slow_offsets:
+            time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return make_page(offset, self.total)
+
+    async def afetch(self, offset):
+        self.offsets.append(offset)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        delay = 0.02 if offset in self.slow_offsets else 0
+        await asyncio.sleep(delay)
+        self.active -= 1
+        return make_page(offset, self.total)
+
+
+class DeadlineRecorder:
+    """Page fetcher recording the deadline active in each fetch."""
+
+    def __init__(self):
+        self.deadlines = []
+
+    def __call__(self, offset):
+        self.deadlines.append(current_deadline())
+        return make_page(offset, total=4)
+
+
+def failing_fetch(offset):
+    if offset == 4:
+        raise ValueError("page failure")
+    return make_page(offset)
+
+
+async def afailing_fetch(offset):
+    await asyncio.sleep(0)
+    return failing_fetch(offset)
+
+
+def test_fetch_pages_parallel_ordered():
+    server = PageServer(slow_offsets=(2,))
+
+    result = page_ids(fetch_pages_parallel(server, concurrency=3))
+
+    assert result == ["ID-0", "ID-2", "ID-4", "ID-6", "ID-8"]
+    assert sorted(server.offsets) == [0, 2, 4, 6, 8]
+    assert server.peak <= 3
+
+
+def test_fetch_pages_parallel_unordered():
+    server = PageServer(total=6, slow_offsets=(2,))
+
+    result = page_ids(fetch_pages_parallel(server, concurrency=2, ordered=False))
+
+    assert result == ["ID-0", "ID-4", "ID-2"]
+
+
+def test_fetch_pages_parallel_single_page():
+    server = PageServer(total=2)
+
+    result = page_ids(fetch_pages_parallel(server))
+
+    assert result == ["ID-0"]
+    assert server.offsets == [0]
+
+
+def test_fetch_pages_parallel_raises_page_error():
+    pages = fetch_pages_parallel(failing_fetch, concurrency=1)
+
+    result = [next(pages), next(pages)]
+
+    assert page_ids(result) == ["ID-0", "ID-2"]
+    with pytest.raises(ValueError, match="page failure"):
+        next(pages)
+
+
+def test_fetch_pages_parallel_keeps_deadline():
+    recorder = DeadlineRecorder()
+
+    with deadline(10) as active_deadline:
+        list(fetch_pages_parallel(recorder))  # act
+
+    assert recorder.deadlines == [active_deadline, active_deadline]
+
+
+def test_fetch_pages_parallel_invalid_concurrency():
+    with pytest.raises(ValueError, match="at least 1"):
+        fetch_pages_parallel(make_page, concurrency=0)
+
+
+async def test_afetch_pages_parallel_ordered():
+    server = PageServer(slow_offsets=(2,))
+
+    result = [page async for page in afetch_pages_parallel(server.afetch, concurrency=3)]
+
+    assert page_ids(result) == ["ID-0", "ID-2", "ID-4", "ID-6", "ID-8"]
+    assert server.peak <= 3
+
+
+async def test_afetch_pages_parallel_unordered():
+    server = PageServer(total=6, slow_offsets=(2,))
+    pages = afetch_pages_parallel(server.afetch, concurrency=2, ordered=False)
+
+    result = [page async for page in pages]
+
+    assert page_ids(result) == ["ID-0", "ID-4", "ID-2"]
+
+
+async def test_afetch_pages_parallel_close_cancels():
+    server = PageServer(slow_offsets=(2, 4))
+    pages = afetch_pages_parallel(server.afetch, concurrency=2)
+    await anext(pages)
+
+    await pages.aclose()
+
+    await asyncio.sleep(0.05)
+    assert server.offsets == [0]
+
+
+async def test_afetch_pages_parallel_raises_page_error():
+    with pytest.raises(ValueError, match="page failure"):
+        [page async for page in afetch_pages_parallel(afailing_fetch)]
+
+
+def test_afetch_pages_parallel_bad_concurrency():
+    with pytest.raises(ValueError, match="at least 1"):
+        afetch_pages_parallel(make_page, concurrency=0)
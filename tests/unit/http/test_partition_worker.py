@@ -0,0 +1,100 @@
+import dataclasses
+import queue
+
+import httpx
+import pytest
+import respx
+
+from mpt_api_client.auth import BearerTokenAuthentication
+from mpt_api_client.http.client import HTTPClient
+from mpt_api_client.http.export_sinks import JSONLExportSink
+from mpt_api_client.http.partition_worker import PartitionJob, export_partition
+from mpt_api_client.http.partitions import Partition
+from mpt_api_client.http.transport_settings import TransportSettings
+from mpt_api_client.json_codec import StdlibJSONCodec
+from tests.unit.conftest import API_TOKEN, API_URL
+from tests.unit.http.conftest import DummyService
+from tests.unit.http.test_export_sinks import read_ids
+from tests.unit.http.test_partitioned_export import make_client, paged_responder
+
+WORKER_CODEC = StdlibJSONCodec()
+
+
+def make_codec_client():
+    return HTTPClient(
+        transport=TransportSettings(base_url=API_URL, json_codec=WORKER_CODEC),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+
+@pytest.fixture
+def events():
+    return queue.Queue()
+
+
+def make_job(tmp_path, partition, events, batch_size=2):
+    return PartitionJob(
+        index=0,
+        partition=partition,
+        path="/api/v1/test",
+        rql="eq(status,'active')",
+        order_by=["id"],
+        select=None,
+        render=False,
+        service_class=DummyService,
+        client_factory=make_client,
+        sink=JSONLExportSink(tmp_path / "export.jsonl"),
+        batch_size=batch_size,
+        events=events,
+    )
+
+
+def test_page_path(tmp_path, events):
+    job = make_job(tmp_path, Partition(), events)
+
+    result = job.page_path(2, 4)
+
+    assert result == "/api/v1/test?limit=2&offset=4&order=id&eq(status,'active')"
+
+
+def test_export_partition_offset_range(tmp_path, events):
+    job = make_job(tmp_path, Partition(offset=1, stop=4), events)
+    with respx.mock:
+        route = respx.get("https://api.example.com/api/v1/test").mock(side_effect=paged_responder)
+
+        result = export_partition(job)
+
+    offsets = [call.request.url.params["offset"] for call in route.calls]
+    assert result == 3
+    assert offsets == ["1", "3"]
+    assert read_ids(job.sink.part_path(0)) == ["ID-2", "ID-3", "ID-4"]
+    assert events.get_nowait() == (0, 3, 2)
+    assert events.get_nowait() == (0, 3, 3)
+
+
+def test_export_partition_without_meta(tmp_path, events):
+    job = make_job(tmp_path, Partition(), events, batch_size=3)
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(
+            return_value=httpx.Response(httpx.codes.OK, json={"data": [{"id": "ID-1"}]})
+        )
+
+        result = export_partition(job)
+
+    assert result == 1
+    assert events.get_nowait() == (0, 1, 1)
+
+
+def test_export_partition_uses_client_codec(tmp_path, events, mocker):
+    job = dataclasses.replace(
+        make_job(tmp_path, Partition(), events, batch_size=3), client_factory=make_codec_client
+    )
+    write = mocker.spy(job.sink, "write_partition")
+    with respx.mock:
+        respx.get("https://api.example.com/api/v1/test").mock(
+            return_value=httpx.Response(httpx.codes.OK, json={"data": [{"id": "ID-1"}]})
+        )
+
+        export_partition(job)  # act
+
+    assert write.call_args.args[2] is WORKER_CODEC
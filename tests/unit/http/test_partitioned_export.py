@@ -0,0 +1,171 @@
+import asyncio
+import json
+import queue
+from pathlib import Path
+
+import httpx
+import respx
+
+from mpt_api_client import RQLQuery
+from mpt_api_client.auth import BearerTokenAuthentication
+from mpt_api_client.http import HTTPClient, TransportSettings
+from mpt_api_client.http.export_sinks import JSONLExportSink
+from mpt_api_client.http.partitioned_export import (
+    ExportProgress,
+    ThreadsafeProgress,
+    partition_jobs,
+    run_partitioned_export,
+)
+from mpt_api_client.http.partitions import Partition
+from tests.unit.conftest import API_TOKEN, API_URL
+from tests.unit.http.conftest import AsyncRecordingProgress, RecordingProgress
+
+RECORD_IDS = ("ID-1", "ID-2", "ID-3", "ID-4", "ID-5")
+ITEM_PROCESSED = ("item_processed",)
+
+
+def make_client():
+    return HTTPClient(
+        transport=TransportSettings(base_url=API_URL),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+
+def paged_responder(request: httpx.Request) -> httpx.Response:
+    """Answer a page of a 5-record collection at the requested limit and offset."""
+    limit = int(request.url.params["limit"])
+    offset = int(request.url.params["offset"])
+    return httpx.Response(
+        httpx.codes.OK,
+        json={
+            "data": [{"id": resource_id} for resource_id in RECORD_IDS[offset : offset + limit]],
+            "$meta": {
+                "pagination": {"total": len(RECORD_IDS), "offset": offset, "limit": limit},
+            },
+        },
+    )
+
+
+class FlakySink(JSONLExportSink):
+    """Sink failing the first attempt at each partition, remembered in marker files."""
+
+    def write_partition(self, index, resources, json_codec=None):
+        marker = Path(f"{self.path}.failed{index}")
+        if not marker.exists():
+            marker.touch()
+            list(resources)
+            raise RuntimeError("worker crashed")
+        super().write_partition(index, resources, json_codec)
+
+
+class BrokenSink(JSONLExportSink):
+    """Sink failing every attempt."""
+
+    def write_partition(self, index, resources, json_codec=None):
+        raise RuntimeError("disk full")
+
+
+def make_jobs(dummy_service, sink, partitions=None):
+    if partitions is None:
+        partitions = [Partition(stop=3), Partition(offset=3)]
+    return partition_jobs(dummy_service, partitions, sink, make_client, 2)
+
+
+def test_partition_jobs_combine_filters(dummy_service, tmp_path):
+    service = dummy_service.filter(RQLQuery(status="active")).select("id")
+    partitions = [Partition(rql="lt(id,'ID-3')"), Partition(offset=2)]
+
+    result = make_jobs(service, JSONLExportSink(tmp_path / "out.jsonl"), partitions)
+
+    assert [job.rql for job in result] == [
+        "and(eq(status,'active'),lt(id,'ID-3'))",
+        "eq(status,'active')",
+    ]
+    assert (
+        result[1].page_path(2, 2) == "/api/v1/test?limit=2&offset=2&select=id&eq(status,'active')"
+    )
+
+
+def test_run_partitioned_export(dummy_service, tmp_path, fork_context):
+    sink = JSONLExportSink(tmp_path / "out.jsonl")
+    jobs = make_jobs(dummy_service, sink)
+    progress = RecordingProgress()
+    with respx.mock:
+        respx.get(f"{API_URL}/api/v1/test").mock(side_effect=paged_responder)
+
+        result = run_partitioned_export(jobs, 2, progress=progress, mp_context=fork_context)
+
+    lines = (tmp_path / "out.jsonl").read_text().splitlines()
+    assert result.ok
+    assert result.results == [3, 2]
+    assert tuple(json.loads(line)["id"] for line in lines) == RECORD_IDS
+    assert progress.events.count(ITEM_PROCESSED) == 5
+    assert progress.events[-1] == ("completed",)
+
+
+def test_run_partitioned_export_retries(dummy_service, tmp_path, fork_context):
+    sink = FlakySink(tmp_path / "out.jsonl")
+    jobs = make_jobs(dummy_service, sink)
+    with respx.mock:
+        respx.get(f"{API_URL}/api/v1/test").mock(side_effect=paged_responder)
+
+        result = run_partitioned_export(jobs, 2, retries=1, mp_context=fork_context)
+
+    assert result.ok
+    assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 5
+
+
+def test_run_partitioned_export_reports_failure(dummy_service, tmp_path, fork_context):
+    sink = BrokenSink(tmp_path / "out.jsonl")
+    jobs = make_jobs(dummy_service, sink, [Partition()])
+    progress = RecordingProgress()
+    with respx.mock:
+        respx.get(f"{API_URL}/api/v1/test").mock(side_effect=paged_responder)
+
+        result = run_partitioned_export(
+            jobs, 1, retries=1, progress=progress, mp_context=fork_context
+        )
+
+    assert result.results == [None]
+    assert result.errors[0].entry == Partition()
+    assert str(result.errors[0].error) == "disk full"
+    assert not (tmp_path / "out.jsonl").exists()
+    assert ("completed",) not in progress.events
+
+
+def test_run_partitioned_export_spawns_workers(mocker, fork_context):
+    get_context = mocker.patch(
+        "mpt_api_client.http.partitioned_export.multiprocessing.get_context",
+        return_value=fork_context,
+    )
+
+    result = run_partitioned_export([])
+
+    assert result.results == []
+    get_context.assert_called_once_with("spawn")
+
+
+def test_export_progress_counts_retries_once():
+    progress = RecordingProgress()
+    events = queue.Queue()
+    events.put((0, 4, 2))
+    events.put((1, 3, 3))
+    events.put((0, 4, 2))
+    events.put((0, 4, 4))
+
+    ExportProgress(progress).drain(events)  # act
+
+    assert progress.events.count(ITEM_PROCESSED) == 7
+    assert [event for event in progress.events if event != ITEM_PROCESSED] == [
+        ("set_total_items", 4),
+        ("set_total_items", 7),
+    ]
+
+
+async def test_threadsafe_progress():
+    progress = AsyncRecordingProgress()
+    thread_progress = ThreadsafeProgress(progress, asyncio.get_running_loop())
+
+    await asyncio.to_thread(thread_progress.set_total_items, 3)  # act
+
+    assert progress.events == [("set_total_items", 3)]
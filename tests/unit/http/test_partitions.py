@@ -0,0 +1,80 @@
+import datetime as dt
+
+import pytest
+
+from mpt_api_client.http.partitions import (
+    Partition,
+    offset_partitions,
+    range_partitions,
+    time_partitions,
+)
+
+
+def test_range_partitions():
+    result = range_partitions(["ID-3", "ID-6"])
+
+    assert result == [
+        Partition(rql="lt(id,'ID-3')"),
+        Partition(rql="and(ge(id,'ID-3'),lt(id,'ID-6'))"),
+        Partition(rql="ge(id,'ID-6')"),
+    ]
+
+
+def test_range_partitions_without_boundaries():
+    result = range_partitions([])
+
+    assert result == [Partition()]
+
+
+def test_range_partitions_rejects_unordered():
+    with pytest.raises(ValueError, match="strictly increasing"):
+        range_partitions(["ID-6", "ID-3"])
+
+
+def test_time_partitions():
+    start = dt.datetime(2025, 1, 1, tzinfo=dt.UTC)
+
+    result = time_partitions(start, start + dt.timedelta(days=3), 3)
+
+    assert [partition.rql for partition in result] == [
+        "lt(audit.created.at,'2025-01-02T00:00:00+00:00')",
+        (
+            "and(ge(audit.created.at,'2025-01-02T00:00:00+00:00'),"
+            "lt(audit.created.at,'2025-01-03T00:00:00+00:00'))"
+        ),
+        "ge(audit.created.at,'2025-01-03T00:00:00+00:00')",
+    ]
+
+
+def test_time_partitions_rejects_empty_window():
+    start = dt.datetime(2025, 1, 1, tzinfo=dt.UTC)
+
+    with pytest.raises(ValueError, match="after its start"):
+        time_partitions(start, start, 2)
+
+
+@pytest.mark.parametrize(
+    ("total", "count", "expected"),
+    [
+        (
+            10,
+            3,
+            [
+                Partition(stop=4),
+                Partition(offset=4, stop=8),
+                Partition(offset=8),
+            ],
+        ),
+        (2, 4, [Partition(offset=0, stop=1), Partition(offset=1)]),
+        (0, 4, [Partition()]),
+    ],
+)
+def test_offset_partitions(total, count, expected):
+    result = offset_partitions(total, count)
+
+    assert result == expected
+
+
+def test_offset_partitions_rejects_count():
+    with pytest.raises(ValueError, match="at least 1"):
+        offset_partitions(10, 0)
@@ -0,0 +1,193 @@
+import asyncio
+import itertools
+import threading
+import time
+
+import pytest
+
+from mpt_api_client.http.deadline import current_deadline, deadline
+from mpt_api_client.http.prefetch import aprefetch_pages, prefetch_pages
+
+
+class PageSource:
+    """Endless page iterator counting the pages read from it."""
+
+    def __init__(self):
+        self.produced = 0
+        self.producer_threads = set()
+
+    def __iter__(self):
+        for page in itertools.count():
+            self.produced += 1
+            self.producer_threads.add(threading.get_ident())
+            yield page
+
+    async def __aiter__(self):
+        for page in itertools.count():
+            self.produced += 1
+            await asyncio.sleep(0)  # noqa: WPS476
+            yield page
+
+
+class FetchAbortedError(BaseException):  # noqa: WPS418
+    """Error outside the ``Exception`` hierarchy, such as an interrupted fetch."""
+
+
+def wait_for_pages(source, produced):
+    started_at = time.monotonic()
+    while source.produced < produced and time.monotonic() - started_at < 1:
+        time.sleep(0.001)
+    time.sleep(0.01)
+
+
+def failing_pages():
+    yield 1
+    yield 2
+    raise ValueError("page failure")
+
+
+async def afailing_pages():
+    await asyncio.sleep(0)
+    yield 1
+    raise ValueError("page failure")
+
+
+def aborted_pages():
+    yield 1
+    raise FetchAbortedError
+
+
+async def aaborted_pages():
+    await asyncio.sleep(0)
+    yield 1
+    raise FetchAbortedError
+
+
+async def apages(count):
+    for page in range(count):
+        await asyncio.sleep(0)  # noqa: WPS476
+        yield page
+
+
+def test_prefetch_pages_in_order():
+    result = list(prefetch_pages(iter(range(5)), depth=2))
+
+    assert result == [0, 1, 2, 3, 4]
+
+
+def test_prefetch_pages_reads_in_background():
+    source = PageSource()
+    pages = prefetch_pages(iter(source), depth=3)
+
+    first_page = next(pages)  # act
+
+    wait_for_pages(source, 5)
+    assert first_page == 0
+    assert source.produced == 5
+    assert threading.get_ident() not in source.producer_threads
+    pages.close()
+
+
+def test_prefetch_pages_close_stops_reader():
+    source = PageSource()
+    pages = prefetch_pages(iter(source), depth=1)
+    next(pages)
+
+    pages.close()  # act
+
+    wait_for_pages(source, 3)
+    produced = source.produced
+    wait_for_pages(source, produced + 1)
+    assert source.produced == produced
+
+
+def test_prefetch_pages_raises_page_error():
+    pages = prefetch_pages(failing_pages(), depth=4)
+
+    result = [next(pages), next(pages)]
+
+    assert result == [1, 2]
+    with pytest.raises(ValueError, match="page failure"):
+        next(pages)
+
+
+def test_prefetch_pages_raises_base_exception():
+    pages = prefetch_pages(aborted_pages(), depth=4)
+
+    with pytest.raises(FetchAbortedError):
+        list(pages)
+
+
+def read_deadlines():
+    yield current_deadline()
+
+
+def test_prefetch_pages_keeps_deadline():
+    with deadline(10) as active_deadline:
+        result = list(prefetch_pages(read_deadlines(), depth=1))
+
+    assert result == [active_deadline]
+
+
+def test_prefetch_pages_invalid_depth():
+    pages = prefetch_pages(iter(range(3)), depth=0)
+
+    with pytest.raises(ValueError, match="at least 1"):
+        next(pages)
+
+
+async def test_aprefetch_pages_in_order():
+    result = [page async for page in aprefetch_pages(apages(5), depth=2)]
+
+    assert result == [0, 1, 2, 3, 4]
+
+
+async def test_aprefetch_pages_bounded():
+    source = PageSource()
+    pages = aprefetch_pages(aiter(source), depth=2)
+
+    first_page = await anext(pages)
+
+    for _ in range(10):
+        await asyncio.sleep(0)  # noqa: WPS476
+    assert first_page == 0
+    assert source.produced == 4
+    await pages.aclose()
+
+
+async def test_aprefetch_pages_close_cancels_reader():
+    source = PageSource()
+    pages = aprefetch_pages(aiter(source), depth=1)
+    await anext(pages)
+
+    await pages.aclose()
+
+    produced = source.produced
+    for _ in range(10):
+        await asyncio.sleep(0)  # noqa: WPS476
+    assert source.produced == produced
+
+
+async def test_aprefetch_pages_raises_page_error():
+    pages = aprefetch_pages(afailing_pages(), depth=2)
+
+    first_page = await anext(pages)
+
+    assert first_page == 1
+    with pytest.raises(ValueError, match="page failure"):
+        await anext(pages)
+
+
+async def test_aprefetch_pages_raises_base_exception():
+    pages = aprefetch_pages(aaborted_pages(), depth=2)
+    await anext(pages)
+
+    with pytest.raises(FetchAbortedError):
+        await asyncio.wait_for(anext(pages), timeout=1)
+
+
+async def test_aprefetch_pages_invalid_depth():
+    pages = aprefetch_pages(apages(3), depth=0)
+
+    with pytest.raises(ValueError, match="at least 1"):
+        await anext(pages)
@@ -0,0 +1,49 @@
+from mpt_api_client.http.metrics import ClientMetrics
+from mpt_api_client.http.metrics_snapshot import Histogram, MetricsSnapshot, PoolMetrics
+from mpt_api_client.http.prometheus import format_prometheus
+
+
+def test_format_prometheus():
+    metrics = ClientMetrics(max_connections=10)
+    metrics.record_max_retry_error("GET", '/files/"quoted"')
+    metrics.decoding("/public/v1/catalog/products").record(100, 0.25)
+    snapshot = metrics.snapshot()
+
+    result = format_prometheus(snapshot, namespace="mpt")
+
+    lines = result.splitlines()
+    assert "# TYPE mpt_requests_total counter" in lines
+    assert r'mpt_max_retry_errors_total{method="GET",endpoint="/files/\"quoted\""} 1' in lines
+    assert (
+        'mpt_records_decoded_total{method="GET",endpoint="/public/v1/catalog/products"} 100'
+        in lines
+    )
+    assert "mpt_pool_max_connections 10" in lines
+    assert result.endswith("\n")
+
+
+def test_format_prometheus_cumulative_buckets():
+    wait = Histogram(bounds=(0.1, 1))
+    for latency in (0.05, 0.5, 2):
+        wait.observe(latency)
+    snapshot = MetricsSnapshot(endpoints={}, pool=PoolMetrics(wait=wait), components={})
+
+    result = format_prometheus(snapshot).splitlines()
+
+    assert result[-5:] == [
+        'mpt_client_pool_wait_seconds_bucket{le="0.1"} 1',
+        'mpt_client_pool_wait_seconds_bucket{le="1"} 2',
+        'mpt_client_pool_wait_seconds_bucket{le="+Inf"} 3',
+        "mpt_client_pool_wait_seconds_sum 2.55",
+        "mpt_client_pool_wait_seconds_count 3",
+    ]
+
+
+def test_format_prometheus_components():
+    snapshot = MetricsSnapshot(
+        endpoints={}, pool=PoolMetrics(), components={"http_cache": {"hits": 2}}
+    )
+
+    result = format_prometheus(snapshot).splitlines()
+
+    assert result[-1] == "mpt_client_http_cache_hits 2"
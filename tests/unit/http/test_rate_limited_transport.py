@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+from mpt_api_client.http.rate_limited_transport import (
+    AsyncRateLimitedTransport,
+    RateLimitedTransport,
+)
+from mpt_api_client.http.rate_limiter import AsyncRateLimiter, RateLimit, RateLimiter
+from tests.unit.conftest import API_URL
+
+ORDERS_URL = f"{API_URL}/public/v1/commerce/orders"
+
+
+def throttled_handler(request):
+    return httpx.Response(httpx.codes.TOO_MANY_REQUESTS, headers={"Retry-After": "1"})
+
+
+@pytest.fixture
+def rate_limiter(mocker):
+    limiter = mocker.Mock(spec=RateLimiter)
+    limiter.acquire.return_value = None
+    return limiter
+
+
+@pytest.fixture
+def async_rate_limiter(mocker):
+    return mocker.AsyncMock(spec=AsyncRateLimiter)
+
+
+def test_transport_acquires_and_observes(rate_limiter):
+    transport = RateLimitedTransport(httpx.MockTransport(throttled_handler), rate_limiter)
+
+    result = transport.handle_request(httpx.Request("GET", ORDERS_URL))
+
+    assert result.status_code == httpx.codes.TOO_MANY_REQUESTS
+    rate_limiter.acquire.assert_called_once_with("/public/v1/commerce/orders")
+    rate_limiter.observe.assert_called_once_with(
+        "/public/v1/commerce/orders", httpx.codes.TOO_MANY_REQUESTS, result.headers
+    )
+
+
+def test_transport_close_closes_inner(mocker, rate_limiter):
+    inner = mocker.Mock(spec=httpx.BaseTransport)
+    transport = RateLimitedTransport(inner, rate_limiter)
+
+    transport.close()  # act
+
+    inner.close.assert_called_once_with()
+
+
+async def test_async_transport_acquires_and_observes(async_rate_limiter):
+    transport = AsyncRateLimitedTransport(
+        httpx.MockTransport(throttled_handler), async_rate_limiter
+    )
+
+    result = await transport.handle_async_request(httpx.Request("GET", ORDERS_URL))
+
+    assert result.status_code == httpx.codes.TOO_MANY_REQUESTS
+    async_rate_limiter.acquire.assert_awaited_once_with("/public/v1/commerce/orders")
+    async_rate_limiter.observe.assert_called_once_with(
+        "/public/v1/commerce/orders", httpx.codes.TOO_MANY_REQUESTS, result.headers
+    )
+
+
+async def test_async_transport_aclose_closes_inner(mocker, async_rate_limiter):
+    inner = mocker.AsyncMock(spec=httpx.AsyncBaseTransport)
+    transport = AsyncRateLimitedTransport(inner, async_rate_limiter)
+
+    await transport.aclose()  # act
+
+    inner.aclose.assert_awaited_once_with()
+
+
+def test_client_pauses_after_throttle(mocker, fake_clock):
+    sleep = mocker.Mock(side_effect=fake_clock.sleep)
+    limiter = RateLimiter(RateLimit(rate=100, burst=10), clock=fake_clock, sleep=sleep)
+    transport = RateLimitedTransport(httpx.MockTransport(throttled_handler), limiter)
+    client = httpx.Client(transport=transport)
+    client.get(ORDERS_URL)
+
+    client.get(ORDERS_URL)  # act
+
+    sleep.assert_called_once_with(pytest.approx(1.0))
@@ -0,0 +1,274 @@
+import time
+
+import pytest
+from httpx import Headers
+
+from mpt_api_client.exceptions import MPTDeadlineExceededError
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.rate_limiter import (
+    MAX_RATE_LIMIT_RESET,
+    AsyncRateLimiter,
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+
+BILLING_PREFIX = "/public/v1/billing"
+INVOICES_PATH = f"{BILLING_PREFIX}/invoices"
+ORDERS_PATH = "/public/v1/commerce/orders"
+
+
+@pytest.fixture
+def fast_limiter(fake_clock):
+    return RateLimiter(RateLimit(rate=100, burst=10), clock=fake_clock, sleep=fake_clock.sleep)
+
+
+@pytest.mark.parametrize(
+    ("rate", "burst"),
+    [(0, 1), (-1, 1), (1, 0)],
+)
+def test_rate_limit_validation(rate, burst):
+    with pytest.raises(ValueError):
+        RateLimit(rate=rate, burst=burst)
+
+
+def test_parse_retry_after_seconds():
+    result = parse_retry_after(" 7 ")
+
+    assert result == pytest.approx(7.0)
+
+
+def test_parse_retry_after_http_date():
+    result = parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0)
+
+    assert result == pytest.approx(10.0)
+
+
+def test_parse_retry_after_past_date_is_zero():
+    result = parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412490.0)
+
+    assert result == 0
+
+
+def test_parse_retry_after_invalid():
+    result = parse_retry_after("soon")
+
+    assert result is None
+
+
+@pytest.mark.parametrize(
+    ("reset", "expected"),
+    [
+        (4, 4),
+        (1000, 300),
+        (-1, 0),
+        (1445412490, 10),
+        (1445412400, 0),
+        (1445419680, 300),
+    ],
+)
+def test_parse_rate_limit_reset(reset, expected):
+    result = parse_rate_limit_reset(reset, now=1445412480.0)
+
+    assert result == pytest.approx(expected)
+
+
+def test_bucket_allows_burst_then_waits(fake_clock):
+    bucket = TokenBucket(RateLimit(rate=2, burst=2), fake_clock)
+
+    result = [bucket.try_acquire() for _ in range(3)]
+
+    assert result == [0, 0, pytest.approx(0.5)]
+
+
+def test_bucket_refills_at_rate(fake_clock):
+    bucket = TokenBucket(RateLimit(rate=2, burst=2), fake_clock)
+    bucket.try_acquire()
+    bucket.try_acquire()
+    fake_clock.sleep(0.5)
+
+    result = bucket.try_acquire()
+
+    assert result == 0
+
+
+def test_bucket_pause_blocks_until_expiry(fake_clock):
+    bucket = TokenBucket(RateLimit(rate=10, burst=5), fake_clock)
+    bucket.pause(3)
+
+    result = bucket.try_acquire()
+
+    assert result == pytest.approx(3.0)
+    fake_clock.sleep(3)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.1)
+
+
+def test_bucket_shorter_pause_keeps_longer(fake_clock):
+    bucket = TokenBucket(RateLimit(rate=10), fake_clock)
+    bucket.pause(5)
+
+    bucket.pause(1)  # act
+
+    assert bucket.try_acquire() == pytest.approx(5.0)
+
+
+def test_bucket_drain_lowers_tokens(fake_clock):
+    bucket = TokenBucket(RateLimit(rate=1, burst=10), fake_clock)
+
+    bucket.drain(2)  # act
+
+    assert bucket.tokens == pytest.approx(2.0)
+
+
+def test_limiter_applies_endpoint_and_client(fake_clock):
+    limiter = RateLimiter(
+        RateLimit(rate=100), {f"{BILLING_PREFIX}/": RateLimit(rate=1)}, clock=fake_clock
+    )
+
+    result = limiter.buckets_for(INVOICES_PATH)
+
+    assert len(result) == 2
+    assert limiter.buckets_for(ORDERS_PATH) == [result[1]]
+
+
+def test_limiter_longest_prefix_wins(fake_clock):
+    limiter = RateLimiter(
+        endpoint_rate_limits={
+            "/public/v1": RateLimit(rate=100),
+            BILLING_PREFIX: RateLimit(rate=1),
+        },
+        clock=fake_clock,
+    )
+
+    result = limiter.buckets_for(INVOICES_PATH)
+
+    assert len(result) == 1
+    assert result[0] is limiter.buckets_for(BILLING_PREFIX)[0]
+    assert result[0] is not limiter.buckets_for(ORDERS_PATH)[0]
+
+
+def test_limiter_prefix_matches_path_segments(fake_clock):
+    limiter = RateLimiter(
+        endpoint_rate_limits={BILLING_PREFIX: RateLimit(rate=1)}, clock=fake_clock
+    )
+
+    result = limiter.buckets_for(f"{BILLING_PREFIX}-archive/invoices")
+
+    assert result == []
+
+
+def test_limiter_acquire_sleeps_for_tokens(fake_clock):
+    limiter = RateLimiter(RateLimit(rate=4), clock=fake_clock, sleep=fake_clock.sleep)
+
+    for _ in range(3):  # act
+        limiter.acquire(ORDERS_PATH)
+
+    assert fake_clock.now == pytest.approx(1000.5)
+
+
+def test_limiter_unlimited_path_does_not_sleep(fake_clock):
+    billing_limits = {BILLING_PREFIX: RateLimit(rate=1)}
+    limiter = RateLimiter(
+        endpoint_rate_limits=billing_limits, clock=fake_clock, sleep=fake_clock.sleep
+    )
+
+    for _ in range(5):  # act
+        limiter.acquire(ORDERS_PATH)
+
+    assert fake_clock.now == pytest.approx(1000.0)
+
+
+def test_limiter_retry_after_pauses_on_throttle(fast_limiter, fake_clock):
+    fast_limiter.observe(ORDERS_PATH, 429, Headers({"Retry-After": "2"}))  # act
+
+    fast_limiter.acquire(ORDERS_PATH)
+    assert fake_clock.now == pytest.approx(1002.0)
+
+
+@pytest.mark.parametrize("retry_after", ["86400", "Wed, 21 Oct 2099 07:28:00 GMT"])
+def test_limiter_retry_after_pause_is_capped(fast_limiter, fake_clock, retry_after):
+    fast_limiter.observe(ORDERS_PATH, 429, Headers({"Retry-After": retry_after}))  # act
+
+    fast_limiter.acquire(ORDERS_PATH)
+    assert fake_clock.now == pytest.approx(1000.0 + MAX_RATE_LIMIT_RESET)
+
+
+def test_limiter_retry_after_ignored_on_success(fast_limiter, fake_clock):
+    fast_limiter.observe(ORDERS_PATH, 200, Headers({"Retry-After": "2"}))  # act
+
+    fast_limiter.acquire(ORDERS_PATH)
+    assert fake_clock.now == pytest.approx(1000.0)
+
+
+def test_limiter_exhausted_quota_waits_for_reset(fast_limiter, fake_clock):
+    headers = Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4"})
+
+    fast_limiter.observe(ORDERS_PATH, 200, headers)  # act
+
+    fast_limiter.acquire(ORDERS_PATH)
+    assert fake_clock.now == pytest.approx(1004.0)
+
+
+def test_limiter_epoch_reset_waits_until_reset(fast_limiter, fake_clock):
+    reset_at = str(int(time.time()) + 5)
+    headers = Headers({"RateLimit-Remaining": "0", "RateLimit-Reset": reset_at})
+
+    fast_limiter.observe(ORDERS_PATH, 200, headers)  # act
+
+    fast_limiter.acquire(ORDERS_PATH)
+    assert fake_clock.now == pytest.approx(1004.5, abs=1)
+
+
+def test_limiter_remaining_quota_drains_bucket(fast_limiter):
+    fast_limiter.observe(ORDERS_PATH, 200, Headers({"RateLimit-Remaining": "1"}))  # act
+
+    assert fast_limiter.buckets_for(ORDERS_PATH)[0].tokens == pytest.approx(1.0)
+
+
+def test_limiter_observe_ignores_invalid_headers(fake_clock):
+    limiter = RateLimiter(RateLimit(rate=1, burst=10), clock=fake_clock)
+
+    limiter.observe(  # act
+        ORDERS_PATH, 429, Headers({"Retry-After": "later", "RateLimit-Remaining": "n/a"})
+    )
+
+    assert limiter.buckets_for(ORDERS_PATH)[0].tokens == pytest.approx(10.0)
+
+
+def test_limiter_pauses_most_specific_bucket(fake_clock):
+    billing_limits = {BILLING_PREFIX: RateLimit(rate=100)}
+    limiter = RateLimiter(
+        RateLimit(rate=100), billing_limits, clock=fake_clock, sleep=fake_clock.sleep
+    )
+
+    limiter.observe(INVOICES_PATH, 429, Headers({"Retry-After": "3"}))  # act
+
+    limiter.acquire(ORDERS_PATH)
+    assert fake_clock.now == pytest.approx(1000.0)
+    limiter.acquire(INVOICES_PATH)
+    assert fake_clock.now == pytest.approx(1003.0)
+
+
+def test_limiter_wait_past_deadline_raises(fast_limiter, fake_clock):
+    fast_limiter.observe(INVOICES_PATH, 429, Headers({"Retry-After": "30"}))
+
+    with deadline(5, fake_clock), pytest.raises(MPTDeadlineExceededError, match="rate limit"):
+        fast_limiter.acquire(INVOICES_PATH)  # act
+
+    assert fake_clock.now == pytest.approx(1000.0)
+
+
+async def test_async_limiter_acquire_sleeps_for_tokens(mocker, fake_clock):
+    mocker.patch(
+        "mpt_api_client.http.rate_limiter.asyncio.sleep",
+        new=mocker.AsyncMock(side_effect=fake_clock.sleep),
+    )
+    limiter = AsyncRateLimiter(RateLimit(rate=4), clock=fake_clock)
+
+    for _ in range(3):  # act
+        await limiter.acquire(ORDERS_PATH)  # noqa: WPS476
+
+    assert fake_clock.now == pytest.approx(1000.5)
@@ -0,0 +1,41 @@
+import pytest
+
+from mpt_api_client.http.request_response_utils import encode_json_body, get_request_key
+from mpt_api_client.json_codec import StdlibJSONCodec
+
+
+@pytest.mark.parametrize(
+    ("method", "headers", "expected"),
+    [
+        ("get", None, ("GET", "/items", "limit=1", "")),
+        ("GET", {"accept": "application/pdf"}, ("GET", "/items", "limit=1", "application/pdf")),
+        ("POST", None, None),
+    ],
+)
+def test_get_request_key(method, headers, expected):
+    result = get_request_key(method, "/items", "limit=1", headers)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        (None, {"Content-Type": "application/json"}),
+        ({"Accept": "*/*"}, {"Accept": "*/*", "Content-Type": "application/json"}),
+        (
+            {"content-type": "application/merge-patch+json"},
+            {"content-type": "application/merge-patch+json"},
+        ),
+    ],
+)
+def test_encode_json_body_headers(headers, expected):
+    result = encode_json_body({"id": "ID-1"}, headers, StdlibJSONCodec())
+
+    assert result == (b'{"id":"ID-1"}', expected)
+
+
+def test_encode_json_body_without_json():
+    result = encode_json_body(None, {"Accept": "*/*"}, StdlibJSONCodec())
+
+    assert result == (None, {"Accept": "*/*"})
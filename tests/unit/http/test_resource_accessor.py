@@ -1,9 +1,12 @@
+import contextlib
+import functools
 import json
 
 import httpx
 import pytest
 import respx
 
+from mpt_api_client.exceptions import MPTError
 from mpt_api_client.http.query_options import QueryOptions
 from mpt_api_client.http.resource_accessor import AsyncResourceAccessor, ResourceAccessor
 from tests.unit.conftest import API_URL, DummyModel
@@ -269,3 +272,102 @@ def test_get_with_render(http_client):
 
     assert result.to_dict() == response_data
     assert mock_route.call_count == 1
+
+
+@pytest.fixture
+def cached_accessor(cached_dummy_service):
+    return ResourceAccessor(cached_dummy_service.http_client, RESOURCE_URL, DummyModel)
+
+
+@pytest.fixture
+def async_cached_accessor(async_cached_dummy_service):
+    return AsyncResourceAccessor(async_cached_dummy_service.http_client, RESOURCE_URL, DummyModel)
+
+
+@respx.mock
+@pytest.mark.parametrize(
+    ("get_kwargs", "expected_calls"),
+    [
+        ({}, 1),
+        ({"action": "status"}, 2),
+        ({"query_params": {"select": "id", "limit": 1}}, 2),
+        ({"options": QueryOptions(render=True)}, 1),
+    ],
+    ids=["resource", "action", "other-query", "render"],
+)
+def test_get_model_cache(cached_accessor, get_kwargs, expected_calls):
+    mock_route = respx.get(url__startswith=FULL_URL).mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    cached_accessor.get(**get_kwargs)
+
+    cached_accessor.get(**get_kwargs)  # act
+
+    assert mock_route.call_count == expected_calls
+
+
+@respx.mock
+@pytest.mark.parametrize("status_code", [httpx.codes.OK, httpx.codes.BAD_REQUEST])
+def test_post_invalidates_model_cache(cached_accessor, status_code):
+    get_route = respx.get(FULL_URL).mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    post_response = httpx.Response(status_code, json={})
+    respx.post(f"{FULL_URL}/complete").mock(return_value=post_response)
+    cached_accessor.get()
+    with contextlib.suppress(MPTError):
+        cached_accessor.post("complete")
+
+    cached_accessor.get()  # act
+
+    assert get_route.call_count == 2
+
+
+@respx.mock
+def test_client_request_invalidates_model_cache(cached_accessor, cached_dummy_service):
+    get_route = respx.get(FULL_URL).mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    put_response = httpx.Response(httpx.codes.OK, json={})
+    respx.put(FULL_URL).mock(return_value=put_response)
+    cached_accessor.get()
+    cached_dummy_service.http_client.request(
+        "PUT", RESOURCE_URL, files={"file": ("a.txt", b"data")}, json={"name": "Resource"}
+    )
+
+    cached_accessor.get()  # act
+
+    assert get_route.call_count == 2
+
+
+def respond_after_invalidation(model_cache, request):
+    model_cache.invalidate(RESOURCE_URL)
+    return httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+
+
+@respx.mock
+def test_get_during_invalidation_not_cached(cached_accessor, cached_dummy_service):
+    model_cache = cached_dummy_service.http_client.components.model_cache
+    get_route = respx.get(FULL_URL).mock(
+        side_effect=functools.partial(respond_after_invalidation, model_cache)
+    )
+    cached_accessor.get()
+
+    cached_accessor.get()  # act
+
+    assert get_route.call_count == 2
+
+
+@respx.mock
+async def test_async_delete_invalidates_model_cache(async_cached_accessor):
+    get_route = respx.get(FULL_URL).mock(
+        return_value=httpx.Response(httpx.codes.OK, json={"id": "RES-123"})
+    )
+    respx.delete(FULL_URL).mock(return_value=httpx.Response(httpx.codes.NO_CONTENT))
+    await async_cached_accessor.get()
+    await async_cached_accessor.get()
+    await async_cached_accessor.delete()
+
+    await async_cached_accessor.get()  # act
+
+    assert get_route.call_count == 2
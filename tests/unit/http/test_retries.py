@@ -0,0 +1,114 @@
+from typing import override
+
+import pytest
+from httpx import Response, codes
+from httpx_retries import Retry
+
+from mpt_api_client.exceptions import MPTDeadlineExceededError
+from mpt_api_client.http.deadline import deadline
+from mpt_api_client.http.retries import ClientRetry
+
+
+class FixedBackoffRetry(Retry):
+    """Retry policy overriding the backoff strategy."""
+
+    @override
+    def backoff_strategy(self) -> float:
+        return 4
+
+
+def test_increment_wraps_next_policy():
+    retry = ClientRetry(FixedBackoffRetry(total=3))
+
+    result = retry.increment()
+
+    assert isinstance(result.policy, FixedBackoffRetry)
+    assert result.policy.attempts_made == 1
+    assert retry.policy.attempts_made == 0
+
+
+def test_backoff_uses_policy_strategy():
+    retry = ClientRetry(FixedBackoffRetry(total=3)).increment()
+
+    result = retry.backoff(Response(codes.BAD_GATEWAY))
+
+    assert result == 4
+
+
+def test_first_attempt_does_not_back_off():
+    retry = ClientRetry(FixedBackoffRetry(total=3))
+
+    result = retry.backoff(Response(codes.BAD_GATEWAY))
+
+    assert result == 0
+
+
+def test_backoff_capped_by_total_timeout():
+    retry = ClientRetry(FixedBackoffRetry(total=3, total_timeout=5, elapsed_sleep=2)).increment()
+
+    result = retry.backoff(Response(codes.BAD_GATEWAY))
+
+    assert result == 3
+
+
+def test_sleep_without_deadline(mocker):
+    sleep = mocker.patch("time.sleep")
+    retry = ClientRetry(Retry(total=3, backoff_factor=1, backoff_jitter=0)).increment()
+
+    retry.sleep(None)  # act
+
+    sleep.assert_called_once()
+
+
+def test_backoff_past_deadline_raises(mocker, fake_clock):
+    sleep = mocker.patch("time.sleep")
+    retry = ClientRetry(Retry(total=3, backoff_factor=10, backoff_jitter=0)).increment()
+
+    with deadline(1, fake_clock), pytest.raises(MPTDeadlineExceededError, match="retry backoff"):
+        retry.sleep(None)  # act
+
+    sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("status_code", "expected_sleep"),
+    [(codes.TOO_MANY_REQUESTS, 7), (codes.SERVICE_UNAVAILABLE, 7), (codes.BAD_GATEWAY, 0)],
+)
+def test_retry_after_honoured_on_throttling_only(mocker, status_code, expected_sleep):
+    sleep = mocker.patch("time.sleep")
+    response = Response(status_code, headers={"Retry-After": "7"})
+    retry = ClientRetry(Retry(total=3)).increment()
+
+    retry.sleep(response)  # act
+
+    sleep.assert_called_once_with(expected_sleep)
+
+
+def test_retry_after_ignored_if_policy_disables():
+    response = Response(codes.TOO_MANY_REQUESTS, headers={"Retry-After": "7"})
+    retry = ClientRetry(FixedBackoffRetry(total=3, respect_retry_after_header=False)).increment()
+
+    result = retry.backoff(response)
+
+    assert result == 4
+
+
+async def test_async_retry_after_honoured(mocker):
+    sleep = mocker.patch("asyncio.sleep", new=mocker.AsyncMock())
+    response = Response(codes.TOO_MANY_REQUESTS, headers={"Retry-After": "7"})
+    retry = ClientRetry(Retry(total=3)).increment()
+
+    await retry.asleep(response)  # act
+
+    sleep.assert_awaited_once_with(7)
+    assert retry.policy.elapsed_sleep == 7
+
+
+def test_backoff_is_fully_jittered(mocker):
+    uniform = mocker.patch("random.uniform", return_value=0.25)
+    retry = ClientRetry(Retry(total=3, backoff_factor=0.5)).increment()
+
+    result = retry.backoff(Response(codes.BAD_GATEWAY))
+
+    uniform.assert_called_once_with(0, 1)
+    assert result == pytest.approx(0.25)
@@ -0,0 +1,43 @@
+import pytest
+
+from mpt_api_client.http.retry_budget import RetryBudget, RetryBudgetLimiter, RetryBudgetStats
+
+
+@pytest.mark.parametrize(
+    "budget_kwargs",
+    [{"ratio": 0}, {"ratio": 1.5}, {"burst": 0}],
+)
+def test_budget_validation(budget_kwargs):
+    with pytest.raises(ValueError, match="Retry budget"):
+        RetryBudget(**budget_kwargs)
+
+
+def test_limiter_starts_with_full_burst():
+    limiter = RetryBudgetLimiter(RetryBudget(burst=2))
+
+    result = [limiter.try_retry() for _ in range(3)]
+
+    assert result == [True, True, False]
+    assert limiter.stats == RetryBudgetStats(retries=2, exhausted=1)
+
+
+def test_requests_earn_ratio_of_a_retry():
+    limiter = RetryBudgetLimiter(RetryBudget(ratio=0.5, burst=1))
+    limiter.try_retry()
+    limiter.record_request()
+
+    result = limiter.try_retry()
+
+    assert result is False
+    limiter.record_request()
+    assert limiter.try_retry() is True
+
+
+def test_tokens_capped_at_burst():
+    limiter = RetryBudgetLimiter(RetryBudget(ratio=1, burst=3))
+
+    for _ in range(10):  # act
+        limiter.record_request()
+
+    assert limiter.tokens == 3
+    assert limiter.stats == RetryBudgetStats(requests=10)
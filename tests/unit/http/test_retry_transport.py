@@ -0,0 +1,178 @@
+import httpx
+import pytest
+from httpx_retries import Retry
+
+from mpt_api_client.http.retry_budget import RetryBudget, RetryBudgetLimiter
+from mpt_api_client.http.retry_transport import (
+    IDEMPOTENCY_KEY_HEADER,
+    BudgetRetryTransport,
+    get_retry_state,
+)
+from tests.unit.conftest import API_URL
+
+ORDERS_URL = f"{API_URL}/public/v1/commerce/orders"
+RETRY = Retry(total=3, allowed_methods=["GET", "POST"])
+
+
+class ScriptedResponder:
+    """MockTransport handler answering with scripted statuses or errors, in order."""
+
+    def __init__(self, *outcomes):
+        self._outcomes = list(outcomes)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        outcome = self._outcomes[0]
+        if len(self._outcomes) > 1:
+            self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+
+
+def retry_client(responder, budget=None, retry=RETRY):
+    transport = BudgetRetryTransport(httpx.MockTransport(responder), retry, budget)
+    return httpx.Client(transport=transport)
+
+
+def reject_empty_body(response):
+    if not response.content:
+        raise httpx.ReadError("Empty body", request=response.request)
+
+
+async def async_reject_empty_body(response):
+    await response.aread()
+    reject_empty_body(response)
+
+
+def test_retries_until_success():
+    responder = ScriptedResponder(httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.OK)
+
+    result = retry_client(responder).get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.OK
+    assert get_retry_state(result.request).attempts == 2
+
+
+def test_post_without_idempotency_key_not_retried():
+    responder = ScriptedResponder(httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.OK)
+
+    result = retry_client(responder).post(ORDERS_URL, json={})
+
+    assert result.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    assert len(responder.requests) == 1
+
+
+def test_post_with_idempotency_key_retried():
+    responder = ScriptedResponder(httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.OK)
+
+    result = retry_client(responder).post(
+        ORDERS_URL, json={}, headers={IDEMPOTENCY_KEY_HEADER: "order-1"}
+    )
+
+    assert result.status_code == httpx.codes.OK
+    assert len(responder.requests) == 2
+
+
+def test_exhausted_budget_returns_last_response():
+    budget = RetryBudgetLimiter(RetryBudget(ratio=0.1, burst=1))
+    responder = ScriptedResponder(httpx.codes.SERVICE_UNAVAILABLE)
+
+    result = retry_client(responder, budget).get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    assert get_retry_state(result.request).attempts == 2
+    assert get_retry_state(result.request).budget_exhausted is True
+    assert budget.stats.exhausted == 1
+
+
+def test_exhausted_budget_raises_last_error():
+    budget = RetryBudgetLimiter(RetryBudget(ratio=0.1, burst=1))
+    responder = ScriptedResponder(httpx.ConnectError("refused"))
+    client = retry_client(responder, budget)
+
+    with pytest.raises(httpx.ConnectError) as error_info:
+        client.get(ORDERS_URL)
+
+    assert get_retry_state(error_info.value.request).attempts == 2
+    assert get_retry_state(error_info.value.request).budget_exhausted is True
+
+
+def test_non_retryable_error_raised_at_once():
+    responder = ScriptedResponder(ValueError("bug"))
+    client = retry_client(responder)
+
+    with pytest.raises(ValueError, match="bug"):
+        client.get(ORDERS_URL)
+
+    assert len(responder.requests) == 1
+
+
+def test_successful_request_spends_no_budget():
+    budget = RetryBudgetLimiter(RetryBudget(burst=1))
+
+    retry_client(ScriptedResponder(httpx.codes.OK), budget).get(ORDERS_URL)  # act
+
+    assert (budget.stats.requests, budget.stats.retries) == (1, 0)
+
+
+def test_validate_response_error_retried():
+    responder = ScriptedResponder(httpx.codes.OK)
+    retry = Retry(total=2, validate_response=reject_empty_body)
+
+    result = retry_client(responder, retry=retry).get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.OK
+    assert get_retry_state(result.request).attempts == 3
+
+
+def test_validate_response_skips_retryable_status():
+    responder = ScriptedResponder(httpx.codes.SERVICE_UNAVAILABLE)
+    retry = Retry(total=1, validate_response=reject_empty_body)
+
+    result = retry_client(responder, retry=retry).get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    assert get_retry_state(result.request).attempts == 2
+
+
+def test_sync_transport_rejects_async_validator():
+    retry = Retry(total=1, validate_response=async_reject_empty_body)
+
+    with pytest.raises(TypeError, match="validate_response must be a sync function"):
+        retry_client(ScriptedResponder(httpx.codes.OK), retry=retry).get(ORDERS_URL)
+
+
+async def test_async_validate_response_awaited():
+    responder = ScriptedResponder(httpx.codes.OK)
+    retry = Retry(total=1, validate_response=async_reject_empty_body)
+    transport = BudgetRetryTransport(httpx.MockTransport(responder), retry)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await client.get(ORDERS_URL)
+
+    assert get_retry_state(result.request).attempts == 2
+
+
+async def test_async_retries_until_success():
+    responder = ScriptedResponder(httpx.ConnectError("refused"), httpx.codes.OK)
+    transport = BudgetRetryTransport(httpx.MockTransport(responder), RETRY)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await client.get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.OK
+    assert len(responder.requests) == 2
+
+
+async def test_async_exhausted_budget_returns_response():
+    budget = RetryBudgetLimiter(RetryBudget(ratio=0.1, burst=1))
+    responder = ScriptedResponder(httpx.codes.TOO_MANY_REQUESTS)
+    transport = BudgetRetryTransport(httpx.MockTransport(responder), RETRY, budget)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await client.get(ORDERS_URL)
+
+    assert result.status_code == httpx.codes.TOO_MANY_REQUESTS
+    assert get_retry_state(result.request).budget_exhausted is True
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+
+import pytest
+
+from mpt_api_client.http.singleflight import AsyncSingleFlight, SingleFlight
+
+KEY = ("GET", "/public/v1/catalog/products/PRD-1", "", "")
+
+
+class BlockingCall:
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.call_count = 0
+
+    def __call__(self):
+        self.call_count += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return "payload"
+
+
+def record_run(singleflight, call, outcomes):
+    outcomes.append(singleflight.run(KEY, call))
+
+
+async def async_payload():
+    await asyncio.sleep(0)
+    return "payload"
+
+
+async def async_failure():
+    await asyncio.sleep(0)
+    raise ValueError("boom")
+
+
+def test_sync_run_returns_fresh_result():
+    singleflight = SingleFlight()
+
+    result = singleflight.run(KEY, lambda: "payload")
+
+    assert result == ("payload", False)
+
+
+def test_sync_concurrent_callers_share_one_call():
+    call = BlockingCall()
+    singleflight = SingleFlight()
+    outcomes = []
+    threads = [
+        threading.Thread(target=record_run, args=(singleflight, call, outcomes)) for _ in range(2)
+    ]
+    threads[0].start()
+    call.started.wait(timeout=5)
+    threads[1].start()
+    threading.Timer(0.05, call.release.set).start()
+
+    for thread in threads:  # act
+        thread.join(timeout=5)
+
+    assert call.call_count == 1
+    assert sorted(outcomes) == [("payload", False), ("payload", True)]
+
+
+def test_sync_exception_is_raised_and_forgotten():
+    singleflight = SingleFlight()
+
+    with pytest.raises(ValueError):
+        singleflight.run(KEY, lambda: int("not a number"))
+
+    assert singleflight.run(KEY, lambda: 1) == (1, False)
+
+
+async def test_async_concurrent_callers_share_one_call(mocker):
+    call = mocker.Mock(side_effect=async_payload)
+    singleflight = AsyncSingleFlight()
+    runs = [singleflight.run(KEY, call) for _ in range(2)]
+
+    result = await asyncio.gather(*runs)
+
+    call.assert_called_once()
+    assert result == [("payload", False), ("payload", True)]
+
+
+async def test_async_sequential_calls_are_not_shared():
+    singleflight = AsyncSingleFlight()
+    await singleflight.run(KEY, lambda: asyncio.sleep(0, result="first"))
+
+    result = await singleflight.run(KEY, lambda: asyncio.sleep(0, result="second"))
+
+    assert result == ("second", False)
+
+
+async def test_async_leader_cancel_spares_followers():
+    singleflight = AsyncSingleFlight()
+    leader = asyncio.create_task(singleflight.run(KEY, async_payload))
+    follower = asyncio.create_task(singleflight.run(KEY, async_payload))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    result = await follower
+
+    assert result == ("payload", True)
+    assert leader.cancelled()
+
+
+async def test_async_exception_is_shared():
+    singleflight = AsyncSingleFlight()
+    runs = [singleflight.run(KEY, async_failure) for _ in range(2)]
+
+    result = await asyncio.gather(*runs, return_exceptions=True)
+
+    assert [type(error) for error in result] == [ValueError, ValueError]
+
+
+def test_sync_follower_wait_times_out():
+    call = BlockingCall()
+    singleflight = SingleFlight()
+    leader = threading.Thread(target=singleflight.run, args=(KEY, call))
+    leader.start()
+    call.started.wait(timeout=5)
+
+    with pytest.raises(TimeoutError):
+        singleflight.run(KEY, call, timeout=0.01)
+
+    call.release.set()
+    leader.join(timeout=5)
+    assert call.call_count == 1
+
+
+async def test_async_wait_times_out_call_goes_on():
+    singleflight = AsyncSingleFlight()
+    follower = asyncio.create_task(singleflight.run(KEY, async_payload))
+
+    with pytest.raises(TimeoutError):
+        await singleflight.run(KEY, async_payload, timeout=0)
+
+    assert await follower == ("payload", True)
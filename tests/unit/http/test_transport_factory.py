@@ -0,0 +1,110 @@
+from httpx_retries import RetryTransport
+
+from mpt_api_client.http.adaptive_concurrency import AdaptiveConcurrency
+from mpt_api_client.http.circuit_breaker import CircuitBreakerPolicy
+from mpt_api_client.http.client_components import build_async_components, build_components
+from mpt_api_client.http.rate_limiter import RateLimit
+from mpt_api_client.http.retry_budget import RetryBudget
+from mpt_api_client.http.transport_factory import build_async_transport, build_transport
+from mpt_api_client.http.transport_settings import TransportSettings
+from tests.unit.conftest import API_URL
+
+DEFAULT_SETTINGS = TransportSettings(base_url=API_URL)
+LIMITED_SETTINGS = TransportSettings(
+    base_url=API_URL,
+    rate_limit=RateLimit(rate=1),
+    adaptive_concurrency=AdaptiveConcurrency(),
+)
+FACTORY = "mpt_api_client.http.transport_factory"
+
+
+def test_build_transport_pool_limits_and_http2(mocker):
+    mock_transport = mocker.patch(f"{FACTORY}.HTTPTransport")
+    settings = TransportSettings(base_url=API_URL, max_connections=10, http2=True)
+
+    result = build_transport(settings, build_components(settings))
+
+    mock_transport.assert_called_once_with(limits=settings.limits, http2=True)
+    assert isinstance(result, RetryTransport)
+
+
+def test_build_async_transport_limits_and_http2(mocker):
+    mock_transport = mocker.patch(f"{FACTORY}.AsyncHTTPTransport")
+    settings = TransportSettings(base_url=API_URL, max_connections=10, http2=True)
+
+    result = build_async_transport(settings, build_async_components(settings))
+
+    mock_transport.assert_called_once_with(limits=settings.limits, http2=True)
+    assert isinstance(result, RetryTransport)
+
+
+def test_build_transport_hooks_and_rate_limiter(mocker):
+    mock_transport = mocker.patch(f"{FACTORY}.HTTPTransport")
+    mock_hooked = mocker.patch(f"{FACTORY}.HookTransport")
+    mock_rate_limited = mocker.patch(f"{FACTORY}.RateLimitedTransport")
+    settings = TransportSettings(base_url=API_URL, rate_limit=RateLimit(rate=1))
+    components = build_components(settings)
+
+    build_transport(settings, components)  # act
+
+    mock_hooked.assert_called_once_with(mock_transport.return_value, components.hooks)
+    mock_rate_limited.assert_called_once_with(mock_hooked.return_value, components.rate_limiter)
+
+
+def test_build_async_transport_hooks_and_limiters(mocker):
+    mock_transport = mocker.patch(f"{FACTORY}.AsyncHTTPTransport")
+    mock_hooked = mocker.patch(f"{FACTORY}.AsyncHookTransport")
+    mock_concurrency = mocker.patch(f"{FACTORY}.AdaptiveConcurrencyTransport")
+    mock_rate_limited = mocker.patch(f"{FACTORY}.AsyncRateLimitedTransport")
+    components = build_async_components(LIMITED_SETTINGS)
+
+    build_async_transport(LIMITED_SETTINGS, components)  # act
+
+    mock_hooked.assert_called_once_with(mock_transport.return_value, components.hooks)
+    mock_concurrency.assert_called_once_with(
+        mock_hooked.return_value, components.concurrency_limiter
+    )
+    mock_rate_limited.assert_called_once_with(
+        mock_concurrency.return_value, components.rate_limiter
+    )
+
+
+def test_build_transport_skips_disabled_limiters(mocker):
+    mock_rate_limited = mocker.patch(f"{FACTORY}.AsyncRateLimitedTransport")
+    mock_concurrency = mocker.patch(f"{FACTORY}.AdaptiveConcurrencyTransport")
+
+    build_async_transport(DEFAULT_SETTINGS, build_async_components(DEFAULT_SETTINGS))  # act
+
+    mock_rate_limited.assert_not_called()
+    mock_concurrency.assert_not_called()
+
+
+def test_build_transport_retry_budget():
+    settings = TransportSettings(base_url=API_URL, retry_budget=RetryBudget())
+    components = build_components(settings)
+
+    result = build_transport(settings, components)
+
+    assert result.budget is components.retry_budget
+
+
+def test_build_transport_circuit_breaker(mocker):
+    mock_deadline = mocker.patch(f"{FACTORY}.DeadlineTransport")
+    mock_breaker = mocker.patch(f"{FACTORY}.CircuitBreakerTransport")
+    settings = TransportSettings(base_url=API_URL, circuit_breaker=CircuitBreakerPolicy())
+    components = build_components(settings)
+
+    build_transport(settings, components)  # act
+
+    mock_breaker.assert_called_once_with(mock_deadline.return_value, components.circuit_breaker)
+
+
+def test_build_async_transport_circuit_breaker(mocker):
+    mock_deadline = mocker.patch(f"{FACTORY}.AsyncDeadlineTransport")
+    mock_breaker = mocker.patch(f"{FACTORY}.AsyncCircuitBreakerTransport")
+    settings = TransportSettings(base_url=API_URL, circuit_breaker=CircuitBreakerPolicy())
+    components = build_async_components(settings)
+
+    build_async_transport(settings, components)  # act
+
+    mock_breaker.assert_called_once_with(mock_deadline.return_value, components.circuit_breaker)
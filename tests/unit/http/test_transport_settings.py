@@ -1,7 +1,9 @@
 import pytest
+from httpx import Limits
 from httpx_retries import Retry
 
 from mpt_api_client.http.transport_settings import (
+    DEFAULT_RETRY_BACKOFF_FACTOR,
     DEFAULT_STREAM_READ_TIMEOUT,
     DEFAULT_TIMEOUT,
     ENV_BASE_URL,
@@ -9,6 +11,7 @@ from mpt_api_client.http.transport_settings import (
     EnvTransportSettings,
     TransportSettings,
 )
+from mpt_api_client.json_codec import StdlibJSONCodec
 from tests.unit.conftest import API_URL
 
 PHASE_ONE_FIRST_BYTE_SLO = 60.0
@@ -20,6 +23,14 @@ def test_retries_count_is_normalized_to_retry():
     assert isinstance(settings.retries, Retry)
     assert settings.retry.total == 3
     assert set(settings.retry.allowed_methods) == set(RETRY_ALLOWED_METHODS)
+    assert settings.retry.backoff_factor == DEFAULT_RETRY_BACKOFF_FACTOR
+    assert settings.retry.backoff_jitter == 1
+
+
+def test_retry_budget_disabled_by_default():
+    result = TransportSettings(base_url=API_URL)
+
+    assert result.retry_budget is None
 
 
 def test_retries_retry_instance_is_used_as_is():
@@ -127,3 +138,38 @@ def test_stream_never_lowers_explicit_read():
     settings = TransportSettings(base_url=API_URL, read_timeout=900.0)  # act
 
     assert settings.stream_timeout.read == pytest.approx(900.0)
+
+
+def test_json_codec_defaults_to_stdlib():
+    settings = TransportSettings(base_url=API_URL)  # act
+
+    assert isinstance(settings.codec, StdlibJSONCodec)
+
+
+def test_json_codec_is_used_as_is():
+    json_codec = StdlibJSONCodec()
+
+    settings = TransportSettings(base_url=API_URL, json_codec=json_codec)  # act
+
+    assert settings.codec is json_codec
+
+
+def test_limits_default_to_bounded_pool():
+    settings = TransportSettings(base_url=API_URL)
+
+    result = settings.limits
+
+    assert result == Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+    assert settings.http2 is False
+
+
+def test_limits_are_configurable():
+    settings = TransportSettings(
+        base_url=API_URL, max_connections=None, max_keepalive_connections=50, keepalive_expiry=30.0
+    )
+
+    result = settings.limits
+
+    assert result == Limits(
+        max_connections=None, max_keepalive_connections=50, keepalive_expiry=30.0
+    )
@@ -0,0 +1,71 @@
+import pytest
+
+from mpt_api_client.http.types import Response
+from mpt_api_client.json_codec import StdlibJSONCodec
+
+
+@pytest.fixture
+def json_codec():
+    return StdlibJSONCodec()
+
+
+def test_response_json_is_decoded_once(mocker, json_codec):
+    response = Response(
+        headers={}, status_code=200, content=b'{"id": "ID-1"}', json_codec=json_codec
+    )
+    loads_spy = mocker.spy(json_codec, "loads")
+
+    result = [response.json(), response.json()]
+
+    assert result[0] == {"id": "ID-1"}
+    assert result[0] is result[1]
+    loads_spy.assert_called_once_with(b'{"id": "ID-1"}')
+
+
+def test_response_json_is_lazy(mocker, json_codec):
+    loads_spy = mocker.spy(json_codec, "loads")
+
+    Response(headers={}, status_code=200, content=b"not json", json_codec=json_codec)  # act
+
+    loads_spy.assert_not_called()
+
+
+def test_response_json_kwargs_bypass_cache(json_codec):
+    response = Response(
+        headers={}, status_code=200, content=b'{"amount": 1.5}', json_codec=json_codec
+    )
+    cached = response.json()
+
+    result = response.json(parse_float=str)
+
+    assert result == {"amount": "1.5"}
+    assert cached == {"amount": 1.5}
+
+
+def test_response_json_uses_default_codec(mocker):
+    default_codec = mocker.Mock(spec=StdlibJSONCodec)
+    default_codec.loads.return_value = {"id": "ID-1"}
+    mocker.patch("mpt_api_client.http.types.default_json_codec", return_value=default_codec)
+    response = Response(headers={}, status_code=200, content=b'{"id": "ID-1"}')
+
+    result = response.json()
+
+    assert result == {"id": "ID-1"}
+    default_codec.loads.assert_called_once_with(b'{"id": "ID-1"}')
+
+
+def test_response_copy_shares_decoded_json():
+    response = Response(
+        headers={"X-Id": "1"},
+        status_code=200,
+        content=b'{"id": "ID-1"}',
+        json_codec=StdlibJSONCodec(),
+    )
+    original_json = response.json()
+
+    result = response.copy()
+
+    assert result.json() == original_json
+    assert result.json() is original_json
+    assert result.headers == response.headers
+    assert result.status_code == response.status_code
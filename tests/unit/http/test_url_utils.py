@@ -1,6 +1,6 @@
 import pytest
 
-from mpt_api_client.http.url_utils import join_url_path
+from mpt_api_client.http.url_utils import is_path_within, join_url_path
 
 
 def test_simple_segment():
@@ -84,3 +84,18 @@ def test_real_world_paths(base, segments, expected):
     result = join_url_path(base, *segments)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("path", "prefix", "expected"),
+    [
+        ("/api/v1/orders", "/api/v1/orders", True),
+        ("/api/v1/orders/ORD-1", "/api/v1/orders/", True),
+        ("/api/v1/orders-archive", "/api/v1/orders", False),
+        ("/api/v1", "/api/v1/orders", False),
+    ],
+)
+def test_is_path_within(path, prefix, expected):
+    result = is_path_within(path, prefix)
+
+    assert result is expected
@@ -1,6 +1,9 @@
+import json
+
 import pytest
 from httpx import Response
 
+from mpt_api_client.http.types import Response as HTTPResponse
 from mpt_api_client.models import Meta, Model, ModelCollection
 from mpt_api_client.models.model import (  # noqa: WPS347
     BaseModel,
@@ -86,6 +89,17 @@ def test_attribute_id(meta_data):
     assert resource.to_dict() == {"id": "R-1", "name": {"given": "Albert", "family": "Einstein"}}
 
 
+def test_from_response_keeps_shared_body(meta_data):
+    response_data = {"id": "1", "$meta": meta_data}
+    response_content = json.dumps(response_data).encode()
+    response = HTTPResponse(headers={}, status_code=200, content=response_content)
+
+    result = Model.from_response(response)
+
+    assert result.to_dict() == {"id": "1"}
+    assert response.json() == response_data
+
+
 def test_from_response_list():
     response_data = [{"id": "1"}, {"id": "2"}]
     response = Response(200, json=response_data)
@@ -13,14 +13,14 @@ def async_records_service(async_http_client):
     return AsyncRecordsService(http_client=async_http_client)
 
 
-@pytest.mark.parametrize("method", ["get", "create"])
+@pytest.mark.parametrize("method", ["get", "create", "stream", "stream_or_iterate"])
 def test_mixins_present(records_service, method):
     result = hasattr(records_service, method)
 
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get", "create"])
+@pytest.mark.parametrize("method", ["get", "create", "stream", "stream_or_iterate"])
 def test_async_mixins_present(async_records_service, method):
     result = hasattr(async_records_service, method)
 
@@ -36,14 +36,14 @@ def test_async_endpoint(async_custom_ledger_charges_service):
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get"])
+@pytest.mark.parametrize("method", ["get", "stream", "stream_or_iterate"])
 def test_methods_present(custom_ledger_charges_service, method):
     result = hasattr(custom_ledger_charges_service, method)
 
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get"])
+@pytest.mark.parametrize("method", ["get", "stream", "stream_or_iterate"])
 def test_async_methods_present(async_custom_ledger_charges_service, method):
     result = hasattr(async_custom_ledger_charges_service, method)
 
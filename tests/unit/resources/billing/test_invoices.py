@@ -22,7 +22,7 @@ def async_invoices_service(async_http_client):
 
 @pytest.mark.parametrize(
     "method",
-    ["get", "create", "update"],
+    ["get", "create", "update", "stream", "stream_or_iterate"],
 )
 def test_methods_present(invoices_service, method):
     result = hasattr(invoices_service, method)
@@ -32,7 +32,7 @@ def test_methods_present(invoices_service, method):
 
 @pytest.mark.parametrize(
     "method",
-    ["get", "create", "update"],
+    ["get", "create", "update", "stream", "stream_or_iterate"],
 )
 def test_async_methods_present(async_invoices_service, method):
     result = hasattr(async_invoices_service, method)
@@ -34,14 +34,14 @@ def test_async_endpoint(async_journal_charges_service):
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get"])
+@pytest.mark.parametrize("method", ["get", "stream", "stream_or_iterate"])
 def test_methods_present(journal_charges_service, method):
     result = hasattr(journal_charges_service, method)
 
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get"])
+@pytest.mark.parametrize("method", ["get", "stream", "stream_or_iterate"])
 def test_async_methods_present(async_journal_charges_service, method):
     result = hasattr(async_journal_charges_service, method)
 
@@ -32,14 +32,14 @@ def test_async_endpoint(async_ledger_charges_service):
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get"])
+@pytest.mark.parametrize("method", ["get", "stream", "stream_or_iterate"])
 def test_methods_present(ledger_charges_service, method):
     result = hasattr(ledger_charges_service, method)
 
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get"])
+@pytest.mark.parametrize("method", ["get", "stream", "stream_or_iterate"])
 def test_async_methods_present(async_ledger_charges_service, method):
     result = hasattr(async_ledger_charges_service, method)
 
@@ -35,6 +35,8 @@ def async_statements_service(async_http_client):
         "recalculate",
         "attachments",
         "charges",
+        "stream",
+        "stream_or_iterate",
     ],
 )
 def test_mixins_present(statements_service, method):
@@ -57,6 +59,8 @@ def test_mixins_present(statements_service, method):
         "recalculate",
         "attachments",
         "charges",
+        "stream",
+        "stream_or_iterate",
     ],
 )
 def test_async_mixins_present(async_statements_service, method):
@@ -69,7 +69,9 @@ def test_async_attachments_service(http_client):
     assert result.endpoint_params == {"agreement_id": "AGR-123"}
 
 
-@pytest.mark.parametrize("method", ["create", "update", "get", "render", "template"])
+@pytest.mark.parametrize(
+    "method", ["create", "update", "get", "render", "template", "stream", "stream_or_iterate"]
+)
 def test_mixins_present(http_client, method):
     service = AgreementsService(http_client=http_client)
 
@@ -78,7 +80,9 @@ def test_mixins_present(http_client, method):
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["create", "update", "get", "render", "template"])
+@pytest.mark.parametrize(
+    "method", ["create", "update", "get", "render", "template", "stream", "stream_or_iterate"]
+)
 def test_async_mixins_present(async_http_client, method):
     service = AgreementsService(http_client=async_http_client)
 
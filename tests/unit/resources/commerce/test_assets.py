@@ -14,14 +14,18 @@ def async_assets_service(async_http_client):
     return AsyncAssetService(http_client=async_http_client)
 
 
-@pytest.mark.parametrize("method", ["create", "update", "get", "render", "terminate"])
+@pytest.mark.parametrize(
+    "method", ["create", "update", "get", "render", "terminate", "stream", "stream_or_iterate"]
+)
 def test_assets_service_methods(assets_service, method):
     result = hasattr(assets_service, method)
 
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["create", "update", "get", "render", "terminate"])
+@pytest.mark.parametrize(
+    "method", ["create", "update", "get", "render", "terminate", "stream", "stream_or_iterate"]
+)
 def test_async_assets_service_methods(async_assets_service, method):
     result = hasattr(async_assets_service, method)
 
@@ -236,14 +236,20 @@ def test_async_asset_service(async_http_client):
     assert result.endpoint_params == {"order_id": "ORD-123"}
 
 
-@pytest.mark.parametrize("method", ["get", "create", "update", "delete", "render", "template"])
+@pytest.mark.parametrize(
+    "method",
+    ["get", "create", "update", "delete", "render", "template", "stream", "stream_or_iterate"],
+)
 def test_mixins_present(orders_service, method):
     result = hasattr(orders_service, method)
 
     assert result is True
 
 
-@pytest.mark.parametrize("method", ["get", "create", "update", "delete", "render", "template"])
+@pytest.mark.parametrize(
+    "method",
+    ["get", "create", "update", "delete", "render", "template", "stream", "stream_or_iterate"],
+)
 def test_async_mixins_present(async_orders_service, method):
     result = hasattr(async_orders_service, method)
 
@@ -7,6 +7,7 @@ from mpt_api_client.exceptions import (
     MPTHttpError,
     transform_http_status_exception,
 )
+from mpt_api_client.json_codec import StdlibJSONCodec
 
 
 def test_http_error():
@@ -129,3 +130,19 @@ def test_transform_http_status_exception():
     assert result.status_code == 500
     assert result.body == "Internal Server Error"
     assert str(result) == "HTTP 500: Error message"
+
+
+def test_transform_uses_codec(mocker):
+    response = Response(
+        status_code=400,
+        request=Request("GET", "http://test"),
+        content=b'{"title": "Bad Request"}',
+    )
+    exc = HTTPStatusError("error", request=response.request, response=response)
+    json_codec = mocker.Mock(spec=StdlibJSONCodec)
+    json_codec.loads.return_value = {"title": "Decoded"}
+
+    result = transform_http_status_exception(exc, json_codec)
+
+    assert result.title == "Decoded"
+    json_codec.loads.assert_called_once_with(b'{"title": "Bad Request"}')
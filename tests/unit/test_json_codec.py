@@ -0,0 +1,122 @@
+import importlib
+import math
+
+import pytest
+
+from mpt_api_client.json_codec import (
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    default_json_codec,
+    fastest_json_codec,
+)
+
+FAST_CODECS = (
+    pytest.param("orjson", OrjsonCodec, id="orjson"),
+    pytest.param("msgspec", MsgspecCodec, id="msgspec"),
+)
+
+
+REAL_IMPORT_MODULE = importlib.import_module
+
+
+def raise_import_error(name):
+    raise ImportError(name)
+
+
+def import_without_orjson(name):
+    if name == "orjson":
+        raise_import_error(name)
+    return REAL_IMPORT_MODULE(name)
+
+
+def test_stdlib_dumps_compact_utf8():
+    result = StdlibJSONCodec().dumps({"name": "Zoë", "ids": [1, 2]})
+
+    assert result == '{"name":"Zoë","ids":[1,2]}'.encode()
+
+
+def test_stdlib_dumps_rejects_nan():
+    with pytest.raises(ValueError, match="Out of range float values"):
+        StdlibJSONCodec().dumps({"amount": math.nan})
+
+
+def test_stdlib_loads():
+    result = StdlibJSONCodec().loads(b'{"id": "ID-1"}')
+
+    assert result == {"id": "ID-1"}
+
+
+@pytest.mark.parametrize(("module_name", "codec_class"), FAST_CODECS)
+def test_fast_codec_round_trip(module_name, codec_class):
+    pytest.importorskip(module_name)
+    codec = codec_class()
+    encoded = codec.dumps({"name": "Zoë", "ids": [1, 2]})
+
+    result = codec.loads(encoded)
+
+    assert result == {"name": "Zoë", "ids": [1, 2]}
+    assert codec.name == module_name
+
+
+@pytest.mark.parametrize(("module_name", "codec_class"), FAST_CODECS)
+def test_fast_codec_loads_str(module_name, codec_class):
+    pytest.importorskip(module_name)
+
+    result = codec_class().loads('{"id": "ID-1"}')
+
+    assert result == {"id": "ID-1"}
+
+
+@pytest.mark.parametrize(("module_name", "codec_class"), FAST_CODECS)
+def test_fast_codec_invalid_json(module_name, codec_class):
+    pytest.importorskip(module_name)
+
+    with pytest.raises(ValueError):
+        codec_class().loads(b"not json")
+
+
+@pytest.mark.parametrize("codec_class", [OrjsonCodec, MsgspecCodec])
+def test_fast_codec_not_installed(mocker, codec_class):
+    mocker.patch("importlib.import_module", side_effect=raise_import_error)
+
+    with pytest.raises(ImportError):
+        codec_class()
+
+
+def test_default_codec_is_stdlib():
+    result = default_json_codec()
+
+    assert isinstance(result, StdlibJSONCodec)
+
+
+def test_fastest_codec_falls_back_to_stdlib(mocker):
+    mocker.patch("importlib.import_module", side_effect=raise_import_error)
+
+    result = fastest_json_codec()
+
+    assert isinstance(result, StdlibJSONCodec)
+
+
+def test_fastest_codec_prefers_orjson():
+    pytest.importorskip("orjson")
+
+    result = fastest_json_codec()
+
+    assert isinstance(result, OrjsonCodec)
+
+
+def test_fastest_codec_msgspec_fallback(mocker):
+    pytest.importorskip("msgspec")
+    mocker.patch("importlib.import_module", side_effect=import_without_orjson)
+
+    result = fastest_json_codec()
+
+    assert isinstance(result, MsgspecCodec)
+
+
+def test_default_codec_is_a_json_codec():
+    result = default_json_codec()
+
+    assert isinstance(result, JSONCodec)
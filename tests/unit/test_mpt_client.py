@@ -1,7 +1,7 @@
 import pytest
 
 from mpt_api_client.auth import BearerTokenAuthentication
-from mpt_api_client.http import AsyncHTTPClient, HTTPClient
+from mpt_api_client.http import AsyncHTTPClient, HTTPClient, TransportSettings
 from mpt_api_client.mpt_client import AsyncMPTClient, MPTClient
 from mpt_api_client.resources import (
     Accounts,
@@ -110,3 +110,25 @@ def test_async_mpt_client_from_config(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert isinstance(result, AsyncMPTClient)
     assert isinstance(result.http_client, AsyncHTTPClient)
+
+
+def test_mpt_client_metrics() -> None:
+    http_client = HTTPClient(
+        transport=TransportSettings(base_url=API_URL),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+    result = MPTClient(http_client).metrics
+
+    assert result is http_client.components.metrics
+
+
+def test_async_mpt_client_metrics() -> None:
+    http_client = AsyncHTTPClient(
+        transport=TransportSettings(base_url=API_URL),
+        authentication=BearerTokenAuthentication(API_TOKEN),
+    )
+
+    result = AsyncMPTClient(http_client).metrics
+
+    assert result is http_client.components.metrics